@@ -2,31 +2,51 @@
 Client library for Volue Energy's Mesh software.
 """
 
-from ._authentication import Authentication
-from ._timeseries import Timeseries
-from ._timeseries_resource import TimeseriesResource
-from ._attribute import (
-    AttributeBase,
-    LinkRelationAttribute,
-    OwnershipRelationAttribute,
-    TimeseriesAttribute,
-    VersionedLinkRelationAttribute,
-    SimpleAttribute,
-)
-from ._object import Object
-from ._common import (
-    AttributesFilter,
-    HydSimDataset,
-    LinkRelationVersion,
-    LogMessage,
-    RatingCurveSegment,
-    RatingCurveVersion,
-    UserIdentity,
-    VersionInfo,
-    XyCurve,
-    XySet,
-)
-from ._connection import Connection
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._authentication import Authentication
+    from ._timeseries import Timeseries
+    from ._timeseries_resource import TimeseriesResource
+    from ._attribute import (
+        AttributeBase,
+        LinkRelationAttribute,
+        OwnershipRelationAttribute,
+        TimeseriesAttribute,
+        VersionedLinkRelationAttribute,
+        SimpleAttribute,
+    )
+    from ._object import Object
+    from ._common import (
+        AttributeMapping,
+        AttributesFilter,
+        CopyTimeseriesResult,
+        HydSimDataset,
+        LinkRelationUpdate,
+        LinkRelationVersion,
+        LogMessage,
+        RatingCurveSegment,
+        RatingCurveVersion,
+        SimpleAttributeUpdateFailure,
+        TimeseriesCopyMode,
+        TraversalNode,
+        TypeAttributeMapping,
+        UserIdentity,
+        VersionedLinkRelationUpdate,
+        VersionInfo,
+        XyCurve,
+        XySet,
+    )
+    from ._connection import Connection
+    from ._mesh_id import PathCache
+    from ._model_definition import (
+        MetadataCache,
+        Namespace,
+        ObjectDefinition,
+        Tag,
+        UnitOfMeasurement,
+    )
 
 __title__ = "volue.mesh"
 __author__ = "Volue AS"
@@ -53,4 +73,72 @@ __all__ = [
     "RatingCurveSegment",
     "RatingCurveVersion",
     "LinkRelationVersion",
+    "PathCache",
+    "TimeseriesCopyMode",
+    "AttributeMapping",
+    "TypeAttributeMapping",
+    "CopyTimeseriesResult",
+    "MetadataCache",
+    "UnitOfMeasurement",
+    "Tag",
+    "Namespace",
+    "ObjectDefinition",
+    "LinkRelationUpdate",
+    "VersionedLinkRelationUpdate",
+    "SimpleAttributeUpdateFailure",
+    "TraversalNode",
 ]
+
+# Public names are resolved on first access (PEP 562), so that `import volue.mesh`
+# does not load gRPC, the generated protobuf modules or PyArrow up front.
+_LAZY_ATTRIBUTES = {
+    "Authentication": "._authentication",
+    "Timeseries": "._timeseries",
+    "TimeseriesResource": "._timeseries_resource",
+    "AttributeBase": "._attribute",
+    "LinkRelationAttribute": "._attribute",
+    "OwnershipRelationAttribute": "._attribute",
+    "TimeseriesAttribute": "._attribute",
+    "VersionedLinkRelationAttribute": "._attribute",
+    "SimpleAttribute": "._attribute",
+    "Object": "._object",
+    "AttributesFilter": "._common",
+    "HydSimDataset": "._common",
+    "LinkRelationUpdate": "._common",
+    "LinkRelationVersion": "._common",
+    "LogMessage": "._common",
+    "RatingCurveSegment": "._common",
+    "RatingCurveVersion": "._common",
+    "SimpleAttributeUpdateFailure": "._common",
+    "TimeseriesCopyMode": "._common",
+    "TraversalNode": "._common",
+    "AttributeMapping": "._common",
+    "TypeAttributeMapping": "._common",
+    "CopyTimeseriesResult": "._common",
+    "UserIdentity": "._common",
+    "VersionedLinkRelationUpdate": "._common",
+    "VersionInfo": "._common",
+    "XyCurve": "._common",
+    "XySet": "._common",
+    "Connection": "._connection",
+    "PathCache": "._mesh_id",
+    "MetadataCache": "._model_definition",
+    "UnitOfMeasurement": "._model_definition",
+    "Tag": "._model_definition",
+    "Namespace": "._model_definition",
+    "ObjectDefinition": "._model_definition",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    # cache it, subsequent lookups do not go through `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,8 @@ Functionality for working with Mesh attributes.
 
 from __future__ import annotations
 
+import functools
+import sys
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,7 +14,7 @@ from typing import Any, List
 from dateutil import tz
 from google.protobuf import timestamp_pb2
 
-from volue.mesh import TimeseriesResource
+from volue.mesh import TimeseriesResource, profiling
 from volue.mesh._common import LinkRelationVersion, _from_proto_guid
 from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
 from volue.mesh.proto.model_definition.v1alpha import (
@@ -27,6 +29,25 @@ SIMPLE_TYPE_OR_COLLECTION = (
 PROTO_VALUE_ONE_OF_FIELD_NAME = "value_oneof"
 PROTO_DEFINITION_ONE_OF_FIELD_NAME = "definition_type_oneof"
 
+# used when `value_type` is not a part of the attribute field mask
+_VALUE_TYPES_BY_VALUE_FIELD_NAME = {
+    "int_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_INT,
+    "double_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE,
+    "boolean_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_BOOL,
+    "string_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_STRING,
+    "utc_time_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UTC_TIME,
+    "timeseries_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES,
+    "ownership_relation_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_OWNERSHIP_RELATION,
+    "link_relation_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_LINK_RELATION,
+    "versioned_link_relation_value": model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_VERSIONED_LINK_RELATION,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _from_owner_guid_bytes(bytes_le: bytes) -> uuid.UUID:
+    """Share `owner_id` UUIDs between attributes of the same object."""
+    return uuid.UUID(bytes_le=bytes_le)
+
 
 def _get_field_value(field_name: str, field_names: set[str], proto_message: Any):
     """
@@ -62,8 +83,18 @@ def _from_proto_attribute(proto_attribute: model_resources_pb2.Attribute):
     Args:
         proto_attribute: protobuf Attribute returned from the gRPC methods.
     """
+    start = profiling._start()
     attribute_value_type = proto_attribute.value_type
 
+    if (
+        attribute_value_type
+        == model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UNSPECIFIED
+        and len(proto_attribute.values) > 0
+    ):
+        attribute_value_type = _VALUE_TYPES_BY_VALUE_FIELD_NAME.get(
+            proto_attribute.values[0].WhichOneof(PROTO_VALUE_ONE_OF_FIELD_NAME)
+        )
+
     if (
         attribute_value_type
         == model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES
@@ -95,9 +126,50 @@ def _from_proto_attribute(proto_attribute: model_resources_pb2.Attribute):
     else:
         attribute = AttributeBase(proto_attribute, init_definition=True)
 
+    if start is not None:
+        profiling._record(
+            "parse_attribute",
+            start,
+            target=proto_attribute.path,
+            bytes=proto_attribute.ByteSize(),
+        )
     return attribute
 
 
+def _from_proto_attribute_definition(
+    proto_definition: model_definition_resources_pb2.AttributeDefinition,
+) -> AttributeBase.AttributeBaseDefinition:
+    """Factory for creating attribute definitions from protobuf Mesh AttributeDefinition.
+
+    Args:
+        proto_definition: protobuf AttributeDefinition returned from the gRPC methods.
+    """
+    definition_type_name = proto_definition.WhichOneof(
+        PROTO_DEFINITION_ONE_OF_FIELD_NAME
+    )
+
+    if definition_type_name == "timeseries_definition":
+        definition_class = TimeseriesAttribute.TimeseriesAttributeDefinition
+    elif definition_type_name == "ownership_relation_definition":
+        definition_class = (
+            OwnershipRelationAttribute.OwnershipRelationAttributeDefinition
+        )
+    elif definition_type_name == "link_relation_definition":
+        definition_class = LinkRelationAttribute.LinkRelationAttributeDefinition
+    elif definition_type_name in (
+        "int_definition",
+        "double_definition",
+        "boolean_definition",
+        "string_definition",
+        "utc_time_definition",
+    ):
+        definition_class = SimpleAttribute.SimpleAttributeDefinition
+    else:
+        definition_class = AttributeBase.AttributeBaseDefinition
+
+    return definition_class(proto_definition)
+
+
 class AttributeBase:
     """Base class for Mesh Attribute.
 
@@ -110,9 +182,23 @@ class AttributeBase:
     `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
     """
 
+    __slots__ = ("id", "path", "name", "owner_id", "owner_path", "definition")
+
     class AttributeBaseDefinition:
         """Attribute definition common for all kinds of attributes."""
 
+        __slots__ = (
+            "id",
+            "path",
+            "name",
+            "description",
+            "tags",
+            "namespace",
+            "type_name",
+            "minimum_cardinality",
+            "maximum_cardinality",
+        )
+
         def __init__(
             self,
             proto_definition: model_definition_resources_pb2.AttributeDefinition,
@@ -120,14 +206,15 @@ class AttributeBase:
             self.id: uuid.UUID = _from_proto_guid(
                 proto_definition.id
             )  # ID will always be present here
-            self.path: str = proto_definition.path
-            self.name: str = proto_definition.name
+            # definitions are shared by many attributes, intern repeated strings
+            self.path: str = sys.intern(proto_definition.path)
+            self.name: str = sys.intern(proto_definition.name)
             self.description: str = proto_definition.description
-            self.tags: List[str] = []
-            for tag in proto_definition.tags:
-                self.tags.append(tag.name)
-            self.namespace: str = proto_definition.name_space
-            self.type_name: str = proto_definition.type_name
+            self.tags: List[str] = [
+                sys.intern(tag.name) for tag in proto_definition.tags
+            ]
+            self.namespace: str = sys.intern(proto_definition.name_space)
+            self.type_name: str = sys.intern(proto_definition.type_name)
             self.minimum_cardinality: int = proto_definition.minimum_cardinality
             self.maximum_cardinality: int = proto_definition.maximum_cardinality
 
@@ -136,11 +223,21 @@ class AttributeBase:
         proto_attribute: model_resources_pb2.Attribute,
         init_definition: bool = False,
     ):
-        self.id: uuid.UUID = _from_proto_guid(proto_attribute.id)
+        # ID and owner ID may be excluded by an explicit attribute field mask
+        self.id: uuid.UUID | None = (
+            _from_proto_guid(proto_attribute.id)
+            if proto_attribute.HasField("id")
+            else None
+        )
         self.path: str = proto_attribute.path
-        self.name: str = proto_attribute.name
-        self.owner_id: uuid.UUID = _from_proto_guid(proto_attribute.owner_id.id)
-        self.owner_path: str = proto_attribute.owner_id.path
+        # the same names and owner paths are repeated for many attributes
+        self.name: str = sys.intern(proto_attribute.name)
+        self.owner_id: uuid.UUID | None = (
+            _from_owner_guid_bytes(proto_attribute.owner_id.id.bytes_le)
+            if proto_attribute.owner_id.HasField("id")
+            else None
+        )
+        self.owner_path: str = sys.intern(proto_attribute.owner_id.path)
 
         self.definition = None
 
@@ -200,9 +297,18 @@ class SimpleAttribute(AttributeBase):
     `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
     """
 
+    __slots__ = ("value",)
+
     class SimpleAttributeDefinition(AttributeBase.AttributeBaseDefinition):
         """Attribute definition for simple attributes."""
 
+        __slots__ = (
+            "default_value",
+            "minimum_value",
+            "maximum_value",
+            "unit_of_measurement",
+        )
+
         def __init__(
             self,
             proto_definition: model_definition_resources_pb2.AttributeDefinition,
@@ -229,14 +335,21 @@ class SimpleAttribute(AttributeBase):
             )
 
             if "unit_of_measurement" in field_names:
-                self.unit_of_measurement = definition_type.unit_of_measurement.name
+                self.unit_of_measurement = sys.intern(
+                    definition_type.unit_of_measurement.name
+                )
             else:
                 self.unit_of_measurement = None
 
     def __init__(self, proto_attribute: model_resources_pb2.Attribute):
         super().__init__(proto_attribute)
 
-        if proto_attribute.value_type_collection:
+        if proto_attribute.value_type_collection or (
+            # value type not returned, more values can only be a collection
+            proto_attribute.value_type
+            == model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UNSPECIFIED
+            and len(proto_attribute.values) > 1
+        ):
             self.value = []
             for proto_value in proto_attribute.values:
                 value = _get_attribute_value(proto_value)
@@ -290,15 +403,19 @@ class OwnershipRelationAttribute(AttributeBase):
     `Mesh relations <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/relations/>`__.
     """
 
+    __slots__ = ("target_object_ids",)
+
     class OwnershipRelationAttributeDefinition(AttributeBase.AttributeBaseDefinition):
         """Attribute definition for ownership relation attribute."""
 
+        __slots__ = ("target_object_type_name",)
+
         def __init__(
             self,
             proto_definition: model_definition_resources_pb2.AttributeDefinition,
         ):
             super().__init__(proto_definition)
-            self.target_object_type_name: str = (
+            self.target_object_type_name: str = sys.intern(
                 proto_definition.ownership_relation_definition.target_object_type_name
             )
 
@@ -354,15 +471,19 @@ class LinkRelationAttribute(AttributeBase):
     `Mesh relations <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/relations/>`__.
     """
 
+    __slots__ = ("target_object_ids",)
+
     class LinkRelationAttributeDefinition(AttributeBase.AttributeBaseDefinition):
         """Attribute definition for link relation attribute."""
 
+        __slots__ = ("target_object_type_name",)
+
         def __init__(
             self,
             proto_definition: model_definition_resources_pb2.AttributeDefinition,
         ):
             super().__init__(proto_definition)
-            self.target_object_type_name: str = (
+            self.target_object_type_name: str = sys.intern(
                 proto_definition.link_relation_definition.target_object_type_name
             )
 
@@ -419,6 +540,8 @@ class VersionedLinkRelationAttribute(AttributeBase):
     `Mesh relations <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/relations/>`__.
     """
 
+    __slots__ = ("entries",)
+
     @dataclass
     class VersionedLinkRelationEntry:
         """Represents a versioned link relation entry."""
@@ -490,9 +613,13 @@ class TimeseriesAttribute(AttributeBase):
     `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
     """
 
+    __slots__ = ("time_series_resource", "is_local_expression", "expression")
+
     class TimeseriesAttributeDefinition(AttributeBase.AttributeBaseDefinition):
         """Attribute definition for time series attribute."""
 
+        __slots__ = ("template_expression", "unit_of_measurement")
+
         def __init__(
             self,
             proto_definition: model_definition_resources_pb2.AttributeDefinition,
@@ -503,7 +630,7 @@ class TimeseriesAttribute(AttributeBase):
             )
 
             if proto_definition.timeseries_definition.HasField("unit_of_measurement"):
-                self.unit_of_measurement = (
+                self.unit_of_measurement = sys.intern(
                     proto_definition.timeseries_definition.unit_of_measurement.name
                 )
             else:
@@ -531,6 +658,11 @@ class TimeseriesAttribute(AttributeBase):
 
             self.is_local_expression: bool | None = proto_value.is_local_expression
             self.expression: str | None = proto_value.expression
+        else:
+            # e.g. attribute values excluded by an attribute field mask
+            self.time_series_resource = None
+            self.is_local_expression = None
+            self.expression = None
 
         # in basic view the definition is not a part of response from Mesh server
         if proto_attribute.HasField("definition"):
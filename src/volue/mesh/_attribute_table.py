@@ -0,0 +1,167 @@
+"""
+Arrow tables of simple attribute values of many objects.
+"""
+
+from __future__ import annotations
+
+import operator
+import typing
+
+import pyarrow as pa
+
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+
+if typing.TYPE_CHECKING:
+    from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+
+OBJECT_ID_COLUMN_NAME = "object_id"
+OBJECT_PATH_COLUMN_NAME = "object_path"
+
+SIMPLE_ATTRIBUTE_TABLE_FIELDS = ("value_type", "value_type_collection", "values")
+"""Attribute fields requested from Mesh for simple attribute tables."""
+
+# attribute value field and Arrow type of each simple attribute value type
+_SIMPLE_VALUE_TYPES = {
+    model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_INT: ("int_value", pa.int64()),
+    model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE: (
+        "double_value",
+        pa.float64(),
+    ),
+    model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_BOOL: (
+        "boolean_value",
+        pa.bool_(),
+    ),
+    model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_STRING: (
+        "string_value",
+        pa.string(),
+    ),
+    model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UTC_TIME: (
+        "utc_time_value",
+        pa.timestamp("us", tz="UTC"),
+    ),
+}
+
+
+def _guid_to_string(bytes_le: bytes) -> str:
+    """Same as `str(uuid.UUID(bytes_le=bytes_le))`, without creating UUIDs."""
+    return "-".join(
+        (
+            bytes_le[3::-1].hex(),
+            bytes_le[5:3:-1].hex(),
+            bytes_le[7:5:-1].hex(),
+            bytes_le[8:10].hex(),
+            bytes_le[10:].hex(),
+        )
+    )
+
+
+def _to_microseconds(proto_value: model_resources_pb2.AttributeValue) -> int:
+    timestamp = proto_value.utc_time_value
+    return timestamp.seconds * 1_000_000 + timestamp.nanos // 1_000
+
+
+class _SimpleAttributeColumn:
+    """Values of one simple attribute, flat, with start offsets of rows for
+    collection attributes. Missing attributes are nulls."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.value_type: int | None = None
+        self.collection: bool = False
+        self._get_value: typing.Callable[[typing.Any], typing.Any] | None = None
+        self.values: typing.List[typing.Any] = []
+        # start of each row in `values`, `None` for missing attributes
+        self.starts: typing.List[int | None] = []
+
+    def add(self, proto_attribute: model_resources_pb2.Attribute | None) -> None:
+        if proto_attribute is None:
+            self.starts.append(None)
+            if not self.collection:
+                self.values.append(None)
+            return
+
+        if self.value_type is None:
+            if proto_attribute.value_type not in _SIMPLE_VALUE_TYPES:
+                raise ValueError(f"attribute '{self.name}' is not a simple attribute")
+            self.value_type = proto_attribute.value_type
+            self.collection = proto_attribute.value_type_collection
+            field_name = _SIMPLE_VALUE_TYPES[self.value_type][0]
+            self._get_value = (
+                _to_microseconds
+                if field_name == "utc_time_value"
+                else operator.attrgetter(field_name)
+            )
+            if self.collection:
+                # rows added so far are nulls
+                self.values.clear()
+        elif (
+            proto_attribute.value_type != self.value_type
+            or proto_attribute.value_type_collection != self.collection
+        ):
+            raise ValueError(
+                f"attribute '{self.name}' has different value types in found objects"
+            )
+
+        proto_values = proto_attribute.values
+        self.starts.append(len(self.values))
+        if self.collection:
+            self.values.extend(map(self._get_value, proto_values))
+        elif len(proto_values) > 0:
+            self.values.append(self._get_value(proto_values[0]))
+        else:
+            self.values.append(None)
+
+    def to_arrow(self) -> pa.Array:
+        if self.value_type is None:
+            return pa.nulls(len(self.starts))
+
+        value_type = _SIMPLE_VALUE_TYPES[self.value_type][1]
+        values = pa.array(self.values, type=value_type)
+        if not self.collection:
+            return values
+
+        # null offsets are null lists
+        offsets = pa.array([*self.starts, len(self.values)], type=pa.int32())
+        return pa.ListArray.from_arrays(offsets, values)
+
+
+class _SimpleAttributeTableBuilder:
+    """Collects values of simple attributes of found objects directly from
+    protobuf objects, without creating `Object` and `SimpleAttribute`
+    instances."""
+
+    def __init__(self, attribute_names: typing.Iterable[str]):
+        # unique names in the original order
+        self.attribute_names = list(dict.fromkeys(attribute_names))
+        if not self.attribute_names:
+            raise ValueError("attribute_names must not be empty")
+
+        self._object_ids: typing.List[str] = []
+        self._object_paths: typing.List[str] = []
+        self._columns = [_SimpleAttributeColumn(name) for name in self.attribute_names]
+
+    def add(self, proto_object: model_resources_pb2.Object) -> None:
+        self._object_ids.append(_guid_to_string(proto_object.id.bytes_le))
+        self._object_paths.append(proto_object.path)
+
+        attributes = {
+            attribute.name: attribute for attribute in proto_object.attributes
+        }
+        for column in self._columns:
+            column.add(attributes.get(column.name))
+
+    def to_table(self) -> pa.Table:
+        return pa.Table.from_arrays(
+            [
+                pa.array(self._object_ids, type=pa.string()),
+                pa.array(self._object_paths, type=pa.string()),
+                *(column.to_arrow() for column in self._columns),
+            ],
+            names=[
+                OBJECT_ID_COLUMN_NAME,
+                OBJECT_PATH_COLUMN_NAME,
+                *self.attribute_names,
+            ],
+        )
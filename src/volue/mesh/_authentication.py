@@ -14,10 +14,20 @@ from google import protobuf
 
 from volue.mesh.proto.auth.v1alpha import auth_pb2, auth_pb2_grpc
 
-if platform.startswith("win32"):
-    import winkerberos as kerberos
-elif platform.startswith("linux"):
-    import kerberos
+
+def _import_kerberos():
+    """
+    Import the platform specific Kerberos module.
+
+    It is imported only when a Kerberos authenticated connection is created,
+    other connection types do not need it.
+    """
+    if platform.startswith("win32"):
+        import winkerberos as kerberos
+    elif platform.startswith("linux"):
+        import kerberos
+
+    return kerberos
 
 
 class Authentication(grpc.AuthMetadataPlugin):
@@ -70,10 +80,11 @@ class Authentication(grpc.AuthMetadataPlugin):
             self.service_principal: str = service_principal
             self.user_principal: str = user_principal
             self.exception: Exception | None = None
+            self.kerberos = _import_kerberos()
 
             # there is no need to check status for failures as
             # kerberos module converts failures to exceptions
-            _, self.krb_context = kerberos.authGSSClientInit(
+            _, self.krb_context = self.kerberos.authGSSClientInit(
                 self.service_principal, self.user_principal, gssflags=0
             )
 
@@ -87,7 +98,7 @@ class Authentication(grpc.AuthMetadataPlugin):
             """
             try:
                 if self.first_iteration:
-                    _ = kerberos.authGSSClientStep(self.krb_context, "")
+                    _ = self.kerberos.authGSSClientStep(self.krb_context, "")
                 else:
                     self.response_received.wait()
                     self.response_received.clear()
@@ -102,12 +113,12 @@ class Authentication(grpc.AuthMetadataPlugin):
                     base64_server_kerberos_token = base64.b64encode(
                         self.server_kerberos_token
                     ).decode("ascii")
-                    _ = kerberos.authGSSClientStep(
+                    _ = self.kerberos.authGSSClientStep(
                         self.krb_context, base64_server_kerberos_token
                     )
 
                 # response is base64 encoded
-                base64_client_kerberos_token = kerberos.authGSSClientResponse(
+                base64_client_kerberos_token = self.kerberos.authGSSClientResponse(
                     self.krb_context
                 )
 
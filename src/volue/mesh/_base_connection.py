@@ -1,25 +1,51 @@
+from __future__ import annotations
+
 import abc
+import importlib
+import time
+import typing
 import uuid
 from typing import TypeVar
 
 import grpc
 
-from volue.mesh.proto.auth.v1alpha import auth_pb2, auth_pb2_grpc
-from volue.mesh.proto.availability.v1alpha import availability_pb2_grpc
-from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
 from volue.mesh.proto.config.v1alpha import config_pb2, config_pb2_grpc
-from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
-from volue.mesh.proto.model.v1alpha import model_pb2_grpc
-from volue.mesh.proto.model_definition.v1alpha import model_definition_pb2_grpc
-from volue.mesh.proto.session.v1alpha import session_pb2_grpc
-from volue.mesh.proto.time_series.v1alpha import time_series_pb2_grpc
 
 from . import _authentication
 from ._authentication import Authentication, ExternalAccessTokenPlugin
+from ._model_definition import MetadataCache
+
+if typing.TYPE_CHECKING:
+    from volue.mesh.proto.auth.v1alpha import auth_pb2
 
 C = TypeVar("C", bound="Connection")
 
 
+class _LazyServiceStub:
+    """
+    Proxy for a gRPC generated service stub.
+
+    The generated `*_pb2_grpc` module is imported and the stub is created on
+    first use, so services that are never called are never loaded.
+    """
+
+    def __init__(self, channel, module_name: str, stub_name: str):
+        self._channel = channel
+        self._module_name = module_name
+        self._stub_name = stub_name
+        self._stub = None
+
+    def _load(self):
+        """Import the generated module and create the stub, if not done yet."""
+        if self._stub is None:
+            module = importlib.import_module(self._module_name)
+            self._stub = getattr(module, self._stub_name)(self._channel)
+        return self._stub
+
+    def __getattr__(self, name: str):
+        return getattr(self._load(), name)
+
+
 class Connection(abc.ABC):
     """A connection to a Mesh server.
 
@@ -55,7 +81,8 @@ class Connection(abc.ABC):
         """Create an insecure gRPC channel.
 
         Derived classes should implement this using either grpc.aio.insecure_channel
-        or grpc.insecure_channel depending on desired behavior.
+        or grpc.insecure_channel depending on desired behavior. The optional
+        `interceptors` keyword argument must be applied to the created channel.
         """
 
     @staticmethod
@@ -64,7 +91,8 @@ class Connection(abc.ABC):
         """Create a secure gRPC channel.
 
         Derived classes should implement this using either grpc.aio.secure_channel
-        or grpc.secure_channel depending on desired behavior.
+        or grpc.secure_channel depending on desired behavior. The optional
+        `interceptors` keyword argument must be applied to the created channel.
         """
 
     @staticmethod
@@ -109,23 +137,11 @@ class Connection(abc.ABC):
             - with TLS and externally obtained access tokens (requires TLS for encrypting access tokens)
         """
         self.auth_metadata_plugin = auth_metadata_plugin
+        # shared by all sessions created by this connection
+        self.metadata_cache = MetadataCache()
 
         if channel is not None:
-            self.auth_service = auth_pb2_grpc.AuthenticationServiceStub(channel)
-            self.availability_service = availability_pb2_grpc.AvailabilityServiceStub(
-                channel
-            )
-            self.calc_service = calc_pb2_grpc.CalculationServiceStub(channel)
-            self.config_service = config_pb2_grpc.ConfigurationServiceStub(channel)
-            self.hydsim_service = hydsim_pb2_grpc.HydsimServiceStub(channel)
-            self.model_service = model_pb2_grpc.ModelServiceStub(channel)
-            self.model_definition_service = (
-                model_definition_pb2_grpc.ModelDefinitionServiceStub(channel)
-            )
-            self.session_service = session_pb2_grpc.SessionServiceStub(channel)
-            self.time_series_service = time_series_pb2_grpc.TimeseriesServiceStub(
-                channel
-            )
+            self._create_service_stubs(channel)
             return
 
         target = f"{host}:{port}"
@@ -169,23 +185,65 @@ class Connection(abc.ABC):
                     target=target, credentials=channel_credentials
                 )
 
-        self.auth_service = auth_pb2_grpc.AuthenticationServiceStub(channel)
-        self.availability_service = availability_pb2_grpc.AvailabilityServiceStub(
-            channel
+        self._create_service_stubs(channel)
+
+    def _create_service_stubs(self, channel) -> None:
+        """Create gRPC service stubs for the given channel.
+
+        The configuration service is created right away, it is needed for
+        the server version compatibility check. All other services are
+        loaded on first use.
+        """
+        self._channel = channel
+        self.auth_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.auth.v1alpha.auth_pb2_grpc",
+            "AuthenticationServiceStub",
+        )
+        self.availability_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.availability.v1alpha.availability_pb2_grpc",
+            "AvailabilityServiceStub",
+        )
+        self.calc_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.calc.v1alpha.calc_pb2_grpc",
+            "CalculationServiceStub",
         )
-        self.calc_service = calc_pb2_grpc.CalculationServiceStub(channel)
         self.config_service = config_pb2_grpc.ConfigurationServiceStub(channel)
-        self.hydsim_service = hydsim_pb2_grpc.HydsimServiceStub(channel)
-        self.model_service = model_pb2_grpc.ModelServiceStub(channel)
-        self.model_definition_service = (
-            model_definition_pb2_grpc.ModelDefinitionServiceStub(channel)
+        self.hydsim_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.hydsim.v1alpha.hydsim_pb2_grpc",
+            "HydsimServiceStub",
+        )
+        self.model_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.model.v1alpha.model_pb2_grpc",
+            "ModelServiceStub",
+        )
+        self.model_definition_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.model_definition.v1alpha.model_definition_pb2_grpc",
+            "ModelDefinitionServiceStub",
+        )
+        self.session_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.session.v1alpha.session_pb2_grpc",
+            "SessionServiceStub",
+        )
+        self.time_series_service = _LazyServiceStub(
+            channel,
+            "volue.mesh.proto.time_series.v1alpha.time_series_pb2_grpc",
+            "TimeseriesServiceStub",
         )
-        self.session_service = session_pb2_grpc.SessionServiceStub(channel)
-        self.time_series_service = time_series_pb2_grpc.TimeseriesServiceStub(channel)
 
     @classmethod
     def insecure(
-        cls: C, target: str, *, grpc_max_receive_message_length: int | None = None
+        cls: C,
+        target: str,
+        *,
+        grpc_max_receive_message_length: int | None = None,
+        interceptors: typing.Sequence[typing.Any] | None = None,
     ) -> C:
         """Creates an insecure connection to a Mesh server.
 
@@ -193,10 +251,15 @@ class Connection(abc.ABC):
             target: The server address.
             grpc_max_receive_message_length: Maximum inbound gRPC message size
                 in bytes. By default the maximum inbound gRPC message size is 4MB.
+            interceptors: gRPC client interceptors applied to all calls made
+                through the connection, e.g.
+                :py:class:`volue.mesh.metrics.MetricsInterceptor`.
         """
 
         options = cls._get_grpc_channel_options(grpc_max_receive_message_length)
-        channel = cls._insecure_grpc_channel(target=target, options=options)
+        channel = cls._insecure_grpc_channel(
+            target=target, options=options, interceptors=interceptors
+        )
         return cls(channel=channel)
 
     @classmethod
@@ -206,6 +269,7 @@ class Connection(abc.ABC):
         root_certificates: str | None,
         *,
         grpc_max_receive_message_length: int | None = None,
+        interceptors: typing.Sequence[typing.Any] | None = None,
     ) -> C:
         """Creates an encrypted connection to a Mesh server.
 
@@ -216,11 +280,17 @@ class Connection(abc.ABC):
                 by the gRPC runtime.
             grpc_max_receive_message_length: Maximum inbound gRPC message size
                 in bytes. By default the maximum inbound gRPC message size is 4MB.
+            interceptors: gRPC client interceptors applied to all calls made
+                through the connection, e.g.
+                :py:class:`volue.mesh.metrics.MetricsInterceptor`.
         """
         credentials = grpc.ssl_channel_credentials(root_certificates)
         options = cls._get_grpc_channel_options(grpc_max_receive_message_length)
         channel = cls._secure_grpc_channel(
-            target=target, credentials=credentials, options=options
+            target=target,
+            credentials=credentials,
+            options=options,
+            interceptors=interceptors,
         )
         return cls(channel=channel)
 
@@ -233,6 +303,7 @@ class Connection(abc.ABC):
         user_principal: str | None = None,
         *,
         grpc_max_receive_message_length: int | None = None,
+        interceptors: typing.Sequence[typing.Any] | None = None,
     ) -> C:
         """Creates an encrypted and authenticated connection to a Mesh server.
 
@@ -258,6 +329,9 @@ class Connection(abc.ABC):
                 'ad\\user`.
             grpc_max_receive_message_length: Maximum inbound gRPC message size
                 in bytes. By default the maximum inbound gRPC message size is 4MB.
+            interceptors: gRPC client interceptors applied to all calls made
+                through the connection, e.g.
+                :py:class:`volue.mesh.metrics.MetricsInterceptor`.
         """
         ssl_credentials = grpc.ssl_channel_credentials(root_certificates)
         auth_params = _authentication.Authentication.Parameters(
@@ -270,7 +344,10 @@ class Connection(abc.ABC):
         )
         options = cls._get_grpc_channel_options(grpc_max_receive_message_length)
         channel = cls._secure_grpc_channel(
-            target=target, credentials=credentials, options=options
+            target=target,
+            credentials=credentials,
+            options=options,
+            interceptors=interceptors,
         )
         return cls(channel=channel, auth_metadata_plugin=auth_metadata_plugin)
 
@@ -282,6 +359,7 @@ class Connection(abc.ABC):
         access_token: str,
         *,
         grpc_max_receive_message_length: int | None = None,
+        interceptors: typing.Sequence[typing.Any] | None = None,
     ) -> C:
         """Creates an encrypted connection to a Mesh server and will add
         provided access token to authorization header to each server request.
@@ -298,6 +376,9 @@ class Connection(abc.ABC):
                 server.
             grpc_max_receive_message_length: Maximum inbound gRPC message size
                 in bytes. By default the maximum inbound gRPC message size is 4MB.
+            interceptors: gRPC client interceptors applied to all calls made
+                through the connection, e.g.
+                :py:class:`volue.mesh.metrics.MetricsInterceptor`.
         """
         ssl_credentials = grpc.ssl_channel_credentials(root_certificates)
         auth_metadata_plugin = ExternalAccessTokenPlugin(access_token)
@@ -307,7 +388,10 @@ class Connection(abc.ABC):
         )
         options = cls._get_grpc_channel_options(grpc_max_receive_message_length)
         channel = cls._secure_grpc_channel(
-            target=target, credentials=credentials, options=options
+            target=target,
+            credentials=credentials,
+            options=options,
+            interceptors=interceptors,
         )
         return cls(channel=channel, auth_metadata_plugin=auth_metadata_plugin)
 
@@ -322,6 +406,84 @@ class Connection(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def get_health_status(self) -> typing.Dict[str, typing.Any]:
+        """Request health information of the connected Mesh server.
+
+        The content of the health information is not stable and may differ
+        between Mesh server versions.
+
+        Note:
+            Does not require an open session.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def warm_up(
+        self, timeout: float | None = None, number_of_sessions: int = 0
+    ) -> typing.List:
+        """Prepare the connection, so that the first request does not pay
+        connection set up costs.
+
+        The following steps are performed:
+
+        1. Wait until the gRPC channel is connected (including TLS handshake).
+        2. Acquire Mesh token for Kerberos authenticated connections, unless
+           there is a valid one already.
+        3. Load all gRPC service stubs.
+        4. Request Mesh server version and validate that it is compatible with
+           this version of Mesh Python SDK.
+        5. Request Mesh server health status.
+        6. Optionally open `number_of_sessions` sessions concurrently, within
+           the remaining time of the deadline.
+
+        Args:
+            timeout: Deadline in seconds for the whole warm-up. If not set
+                the warm-up waits until the server is reachable.
+            number_of_sessions: Number of sessions to open. The opened sessions
+                are returned and the caller is responsible for closing them.
+
+        Returns:
+            Opened sessions, empty if `number_of_sessions` is 0.
+
+        Note:
+            Does not require an open session.
+
+        Raises:
+            TimeoutError: The channel was not ready before the deadline.
+            grpc.RpcError: Error message raised if the gRPC request could not
+                be completed, e.g.: `StatusCode.DEADLINE_EXCEEDED`.
+            RuntimeError: Incompatible Mesh server version.
+        """
+
+    @staticmethod
+    def _get_warm_up_deadline(timeout: float | None) -> float | None:
+        """Convert `timeout` in seconds to a monotonic clock deadline."""
+        if timeout is None:
+            return None
+        return time.monotonic() + timeout
+
+    @staticmethod
+    def _get_remaining_time(deadline: float | None) -> float | None:
+        """Seconds left until `deadline`, or None if there is no deadline."""
+        if deadline is None:
+            return None
+        return max(deadline - time.monotonic(), 0.0)
+
+    def _prepare_warm_up(self) -> None:
+        """Load service stubs and acquire authentication token if needed."""
+        for service in vars(self).values():
+            if isinstance(service, _LazyServiceStub):
+                service._load()
+
+        if (
+            isinstance(self.auth_metadata_plugin, Authentication)
+            and not self.auth_metadata_plugin.is_token_valid()
+        ):
+            self.auth_metadata_plugin.get_token()
+
     @abc.abstractmethod
     def get_user_identity(self) -> auth_pb2.UserIdentity:
         """Request information about the user authorized to work with the Mesh server.
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections.abc
+import enum
 import threading
 import typing
 import uuid
@@ -9,59 +11,409 @@ from datetime import datetime, timedelta
 from typing import List, Tuple
 
 import dateutil
+import pyarrow as pa
+import pyarrow.compute as pc
 from google import protobuf
+from google.protobuf import timestamp_pb2
 
-from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
-from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2, hydsim_pb2_grpc
-from volue.mesh.proto.model.v1alpha import model_pb2, model_pb2_grpc
+from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2
+from volue.mesh.proto.model.v1alpha import model_pb2
 from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
-from volue.mesh.proto.model_definition.v1alpha import (
-    model_definition_pb2,
-    model_definition_pb2_grpc,
-)
-from volue.mesh.proto.session.v1alpha import session_pb2_grpc
-from volue.mesh.proto.time_series.v1alpha import time_series_pb2, time_series_pb2_grpc
+from volue.mesh.proto.model_definition.v1alpha import model_definition_pb2
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
 from volue.mesh.proto.type import resources_pb2
 
+from . import profiling
 from ._attribute import (
     SIMPLE_TYPE,
     SIMPLE_TYPE_OR_COLLECTION,
     AttributeBase,
+    LinkRelationAttribute,
     TimeseriesAttribute,
 )
 from ._common import (
     AttributesFilter,
+    CopyTimeseriesResult,
+    LinkRelationUpdate,
     LinkRelationVersion,
     RatingCurveSegment,
     RatingCurveVersion,
+    SimpleAttributeUpdateFailure,
+    TimeseriesCopyMode,
+    TraversalNode,
+    TypeAttributeMapping,
+    VersionedLinkRelationUpdate,
     XyCurve,
     XySet,
     _datetime_to_timestamp_pb2,
+    _from_proto_guid,
     _object_to_proto_field_mask,
     _read_proto_reply,
     _to_proto_attribute_field_mask,
     _to_proto_attribute_masks,
     _to_proto_curve_type,
     _to_proto_guid,
+    _to_proto_resolution,
     _to_proto_timeseries,
+    _to_proto_type_attribute_mappings,
     _to_proto_utcinterval,
 )
 from ._mesh_id import (
+    PathCache,
+    _PathCacheFallbackStub,
     _to_proto_attribute_definition_mesh_id,
     _to_proto_attribute_mesh_id,
+    _to_proto_model_definition_mesh_id,
+    _to_proto_object_definition_mesh_id,
     _to_proto_object_mesh_id,
+    _to_proto_owner_mesh_id,
     _to_proto_read_timeseries_mesh_id,
 )
+from ._model_definition import (
+    MetadataCache,
+    Namespace,
+    ObjectDefinition,
+    Tag,
+    UnitOfMeasurement,
+)
 from ._object import Object
 from ._timeseries import Timeseries
 from ._timeseries_resource import TimeseriesResource
-from .calc.forecast import ForecastFunctions
-from .calc.history import HistoryFunctions
-from .calc.statistical import StatisticalFunctions
-from .calc.transform import TransformFunctions
+
+if typing.TYPE_CHECKING:
+    from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
+    from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
+    from volue.mesh.proto.model.v1alpha import model_pb2_grpc
+    from volue.mesh.proto.model_definition.v1alpha import model_definition_pb2_grpc
+    from volue.mesh.proto.session.v1alpha import session_pb2_grpc
+    from volue.mesh.proto.time_series.v1alpha import time_series_pb2_grpc
+
+    from .calc.forecast import ForecastFunctions
+    from .calc.history import HistoryFunctions
+    from .calc.statistical import StatisticalFunctions
+    from .calc.transform import TransformFunctions
 
 EXTEND_SESSION_LIFETIME_INTERVAL_IN_SECS = 150
 
+DEFAULT_MAX_CONCURRENT_UPDATES = 16
+
+DEFAULT_MAX_CONCURRENT_READS = 16
+
+
+def _validate_batch_size(batch_size: int | None) -> None:
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+
+def _batched(
+    iterable: typing.Iterable[typing.Any], batch_size: int | None
+) -> typing.Iterator[typing.Any]:
+    """Yield items of `iterable`, or lists of up to `batch_size` items if set."""
+    if batch_size is None:
+        yield from iterable
+        return
+
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _Traversal:
+    """Breadth-first traversal of ownership relations, shared by the
+    synchronous and asynchronous `traverse_objects`."""
+
+    def __init__(
+        self,
+        target: uuid.UUID | str | Object,
+        max_depth: int | None,
+        visitor: typing.Callable[[TraversalNode], bool | None] | None,
+    ):
+        if max_depth is not None and max_depth < 0:
+            raise ValueError("max_depth must not be negative")
+        self.max_depth = max_depth
+        self.visitor = visitor
+        # IDs of visited and pending objects
+        self.visited: typing.Set[uuid.UUID] = set()
+        # objects to request: target, depth and ID of the parent object
+        self.pending: typing.Deque[
+            typing.Tuple[uuid.UUID | str | Object, int, uuid.UUID | None]
+        ] = collections.deque([(target, 0, None)])
+
+    def visit(
+        self,
+        object: Object,
+        proto_object: model_resources_pb2.Object,
+        depth: int,
+        parent_id: uuid.UUID | None,
+    ) -> TraversalNode:
+        """Create the node of a received object and queue its children."""
+        node = TraversalNode(object, depth, parent_id)
+        self.visited.add(object.id)
+
+        if self.visitor is not None and self.visitor(node) is False:
+            return node
+        if self.max_depth is not None and depth >= self.max_depth:
+            return node
+
+        for proto_attribute in proto_object.attributes:
+            for proto_value in proto_attribute.values:
+                if not proto_value.HasField("ownership_relation_value"):
+                    continue
+                child_id = _from_proto_guid(
+                    proto_value.ownership_relation_value.target_object_id
+                )
+                if child_id not in self.visited:
+                    self.visited.add(child_id)
+                    self.pending.append((child_id, depth + 1, object.id))
+        return node
+
+
+async def _batched_async(
+    iterable: typing.AsyncIterable[typing.Any], batch_size: int | None
+) -> typing.AsyncIterator[typing.Any]:
+    """Asynchronous version of :py:func:`_batched`."""
+    batch = []
+    async for item in iterable:
+        if batch_size is None:
+            yield item
+            continue
+
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+_ATTRIBUTE_VALUE_FIELDS = {
+    int: "int_value",
+    float: "double_value",
+    bool: "boolean_value",
+    str: "string_value",
+}
+
+_TIMESTAMP_UNITS_PER_SECOND = {
+    "s": 1,
+    "ms": 1_000,
+    "us": 1_000_000,
+    "ns": 1_000_000_000,
+}
+
+
+def _set_proto_attribute_value(
+    proto_value: model_resources_pb2.AttributeValue, value: SIMPLE_TYPE
+) -> None:
+    field_name = _ATTRIBUTE_VALUE_FIELDS.get(type(value))
+    if field_name is not None:
+        setattr(proto_value, field_name, value)
+    elif type(value) is datetime:
+        proto_value.utc_time_value.FromDatetime(value)
+    else:
+        raise RuntimeError(
+            "Not supported value type. Supported simple types are: boolean, float, int, str, datetime."
+        )
+
+
+def _arrow_to_simple_values(
+    array: pa.Array,
+) -> Tuple[
+    List[typing.Any],
+    typing.Callable[[model_resources_pb2.AttributeValue, typing.Any], None],
+]:
+    """Convert Arrow array of simple values to Python values and a function
+    setting them in attribute values. The attribute value field is chosen
+    once for the whole array."""
+    array_type = array.type
+    if len(array) == 0:
+        # e.g. values of empty lists, without type
+        return [], _set_proto_attribute_value
+
+    if pa.types.is_timestamp(array_type):
+        units_per_second = _TIMESTAMP_UNITS_PER_SECOND[array_type.unit]
+        nanos_per_unit = 1_000_000_000 // units_per_second
+        values = [
+            divmod(value, units_per_second)
+            for value in array.cast(pa.int64()).to_pylist()
+        ]
+
+        def set_value(proto_value, value):
+            seconds, units = value
+            proto_value.utc_time_value.seconds = seconds
+            proto_value.utc_time_value.nanos = units * nanos_per_unit
+
+        return values, set_value
+
+    if pa.types.is_integer(array_type):
+        field_name = "int_value"
+    elif pa.types.is_floating(array_type):
+        field_name = "double_value"
+    elif pa.types.is_boolean(array_type):
+        field_name = "boolean_value"
+    elif pa.types.is_string(array_type) or pa.types.is_large_string(array_type):
+        field_name = "string_value"
+    else:
+        raise TypeError(f"not supported Arrow type of simple values: {array_type}")
+
+    def set_value(proto_value, value):
+        setattr(proto_value, field_name, value)
+
+    return array.to_pylist(), set_value
+
+
+def _arrow_to_targets(targets: pa.Array) -> List[uuid.UUID | str | None]:
+    """Convert Arrow array of attribute paths or IDs (16 bytes, see
+    `uuid.UUID.bytes`) to attribute targets, nulls are `None`."""
+    if isinstance(targets.type, pa.ExtensionType):
+        # e.g. UUID extension type
+        targets = targets.storage
+    if pa.types.is_string(targets.type) or pa.types.is_large_string(targets.type):
+        return targets.to_pylist()
+    if pa.types.is_fixed_size_binary(targets.type) and targets.type.byte_width == 16:
+        return [
+            uuid.UUID(bytes=target) if target is not None else None
+            for target in targets.to_pylist()
+        ]
+    raise TypeError(f"not supported Arrow type of targets: {targets.type}")
+
+
+def _arrow_to_simple_attribute_updates(
+    table: pa.Table,
+) -> Tuple[
+    List[Tuple[uuid.UUID | str, typing.Any]],
+    typing.Callable[[model_resources_pb2.AttributeValue, typing.Any], None],
+]:
+    """Convert Arrow table with `target` and `value` columns to pairs of
+    attribute target and value (or list of values for collections), and a
+    function setting the values in attribute values."""
+    missing_columns = {"target", "value"} - set(table.column_names)
+    if missing_columns:
+        raise ValueError(
+            f"Arrow table is missing columns: {', '.join(sorted(missing_columns))}"
+        )
+
+    targets = table.column("target").combine_chunks()
+    values = table.column("value").combine_chunks()
+    if targets.null_count > 0 or values.null_count > 0:
+        raise ValueError("Arrow table must not contain null targets or values")
+
+    target_ids = _arrow_to_targets(targets)
+
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if pa.types.is_list(values.type) or pa.types.is_large_list(values.type):
+        flat_values = values.flatten()
+        if flat_values.null_count > 0:
+            raise ValueError("Arrow table must not contain null targets or values")
+
+        flat_values, set_value = _arrow_to_simple_values(flat_values)
+        # offsets of a sliced array do not start at 0
+        offsets = values.offsets.to_pylist()
+        start = offsets[0]
+        values = [
+            flat_values[begin - start : end - start]
+            for begin, end in zip(offsets, offsets[1:])
+        ]
+    else:
+        values, set_value = _arrow_to_simple_values(values)
+
+    return list(zip(target_ids, values)), set_value
+
+
+_PHYSICAL_TIMESERIES_COLUMNS = (
+    "path",
+    "name",
+    "curve_type",
+    "resolution",
+    "unit_of_measurement",
+)
+
+PROVISIONED_TIMESERIES_SCHEMA = pa.schema(
+    [
+        pa.field("timeseries_key", pa.int64()),
+        pa.field("path", pa.string()),
+        pa.field("error", pa.string()),
+    ]
+)
+
+
+def _get_physical_timeseries_units(table: pa.Table) -> List[str]:
+    """Validate columns of physical time series to create and return their
+    distinct units of measurement."""
+    missing_columns = set(_PHYSICAL_TIMESERIES_COLUMNS) - set(table.column_names)
+    if missing_columns:
+        raise ValueError(
+            f"Arrow table is missing columns: {', '.join(sorted(missing_columns))}"
+        )
+    for name in _PHYSICAL_TIMESERIES_COLUMNS:
+        if table.column(name).null_count > 0:
+            raise ValueError(f"Arrow table must not contain null values of {name}")
+
+    return pc.unique(table.column("unit_of_measurement")).to_pylist()
+
+
+def _arrow_to_enum_members(
+    column: pa.ChunkedArray, enum_type: typing.Type[enum.Enum]
+) -> List[enum.Enum]:
+    """Convert Arrow column of enum member names, e.g. `HOUR`, to members."""
+    members = {}
+    for name in pc.unique(column).to_pylist():
+        try:
+            members[name] = enum_type[name]
+        except KeyError:
+            raise ValueError(
+                f"invalid {enum_type.__qualname__} '{name}' in Arrow table"
+            ) from None
+    return [members[name] for name in column.to_pylist()]
+
+
+def _get_error_message(error: Exception) -> str:
+    # `grpc.RpcError` returned by gRPC calls has the server's error details
+    details = getattr(error, "details", None)
+    if callable(details):
+        return details()
+    return str(error) or type(error).__name__
+
+
+def _to_provisioned_timeseries_table(
+    responses: List[time_series_pb2.TimeseriesResource | Exception],
+    connect_errors: typing.Dict[int, Exception],
+) -> pa.Table:
+    """Table of created time series resources or errors, per row."""
+    keys = []
+    paths = []
+    errors = []
+    for row, response in enumerate(responses):
+        if isinstance(response, Exception):
+            keys.append(None)
+            paths.append(None)
+            errors.append(_get_error_message(response))
+            continue
+
+        keys.append(response.timeseries_key)
+        paths.append(response.path)
+        error = connect_errors.get(row)
+        errors.append(_get_error_message(error) if error is not None else None)
+
+    return pa.Table.from_arrays(
+        [
+            pa.array(keys, pa.int64()),
+            pa.array(paths, pa.string()),
+            pa.array(errors, pa.string()),
+        ],
+        schema=PROVISIONED_TIMESERIES_SCHEMA,
+    )
+
 
 class Session(abc.ABC):
     class WorkerThread(threading.Thread):
@@ -112,6 +464,11 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed
         """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # record spans of all session methods while profiling, see `volue.mesh.profiling`
+        profiling._profile_public_methods(cls)
+
     def __init__(
         self,
         calc_service: calc_pb2_grpc.CalculationServiceStub,
@@ -121,6 +478,7 @@ class Session(abc.ABC):
         session_service: session_pb2_grpc.SessionServiceStub,
         time_series_service: time_series_pb2_grpc.TimeseriesServiceStub,
         session_id: uuid.UUID | None = None,
+        metadata_cache: MetadataCache | None = None,
     ):
         """
         Initialize a session object for working with the Mesh server.
@@ -133,21 +491,60 @@ class Session(abc.ABC):
             session_service: gRPC generated Mesh session service.
             time_series_service: gRPC generated Mesh time series service.
             session_id: ID of the session you are (or want to be) connected to.
+            metadata_cache: Model definition metadata cache, usually shared by
+                all sessions of a connection. If not set, the session has its
+                own cache.
         """
+        # paths of objects and attributes returned by this session, see `PathCache`
+        self.path_cache: PathCache = PathCache()
+
         self.session_id: uuid.UUID | None = session_id
-        self.calc_service: calc_pb2_grpc.CalculationServiceStub = calc_service
-        self.hydsim_service: hydsim_pb2_grpc.HydsimServiceStub = hydsim_service
-        self.model_service: model_pb2_grpc.ModelServiceStub = model_service
+        # services of requests with targets resolved by the path cache
+        self.calc_service: calc_pb2_grpc.CalculationServiceStub = (
+            self._with_path_cache_fallback(calc_service)
+        )
+        self.hydsim_service: hydsim_pb2_grpc.HydsimServiceStub = (
+            self._with_path_cache_fallback(hydsim_service)
+        )
+        self.model_service: model_pb2_grpc.ModelServiceStub = (
+            self._with_path_cache_fallback(model_service)
+        )
         self.model_definition_service: (
             model_definition_pb2_grpc.ModelDefinitionServiceStub
         ) = model_definition_service
         self.session_service: session_pb2_grpc.SessionServiceStub = session_service
         self.time_series_service: time_series_pb2_grpc.TimeseriesServiceStub = (
-            time_series_service
+            self._with_path_cache_fallback(time_series_service)
         )
 
         self.stop_worker_thread: threading.Event = threading.Event()
         self.worker_thread: Session.WorkerThread | None = None
+        # units, definitions, namespaces and tags, see `MetadataCache`
+        self.metadata_cache: MetadataCache = (
+            metadata_cache if metadata_cache is not None else MetadataCache()
+        )
+        # replaced by a cache of this session while it has uncommitted
+        # model definition changes
+        self._shared_metadata_cache: MetadataCache = self.metadata_cache
+
+    def _begin_model_definition_change(self) -> None:
+        """Cache metadata in this session until the model definition change is
+        committed or rolled back, so that other sessions do not see it."""
+        if self.metadata_cache is self._shared_metadata_cache:
+            self.metadata_cache = MetadataCache(self._shared_metadata_cache.ttl)
+        else:
+            self.metadata_cache.refresh()
+
+    def _end_model_definition_change(self, committed: bool) -> None:
+        if self.metadata_cache is not self._shared_metadata_cache:
+            self.metadata_cache = self._shared_metadata_cache
+            if committed:
+                self.metadata_cache.refresh()
+
+    def _with_path_cache_fallback(self, service):
+        if service is None:
+            return None
+        return _PathCacheFallbackStub(service, self.path_cache)
 
     @abc.abstractmethod
     def open(self) -> None:
@@ -250,12 +647,101 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def list_units_of_measurement(self) -> List[UnitOfMeasurement]:
+        """
+        List all units of measurement defined in Mesh.
+
+        The result is cached in :py:attr:`metadata_cache`, shared by all
+        sessions of the connection.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def list_tags(self, target: uuid.UUID | str) -> List[Tag]:
+        """
+        List all tags of a model definition.
+
+        The result is cached in :py:attr:`metadata_cache`, shared by all
+        sessions of the connection.
+
+        Args:
+            target: Model definition. It could be a Universal Unique Identifier
+                or a path, e.g. `Repository/SimpleThermalTestRepository`.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def search_namespaces(
+        self, target: uuid.UUID | str, recursive: bool = False
+    ) -> List[Namespace]:
+        """
+        Search for namespaces owned by a namespace or a model definition.
+
+        The result is cached in :py:attr:`metadata_cache`, shared by all
+        sessions of the connection.
+
+        Args:
+            target: Owner namespace or model definition. It could be a
+                Universal Unique Identifier or a path.
+            recursive: If set, namespaces owned by child namespaces are
+                also included, otherwise only direct children are returned.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def search_object_definitions(
+        self, target: uuid.UUID | str, recursive: bool = False
+    ) -> List[ObjectDefinition]:
+        """
+        Search for object definitions with their attribute definitions
+        owned by a namespace or a model definition.
+
+        The result is cached in :py:attr:`metadata_cache`, shared by all
+        sessions of the connection.
+
+        Args:
+            target: Owner namespace or model definition. It could be a
+                Universal Unique Identifier or a path.
+            recursive: If set, object definitions from child namespaces are
+                also included, otherwise only direct children are returned.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def search_attribute_definitions(
+        self, target: uuid.UUID | str
+    ) -> List[AttributeBase.AttributeBaseDefinition]:
+        """
+        Search for all attribute definitions of an attribute type.
+
+        The result is cached in :py:attr:`metadata_cache`, shared by all
+        sessions of the connection. Returned definitions are copies of the
+        cached ones.
+
+        Args:
+            target: Attribute type. It could be a Universal Unique Identifier
+                or a path.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
     @abc.abstractmethod
     def get_object(
         self,
         target: uuid.UUID | str | Object,
         full_attribute_info: bool = False,
         attributes_filter: AttributesFilter | None = None,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> Object:
         """
         Request information associated with a Mesh object from the Mesh model.
@@ -270,8 +756,15 @@ class Session(abc.ABC):
                 path, ID and value(s).
             attributes_filter: Filtering criteria for what attributes owned by
                 object should be returned. By default all attributes are returned.
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, paths of fields of the Mesh protobuf `Attribute`
+                message, e.g. `["id", "values.timeseries_value.time_series_resource.timeseries_key"]`.
+                Attribute name, value type and value type collection flag are
+                always returned. Fields not returned have empty or `None`
+                values. Cannot be used with `full_attribute_info`.
 
         Raises:
+            ValueError: Invalid `attribute_fields`.
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
@@ -282,6 +775,7 @@ class Session(abc.ABC):
         query: str,
         full_attribute_info: bool = False,
         attributes_filter: AttributesFilter | None = None,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> List[Object]:
         """
         Use the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__
@@ -297,8 +791,255 @@ class Session(abc.ABC):
                 path, ID and value(s).
             attributes_filter: Filtering criteria for what attributes owned by
                 object(s) should be returned. By default all attributes are returned.
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, paths of fields of the Mesh protobuf `Attribute`
+                message, e.g. `["id", "values.timeseries_value.time_series_resource.timeseries_key"]`.
+                Attribute name, value type and value type collection flag are
+                always returned. Fields not returned have empty or `None`
+                values. Cannot be used with `full_attribute_info`.
+
+        Raises:
+            ValueError: Invalid `attribute_fields`.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def iter_objects(
+        self,
+        target: uuid.UUID | str | Object,
+        query: str,
+        full_attribute_info: bool = False,
+        attributes_filter: AttributesFilter | None = None,
+        batch_size: int | None = None,
+        attribute_fields: typing.Sequence[str] | None = None,
+    ) -> (
+        typing.Iterator[Object | List[Object]]
+        | typing.AsyncIterator[Object | List[Object]]
+    ):
+        """
+        Like :py:meth:`search_for_objects`, but yields objects as they are
+        received from the Mesh server instead of collecting all of them first.
+        For large searches this shortens the time to the first result and
+        keeps memory usage independent of the number of found objects.
+
+        Args:
+            target: Start searching at the target object. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: A search formulated using the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of attributes owned by the object(s) will be returned, otherwise only name,
+                path, ID and value(s).
+            attributes_filter: Filtering criteria for what attributes owned by
+                object(s) should be returned. By default all attributes are returned.
+            batch_size: If set, lists of up to `batch_size` objects are
+                yielded instead of single objects.
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, paths of fields of the Mesh protobuf `Attribute`
+                message, e.g. `["id", "values.timeseries_value.time_series_resource.timeseries_key"]`.
+                Attribute name, value type and value type collection flag are
+                always returned. Fields not returned have empty or `None`
+                values. Cannot be used with `full_attribute_info`.
+
+        Returns:
+            An iterator (or asynchronous iterator for `volue.mesh.aio`) of
+            objects, or of lists of objects if `batch_size` is set.
 
         Raises:
+            ValueError: Invalid `attribute_fields` or `batch_size` is less than 1.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def iter_objects_by_definition(
+        self,
+        target: uuid.UUID | str,
+        ids_only: bool = False,
+        full_attribute_info: bool = False,
+        attributes_filter: AttributesFilter | None = None,
+        batch_size: int | None = None,
+        attribute_fields: typing.Sequence[str] | None = None,
+    ) -> (
+        typing.Iterator[Object | uuid.UUID | List[Object | uuid.UUID]]
+        | typing.AsyncIterator[Object | uuid.UUID | List[Object | uuid.UUID]]
+    ):
+        """
+        Find all Mesh objects of a given object definition (object type), e.g.
+        all `HydroPlant` objects. The search is done by the Mesh server and
+        objects are yielded as they are received.
+
+        Args:
+            target: Object definition. It could be a Universal Unique Identifier
+                or a path, e.g.: `Repository/SimpleThermalTestRepository/PlantElementType`.
+            ids_only: If set then only IDs of the objects are returned.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of attributes owned by the object(s) will be returned, otherwise only name,
+                path, ID and value(s).
+            attributes_filter: Filtering criteria for what attributes owned by
+                object(s) should be returned. By default all attributes are returned.
+            batch_size: If set, lists of up to `batch_size` objects are
+                yielded instead of single objects.
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, see :py:meth:`search_for_objects`.
+
+        Returns:
+            An iterator (or asynchronous iterator for `volue.mesh.aio`) of
+            objects or object IDs if `ids_only` is set, or of lists of them
+            if `batch_size` is set.
+
+        Raises:
+            ValueError: Invalid `attribute_fields`, `batch_size` is less than 1
+                or attribute options are used with `ids_only`.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def search_simple_attributes_table(
+        self,
+        target: uuid.UUID | str | Object,
+        query: str,
+        attribute_names: typing.Sequence[str],
+    ) -> pa.Table:
+        """
+        Use the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__
+        to find Mesh objects and return values of their simple attributes
+        as an Arrow table, e.g. all reservoirs with their `HRWL`, `LRWL` and
+        `Volume` attributes.
+
+        Only the given attributes are requested from Mesh and the table is
+        built directly from the received messages, without creating
+        :py:class:`volue.mesh.Object` and :py:class:`volue.mesh.SimpleAttribute`
+        instances.
+
+        The table has one row per found object with `object_id` column of
+        object IDs (strings, see `str(uuid.UUID)`), `object_path` column and
+        one column per attribute name. Attribute columns are typed according
+        to the attribute value type, collection attributes are list columns
+        and UTC times are timestamps with UTC time zone. Objects without an
+        attribute have null values.
+
+        Args:
+            target: Start searching at the target object. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: A search formulated using the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__.
+            attribute_names: Names of simple attributes, i.e. the table columns.
+
+        Raises:
+            ValueError: `attribute_names` is empty, an attribute is not a
+                simple attribute or has different value types in found
+                objects.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def search_simple_attributes_table_by_definition(
+        self,
+        target: uuid.UUID | str,
+        attribute_names: typing.Sequence[str],
+    ) -> pa.Table:
+        """
+        Like :py:meth:`search_simple_attributes_table`, but for all Mesh
+        objects of a given object definition (object type), see
+        :py:meth:`iter_objects_by_definition`.
+
+        Args:
+            target: Object definition. It could be a Universal Unique Identifier
+                or a path, e.g.: `Repository/SimpleThermalTestRepository/PlantElementType`.
+            attribute_names: Names of simple attributes, i.e. the table columns.
+
+        Raises:
+            ValueError: `attribute_names` is empty, an attribute is not a
+                simple attribute or has different value types in found
+                objects.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def iter_linked_from(
+        self,
+        target: uuid.UUID | str | Object,
+        ids_only: bool = False,
+        full_attribute_info: bool = False,
+        batch_size: int | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_READS,
+    ) -> (
+        typing.Iterator[
+            LinkRelationAttribute | uuid.UUID | List[LinkRelationAttribute | uuid.UUID]
+        ]
+        | typing.AsyncIterator[
+            LinkRelationAttribute | uuid.UUID | List[LinkRelationAttribute | uuid.UUID]
+        ]
+    ):
+        """
+        Find all link relation attributes pointing to a given Mesh object.
+        The search is done by the Mesh server. Owners of the found link
+        relation attributes are the objects linking to the target object.
+
+        Args:
+            target: Target object of the link relations. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            ids_only: If set then only IDs of the link relation attributes are
+                returned. Otherwise the found attributes are requested from
+                the Mesh server like in :py:meth:`get_attributes`.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of the attributes will be returned, otherwise only name,
+                path, ID and value(s).
+            batch_size: If set, lists of up to `batch_size` attributes are
+                yielded instead of single attributes.
+            max_concurrency: Maximum number of attribute requests in flight.
+
+        Returns:
+            An iterator (or asynchronous iterator for `volue.mesh.aio`) of
+            link relation attributes or their IDs if `ids_only` is set, or of
+            lists of them if `batch_size` is set.
+
+        Raises:
+            ValueError: `batch_size` or `max_concurrency` is less than 1.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def traverse_objects(
+        self,
+        target: uuid.UUID | str | Object,
+        max_depth: int | None = None,
+        full_attribute_info: bool = False,
+        attributes_filter: AttributesFilter | None = None,
+        visitor: typing.Callable[[TraversalNode], bool | None] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_READS,
+    ) -> typing.Iterator[TraversalNode] | typing.AsyncIterator[TraversalNode]:
+        """
+        Traverse the Mesh model breadth-first along ownership relations,
+        starting at the target object. Instead of requesting one object at a
+        time, up to `max_concurrency` objects are requested from the Mesh
+        server concurrently, so traversing large models over high latency
+        links takes a fraction of the time.
+
+        Each object is requested and yielded once, in breadth-first order,
+        as soon as it and the objects before it are received.
+
+        Args:
+            target: Start object, e.g. a model. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            max_depth: If set, objects deeper than `max_depth` ownership
+                relations from the start object are not requested.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of attributes owned by the objects will be returned, otherwise only name,
+                path, ID and value(s).
+            attributes_filter: Filtering criteria for what attributes owned by
+                objects should be returned. Only returned ownership relation
+                attributes are followed, so e.g. a name mask also limits
+                which relations are traversed.
+            visitor: Called for each object before its children are
+                requested. If it returns `False`, the children of the object
+                are not traversed, the object itself is still yielded.
+            max_concurrency: Maximum number of objects requested concurrently.
+
+        Returns:
+            An iterator (or asynchronous iterator for `volue.mesh.aio`) of
+            traversed objects with their depth and parent object ID.
+
+        Raises:
+            ValueError: `max_depth` is negative or `max_concurrency` is less than 1.
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
@@ -331,6 +1072,40 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def clone_object(
+        self,
+        target: uuid.UUID | str | Object,
+        new_name: str,
+        new_owner: uuid.UUID | str | Object | AttributeBase | None = None,
+        timeseries_copy_mode: TimeseriesCopyMode = TimeseriesCopyMode.ALL,
+    ) -> Object:
+        """
+        Recursively clone a Mesh object with all its child objects in a single
+        call to the Mesh server.
+
+        Links to objects outside of the cloned hierarchy are preserved and
+        links between cloned objects are updated to point to the clones.
+        Incoming links from other objects are not cloned.
+
+        Args:
+            target: Mesh object to be cloned. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            new_name: Name of the cloned object. Must be unique in the new owner.
+            new_owner: Object or ownership relation attribute that will own
+                the cloned object. If not set, the clone is created as
+                a sibling of the source object. Must not be set when cloning
+                a model.
+            timeseries_copy_mode: Defines how time series connections of
+                cloned attributes are handled.
+
+        Returns:
+            The root object of the cloned hierarchy.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
     @abc.abstractmethod
     def update_object(
         self,
@@ -399,6 +1174,34 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def get_attributes(
+        self,
+        targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+        full_attribute_info: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_READS,
+    ) -> List[AttributeBase]:
+        """
+        Request information associated with many Mesh attributes from the
+        Mesh `model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`_.
+
+        Like :py:meth:`get_attribute`, but requests are sent without waiting
+        for the responses of the previous ones.
+
+        Args:
+            targets: Mesh attributes to be read. See :py:meth:`get_attribute`.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of attributes will be returned, otherwise only name, path, ID and value(s).
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            Attributes in the order of `targets`.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+            ValueError: Raised if `max_concurrency` is less than 1.
+        """
+
     @abc.abstractmethod
     def get_timeseries_attribute(
         self,
@@ -428,6 +1231,7 @@ class Session(abc.ABC):
         target: uuid.UUID | str | Object,
         query: str,
         full_attribute_info: bool = False,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> List[AttributeBase]:
         """
         Use the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__
@@ -442,8 +1246,57 @@ class Session(abc.ABC):
             full_attribute_info: If set then all information (e.g. description, value type, etc.)
                 of attributes owned by the object(s) will be returned, otherwise only name,
                 path, ID and value(s).
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, paths of fields of the Mesh protobuf `Attribute`
+                message, e.g. `["id", "values.timeseries_value.time_series_resource.timeseries_key"]`.
+                Value type and value type collection flag are always
+                returned. Fields not returned have empty or `None` values.
+                Cannot be used with `full_attribute_info`.
 
         Raises:
+            ValueError: Invalid `attribute_fields`.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def iter_attributes(
+        self,
+        target: uuid.UUID | str | Object,
+        query: str,
+        full_attribute_info: bool = False,
+        batch_size: int | None = None,
+        attribute_fields: typing.Sequence[str] | None = None,
+    ) -> (
+        typing.Iterator[AttributeBase | List[AttributeBase]]
+        | typing.AsyncIterator[AttributeBase | List[AttributeBase]]
+    ):
+        """
+        Like :py:meth:`search_for_attributes`, but yields attributes as they
+        are received from the Mesh server instead of collecting all of them
+        first.
+
+        Args:
+            target: Start searching at the target object. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: A search formulated using the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__.
+            full_attribute_info: If set then all information (e.g. description, value type, etc.)
+                of attributes owned by the object(s) will be returned, otherwise only name,
+                path, ID and value(s).
+            batch_size: If set, lists of up to `batch_size` attributes are
+                yielded instead of single attributes.
+            attribute_fields: Explicit projection of attribute fields to be
+                returned, paths of fields of the Mesh protobuf `Attribute`
+                message, e.g. `["id", "values.timeseries_value.time_series_resource.timeseries_key"]`.
+                Value type and value type collection flag are always
+                returned. Fields not returned have empty or `None` values.
+                Cannot be used with `full_attribute_info`.
+
+        Returns:
+            An iterator (or asynchronous iterator for `volue.mesh.aio`) of
+            attributes, or of lists of attributes if `batch_size` is set.
+
+        Raises:
+            ValueError: Invalid `attribute_fields` or `batch_size` is less than 1.
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
@@ -498,6 +1351,48 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def update_simple_attributes(
+        self,
+        values: (
+            typing.Mapping[uuid.UUID | str | AttributeBase, SIMPLE_TYPE_OR_COLLECTION]
+            | typing.Iterable[
+                Tuple[uuid.UUID | str | AttributeBase, SIMPLE_TYPE_OR_COLLECTION]
+            ]
+            | pa.Table
+        ),
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+    ) -> List[SimpleAttributeUpdateFailure]:
+        """
+        Update values of many existing Mesh simple attributes in the Mesh
+        model. All requests are prepared first and then up to
+        `max_concurrency` of them are sent to the Mesh server concurrently.
+
+        Unlike :py:meth:`update_simple_attribute` a failed update does not
+        stop the other updates, all failures are returned instead.
+
+        Args:
+            values: New simple attribute values, see
+                :py:meth:`update_simple_attribute`. Either a mapping or pairs
+                of attribute (ID, path or instance) and value, or an Arrow
+                table with `target` column of attribute paths (string) or IDs
+                (16 bytes fixed size binary) and `value` column of integer,
+                floating point, boolean, string or timestamp type, or a list
+                of one of those types for collection attributes. Values of an
+                Arrow table are converted column by column, timestamps without
+                time zone are in UTC.
+            max_concurrency: Maximum number of updates sent concurrently.
+
+        Returns:
+            Failed updates ordered by their position in `values`, empty if
+            all attributes were updated.
+
+        Raises:
+            ValueError: `max_concurrency` is less than 1 or the Arrow table
+                has missing columns or null values.
+            TypeError: Not supported Arrow column type.
+        """
+
     @abc.abstractmethod
     def update_timeseries_attribute(
         self,
@@ -642,6 +1537,121 @@ class Session(abc.ABC):
             `Mesh documentation <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/relations/>`__
         """
 
+    @abc.abstractmethod
+    def update_link_relation_attributes(
+        self,
+        updates: typing.Iterable[LinkRelationUpdate | VersionedLinkRelationUpdate],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+    ) -> None:
+        """
+        Update many link relation attributes, versioned or not, in the Mesh
+        model. Instead of waiting for each update before sending the next one,
+        up to `max_concurrency` updates are sent to the Mesh server
+        concurrently. Use it e.g. to rewire a topology of many objects.
+
+        All requests are prepared before the first one is sent, so invalid
+        arguments do not leave the model partially updated.
+
+        Args:
+            updates: Link relation updates, see
+                :py:class:`volue.mesh.LinkRelationUpdate` and
+                :py:class:`volue.mesh.VersionedLinkRelationUpdate`. Each
+                attribute should be updated at most once, the order in which
+                the updates are applied is not defined.
+            max_concurrency: Maximum number of updates sent concurrently.
+
+        Raises:
+            ValueError: `max_concurrency` is less than 1.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+                No more updates are sent after the first failed one. Updates
+                already sent may have been applied, use :py:meth:`rollback`
+                to discard them.
+
+        See Also:
+            `Mesh documentation <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/relations/>`__
+        """
+
+    @abc.abstractmethod
+    def copy_timeseries_between_objects(
+        self,
+        source: uuid.UUID | str | Object,
+        target: uuid.UUID | str | Object,
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        scenario_name: str | None = None,
+        mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+    ) -> CopyTimeseriesResult:
+        """
+        Copy time series points from time series attributes in the source
+        object hierarchy to time series attributes in the target object
+        hierarchy. The points are copied by the Mesh server and are not
+        transferred to the client.
+
+        Without `mappings`, source and target time series attributes are
+        matched by their paths relative to `source` and `target`, and all
+        matching time series are copied. With `mappings`, only the given
+        attributes are copied, possibly to attributes with different names or
+        found by a search. Source and target may then be the same object.
+
+        For information about `datetime` arguments and time zones refer to
+        :ref:`mesh_client:Date times and time zones`.
+
+        Args:
+            source: Root object of the source hierarchy. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            target: Root object of the target hierarchy. It could be a Universal Unique Identifier
+                or a path in the `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            start_time: the start date and time of the copied interval
+            end_time: the end date and time of the copied interval. If
+                neither `start_time` nor `end_time` is set, nothing is copied,
+                but the returned counts show what would be copied.
+            scenario_name: If set, only time series from the scenario object
+                with this name are copied, i.e. an object with this name owned
+                by an object of type with name ending with `Scenario`.
+            mappings: Mappings of copied time series attributes.
+
+        Raises:
+            ValueError: Only one of `start_time` and `end_time` is set or
+                an attribute mapping is invalid.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
+    @abc.abstractmethod
+    def copy_timeseries_between_object_pairs(
+        self,
+        pairs: typing.Iterable[
+            Tuple[uuid.UUID | str | Object, uuid.UUID | str | Object]
+        ],
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        scenario_name: str | None = None,
+        mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+    ) -> List[CopyTimeseriesResult]:
+        """
+        Bulk form of :py:meth:`copy_timeseries_between_objects`. Copies time
+        series points for each (source, target) pair, e.g. seeds many
+        scenarios from a base case, with the same interval, scenario name and
+        mappings.
+
+        All requests are prepared before the first one is sent. Then up to
+        `max_concurrency` pairs are copied concurrently. The first failed
+        request stops sending further requests and cancels the ones in
+        flight, pairs copied before are not rolled back.
+
+        Args:
+            max_concurrency: Maximum number of requests sent concurrently.
+
+        Returns:
+            Results in the order of `pairs`.
+
+        Raises:
+            ValueError: Only one of `start_time` and `end_time` is set,
+                an attribute mapping is invalid or `max_concurrency` is less
+                than 1.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+
     @abc.abstractmethod
     def get_timeseries_resource_info(self, timeseries_key: int) -> TimeseriesResource:
         """
@@ -725,6 +1735,56 @@ class Session(abc.ABC):
             grpc.RpcError: Error message raised if the gRPC request could not be completed.
         """
 
+    @abc.abstractmethod
+    def provision_physical_timeseries(
+        self,
+        timeseries: pa.Table,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_UPDATES,
+    ) -> pa.Table:
+        """
+        Create many physical time series and optionally connect each of them
+        to a time series attribute, e.g. when onboarding a new asset
+        portfolio.
+
+        Units of measurement are resolved once for all time series and all
+        requests are prepared before the first one is sent. Then up to
+        `max_concurrency` time series are created concurrently, followed by
+        concurrent updates of the time series attributes to connect.
+
+        A failed request does not stop the others. Failures are reported in
+        the returned table.
+
+        Args:
+            timeseries: Arrow table with one row per time series to create
+                and columns:
+
+                - `path`, `name`: see :py:meth:`create_physical_timeseries`,
+                - `curve_type`: name of a :py:class:`volue.mesh.Timeseries.Curve`, e.g. `PIECEWISELINEAR`,
+                - `resolution`: name of a :py:class:`volue.mesh.Timeseries.Resolution`, e.g. `HOUR`,
+                - `unit_of_measurement`: name of an existing unit in Mesh,
+                - `time_zone` (optional): IANA time zone name, null or empty for time zone naive time series,
+                - `target` (optional): time series attribute path or ID (16 bytes, see `uuid.UUID.bytes`)
+                  to connect the new time series to, null for time series not to connect.
+
+            max_concurrency: Maximum number of requests sent concurrently.
+
+        Returns:
+            Arrow table with one row per row of `timeseries` and columns
+            `timeseries_key` and `path` of the created time series resources,
+            and `error`. `error` is null if the time series was created and,
+            if requested, connected. If creating fails, `timeseries_key` and
+            `path` are null. If connecting fails, the time series exists but is
+            not connected.
+
+        Raises:
+            ValueError: Missing columns, null values in required columns,
+                invalid curve type, resolution or unit of measurement, or
+                `max_concurrency` is less than 1.
+            TypeError: Not supported Arrow type of `target` column.
+            grpc.RpcError: Error message raised if the units of measurement
+                could not be listed.
+        """
+
     @abc.abstractmethod
     def forecast_functions(
         self,
@@ -1103,7 +2163,7 @@ class Session(abc.ABC):
 
         request = model_pb2.GetXySetsRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             interval=interval,
             versions_only=versions_only,
         )
@@ -1169,7 +2229,7 @@ class Session(abc.ABC):
 
         request = model_pb2.UpdateXySetsRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             interval=interval,
             xy_sets=xy_sets,
         )
@@ -1190,7 +2250,7 @@ class Session(abc.ABC):
 
         request = time_series_pb2.ReadTimeseriesRequest(
             session_id=_to_proto_guid(self.session_id),
-            timeseries_id=_to_proto_read_timeseries_mesh_id(target),
+            timeseries_id=_to_proto_read_timeseries_mesh_id(target, self.path_cache),
             interval=_to_proto_utcinterval(start_time, end_time),
         )
 
@@ -1205,6 +2265,33 @@ class Session(abc.ABC):
 
         yield timeseries[0]
 
+    def _prepare_copy_timeseries_between_objects_request(
+        self,
+        source: uuid.UUID | str | Object,
+        target: uuid.UUID | str | Object,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        scenario_name: str | None,
+        mappings: typing.Sequence[TypeAttributeMapping] | None,
+    ) -> time_series_pb2.CopyTimeseriesBetweenObjectsRequest:
+        """Create a gRPC `CopyTimeseriesBetweenObjectsRequest`"""
+
+        if (start_time is None) != (end_time is None):
+            raise ValueError(
+                "either both or none of start_time and end_time must be set"
+            )
+
+        request = time_series_pb2.CopyTimeseriesBetweenObjectsRequest(
+            session_id=_to_proto_guid(self.session_id),
+            source=_to_proto_object_mesh_id(source, self.path_cache),
+            target=_to_proto_object_mesh_id(target, self.path_cache),
+            scenario_name=scenario_name or "",
+            mappings=_to_proto_type_attribute_mappings(mappings),
+        )
+        if start_time is not None:
+            request.interval.CopyFrom(_to_proto_utcinterval(start_time, end_time))
+        return request
+
     def _prepare_write_timeseries_points_request(
         self, timeseries: Timeseries
     ) -> time_series_pb2.WriteTimeseriesRequest:
@@ -1243,15 +2330,20 @@ class Session(abc.ABC):
         target: uuid.UUID | str | Object,
         full_attribute_info: bool,
         attributes_filter: AttributesFilter | None,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> model_pb2.GetObjectRequest:
         """Create a gRPC `GetObjectRequest`"""
 
         request = model_pb2.GetObjectRequest(
             session_id=_to_proto_guid(self.session_id),
-            object_id=_to_proto_object_mesh_id(target),
+            object_id=_to_proto_object_mesh_id(target, self.path_cache),
             attributes_masks=_to_proto_attribute_masks(attributes_filter),
             attribute_field_mask=_to_proto_attribute_field_mask(
-                full_attribute_info, attributes_filter
+                full_attribute_info,
+                attributes_filter,
+                attribute_fields,
+                # attributes of an object are identified by name
+                required_fields=("name",),
             ),
             object_field_mask=_object_to_proto_field_mask(attributes_filter),
         )
@@ -1263,21 +2355,77 @@ class Session(abc.ABC):
         query: str,
         full_attribute_info: bool,
         attributes_filter: AttributesFilter | None,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> model_pb2.SearchObjectsRequest:
         """Create a gRPC `SearchObjectsRequest`"""
 
         request = model_pb2.SearchObjectsRequest(
             session_id=_to_proto_guid(self.session_id),
-            start_object_id=_to_proto_object_mesh_id(target),
+            start_object_id=_to_proto_object_mesh_id(target, self.path_cache),
             attributes_masks=_to_proto_attribute_masks(attributes_filter),
             attribute_field_mask=_to_proto_attribute_field_mask(
-                full_attribute_info, attributes_filter
+                full_attribute_info,
+                attributes_filter,
+                attribute_fields,
+                # attributes of an object are identified by name
+                required_fields=("name",),
             ),
             object_field_mask=_object_to_proto_field_mask(attributes_filter),
             query=query,
         )
         return request
 
+    def _prepare_search_objects_by_definition_request(
+        self,
+        target: uuid.UUID | str,
+        ids_only: bool,
+        full_attribute_info: bool,
+        attributes_filter: AttributesFilter | None,
+        attribute_fields: typing.Sequence[str] | None,
+    ) -> model_pb2.SearchObjectsByDefinitionRequest:
+        """Create a gRPC `SearchObjectsByDefinitionRequest`"""
+
+        if ids_only:
+            if (
+                full_attribute_info
+                or attributes_filter is not None
+                or attribute_fields is not None
+            ):
+                raise ValueError(
+                    "ids_only cannot be used with full_attribute_info, "
+                    "attributes_filter or attribute_fields"
+                )
+            return model_pb2.SearchObjectsByDefinitionRequest(
+                session_id=_to_proto_guid(self.session_id),
+                object_definition_id=_to_proto_object_definition_mesh_id(target),
+                object_field_mask=protobuf.field_mask_pb2.FieldMask(paths=["id"]),
+            )
+
+        request = model_pb2.SearchObjectsByDefinitionRequest(
+            session_id=_to_proto_guid(self.session_id),
+            object_definition_id=_to_proto_object_definition_mesh_id(target),
+            attributes_masks=_to_proto_attribute_masks(attributes_filter),
+            attribute_field_mask=_to_proto_attribute_field_mask(
+                full_attribute_info,
+                attributes_filter,
+                attribute_fields,
+                # attributes of an object are identified by name
+                required_fields=("name",),
+            ),
+            object_field_mask=_object_to_proto_field_mask(attributes_filter),
+        )
+        return request
+
+    def _prepare_search_linked_from_request(
+        self, target: uuid.UUID | str | Object
+    ) -> model_pb2.SearchLinkedFromRequest:
+        """Create a gRPC `SearchLinkedFromRequest`"""
+
+        return model_pb2.SearchLinkedFromRequest(
+            session_id=_to_proto_guid(self.session_id),
+            target_object_id=_to_proto_object_mesh_id(target, self.path_cache),
+        )
+
     def _prepare_create_object_request(
         self, target: uuid.UUID | str | AttributeBase, name: str
     ) -> model_pb2.CreateObjectRequest:
@@ -1285,11 +2433,32 @@ class Session(abc.ABC):
 
         request = model_pb2.CreateObjectRequest(
             session_id=_to_proto_guid(self.session_id),
-            owner_id=_to_proto_attribute_mesh_id(target),
+            owner_id=_to_proto_attribute_mesh_id(target, self.path_cache),
             name=name,
         )
         return request
 
+    def _prepare_clone_object_request(
+        self,
+        target: uuid.UUID | str | Object,
+        new_name: str,
+        new_owner: uuid.UUID | str | Object | AttributeBase | None,
+        timeseries_copy_mode: TimeseriesCopyMode,
+    ) -> model_pb2.CloneObjectRequest:
+        """Create a gRPC `CloneObjectRequest`"""
+
+        request = model_pb2.CloneObjectRequest(
+            session_id=_to_proto_guid(self.session_id),
+            source_object_id=_to_proto_object_mesh_id(target, self.path_cache),
+            new_object_name=new_name,
+            timeseries_copy_mode=timeseries_copy_mode.value,
+        )
+        if new_owner is not None:
+            request.new_owner_id.CopyFrom(
+                _to_proto_owner_mesh_id(new_owner, self.path_cache)
+            )
+        return request
+
     def _prepare_update_object_request(
         self,
         target: uuid.UUID | str | Object,
@@ -1300,7 +2469,7 @@ class Session(abc.ABC):
 
         request = model_pb2.UpdateObjectRequest(
             session_id=_to_proto_guid(self.session_id),
-            object_id=_to_proto_object_mesh_id(target),
+            object_id=_to_proto_object_mesh_id(target, self.path_cache),
         )
 
         fields_to_update = []
@@ -1308,7 +2477,9 @@ class Session(abc.ABC):
         # providing new owner is optional
         if new_owner_attribute is not None:
             try:
-                new_owner_mesh_id = _to_proto_attribute_mesh_id(new_owner_attribute)
+                new_owner_mesh_id = _to_proto_attribute_mesh_id(
+                    new_owner_attribute, self.path_cache
+                )
             except TypeError as e:
                 # Wrap the error so that the user can distinguish what
                 # MeshId is wrong: target or new_owner_attribute.
@@ -1334,7 +2505,7 @@ class Session(abc.ABC):
 
         request = model_pb2.DeleteObjectRequest(
             session_id=_to_proto_guid(self.session_id),
-            object_id=_to_proto_object_mesh_id(target),
+            object_id=_to_proto_object_mesh_id(target, self.path_cache),
             recursive_delete=recursive_delete,
         )
         return request
@@ -1344,7 +2515,7 @@ class Session(abc.ABC):
     ) -> model_pb2.GetAttributeRequest:
         request = model_pb2.GetAttributeRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute_id=_to_proto_attribute_mesh_id(target),
+            attribute_id=_to_proto_attribute_mesh_id(target, self.path_cache),
             field_mask=_to_proto_attribute_field_mask(full_attribute_info),
         )
         return request
@@ -1354,12 +2525,15 @@ class Session(abc.ABC):
         target: uuid.UUID | str | Object,
         query: str,
         full_attribute_info: bool,
+        attribute_fields: typing.Sequence[str] | None = None,
     ) -> model_pb2.SearchAttributesRequest:
         request = model_pb2.SearchAttributesRequest(
             session_id=_to_proto_guid(self.session_id),
-            start_object_id=_to_proto_object_mesh_id(target),
+            start_object_id=_to_proto_object_mesh_id(target, self.path_cache),
             query=query,
-            field_mask=_to_proto_attribute_field_mask(full_attribute_info),
+            field_mask=_to_proto_attribute_field_mask(
+                full_attribute_info, attribute_fields=attribute_fields
+            ),
         )
         return request
 
@@ -1370,7 +2544,7 @@ class Session(abc.ABC):
     ) -> model_pb2.UpdateSimpleAttributeRequest:
         request = model_pb2.UpdateSimpleAttributeRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute_id=_to_proto_attribute_mesh_id(target),
+            attribute_id=_to_proto_attribute_mesh_id(target, self.path_cache),
         )
 
         (
@@ -1387,6 +2561,63 @@ class Session(abc.ABC):
 
         return request
 
+    def _prepare_update_simple_attributes_requests(
+        self,
+        values: (
+            typing.Mapping[uuid.UUID | str | AttributeBase, SIMPLE_TYPE_OR_COLLECTION]
+            | typing.Iterable[
+                Tuple[uuid.UUID | str | AttributeBase, SIMPLE_TYPE_OR_COLLECTION]
+            ]
+            | pa.Table
+        ),
+    ) -> Tuple[
+        List[
+            Tuple[
+                int,
+                uuid.UUID | str | AttributeBase,
+                model_pb2.UpdateSimpleAttributeRequest,
+            ]
+        ],
+        List[SimpleAttributeUpdateFailure],
+    ]:
+        """
+        Prepare requests with their positions and targets. Updates that could
+        not be prepared are returned as failures.
+        """
+        if isinstance(values, pa.Table):
+            updates, set_value = _arrow_to_simple_attribute_updates(values)
+        else:
+            updates = (
+                values.items()
+                if isinstance(values, collections.abc.Mapping)
+                else values
+            )
+            set_value = _set_proto_attribute_value
+
+        session_id = _to_proto_guid(self.session_id)
+        requests = []
+        failures = []
+        for index, (target, value) in enumerate(updates):
+            # fields are set in place, without building and copying messages
+            request = model_pb2.UpdateSimpleAttributeRequest()
+            try:
+                request.attribute_id.CopyFrom(
+                    _to_proto_attribute_mesh_id(target, self.path_cache)
+                )
+                if type(value) is list:
+                    for v in value:
+                        set_value(request.new_collection_values.add(), v)
+                else:
+                    set_value(request.new_singular_value, value)
+            except (TypeError, ValueError, RuntimeError) as e:
+                failures.append(SimpleAttributeUpdateFailure(index, target, e))
+                continue
+
+            request.session_id.CopyFrom(session_id)
+            requests.append((index, target, request))
+
+        return requests, failures
+
     def _prepare_update_timeseries_attribute_request(
         self,
         target: uuid.UUID | str | AttributeBase,
@@ -1395,7 +2626,7 @@ class Session(abc.ABC):
     ) -> model_pb2.UpdateTimeseriesAttributeRequest:
         request = model_pb2.UpdateTimeseriesAttributeRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute_id=_to_proto_attribute_mesh_id(target),
+            attribute_id=_to_proto_attribute_mesh_id(target, self.path_cache),
         )
 
         fields_to_update = []
@@ -1437,6 +2668,47 @@ class Session(abc.ABC):
         )
         return request
 
+    def _prepare_list_units_of_measurement_request(
+        self,
+    ) -> model_definition_pb2.ListUnitsOfMeasurementRequest:
+        return model_definition_pb2.ListUnitsOfMeasurementRequest(
+            session_id=_to_proto_guid(self.session_id)
+        )
+
+    def _prepare_list_tags_request(
+        self, target: uuid.UUID | str
+    ) -> model_definition_pb2.ListTagsRequest:
+        return model_definition_pb2.ListTagsRequest(
+            session_id=_to_proto_guid(self.session_id),
+            model_definition=_to_proto_model_definition_mesh_id(target),
+        )
+
+    def _prepare_search_namespaces_request(
+        self, target: uuid.UUID | str, recursive: bool
+    ) -> model_definition_pb2.SearchNamespacesRequest:
+        return model_definition_pb2.SearchNamespacesRequest(
+            session_id=_to_proto_guid(self.session_id),
+            name_space_id=_to_proto_model_definition_mesh_id(target),
+            recursive_search=recursive,
+        )
+
+    def _prepare_search_object_definitions_request(
+        self, target: uuid.UUID | str, recursive: bool
+    ) -> model_definition_pb2.SearchObjectDefinitionsRequest:
+        return model_definition_pb2.SearchObjectDefinitionsRequest(
+            session_id=_to_proto_guid(self.session_id),
+            name_space_id=_to_proto_model_definition_mesh_id(target),
+            recursive_search=recursive,
+        )
+
+    def _prepare_search_attribute_definitions_request(
+        self, target: uuid.UUID | str
+    ) -> model_definition_pb2.SearchAttributeDefinitionsRequest:
+        return model_definition_pb2.SearchAttributeDefinitionsRequest(
+            session_id=_to_proto_guid(self.session_id),
+            attribute_type_id=_to_proto_model_definition_mesh_id(target),
+        )
+
     def _prepare_update_link_relation_attribute_request(
         self,
         target: uuid.UUID | str | AttributeBase,
@@ -1450,7 +2722,7 @@ class Session(abc.ABC):
 
         request = model_pb2.UpdateLinkRelationAttributeRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             append=append,
             target_object_ids=proto_target_object_ids,
         )
@@ -1499,31 +2771,44 @@ class Session(abc.ABC):
 
         request = model_pb2.UpdateVersionedLinkRelationAttributeRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             interval=proto_interval,
             entries=proto_entries,
         )
         return request
 
+    def _prepare_update_link_relation_attributes_requests(
+        self,
+        updates: typing.Iterable[LinkRelationUpdate | VersionedLinkRelationUpdate],
+    ) -> List[
+        model_pb2.UpdateLinkRelationAttributeRequest
+        | model_pb2.UpdateVersionedLinkRelationAttributeRequest
+    ]:
+        requests = []
+        for update in updates:
+            if isinstance(update, LinkRelationUpdate):
+                request = self._prepare_update_link_relation_attribute_request(
+                    update.target, update.new_target_object_ids, update.append
+                )
+            elif isinstance(update, VersionedLinkRelationUpdate):
+                request = self._prepare_versioned_link_relation_attribute_request(
+                    update.target,
+                    update.new_entries,
+                    update.start_time,
+                    update.end_time,
+                )
+            else:
+                raise TypeError(
+                    "need to provide LinkRelationUpdate or VersionedLinkRelationUpdate"
+                )
+            requests.append(request)
+        return requests
+
     def _to_proto_singular_attribute_value(
         self, v: SIMPLE_TYPE
     ) -> model_resources_pb2.AttributeValue:
         att_value = model_resources_pb2.AttributeValue()
-        if type(v) is int:
-            att_value.int_value = v
-        elif type(v) is float:
-            att_value.double_value = v
-        elif type(v) is bool:
-            att_value.boolean_value = v
-        elif type(v) is str:
-            att_value.string_value = v
-        elif type(v) is datetime:
-            att_value.utc_time_value.CopyFrom(_datetime_to_timestamp_pb2(v))
-        else:
-            raise RuntimeError(
-                "Not supported value type. Supported simple types are: boolean, float, int, str, datetime."
-            )
-
+        _set_proto_attribute_value(att_value, v)
         return att_value
 
     def _to_update_attribute_request_values(
@@ -1598,7 +2883,7 @@ class Session(abc.ABC):
 
         request = model_pb2.GetRatingCurveVersionsRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             interval=interval,
             versions_only=versions_only,
         )
@@ -1673,7 +2958,7 @@ class Session(abc.ABC):
 
         request = model_pb2.UpdateRatingCurveVersionsRequest(
             session_id=_to_proto_guid(self.session_id),
-            attribute=_to_proto_attribute_mesh_id(target),
+            attribute=_to_proto_attribute_mesh_id(target, self.path_cache),
             interval=_to_proto_utcinterval(start_time, end_time),
             versions=proto_versions,
         )
@@ -1702,7 +2987,7 @@ class Session(abc.ABC):
 
         return hydsim_pb2.RunHydroSimulationRequest(
             session_id=_to_proto_guid(self.session_id),
-            simulation=_to_proto_object_mesh_id(simulation),
+            simulation=_to_proto_object_mesh_id(simulation, self.path_cache),
             interval=_to_proto_utcinterval(start_time, end_time),
             scenario=scenario,
             resolution=proto_resolution,
@@ -1730,7 +3015,7 @@ class Session(abc.ABC):
 
         return hydsim_pb2.RunInflowCalculationRequest(
             session_id=_to_proto_guid(self.session_id),
-            watercourse=_to_proto_object_mesh_id(targets[0].id),
+            watercourse=_to_proto_object_mesh_id(targets[0].id, self.path_cache),
             interval=_to_proto_utcinterval(start_time, end_time),
             resolution=proto_resolution,
             return_datasets=return_datasets,
@@ -1753,23 +3038,90 @@ class Session(abc.ABC):
 
         return hydsim_pb2.GetMcFileRequest(
             session_id=_to_proto_guid(self.session_id),
-            optimisation_case=_to_proto_object_mesh_id(optimisation_case),
+            optimisation_case=_to_proto_object_mesh_id(
+                optimisation_case, self.path_cache
+            ),
             interval=_to_proto_utcinterval(start_time, end_time),
         )
 
+    def _prepare_create_physical_timeseries_request(
+        self,
+        path: str,
+        name: str,
+        curve_type: Timeseries.Curve,
+        resolution: Timeseries.Resolution,
+        unit_of_measurement_id: resources_pb2.Guid,
+        time_zone: str | None,
+    ) -> time_series_pb2.CreatePhysicalTimeseriesRequest:
+        return time_series_pb2.CreatePhysicalTimeseriesRequest(
+            session_id=_to_proto_guid(self.session_id),
+            path=path,
+            name=name,
+            curve_type=_to_proto_curve_type(curve_type),
+            resolution=_to_proto_resolution(resolution),
+            unit_of_measurement_id=unit_of_measurement_id,
+            time_zone=time_zone,
+        )
+
+    def _prepare_provision_physical_timeseries_requests(
+        self,
+        timeseries: pa.Table,
+        unit_of_measurement_ids: typing.Mapping[str, resources_pb2.Guid],
+    ) -> Tuple[
+        List[time_series_pb2.CreatePhysicalTimeseriesRequest],
+        List[uuid.UUID | str | None],
+    ]:
+        """Create requests to create physical time series and targets to
+        connect them to, per row of `timeseries`."""
+        columns = {
+            name: timeseries.column(name).to_pylist()
+            for name in ("path", "name", "unit_of_measurement")
+        }
+        curve_types = _arrow_to_enum_members(
+            timeseries.column("curve_type"), Timeseries.Curve
+        )
+        resolutions = _arrow_to_enum_members(
+            timeseries.column("resolution"), Timeseries.Resolution
+        )
+        time_zones = (
+            timeseries.column("time_zone").to_pylist()
+            if "time_zone" in timeseries.column_names
+            else [None] * timeseries.num_rows
+        )
+        targets = (
+            _arrow_to_targets(timeseries.column("target").combine_chunks())
+            if "target" in timeseries.column_names
+            else [None] * timeseries.num_rows
+        )
+
+        requests = []
+        for path, name, curve_type, resolution, unit, time_zone in zip(
+            columns["path"],
+            columns["name"],
+            curve_types,
+            resolutions,
+            columns["unit_of_measurement"],
+            time_zones,
+        ):
+            requests.append(
+                self._prepare_create_physical_timeseries_request(
+                    path,
+                    name,
+                    curve_type,
+                    resolution,
+                    unit_of_measurement_ids[unit],
+                    time_zone,
+                )
+            )
+        return requests, targets
+
     def _get_unit_of_measurement_id_by_name(
         self,
         unit_of_measurement: str,
-        list_response: model_definition_pb2.ListUnitsOfMeasurementResponse,
+        units_of_measurement: List[UnitOfMeasurement],
     ) -> resources_pb2.Guid:
-        new_unit_of_measurement_id = None
-
-        for proto_unit in list_response.units_of_measurement:
-            if proto_unit.name == unit_of_measurement:
-                new_unit_of_measurement_id = proto_unit.id
-                break
-
-        if new_unit_of_measurement_id is None:
-            raise ValueError("invalid unit of measurement provided")
+        for unit in units_of_measurement:
+            if unit.name == unit_of_measurement:
+                return _to_proto_guid(unit.id)
 
-        return new_unit_of_measurement_id
+        raise ValueError("invalid unit of measurement provided")
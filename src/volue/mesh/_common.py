@@ -6,16 +6,18 @@ from __future__ import annotations
 
 import datetime
 import logging
+import typing
 import uuid
-from dataclasses import dataclass, fields
-from typing import List, Tuple
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from typing import Any, List, Sequence, Tuple
 
 import pyarrow as pa
 from google.protobuf import field_mask_pb2, timestamp_pb2
 
 from bidict import bidict
 
-from volue.mesh import Timeseries
+from volue.mesh import Timeseries, profiling
 from volue.mesh.proto import type
 from volue.mesh.proto.auth.v1alpha import auth_pb2
 from volue.mesh.proto.config.v1alpha import config_pb2
@@ -26,6 +28,10 @@ from volue.mesh._version_compatibility import (
     to_parsed_version,
 )
 
+if typing.TYPE_CHECKING:
+    from volue.mesh._attribute import AttributeBase
+    from volue.mesh._object import Object
+
 
 @dataclass
 class AttributesFilter:
@@ -300,6 +306,125 @@ class LinkRelationVersion:
         return (getattr(self, field.name) for field in fields(self))
 
 
+@dataclass
+class LinkRelationUpdate:
+    """Update of a link relation (non-versioned) attribute, see
+    `update_link_relation_attributes`.
+
+    Fields have the same meaning as the arguments of
+    `update_link_relation_attribute`.
+    """
+
+    target: uuid.UUID | str | AttributeBase
+    new_target_object_ids: List[uuid.UUID]
+    append: bool = False
+
+
+@dataclass
+class VersionedLinkRelationUpdate:
+    """Update of a versioned link relation attribute, see
+    `update_link_relation_attributes`.
+
+    For a versioned one-to-one link relation attribute `new_entries` contain
+    at most one entry and the edit interval is given by `start_time` and
+    `end_time`, like in `update_versioned_one_to_one_link_relation_attribute`.
+    For a versioned one-to-many link relation attribute the interval is not
+    set and all entries are replaced, like in
+    `update_versioned_one_to_many_link_relation_attribute`.
+    """
+
+    target: uuid.UUID | str | AttributeBase
+    new_entries: List[List[LinkRelationVersion]]
+    start_time: datetime.datetime | None = None
+    end_time: datetime.datetime | None = None
+
+
+@dataclass
+class SimpleAttributeUpdateFailure:
+    """Simple attribute not updated by `update_simple_attributes`.
+
+    Attributes:
+        index: Position of the update in the given updates, e.g. row of the
+            Arrow table.
+        target: Attribute ID, path or instance of the update.
+        error: Error raised when preparing the request, e.g. for a value of
+            not supported type, or `grpc.RpcError` returned by Mesh.
+    """
+
+    index: int
+    target: uuid.UUID | str | AttributeBase
+    error: Exception
+
+
+@dataclass
+class TraversalNode:
+    """Object found by `traverse_objects`.
+
+    Attributes:
+        object: The Mesh object.
+        depth: Number of ownership relations from the start object, which
+            has depth 0.
+        parent_id: ID of the owning object, `None` for the start object.
+    """
+
+    object: Object
+    depth: int
+    parent_id: uuid.UUID | None
+
+
+@dataclass
+class AttributeMapping:
+    """Maps a source time series attribute to a target time series attribute
+    when copying time series between objects.
+
+    The target attribute is given either by name, for an attribute of the
+    matching target object, or by a search from the target object. The search
+    must find exactly one time series attribute and may contain `$ObjName`
+    macro, replaced with the name of the source object.
+
+    See Also:
+        :py:meth:`volue.mesh.Connection.Session.copy_timeseries_between_objects`
+    """
+
+    source_attribute_name: str
+    target_attribute_name: str | None = None
+    target_attribute_search: str | None = None
+
+
+@dataclass
+class TypeAttributeMapping:
+    """Defines which time series attributes of which objects are copied
+    when copying time series between objects.
+
+    If `object_type_name` is set, only time series attributes of objects of
+    this type are copied.
+    """
+
+    object_type_name: str | None = None
+    attribute_mappings: List[AttributeMapping] = field(default_factory=list)
+
+
+@dataclass
+class CopyTimeseriesResult:
+    """Result of copying time series between objects.
+
+    If `match_series_count` is greater than zero, time series were copied (or
+    would be copied, if no interval was given).
+    """
+
+    source_series_count: int
+    target_series_count: int
+    match_series_count: int
+
+    @classmethod
+    def _from_proto(cls, proto):
+        return cls(
+            proto.source_series_count,
+            proto.target_series_count,
+            proto.match_series_count,
+        )
+
+
 @dataclass
 class LogMessage:
     """Represents a log message from the Mesh server.
@@ -343,6 +468,22 @@ class HydSimDataset:
         return cls(proto.name, proto.data)
 
 
+class TimeseriesCopyMode(Enum):
+    """
+    Defines how time series connections are handled when cloning objects.
+
+    Args:
+        NONE: All time series connections are reset.
+        ALL: All time series connections are recreated.
+        INTERNAL: Time series are cloned and reconnected if they match paths
+            in the cloned hierarchy.
+    """
+
+    NONE = 1
+    ALL = 2
+    INTERNAL = 3
+
+
 def _to_proto_guid(uuid: uuid.UUID | None) -> type.resources_pb2.Guid | None:
     """Converts from Python UUID format to Microsoft's GUID format.
 
@@ -478,6 +619,7 @@ def _to_proto_timeseries(
     Returns:
         Protobuf Timeseries.
     """
+    start = profiling._start()
     stream = pa.BufferOutputStream()
     writer = pa.ipc.RecordBatchStreamWriter(
         sink=stream, schema=timeseries.arrow_table.schema
@@ -485,6 +627,14 @@ def _to_proto_timeseries(
 
     writer.write_table(timeseries.arrow_table)
     buffer = stream.getvalue()
+    if start is not None:
+        profiling._record(
+            "encode_timeseries",
+            start,
+            target=timeseries.full_name or timeseries.timskey or timeseries.uuid,
+            points=timeseries.number_of_points,
+            bytes=buffer.size,
+        )
 
     proto_timeseries = time_series_pb2.Timeseries(
         id=_to_proto_mesh_id_from_timeseries(timeseries),
@@ -519,6 +669,34 @@ def _to_proto_mesh_id_from_timeseries(
     return proto_mesh_id
 
 
+def _to_proto_type_attribute_mappings(
+    mappings: Sequence[TypeAttributeMapping] | None,
+) -> List[time_series_pb2.TypeAttributeMapping]:
+    proto_mappings = []
+    for mapping in mappings or []:
+        proto_mapping = time_series_pb2.TypeAttributeMapping(
+            object_type_name=mapping.object_type_name or ""
+        )
+        for attribute_mapping in mapping.attribute_mappings:
+            if (attribute_mapping.target_attribute_name is None) == (
+                attribute_mapping.target_attribute_search is None
+            ):
+                raise ValueError(
+                    "exactly one of target_attribute_name and "
+                    "target_attribute_search must be set for source attribute "
+                    f"'{attribute_mapping.source_attribute_name}'"
+                )
+            proto_mapping.attribute_mappings.append(
+                time_series_pb2.AttributePair(
+                    source_attribute_name=attribute_mapping.source_attribute_name,
+                    target_attribute_name=attribute_mapping.target_attribute_name,
+                    target_attribute_search=attribute_mapping.target_attribute_search,
+                )
+            )
+        proto_mappings.append(proto_mapping)
+    return proto_mappings
+
+
 def _to_proto_attribute_masks(
     attributes_filter: AttributesFilter | None,
 ) -> model_resources_pb2.AttributesMasks:
@@ -551,9 +729,56 @@ def _object_to_proto_field_mask(
     return field_mask_pb2.FieldMask(paths=fields)
 
 
+def _is_valid_field_path(descriptor: Any, path: str) -> bool:
+    """Check if a field mask path, e.g. `values.timeseries_value`, exists in a
+    protobuf message. Unlike `FieldMask.IsValidForDescriptor` it allows paths
+    through repeated message fields.
+    """
+    for name in path.split("."):
+        field = descriptor.fields_by_name.get(name) if descriptor else None
+        if field is None:
+            return False
+        descriptor = field.message_type
+    return True
+
+
+# always returned with explicit attribute fields, attributes are parsed as
+# collections or single values based on them
+_ATTRIBUTE_VALUE_TYPE_FIELDS = ("value_type", "value_type_collection")
+
+
 def _to_proto_attribute_field_mask(
-    full_attribute_info: bool, attributes_filter: AttributesFilter | None = None
+    full_attribute_info: bool,
+    attributes_filter: AttributesFilter | None = None,
+    attribute_fields: Sequence[str] | None = None,
+    required_fields: Sequence[str] = (),
 ) -> field_mask_pb2.FieldMask | None:
+    """Create attribute field mask.
+
+    Args:
+        attribute_fields: Explicit projection, paths of fields of the
+            protobuf `Attribute` message to be returned.
+        required_fields: Fields always added to `attribute_fields`, in
+            addition to the value type fields.
+
+    Raises:
+        ValueError: Both `full_attribute_info` and `attribute_fields` are set
+            or `attribute_fields` contain unknown fields.
+    """
+    if attribute_fields is not None:
+        if full_attribute_info:
+            raise ValueError(
+                "full_attribute_info and attribute_fields cannot be used together"
+            )
+
+        invalid_fields = [
+            field
+            for field in attribute_fields
+            if not _is_valid_field_path(model_resources_pb2.Attribute.DESCRIPTOR, field)
+        ]
+        if invalid_fields:
+            raise ValueError(f"invalid attribute fields: {invalid_fields}")
+
     # If attributes_filter.return_no_attributes is set to True we must not provide attribute field mask,
     # at the same time we can't expect user to provide full_attribute_info set to True. It would be very counter intuitive
     # to request no attributes and have to explicitly request full attributes info.
@@ -563,6 +788,11 @@ def _to_proto_attribute_field_mask(
     if full_attribute_info:
         return None
 
+    if attribute_fields is not None:
+        paths = list(dict.fromkeys([*required_fields, *_ATTRIBUTE_VALUE_TYPE_FIELDS]))
+        paths.extend(field for field in attribute_fields if field not in paths)
+        return field_mask_pb2.FieldMask(paths=paths)
+
     return field_mask_pb2.FieldMask(
         paths=[
             "id",
@@ -607,8 +837,17 @@ def _read_proto_reply(
             start_time = None
             end_time = None
 
+        decode_start = profiling._start()
         reader = pa.ipc.open_stream(proto_timeseries.data)
         table = reader.read_all()
+        if decode_start is not None:
+            profiling._record(
+                "decode_timeseries",
+                decode_start,
+                target=proto_timeseries.id.path or proto_timeseries.id.timeseries_key,
+                points=table.num_rows,
+                bytes=len(proto_timeseries.data),
+            )
 
         if proto_timeseries.HasField("id"):
             timeseries_id = proto_timeseries.id
@@ -2,59 +2,85 @@
 Functionality for synchronously connecting to a Mesh server and working with its sessions.
 """
 
+from __future__ import annotations
+
+import collections
+import copy
 import typing
 import uuid
 from datetime import datetime, timedelta
 from typing import List
 
 import grpc
+import pyarrow as pa
 from google import protobuf
+from google.protobuf import json_format
 
 from volue.mesh import (
     AttributeBase,
     AttributesFilter,
     Authentication,
+    CopyTimeseriesResult,
     HydSimDataset,
+    LinkRelationAttribute,
+    LinkRelationUpdate,
     LogMessage,
+    MetadataCache,
+    Namespace,
     Object,
+    ObjectDefinition,
+    SimpleAttributeUpdateFailure,
+    Tag,
     Timeseries,
     TimeseriesAttribute,
+    TimeseriesCopyMode,
     TimeseriesResource,
+    TraversalNode,
+    TypeAttributeMapping,
+    UnitOfMeasurement,
     UserIdentity,
+    VersionedLinkRelationUpdate,
     VersionInfo,
 )
-from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh._attribute import (
+    _from_proto_attribute,
+    _from_proto_attribute_definition,
+)
+from volue.mesh._attribute_table import (
+    SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+    _SimpleAttributeTableBuilder,
+)
 from volue.mesh._authentication import ExternalAccessTokenPlugin
 from volue.mesh._common import (
     LinkRelationVersion,
     RatingCurveVersion,
     XySet,
     _from_proto_guid,
-    _to_proto_curve_type,
     _to_proto_guid,
-    _to_proto_resolution,
     _validate_server_version,
 )
+from volue.mesh._model_definition import _UNITS_OF_MEASUREMENT_KEY
 from volue.mesh._version_compatibility import get_compatibility_check_metadata
-from volue.mesh.availability._availability import Availability
-from volue.mesh.calc.forecast import ForecastFunctions
-from volue.mesh.calc.history import HistoryFunctions
-from volue.mesh.calc.statistical import StatisticalFunctions
-from volue.mesh.calc.transform import TransformFunctions
-from volue.mesh.proto.availability.v1alpha import availability_pb2_grpc
-from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
-from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
-from volue.mesh.proto.model.v1alpha import model_pb2_grpc
-from volue.mesh.proto.model_definition.v1alpha import (
-    model_definition_pb2,
-    model_definition_pb2_grpc,
-)
-from volue.mesh.proto.session.v1alpha import session_pb2_grpc
-from volue.mesh.proto.time_series.v1alpha import time_series_pb2, time_series_pb2_grpc
+from volue.mesh.proto.model.v1alpha import model_pb2
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
 from volue.mesh.proto.type import resources_pb2
 
 from . import _attribute, _base_connection, _base_session
 
+if typing.TYPE_CHECKING:
+    from volue.mesh.availability._availability import Availability
+    from volue.mesh.calc.forecast import ForecastFunctions
+    from volue.mesh.calc.history import HistoryFunctions
+    from volue.mesh.calc.statistical import StatisticalFunctions
+    from volue.mesh.calc.transform import TransformFunctions
+    from volue.mesh.proto.availability.v1alpha import availability_pb2_grpc
+    from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
+    from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
+    from volue.mesh.proto.model.v1alpha import model_pb2_grpc
+    from volue.mesh.proto.model_definition.v1alpha import model_definition_pb2_grpc
+    from volue.mesh.proto.session.v1alpha import session_pb2, session_pb2_grpc
+    from volue.mesh.proto.time_series.v1alpha import time_series_pb2_grpc
+
 
 class Connection(_base_connection.Connection):
     class Session(_base_session.Session):
@@ -72,9 +98,11 @@ class Connection(_base_connection.Connection):
             time_series_service: time_series_pb2_grpc.TimeseriesServiceStub,
             availability_service: availability_pb2_grpc.AvailabilityServiceStub,
             session_id: uuid.UUID | None = None,
+            metadata_cache: MetadataCache | None = None,
         ):
             super().__init__(
                 session_id=session_id,
+                metadata_cache=metadata_cache,
                 calc_service=calc_service,
                 hydsim_service=hydsim_service,
                 model_service=model_service,
@@ -82,9 +110,20 @@ class Connection(_base_connection.Connection):
                 session_service=session_service,
                 time_series_service=time_series_service,
             )
-            self.availability = Availability(
-                availability_service=availability_service, session_id=session_id
-            )
+            self.availability_service = availability_service
+            self._availability: Availability | None = None
+
+        @property
+        def availability(self) -> Availability:
+            """Mesh availability events functionality, loaded on first use."""
+            if self._availability is None:
+                from volue.mesh.availability._availability import Availability
+
+                self._availability = Availability(
+                    availability_service=self.availability_service,
+                    session_id=self.session_id,
+                )
+            return self._availability
 
         def __enter__(self):
             """
@@ -110,21 +149,29 @@ class Connection(_base_connection.Connection):
         def _get_unit_of_measurement_id_by_name(
             self, unit_of_measurement: str
         ) -> resources_pb2.Guid:
-            list_response = self.model_definition_service.ListUnitsOfMeasurement(
-                model_definition_pb2.ListUnitsOfMeasurementRequest(
-                    session_id=_to_proto_guid(self.session_id)
+            try:
+                return super()._get_unit_of_measurement_id_by_name(
+                    unit_of_measurement, self.list_units_of_measurement()
+                )
+            except ValueError:
+                # the unit may have been added after the units were cached
+                if not self.metadata_cache._remove(_UNITS_OF_MEASUREMENT_KEY):
+                    raise
+                return super()._get_unit_of_measurement_id_by_name(
+                    unit_of_measurement, self.list_units_of_measurement()
                 )
-            )
 
-            return super()._get_unit_of_measurement_id_by_name(
-                unit_of_measurement, list_response
+        def open(self) -> None:
+            self._on_started(
+                self.session_service.StartSession(protobuf.empty_pb2.Empty())
             )
 
-        def open(self) -> None:
-            reply = self.session_service.StartSession(protobuf.empty_pb2.Empty())
+        def _on_started(self, reply: session_pb2.StartSessionResponse) -> None:
+            """Attach to the session started with `StartSession`."""
             self.session_id = _from_proto_guid(reply.session_id)
 
-            self.availability.session_id = self.session_id
+            if self._availability is not None:
+                self._availability.session_id = self.session_id
             self.stop_worker_thread.clear()
             self.worker_thread = super().WorkerThread(self)
             self.worker_thread.start()
@@ -136,12 +183,17 @@ class Connection(_base_connection.Connection):
 
             self.session_service.EndSession(_to_proto_guid(self.session_id))
             self.session_id = None
+            self._end_model_definition_change(committed=False)
 
         def rollback(self) -> None:
             self.session_service.Rollback(_to_proto_guid(self.session_id))
+            self.path_cache.clear()
+            self._end_model_definition_change(committed=False)
 
         def commit(self) -> None:
             self.session_service.Commit(_to_proto_guid(self.session_id))
+            self.path_cache.clear()
+            self._end_model_definition_change(committed=True)
 
         def read_timeseries_points(
             self,
@@ -157,6 +209,66 @@ class Connection(_base_connection.Connection):
             request = super()._prepare_write_timeseries_points_request(timeseries)
             self.time_series_service.WriteTimeseries(request)
 
+        def copy_timeseries_between_objects(
+            self,
+            source: uuid.UUID | str | Object,
+            target: uuid.UUID | str | Object,
+            start_time: datetime | None = None,
+            end_time: datetime | None = None,
+            scenario_name: str | None = None,
+            mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+        ) -> CopyTimeseriesResult:
+            request = super()._prepare_copy_timeseries_between_objects_request(
+                source, target, start_time, end_time, scenario_name, mappings
+            )
+            response = self.time_series_service.CopyTimeseriesBetweenObjects(request)
+            return CopyTimeseriesResult._from_proto(response)
+
+        def copy_timeseries_between_object_pairs(
+            self,
+            pairs: typing.Iterable[
+                typing.Tuple[uuid.UUID | str | Object, uuid.UUID | str | Object]
+            ],
+            start_time: datetime | None = None,
+            end_time: datetime | None = None,
+            scenario_name: str | None = None,
+            mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> List[CopyTimeseriesResult]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            # validate all requests before copying anything
+            requests = [
+                self._prepare_copy_timeseries_between_objects_request(
+                    source, target, start_time, end_time, scenario_name, mappings
+                )
+                for source, target in pairs
+            ]
+
+            # send requests without waiting for responses, keep at most
+            # `max_concurrency` of them in flight
+            results = []
+            in_flight = collections.deque()
+
+            def wait_for_oldest():
+                response = in_flight.popleft().result()
+                results.append(CopyTimeseriesResult._from_proto(response))
+
+            try:
+                for request in requests:
+                    if len(in_flight) == max_concurrency:
+                        wait_for_oldest()
+                    in_flight.append(
+                        self.time_series_service.CopyTimeseriesBetweenObjects.future(
+                            request
+                        )
+                    )
+                while in_flight:
+                    wait_for_oldest()
+            finally:
+                for future in in_flight:
+                    future.cancel()
+            return results
+
         def get_timeseries_resource_info(
             self, timeseries_key: int
         ) -> TimeseriesResource:
@@ -205,20 +317,85 @@ class Connection(_base_connection.Connection):
                 unit_of_measurement
             )
 
-            request = time_series_pb2.CreatePhysicalTimeseriesRequest(
-                session_id=_to_proto_guid(self.session_id),
-                path=path,
-                name=name,
-                curve_type=_to_proto_curve_type(curve_type),
-                resolution=_to_proto_resolution(resolution),
-                unit_of_measurement_id=unit_of_measurement_id,
-                time_zone=time_zone,
+            request = super()._prepare_create_physical_timeseries_request(
+                path,
+                name,
+                curve_type,
+                resolution,
+                unit_of_measurement_id,
+                time_zone,
             )
 
             response = self.time_series_service.CreatePhysicalTimeseries(request)
 
             return TimeseriesResource._from_proto_timeseries_resource(response)
 
+        def provision_physical_timeseries(
+            self,
+            timeseries: pa.Table,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> pa.Table:
+            _base_session._validate_max_concurrency(max_concurrency)
+            unit_of_measurement_ids = {
+                unit: self._get_unit_of_measurement_id_by_name(unit)
+                for unit in _base_session._get_physical_timeseries_units(timeseries)
+            }
+            requests, targets = super()._prepare_provision_physical_timeseries_requests(
+                timeseries, unit_of_measurement_ids
+            )
+
+            def send(method, requests):
+                """Send requests keeping at most `max_concurrency` of them in
+                flight, return responses or errors in order."""
+                responses = []
+                in_flight = collections.deque()
+
+                def wait_for_oldest():
+                    try:
+                        responses.append(in_flight.popleft().result())
+                    except grpc.RpcError as e:
+                        responses.append(e)
+
+                try:
+                    for request in requests:
+                        if len(in_flight) == max_concurrency:
+                            wait_for_oldest()
+                        in_flight.append(method.future(request))
+                    while in_flight:
+                        wait_for_oldest()
+                except BaseException:
+                    for future in in_flight:
+                        future.cancel()
+                    raise
+                return responses
+
+            responses = send(
+                self.time_series_service.CreatePhysicalTimeseries, requests
+            )
+
+            rows = []
+            connect_requests = []
+            for row, (response, target) in enumerate(zip(responses, targets)):
+                if target is not None and not isinstance(response, grpc.RpcError):
+                    rows.append(row)
+                    connect_requests.append(
+                        super()._prepare_update_timeseries_attribute_request(
+                            target, None, response.timeseries_key
+                        )
+                    )
+            connect_responses = send(
+                self.model_service.UpdateTimeseriesAttribute, connect_requests
+            )
+
+            connect_errors = {
+                row: response
+                for row, response in zip(rows, connect_responses)
+                if isinstance(response, grpc.RpcError)
+            }
+            return _base_session._to_provisioned_timeseries_table(
+                responses, connect_errors
+            )
+
         def get_attribute(
             self,
             target: uuid.UUID | str | AttributeBase,
@@ -228,7 +405,46 @@ class Connection(_base_connection.Connection):
                 target, full_attribute_info
             )
             proto_attribute = self.model_service.GetAttribute(request)
-            return _from_proto_attribute(proto_attribute)
+            return self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+        def get_attributes(
+            self,
+            targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+            full_attribute_info: bool = False,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> List[AttributeBase]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            return list(
+                self._get_attributes(targets, full_attribute_info, max_concurrency)
+            )
+
+        def _get_attributes(
+            self,
+            targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+            full_attribute_info: bool,
+            max_concurrency: int,
+        ) -> typing.Iterator[AttributeBase]:
+            """Request attributes without waiting for responses, keep at most
+            `max_concurrency` of them in flight, yield attributes in order."""
+            in_flight = collections.deque()
+
+            def wait_for_oldest():
+                proto_attribute = in_flight.popleft().result()
+                return self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+            try:
+                for target in targets:
+                    if len(in_flight) == max_concurrency:
+                        yield wait_for_oldest()
+                    request = super()._prepare_get_attribute_request(
+                        target, full_attribute_info
+                    )
+                    in_flight.append(self.model_service.GetAttribute.future(request))
+                while in_flight:
+                    yield wait_for_oldest()
+            finally:
+                for future in in_flight:
+                    future.cancel()
 
         def get_timeseries_attribute(
             self,
@@ -247,18 +463,40 @@ class Connection(_base_connection.Connection):
             target: uuid.UUID | str | Object,
             query: str,
             full_attribute_info: bool = False,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> List[AttributeBase]:
             request = super()._prepare_search_attributes_request(
-                target, query, full_attribute_info
+                target, query, full_attribute_info, attribute_fields
             )
 
             proto_attributes = self.model_service.SearchAttributes(request)
 
             attributes = []
             for proto_attribute in proto_attributes:
-                attributes.append(_from_proto_attribute(proto_attribute))
+                attributes.append(
+                    self.path_cache._add(_from_proto_attribute(proto_attribute))
+                )
             return attributes
 
+        def iter_attributes(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            full_attribute_info: bool = False,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.Iterator[AttributeBase | List[AttributeBase]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_attributes_request(
+                target, query, full_attribute_info, attribute_fields
+            )
+
+            def attributes():
+                for proto_attribute in self.model_service.SearchAttributes(request):
+                    yield self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+            return _base_session._batched(attributes(), batch_size)
+
         def search_for_timeseries_attributes(
             self,
             target: uuid.UUID | str | Object,
@@ -278,6 +516,56 @@ class Connection(_base_connection.Connection):
             request = super()._prepare_update_simple_attribute_request(target, value)
             self.model_service.UpdateSimpleAttribute(request)
 
+        def update_simple_attributes(
+            self,
+            values: (
+                typing.Mapping[
+                    uuid.UUID | str | AttributeBase,
+                    _attribute.SIMPLE_TYPE_OR_COLLECTION,
+                ]
+                | typing.Iterable[
+                    typing.Tuple[
+                        uuid.UUID | str | AttributeBase,
+                        _attribute.SIMPLE_TYPE_OR_COLLECTION,
+                    ]
+                ]
+                | pa.Table
+            ),
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> List[SimpleAttributeUpdateFailure]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            requests, failures = super()._prepare_update_simple_attributes_requests(
+                values
+            )
+
+            # send requests without waiting for responses, keep at most
+            # `max_concurrency` of them in flight
+            in_flight = collections.deque()
+
+            def wait_for_oldest():
+                index, target, future = in_flight.popleft()
+                try:
+                    future.result()
+                except grpc.RpcError as e:
+                    failures.append(SimpleAttributeUpdateFailure(index, target, e))
+
+            try:
+                for index, target, request in requests:
+                    if len(in_flight) == max_concurrency:
+                        wait_for_oldest()
+                    future = self.model_service.UpdateSimpleAttribute.future(request)
+                    in_flight.append((index, target, future))
+
+                while in_flight:
+                    wait_for_oldest()
+            except BaseException:
+                for _, _, future in in_flight:
+                    future.cancel()
+                raise
+
+            failures.sort(key=lambda failure: failure.index)
+            return failures
+
         def update_timeseries_attribute(
             self,
             target: uuid.UUID | str | AttributeBase,
@@ -299,6 +587,7 @@ class Connection(_base_connection.Connection):
                 target, new_template_expression, new_description
             )
             self.model_definition_service.UpdateTimeseriesAttributeDefinition(request)
+            self._begin_model_definition_change()
 
         def update_link_relation_attribute(
             self,
@@ -335,6 +624,39 @@ class Connection(_base_connection.Connection):
             )
             self.model_service.UpdateVersionedLinkRelationAttribute(request)
 
+        def update_link_relation_attributes(
+            self,
+            updates: typing.Iterable[LinkRelationUpdate | VersionedLinkRelationUpdate],
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> None:
+            _base_session._validate_max_concurrency(max_concurrency)
+            requests = super()._prepare_update_link_relation_attributes_requests(
+                updates
+            )
+
+            # send requests without waiting for responses, keep at most
+            # `max_concurrency` of them in flight
+            in_flight = collections.deque()
+            try:
+                for request in requests:
+                    if len(in_flight) == max_concurrency:
+                        in_flight.popleft().result()
+
+                    if isinstance(
+                        request, model_pb2.UpdateLinkRelationAttributeRequest
+                    ):
+                        method = self.model_service.UpdateLinkRelationAttribute
+                    else:
+                        method = self.model_service.UpdateVersionedLinkRelationAttribute
+                    in_flight.append(method.future(request))
+
+                while in_flight:
+                    in_flight.popleft().result()
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
         def list_models(
             self,
         ) -> List[Object]:
@@ -342,17 +664,101 @@ class Connection(_base_connection.Connection):
             request = next(gen)
             return gen.send(self.model_service.ListModels(request))
 
+        def _get_metadata(
+            self,
+            key: tuple,
+            request_metadata: typing.Callable[[], typing.Tuple[typing.Any, ...]],
+        ) -> List[typing.Any]:
+            metadata = self.metadata_cache._get(key)
+            if metadata is None:
+                metadata = self.metadata_cache._set(key, request_metadata())
+            # attribute definitions are mutable, keep the cached ones intact
+            return copy.deepcopy(list(metadata))
+
+        def list_units_of_measurement(self) -> List[UnitOfMeasurement]:
+            request = super()._prepare_list_units_of_measurement_request()
+            return self._get_metadata(
+                _UNITS_OF_MEASUREMENT_KEY,
+                lambda: tuple(
+                    map(
+                        UnitOfMeasurement._from_proto,
+                        self.model_definition_service.ListUnitsOfMeasurement(
+                            request
+                        ).units_of_measurement,
+                    )
+                ),
+            )
+
+        def list_tags(self, target: uuid.UUID | str) -> List[Tag]:
+            request = super()._prepare_list_tags_request(target)
+            return self._get_metadata(
+                ("tags", target),
+                lambda: tuple(
+                    map(
+                        Tag._from_proto,
+                        self.model_definition_service.ListTags(request).tags,
+                    )
+                ),
+            )
+
+        def search_namespaces(
+            self, target: uuid.UUID | str, recursive: bool = False
+        ) -> List[Namespace]:
+            request = super()._prepare_search_namespaces_request(target, recursive)
+            return self._get_metadata(
+                ("namespaces", target, recursive),
+                lambda: tuple(
+                    map(
+                        Namespace._from_proto,
+                        self.model_definition_service.SearchNamespaces(request),
+                    )
+                ),
+            )
+
+        def search_object_definitions(
+            self, target: uuid.UUID | str, recursive: bool = False
+        ) -> List[ObjectDefinition]:
+            request = super()._prepare_search_object_definitions_request(
+                target, recursive
+            )
+            return self._get_metadata(
+                ("object_definitions", target, recursive),
+                lambda: tuple(
+                    map(
+                        ObjectDefinition._from_proto,
+                        self.model_definition_service.SearchObjectDefinitions(request),
+                    )
+                ),
+            )
+
+        def search_attribute_definitions(
+            self, target: uuid.UUID | str
+        ) -> List[AttributeBase.AttributeBaseDefinition]:
+            request = super()._prepare_search_attribute_definitions_request(target)
+            return self._get_metadata(
+                ("attribute_definitions", target),
+                lambda: tuple(
+                    map(
+                        _from_proto_attribute_definition,
+                        self.model_definition_service.SearchAttributeDefinitions(
+                            request
+                        ),
+                    )
+                ),
+            )
+
         def get_object(
             self,
             target: uuid.UUID | str | Object,
             full_attribute_info: bool = False,
             attributes_filter: AttributesFilter | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> Object:
             request = super()._prepare_get_object_request(
-                target, full_attribute_info, attributes_filter
+                target, full_attribute_info, attributes_filter, attribute_fields
             )
             proto_object = self.model_service.GetObject(request)
-            return Object._from_proto_object(proto_object)
+            return self.path_cache._add(Object._from_proto_object(proto_object))
 
         def search_for_objects(
             self,
@@ -360,24 +766,194 @@ class Connection(_base_connection.Connection):
             query: str,
             full_attribute_info: bool = False,
             attributes_filter: AttributesFilter | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> List[Object]:
             request = super()._prepare_search_for_objects_request(
-                target, query, full_attribute_info, attributes_filter
+                target, query, full_attribute_info, attributes_filter, attribute_fields
             )
 
             proto_objects = self.model_service.SearchObjects(request)
 
             objects = []
             for proto_object in proto_objects:
-                objects.append(Object._from_proto_object(proto_object))
+                objects.append(
+                    self.path_cache._add(Object._from_proto_object(proto_object))
+                )
             return objects
 
+        def iter_objects(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.Iterator[Object | List[Object]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_for_objects_request(
+                target, query, full_attribute_info, attributes_filter, attribute_fields
+            )
+
+            def objects():
+                for proto_object in self.model_service.SearchObjects(request):
+                    yield self.path_cache._add(
+                        Object._from_proto_object(proto_object, lazy=True)
+                    )
+
+            return _base_session._batched(objects(), batch_size)
+
+        def iter_objects_by_definition(
+            self,
+            target: uuid.UUID | str,
+            ids_only: bool = False,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.Iterator[Object | uuid.UUID | List[Object | uuid.UUID]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_objects_by_definition_request(
+                target,
+                ids_only,
+                full_attribute_info,
+                attributes_filter,
+                attribute_fields,
+            )
+
+            def objects():
+                for proto_object in self.model_service.SearchObjectsByDefinition(
+                    request
+                ):
+                    if ids_only:
+                        yield _from_proto_guid(proto_object.id)
+                    else:
+                        yield self.path_cache._add(
+                            Object._from_proto_object(proto_object, lazy=True)
+                        )
+
+            return _base_session._batched(objects(), batch_size)
+
+        def search_simple_attributes_table(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            attribute_names: typing.Sequence[str],
+        ) -> pa.Table:
+            builder = _SimpleAttributeTableBuilder(attribute_names)
+            request = super()._prepare_search_for_objects_request(
+                target,
+                query,
+                full_attribute_info=False,
+                attributes_filter=AttributesFilter(name_mask=builder.attribute_names),
+                attribute_fields=SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+            )
+
+            for proto_object in self.model_service.SearchObjects(request):
+                builder.add(proto_object)
+            return builder.to_table()
+
+        def search_simple_attributes_table_by_definition(
+            self,
+            target: uuid.UUID | str,
+            attribute_names: typing.Sequence[str],
+        ) -> pa.Table:
+            builder = _SimpleAttributeTableBuilder(attribute_names)
+            request = super()._prepare_search_objects_by_definition_request(
+                target,
+                ids_only=False,
+                full_attribute_info=False,
+                attributes_filter=AttributesFilter(name_mask=builder.attribute_names),
+                attribute_fields=SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+            )
+
+            for proto_object in self.model_service.SearchObjectsByDefinition(request):
+                builder.add(proto_object)
+            return builder.to_table()
+
+        def iter_linked_from(
+            self,
+            target: uuid.UUID | str | Object,
+            ids_only: bool = False,
+            full_attribute_info: bool = False,
+            batch_size: int | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> typing.Iterator[
+            LinkRelationAttribute | uuid.UUID | List[LinkRelationAttribute | uuid.UUID]
+        ]:
+            _base_session._validate_batch_size(batch_size)
+            _base_session._validate_max_concurrency(max_concurrency)
+            request = super()._prepare_search_linked_from_request(target)
+
+            def ids():
+                for response in self.model_service.SearchLinkedFrom(request):
+                    yield _from_proto_guid(response.link_relation_id.id)
+
+            if ids_only:
+                attributes = ids()
+            else:
+                attributes = self._get_attributes(
+                    ids(), full_attribute_info, max_concurrency
+                )
+            return _base_session._batched(attributes, batch_size)
+
+        def traverse_objects(
+            self,
+            target: uuid.UUID | str | Object,
+            max_depth: int | None = None,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            visitor: typing.Callable[[TraversalNode], bool | None] | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> typing.Iterator[TraversalNode]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            traversal = _base_session._Traversal(target, max_depth, visitor)
+
+            def nodes():
+                # request objects without waiting for responses, keep at most
+                # `max_concurrency` of them in flight
+                in_flight = collections.deque()
+                try:
+                    while traversal.pending or in_flight:
+                        while traversal.pending and len(in_flight) < max_concurrency:
+                            target, depth, parent_id = traversal.pending.popleft()
+                            request = self._prepare_get_object_request(
+                                target, full_attribute_info, attributes_filter
+                            )
+                            future = self.model_service.GetObject.future(request)
+                            in_flight.append((depth, parent_id, future))
+
+                        depth, parent_id, future = in_flight.popleft()
+                        proto_object = future.result()
+                        object = self.path_cache._add(
+                            Object._from_proto_object(proto_object, lazy=True)
+                        )
+                        yield traversal.visit(object, proto_object, depth, parent_id)
+                finally:
+                    for _, _, future in in_flight:
+                        future.cancel()
+
+            return nodes()
+
         def create_object(
             self, target: uuid.UUID | str | AttributeBase, name: str
         ) -> Object:
             request = super()._prepare_create_object_request(target=target, name=name)
             proto_object = self.model_service.CreateObject(request)
-            return Object._from_proto_object(proto_object)
+            return self.path_cache._add(Object._from_proto_object(proto_object))
+
+        def clone_object(
+            self,
+            target: uuid.UUID | str | Object,
+            new_name: str,
+            new_owner: uuid.UUID | str | Object | AttributeBase | None = None,
+            timeseries_copy_mode: TimeseriesCopyMode = TimeseriesCopyMode.ALL,
+        ) -> Object:
+            request = super()._prepare_clone_object_request(
+                target, new_name, new_owner, timeseries_copy_mode
+            )
+            response = self.model_service.CloneObject(request)
+            return self.path_cache._add(Object._from_proto_object(response.new_object))
 
         def update_object(
             self,
@@ -389,12 +965,15 @@ class Connection(_base_connection.Connection):
                 target, new_name, new_owner_attribute
             )
             self.model_service.UpdateObject(request)
+            # paths of the object and all objects and attributes owned by it changed
+            self.path_cache.clear()
 
         def delete_object(
             self, target: uuid.UUID | str | Object, recursive_delete: bool = False
         ) -> None:
             request = super()._prepare_delete_object_request(target, recursive_delete)
             self.model_service.DeleteObject(request)
+            self.path_cache.clear()
 
         def forecast_functions(
             self,
@@ -402,6 +981,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> ForecastFunctions:
+            from volue.mesh.calc.forecast import ForecastFunctions
+
             return ForecastFunctions(self, target, start_time, end_time)
 
         def history_functions(
@@ -410,6 +991,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> HistoryFunctions:
+            from volue.mesh.calc.history import HistoryFunctions
+
             return HistoryFunctions(self, target, start_time, end_time)
 
         def statistical_functions(
@@ -418,6 +1001,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> StatisticalFunctions:
+            from volue.mesh.calc.statistical import StatisticalFunctions
+
             return StatisticalFunctions(self, target, start_time, end_time)
 
         def transform_functions(
@@ -426,6 +1011,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> TransformFunctions:
+            from volue.mesh.calc.transform import TransformFunctions
+
             return TransformFunctions(self, target, start_time, end_time)
 
         def get_xy_sets(
@@ -543,12 +1130,18 @@ class Connection(_base_connection.Connection):
                     yield None
 
     @staticmethod
-    def _secure_grpc_channel(*args, **kwargs):
-        return grpc.secure_channel(*args, **kwargs)
+    def _secure_grpc_channel(*args, interceptors=None, **kwargs):
+        channel = grpc.secure_channel(*args, **kwargs)
+        return (
+            grpc.intercept_channel(channel, *interceptors) if interceptors else channel
+        )
 
     @staticmethod
-    def _insecure_grpc_channel(*args, **kwargs):
-        return grpc.insecure_channel(*args, **kwargs)
+    def _insecure_grpc_channel(*args, interceptors=None, **kwargs):
+        channel = grpc.insecure_channel(*args, **kwargs)
+        return (
+            grpc.intercept_channel(channel, *interceptors) if interceptors else channel
+        )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -562,6 +1155,63 @@ class Connection(_base_connection.Connection):
             self.config_service.GetVersion(protobuf.empty_pb2.Empty())
         )
 
+    def get_health_status(self) -> typing.Dict[str, typing.Any]:
+        return json_format.MessageToDict(
+            self.config_service.GetHealthStatus(protobuf.empty_pb2.Empty())
+        )
+
+    def warm_up(
+        self, timeout: float | None = None, number_of_sessions: int = 0
+    ) -> List[Session]:
+        deadline = self._get_warm_up_deadline(timeout)
+
+        try:
+            grpc.channel_ready_future(self._channel).result(
+                timeout=self._get_remaining_time(deadline)
+            )
+        except grpc.FutureTimeoutError:
+            raise TimeoutError(
+                f"gRPC channel not ready within {timeout} seconds"
+            ) from None
+
+        self._prepare_warm_up()
+
+        version_info = self.config_service.GetVersion(
+            protobuf.empty_pb2.Empty(),
+            metadata=get_compatibility_check_metadata(),
+            timeout=self._get_remaining_time(deadline),
+        )
+        _validate_server_version(version_info)
+
+        self.config_service.GetHealthStatus(
+            protobuf.empty_pb2.Empty(), timeout=self._get_remaining_time(deadline)
+        )
+
+        # start all sessions concurrently, bounded by the warm-up deadline
+        sessions = [self.create_session() for _ in range(number_of_sessions)]
+        futures = [
+            session.session_service.StartSession.future(
+                protobuf.empty_pb2.Empty(), timeout=self._get_remaining_time(deadline)
+            )
+            for session in sessions
+        ]
+
+        opened = []
+        errors = []
+        for session, future in zip(sessions, futures):
+            try:
+                session._on_started(future.result())
+                opened.append(session)
+            except Exception as e:
+                errors.append(e)
+
+        if errors:
+            for session in opened:
+                session.close()
+            raise errors[0]
+
+        return sessions
+
     def get_user_identity(self) -> UserIdentity:
         return UserIdentity._from_proto(
             self.auth_service.GetUserIdentity(protobuf.empty_pb2.Empty())
@@ -601,4 +1251,5 @@ class Connection(_base_connection.Connection):
             time_series_service=self.time_series_service,
             availability_service=self.availability_service,
             session_id=session_id,
+            metadata_cache=self.metadata_cache,
         )
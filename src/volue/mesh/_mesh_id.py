@@ -2,15 +2,249 @@
 Mesh ID helper functions.
 """
 
+from __future__ import annotations
+
+import threading
+import typing
 import uuid
+from collections import OrderedDict
+
+import grpc
+from google.protobuf import message
 
 from volue.mesh import AttributeBase, Object
-from volue.mesh._common import _to_proto_guid
+from volue.mesh._common import _from_proto_guid, _to_proto_guid
 from volue.mesh.proto import type
 
+DEFAULT_PATH_CACHE_MAX_SIZE = 10000
+
+_T = typing.TypeVar("_T", AttributeBase, Object)
+
+
+class PathCache:
+    """Session-scoped cache of paths resolved to IDs.
+
+    Paths and IDs of Mesh objects and attributes returned by a session are
+    cached. When a path is later passed as a target to the same session, the
+    compact ID is sent to the Mesh server instead, so the server does not need
+    to resolve the path again. The least recently used entries are evicted
+    when `max_size` is reached.
+
+    The cache is cleared when objects are updated or deleted and on commit
+    and rollback.
+
+    Objects and attributes deleted or moved by other sessions leave stale
+    entries until the cache is cleared or the entries are evicted. A unary
+    call failing with `NOT_FOUND` is therefore retried once with the cached
+    IDs replaced by their paths, and these entries are removed. Calls made
+    with `.future()` are retried when their result is requested. Streaming
+    calls are not retried.
+
+    The cache is thread-safe.
+
+    Attributes:
+        max_size: Maximum number of cached paths, set to 0 to disable caching.
+        hits: Number of paths sent as IDs.
+        misses: Number of paths sent as paths.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_PATH_CACHE_MAX_SIZE):
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._ids: OrderedDict[str, uuid.UUID] = OrderedDict()
+        # sessions may be used by many threads, e.g. with pipelined calls
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._ids)
+
+    def clear(self) -> None:
+        """Remove all cached paths. Hit and miss counts are kept."""
+        with self._lock:
+            self._ids.clear()
+
+    def _get(self, path: str) -> uuid.UUID | None:
+        with self._lock:
+            id = self._ids.get(path)
+            if id is None:
+                self.misses += 1
+                return None
+
+            self._ids.move_to_end(path)
+            self.hits += 1
+            return id
+
+    def _get_retry_request(
+        self, error: grpc.RpcError, request: message.Message
+    ) -> message.Message | None:
+        """Get a copy of a failed request with cached IDs replaced by their
+        paths, or None if the failure is not caused by a stale cache entry.
+        The replaced entries are removed from the cache.
+        """
+        if (
+            not isinstance(error, grpc.Call)
+            or error.code() != grpc.StatusCode.NOT_FOUND
+        ):
+            return None
+
+        with self._lock:
+            paths = {id: path for path, id in self._ids.items()}
+        retry_request = request.__class__()
+        retry_request.CopyFrom(request)
+        replaced_paths = _replace_ids_with_paths(retry_request, paths)
+        if not replaced_paths:
+            return None
+
+        with self._lock:
+            for path in replaced_paths:
+                self._ids.pop(path, None)
+        return retry_request
+
+    def _add(self, target: _T) -> _T:
+        """Cache path and ID of an object or attribute and return it."""
+        # path or ID may be excluded by an explicit attribute field mask
+        if self.max_size > 0 and target.path and target.id is not None:
+            with self._lock:
+                self._ids[target.path] = target.id
+                self._ids.move_to_end(target.path)
+                while len(self._ids) > self.max_size:
+                    self._ids.popitem(last=False)
+        return target
+
+
+def _replace_ids_with_paths(
+    proto_message: message.Message, paths: typing.Dict[uuid.UUID, str]
+) -> typing.List[str]:
+    """Replace IDs of Mesh IDs without a path by paths found in `paths`.
+
+    Returns:
+        The paths set.
+    """
+    if isinstance(proto_message, type.resources_pb2.MeshId):
+        if proto_message.HasField("id") and not proto_message.HasField("path"):
+            path = paths.get(_from_proto_guid(proto_message.id))
+            if path is not None:
+                proto_message.ClearField("id")
+                proto_message.path = path
+                return [path]
+        return []
+
+    replaced_paths = []
+    for field, value in proto_message.ListFields():
+        if field.message_type is None or field.message_type.GetOptions().map_entry:
+            continue
+        values = [value] if isinstance(value, message.Message) else value
+        for item in values:
+            replaced_paths.extend(_replace_ids_with_paths(item, paths))
+    return replaced_paths
+
+
+class _PathCacheFallbackMethod:
+    """Unary gRPC method retried by path on `NOT_FOUND`, see `PathCache`.
+
+    Everything except calling and `future` is delegated to the wrapped
+    method, e.g. `with_call`.
+    """
+
+    __slots__ = ("_method", "_path_cache")
+
+    def __init__(self, method, path_cache: PathCache):
+        self._method = method
+        self._path_cache = path_cache
+
+    def __call__(self, request, *args, **kwargs):
+        try:
+            return self._method(request, *args, **kwargs)
+        except grpc.RpcError as e:
+            retry_request = self._path_cache._get_retry_request(e, request)
+            if retry_request is None:
+                raise
+        return self._method(retry_request, *args, **kwargs)
+
+    def future(self, request, *args, **kwargs):
+        return _PathCacheFallbackFuture(self, request, args, kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._method, name)
+
+
+class _PathCacheFallbackFuture:
+    """Future of a `_PathCacheFallbackMethod` call, retried by path when its
+    result is requested.
+
+    Everything except `result` is delegated to the future of the current
+    attempt, e.g. `cancel`.
+    """
+
+    __slots__ = ("_method", "_request", "_args", "_kwargs", "_future", "_retried")
+
+    def __init__(self, method: _PathCacheFallbackMethod, request, args, kwargs):
+        self._method = method
+        self._request = request
+        self._args = args
+        self._kwargs = kwargs
+        self._future = method._method.future(request, *args, **kwargs)
+        self._retried = False
+
+    def result(self, timeout: float | None = None):
+        try:
+            return self._future.result(timeout)
+        except grpc.RpcError as e:
+            if self._retried:
+                raise
+            retry_request = self._method._path_cache._get_retry_request(
+                e, self._request
+            )
+            if retry_request is None:
+                raise
+        self._retried = True
+        self._future = self._method._method.future(
+            retry_request, *self._args, **self._kwargs
+        )
+        return self._future.result(timeout)
+
+    def __getattr__(self, name: str):
+        return getattr(self._future, name)
+
+
+class _AsyncPathCacheFallbackMethod(_PathCacheFallbackMethod):
+    """Asynchronous version of `_PathCacheFallbackMethod`."""
+
+    __slots__ = ()
+
+    async def __call__(self, request, *args, **kwargs):
+        try:
+            return await self._method(request, *args, **kwargs)
+        except grpc.RpcError as e:
+            retry_request = self._path_cache._get_retry_request(e, request)
+            if retry_request is None:
+                raise
+        return await self._method(retry_request, *args, **kwargs)
+
+
+class _PathCacheFallbackStub:
+    """Proxy for a gRPC service stub of a session. Unary calls that failed
+    because of a stale `PathCache` entry are retried by path.
+    """
+
+    def __init__(self, stub, path_cache: PathCache):
+        self._stub = stub
+        self._path_cache = path_cache
+
+    def __getattr__(self, name: str):
+        method = getattr(self._stub, name)
+        if isinstance(method, grpc.aio.UnaryUnaryMultiCallable):
+            return _AsyncPathCacheFallbackMethod(method, self._path_cache)
+        if isinstance(method, grpc.UnaryUnaryMultiCallable):
+            return _PathCacheFallbackMethod(method, self._path_cache)
+        return method
+
 
 def _to_proto_attribute_mesh_id(
     target: uuid.UUID | str | AttributeBase,
+    path_cache: PathCache | None = None,
 ) -> type.resources_pb2.MeshId:
     """
     Accepts attribute identifiers (path and ID) and attribute instance as
@@ -21,7 +255,7 @@ def _to_proto_attribute_mesh_id(
             "need to provide either path (as str), ID (as uuid.UUID) or attribute instance"
         )
 
-    return _to_proto_mesh_id(target)
+    return _to_proto_mesh_id(target, path_cache)
 
 
 def _to_proto_attribute_definition_mesh_id(
@@ -39,8 +273,38 @@ def _to_proto_attribute_definition_mesh_id(
     return _to_proto_mesh_id(target)
 
 
+def _to_proto_object_definition_mesh_id(
+    target: uuid.UUID | str,
+) -> type.resources_pb2.MeshId:
+    """
+    Accepts object definition identifiers (path and ID) as input.
+    """
+    if not isinstance(target, (uuid.UUID, str)):
+        raise TypeError(
+            "need to provide either path (as str) or ID (as uuid.UUID) of object definition"
+        )
+
+    return _to_proto_mesh_id(target)
+
+
+def _to_proto_model_definition_mesh_id(
+    target: uuid.UUID | str,
+) -> type.resources_pb2.MeshId:
+    """
+    Accepts identifiers (path and ID) of model definitions, namespaces and
+    attribute types as input.
+    """
+    if not isinstance(target, (uuid.UUID, str)):
+        raise TypeError(
+            "need to provide either path (as str) or ID (as uuid.UUID) of model definition resource"
+        )
+
+    return _to_proto_mesh_id(target)
+
+
 def _to_proto_object_mesh_id(
     target: uuid.UUID | str | Object,
+    path_cache: PathCache | None = None,
 ) -> type.resources_pb2.MeshId:
     """
     Accepts object identifiers (path and ID) and object instance as input.
@@ -50,11 +314,28 @@ def _to_proto_object_mesh_id(
             "need to provide either path (as str), ID (as uuid.UUID) or Mesh object instance"
         )
 
-    return _to_proto_mesh_id(target)
+    return _to_proto_mesh_id(target, path_cache)
+
+
+def _to_proto_owner_mesh_id(
+    target: uuid.UUID | str | Object | AttributeBase,
+    path_cache: PathCache | None = None,
+) -> type.resources_pb2.MeshId:
+    """
+    Accepts owner identifiers (path and ID) and object or ownership relation
+    attribute instance as input.
+    """
+    if not isinstance(target, (uuid.UUID, str, Object, AttributeBase)):
+        raise TypeError(
+            "need to provide either path (as str), ID (as uuid.UUID), Mesh object or attribute instance"
+        )
+
+    return _to_proto_mesh_id(target, path_cache)
 
 
 def _to_proto_read_timeseries_mesh_id(
     target: uuid.UUID | str | int | AttributeBase,
+    path_cache: PathCache | None = None,
 ) -> type.resources_pb2.MeshId:
     """
     Accepts identifiers for reading time series:
@@ -65,7 +346,7 @@ def _to_proto_read_timeseries_mesh_id(
             "need to provide either path (as str), ID (as uuid.UUID), time series key or time series attribute instance"
         )
 
-    return _to_proto_mesh_id(target)
+    return _to_proto_mesh_id(target, path_cache)
 
 
 def _to_proto_calculation_target_mesh_id(
@@ -85,8 +366,12 @@ def _to_proto_calculation_target_mesh_id(
 
 def _to_proto_mesh_id(
     target: uuid.UUID | str | int | AttributeBase | Object,
+    path_cache: PathCache | None = None,
 ) -> type.resources_pb2.MeshId:
-    """Accepts path, ID and time series key as input."""
+    """Accepts path, ID and time series key as input.
+
+    If `path_cache` is given, paths resolved before are sent as IDs.
+    """
     proto_mesh_id = type.resources_pb2.MeshId()
 
     if isinstance(
@@ -97,7 +382,11 @@ def _to_proto_mesh_id(
     elif isinstance(target, uuid.UUID):
         proto_mesh_id.id.CopyFrom(_to_proto_guid(target))
     elif isinstance(target, str):
-        proto_mesh_id.path = target
+        id = path_cache._get(target) if path_cache is not None else None
+        if id is not None:
+            proto_mesh_id.id.CopyFrom(_to_proto_guid(id))
+        else:
+            proto_mesh_id.path = target
     elif isinstance(target, int):
         proto_mesh_id.timeseries_key = target
     else:
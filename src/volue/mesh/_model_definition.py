@@ -0,0 +1,192 @@
+"""
+Mesh model definition metadata and its connection-level cache.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import typing
+import uuid
+from dataclasses import dataclass
+
+from volue.mesh._attribute import AttributeBase, _from_proto_attribute_definition
+from volue.mesh._common import _from_proto_guid
+
+if typing.TYPE_CHECKING:
+    from volue.mesh.proto.model_definition.v1alpha import (
+        resources_pb2 as model_definition_resources_pb2,
+    )
+    from volue.mesh.proto.type import resources_pb2
+
+DEFAULT_METADATA_CACHE_TTL = 600.0
+
+_UNITS_OF_MEASUREMENT_KEY = ("units_of_measurement",)
+
+
+def _from_proto_owner_id(proto_owner_id: resources_pb2.MeshId) -> uuid.UUID | None:
+    return (
+        _from_proto_guid(proto_owner_id.id) if proto_owner_id.HasField("id") else None
+    )
+
+
+@dataclass(frozen=True)
+class UnitOfMeasurement:
+    """Unit of measurement defined in Mesh, e.g. `MW`."""
+
+    id: uuid.UUID
+    name: str
+
+    @classmethod
+    def _from_proto(
+        cls, proto_unit: model_definition_resources_pb2.UnitOfMeasurement
+    ) -> UnitOfMeasurement:
+        return cls(id=_from_proto_guid(proto_unit.id), name=proto_unit.name)
+
+
+@dataclass(frozen=True)
+class Tag:
+    """Tag of a model definition, assigned to attribute types and object definitions."""
+
+    id: uuid.UUID
+    name: str
+    description: str
+
+    @classmethod
+    def _from_proto(cls, proto_tag: model_definition_resources_pb2.Tag) -> Tag:
+        return cls(
+            id=_from_proto_guid(proto_tag.id),
+            name=proto_tag.name,
+            description=proto_tag.description,
+        )
+
+
+@dataclass(frozen=True)
+class Namespace:
+    """Namespace of a model definition.
+
+    A model definition is also a namespace, it has no owner.
+    """
+
+    id: uuid.UUID
+    path: str
+    name: str
+    description: str
+    owner_id: uuid.UUID | None
+    is_model_definition: bool
+
+    @classmethod
+    def _from_proto(
+        cls, proto_namespace: model_definition_resources_pb2.Namespace
+    ) -> Namespace:
+        return cls(
+            id=_from_proto_guid(proto_namespace.id),
+            path=proto_namespace.path,
+            name=proto_namespace.name,
+            description=proto_namespace.description,
+            owner_id=_from_proto_owner_id(proto_namespace.owner_id),
+            is_model_definition=proto_namespace.is_model_definition,
+        )
+
+
+@dataclass(frozen=True)
+class ObjectDefinition:
+    """Object definition, i.e. the type of Mesh objects, with its attribute definitions."""
+
+    id: uuid.UUID
+    path: str
+    name: str
+    description: str
+    owner_id: uuid.UUID | None
+    tags: typing.Tuple[str, ...]
+    namespace: str
+    instance_count: int
+    attribute_definitions: typing.Tuple[AttributeBase.AttributeBaseDefinition, ...]
+
+    @classmethod
+    def _from_proto(
+        cls, proto_definition: model_definition_resources_pb2.ObjectDefinition
+    ) -> ObjectDefinition:
+        return cls(
+            id=_from_proto_guid(proto_definition.id),
+            path=proto_definition.path,
+            name=proto_definition.name,
+            description=proto_definition.description,
+            owner_id=_from_proto_owner_id(proto_definition.owner_id),
+            tags=tuple(tag.name for tag in proto_definition.tags),
+            namespace=proto_definition.name_space,
+            instance_count=proto_definition.instance_count,
+            attribute_definitions=tuple(
+                map(
+                    _from_proto_attribute_definition,
+                    proto_definition.attribute_definitions,
+                )
+            ),
+        )
+
+
+class MetadataCache:
+    """Connection-level cache of model definition metadata.
+
+    Units of measurement, object definitions, attribute definitions,
+    namespaces and tags change rarely, but are needed e.g. each time a
+    physical time series is created. Sessions of the same connection share
+    one cache, the metadata is requested from Mesh only when it is not cached
+    yet or has expired.
+
+    A session that updates an attribute definition uses a cache of its own
+    until it is committed, rolled back or closed, so that its uncommitted
+    changes are not visible to other sessions. The shared cache is refreshed
+    on commit. Changes of the model definition made by other clients are
+    visible after `ttl` seconds or after an explicit :py:meth:`refresh`.
+
+    Attributes:
+        ttl: Seconds after which cached metadata is requested from Mesh again.
+            `None` means cached metadata never expires, set to 0 to disable
+            caching.
+        hits: Number of requests served from the cache.
+        misses: Number of requests sent to Mesh.
+    """
+
+    def __init__(self, ttl: float | None = DEFAULT_METADATA_CACHE_TTL):
+        self.ttl: float | None = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: typing.Dict[tuple, typing.Tuple[float, typing.Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self) -> None:
+        """Remove all cached metadata, it is requested from Mesh again on next use.
+
+        Hit and miss counts are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: tuple) -> typing.Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (
+                self.ttl is None or time.monotonic() - entry[0] < self.ttl
+            ):
+                self.hits += 1
+                return entry[1]
+
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def _set(self, key: tuple, value: typing.Any) -> typing.Any:
+        """Cache metadata and return it."""
+        if self.ttl is None or self.ttl > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+        return value
+
+    def _remove(self, key: tuple) -> bool:
+        """Remove cached metadata, return `True` if it was cached."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
@@ -2,20 +2,26 @@
 Functionality for working with Mesh objects.
 """
 
+import sys
 import uuid
+from collections.abc import MutableMapping
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Iterator, List, Sequence
 
+from volue.mesh import profiling
 from volue.mesh._attribute import AttributeBase, _from_proto_attribute
 from volue.mesh._common import _from_proto_guid
 from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
 
 
-@dataclass
+@dataclass(slots=True)
 class Object:
     """Represents a Mesh Object.
 
     Mesh Object is an instance of Object Definition in the Mesh Model.
+    Attributes of objects streamed by `iter_objects`,
+    `iter_objects_by_definition` and `traverse_objects` are parsed on first
+    access.
 
     Refer to documentation for more details:
     `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
@@ -27,14 +33,20 @@ class Object:
     type_name: str
     owner_id: uuid.UUID | None
     owner_path: str | None
-    attributes: Dict[str, AttributeBase] = field(default_factory=dict)
+    attributes: MutableMapping[str, AttributeBase] = field(default_factory=dict)
 
     @classmethod
-    def _from_proto_object(cls, proto_object: model_resources_pb2.Object):
+    def _from_proto_object(
+        cls, proto_object: model_resources_pb2.Object, lazy: bool = False
+    ):
         """Create an `Object` from protobuf Mesh Object.
 
         Args:
             proto_object: Protobuf Object returned from the gRPC methods.
+            lazy: Keep the protobuf attributes and parse each attribute on
+                first access instead of parsing and sorting all of them
+                upfront. Used by bulk reads, where often only a few
+                attributes of each object are accessed.
         """
 
         owner_id = (
@@ -42,26 +54,150 @@ class Object:
             if proto_object.HasField("owner_id")
             else None
         )
+        # siblings share the owner path
         owner_path = (
-            proto_object.owner_id.path if proto_object.HasField("owner_id") else None
+            sys.intern(proto_object.owner_id.path)
+            if proto_object.HasField("owner_id")
+            else None
         )
 
         object = cls(
             id=_from_proto_guid(proto_object.id),
             path=proto_object.path,
             name=proto_object.name,
-            type_name=proto_object.type_name,
+            type_name=sys.intern(proto_object.type_name),
             owner_id=owner_id,
             owner_path=owner_path,
         )
 
+        if lazy:
+            object.attributes = _LazyAttributes(proto_object.attributes, object.path)
+            return object
+
         # no particular order of attributes and objects returned from Mesh is guaranteed
         # sort attributes by name
-        for proto_attribute in sorted(
+        start = profiling._start()
+        proto_attributes = sorted(
             proto_object.attributes, key=lambda attribute: attribute.name.lower()
-        ):
+        )
+        if start is not None:
+            profiling._record(
+                "sort_attributes",
+                start,
+                target=object.path,
+                points=len(proto_attributes),
+            )
+
+        for proto_attribute in proto_attributes:
             object.attributes[proto_attribute.name] = _from_proto_attribute(
                 proto_attribute
             )
 
         return object
+
+
+class _LazyAttributes(MutableMapping):
+    """Attributes of an `Object` parsed from protobuf on first access.
+
+    Keeps the protobuf attributes and parses an attribute only when it is
+    accessed by name. Iteration order is the same as for eagerly parsed
+    objects: attributes sorted by name, case insensitive. Sorting is done on
+    first iteration. Any modification and pickling parse all remaining
+    attributes.
+    """
+
+    __slots__ = ("_proto_attributes", "_object_path", "_indexes", "_names", "_parsed")
+
+    def __init__(
+        self,
+        proto_attributes: Sequence[model_resources_pb2.Attribute],
+        object_path: str,
+    ):
+        self._proto_attributes: Sequence[model_resources_pb2.Attribute] | None = (
+            proto_attributes
+        )
+        self._object_path = object_path
+        # attribute name to index in `_proto_attributes`
+        self._indexes: Dict[str, int] | None = None
+        # attribute names sorted by name
+        self._names: List[str] | None = None
+        self._parsed: Dict[str, AttributeBase] = {}
+
+    def _get_indexes(self) -> Dict[str, int]:
+        if self._indexes is None:
+            self._indexes = {
+                proto_attribute.name: index
+                for index, proto_attribute in enumerate(self._proto_attributes)
+            }
+        return self._indexes
+
+    def _get_names(self) -> List[str]:
+        if self._names is None:
+            start = profiling._start()
+            self._names = sorted(self._get_indexes(), key=str.lower)
+            if start is not None:
+                profiling._record(
+                    "sort_attributes",
+                    start,
+                    target=self._object_path,
+                    points=len(self._names),
+                )
+        return self._names
+
+    @classmethod
+    def _from_parsed(
+        cls, attributes: Dict[str, AttributeBase], object_path: str
+    ) -> "_LazyAttributes":
+        lazy_attributes = cls((), object_path)
+        lazy_attributes._proto_attributes = None
+        lazy_attributes._parsed = attributes
+        return lazy_attributes
+
+    def __reduce__(self):
+        # protobuf containers cannot be pickled, pickle the parsed attributes
+        return (type(self)._from_parsed, (dict(self.items()), self._object_path))
+
+    def _materialize(self) -> None:
+        """Parse all attributes and drop the protobuf attributes."""
+        if self._proto_attributes is not None:
+            self._parsed = {name: self[name] for name in self._get_names()}
+            self._proto_attributes = None
+            self._indexes = None
+            self._names = None
+
+    def __getitem__(self, name: str) -> AttributeBase:
+        attribute = self._parsed.get(name)
+        if attribute is None:
+            if self._proto_attributes is None:
+                raise KeyError(name)
+            attribute = _from_proto_attribute(
+                self._proto_attributes[self._get_indexes()[name]]
+            )
+            self._parsed[name] = attribute
+        return attribute
+
+    def __setitem__(self, name: str, attribute: AttributeBase) -> None:
+        self._materialize()
+        self._parsed[name] = attribute
+
+    def __delitem__(self, name: str) -> None:
+        self._materialize()
+        del self._parsed[name]
+
+    def __contains__(self, name: object) -> bool:
+        if self._proto_attributes is None:
+            return name in self._parsed
+        return name in self._get_indexes()
+
+    def __iter__(self) -> Iterator[str]:
+        if self._proto_attributes is None:
+            return iter(self._parsed)
+        return iter(self._get_names())
+
+    def __len__(self) -> int:
+        if self._proto_attributes is None:
+            return len(self._parsed)
+        return len(self._get_indexes())
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
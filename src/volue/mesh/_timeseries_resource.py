@@ -28,7 +28,7 @@ class TimeseriesResource:
     name: str
     temporary: bool
     curve_type: Timeseries.Curve
-    resolution: Timeseries.Resolution
+    resolution: Timeseries.Resolution | None
     unit_of_measurement: str | None
     virtual_timeseries_expression: str | None = None
     time_zone: str | None = None
@@ -48,7 +48,12 @@ class TimeseriesResource:
             name=proto_timeseries_resource.name,
             temporary=proto_timeseries_resource.temporary,
             curve_type=_from_proto_curve_type(proto_timeseries_resource.curve_type),
-            resolution=_from_proto_resolution(proto_timeseries_resource.resolution),
+            # may be excluded by an explicit attribute field mask
+            resolution=(
+                _from_proto_resolution(proto_timeseries_resource.resolution)
+                if proto_timeseries_resource.HasField("resolution")
+                else None
+            ),
             unit_of_measurement=_get_unit_of_measurement(proto_timeseries_resource),
             virtual_timeseries_expression=proto_timeseries_resource.virtual_timeseries_expression,
             time_zone=(
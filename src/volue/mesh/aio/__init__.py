@@ -2,8 +2,30 @@
 Functionality that supports concurrency using asyncio.
 """
 
-from ._connection import Connection
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._connection import Connection
 
 __all__ = [
     "Connection",
 ]
+
+# See `volue.mesh.__getattr__`.
+_LAZY_ATTRIBUTES = {
+    "Connection": "._connection",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,62 +2,139 @@
 Functionality for asynchronously connecting to a Mesh server and working with its sessions.
 """
 
+from __future__ import annotations
+
 import asyncio
+import collections
+import copy
 import typing
 import uuid
 from datetime import datetime, timedelta
 from typing import List
 
 import grpc
+import pyarrow as pa
 from google import protobuf
+from google.protobuf import json_format
 
 from volue.mesh import (
     AttributeBase,
     AttributesFilter,
     Authentication,
+    CopyTimeseriesResult,
     HydSimDataset,
+    LinkRelationAttribute,
+    LinkRelationUpdate,
     LinkRelationVersion,
     LogMessage,
+    MetadataCache,
+    Namespace,
     Object,
+    ObjectDefinition,
+    SimpleAttributeUpdateFailure,
+    Tag,
     Timeseries,
     TimeseriesAttribute,
+    TimeseriesCopyMode,
     TimeseriesResource,
+    TraversalNode,
+    TypeAttributeMapping,
+    UnitOfMeasurement,
     UserIdentity,
+    VersionedLinkRelationUpdate,
     VersionInfo,
     _attribute,
     _base_connection,
     _base_session,
 )
-from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh._attribute import (
+    _from_proto_attribute,
+    _from_proto_attribute_definition,
+)
+from volue.mesh._attribute_table import (
+    SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+    _SimpleAttributeTableBuilder,
+)
 from volue.mesh._authentication import ExternalAccessTokenPlugin
 from volue.mesh._common import (
     RatingCurveVersion,
     XySet,
     _from_proto_guid,
-    _to_proto_curve_type,
     _to_proto_guid,
-    _to_proto_resolution,
     _validate_server_version,
 )
+from volue.mesh._model_definition import _UNITS_OF_MEASUREMENT_KEY
 from volue.mesh._version_compatibility import get_compatibility_check_metadata
-from volue.mesh.availability._availability_aio import Availability
-from volue.mesh.calc.forecast import ForecastFunctionsAsync
-from volue.mesh.calc.history import HistoryFunctionsAsync
-from volue.mesh.calc.statistical import StatisticalFunctionsAsync
-from volue.mesh.calc.transform import TransformFunctionsAsync
 from volue.mesh.proto.config.v1alpha import config_pb2_grpc
-from volue.mesh.proto.availability.v1alpha import availability_pb2_grpc
-from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
-from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
-from volue.mesh.proto.model.v1alpha import model_pb2_grpc
-from volue.mesh.proto.model_definition.v1alpha import (
-    model_definition_pb2,
-    model_definition_pb2_grpc,
-)
-from volue.mesh.proto.session.v1alpha import session_pb2_grpc
-from volue.mesh.proto.time_series.v1alpha import time_series_pb2, time_series_pb2_grpc
+from volue.mesh.proto.model.v1alpha import model_pb2
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
 from volue.mesh.proto.type import resources_pb2
 
+if typing.TYPE_CHECKING:
+    from volue.mesh.availability._availability_aio import Availability
+    from volue.mesh.calc.forecast import ForecastFunctionsAsync
+    from volue.mesh.calc.history import HistoryFunctionsAsync
+    from volue.mesh.calc.statistical import StatisticalFunctionsAsync
+    from volue.mesh.calc.transform import TransformFunctionsAsync
+    from volue.mesh.proto.availability.v1alpha import availability_pb2_grpc
+    from volue.mesh.proto.calc.v1alpha import calc_pb2_grpc
+    from volue.mesh.proto.hydsim.v1alpha import hydsim_pb2_grpc
+    from volue.mesh.proto.model.v1alpha import model_pb2_grpc
+    from volue.mesh.proto.model_definition.v1alpha import model_definition_pb2_grpc
+    from volue.mesh.proto.session.v1alpha import session_pb2_grpc
+    from volue.mesh.proto.time_series.v1alpha import time_series_pb2_grpc
+
+
+class _UnaryStreamInterceptorAdapter(grpc.aio.UnaryStreamClientInterceptor):
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_unary_stream(self, *args):
+        return await self._interceptor.intercept_unary_stream(*args)
+
+
+class _StreamUnaryInterceptorAdapter(grpc.aio.StreamUnaryClientInterceptor):
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_stream_unary(self, *args):
+        return await self._interceptor.intercept_stream_unary(*args)
+
+
+class _StreamStreamInterceptorAdapter(grpc.aio.StreamStreamClientInterceptor):
+    def __init__(self, interceptor):
+        self._interceptor = interceptor
+
+    async def intercept_stream_stream(self, *args):
+        return await self._interceptor.intercept_stream_stream(*args)
+
+
+def _split_interceptors(
+    interceptors: typing.Sequence[grpc.aio.ClientInterceptor] | None,
+) -> typing.List[grpc.aio.ClientInterceptor] | None:
+    """grpc.aio channels register an interceptor only for the first call type
+    it implements (unary-unary, unary-stream, stream-unary, stream-stream).
+    Interceptors implementing several call types are additionally wrapped in
+    adapters for each of the remaining types.
+    """
+    if interceptors is None:
+        return None
+
+    result = []
+    for interceptor in interceptors:
+        result.append(interceptor)
+        registered = isinstance(interceptor, grpc.aio.UnaryUnaryClientInterceptor)
+        for interceptor_type, adapter in (
+            (grpc.aio.UnaryStreamClientInterceptor, _UnaryStreamInterceptorAdapter),
+            (grpc.aio.StreamUnaryClientInterceptor, _StreamUnaryInterceptorAdapter),
+            (grpc.aio.StreamStreamClientInterceptor, _StreamStreamInterceptorAdapter),
+        ):
+            if isinstance(interceptor, interceptor_type):
+                if registered:
+                    result.append(adapter(interceptor))
+                registered = True
+    return result
+
 
 class Connection(_base_connection.Connection):
     class Session(_base_session.Session):
@@ -78,9 +155,11 @@ class Connection(_base_connection.Connection):
             time_series_service: time_series_pb2_grpc.TimeseriesServiceStub,
             availability_service: availability_pb2_grpc.AvailabilityServiceStub,
             session_id: uuid.UUID | None = None,
+            metadata_cache: MetadataCache | None = None,
         ):
             super().__init__(
                 session_id=session_id,
+                metadata_cache=metadata_cache,
                 calc_service=calc_service,
                 hydsim_service=hydsim_service,
                 model_service=model_service,
@@ -88,10 +167,22 @@ class Connection(_base_connection.Connection):
                 session_service=session_service,
                 time_series_service=time_series_service,
             )
-            self.availability = Availability(
-                availability_service=availability_service, session_id=session_id
-            )
+            self.availability_service = availability_service
+            self._availability: Availability | None = None
             self.config_service = config_service
+            self._metadata_requests: typing.Dict[tuple, asyncio.Future] = {}
+
+        @property
+        def availability(self) -> Availability:
+            """Mesh availability events functionality, loaded on first use."""
+            if self._availability is None:
+                from volue.mesh.availability._availability_aio import Availability
+
+                self._availability = Availability(
+                    availability_service=self.availability_service,
+                    session_id=self.session_id,
+                )
+            return self._availability
 
         async def __aenter__(self):
             """
@@ -118,15 +209,17 @@ class Connection(_base_connection.Connection):
         async def _get_unit_of_measurement_id_by_name(
             self, unit_of_measurement: str
         ) -> resources_pb2.Guid:
-            list_response = await self.model_definition_service.ListUnitsOfMeasurement(
-                model_definition_pb2.ListUnitsOfMeasurementRequest(
-                    session_id=_to_proto_guid(self.session_id)
+            try:
+                return super()._get_unit_of_measurement_id_by_name(
+                    unit_of_measurement, await self.list_units_of_measurement()
+                )
+            except ValueError:
+                # the unit may have been added after the units were cached
+                if not self.metadata_cache._remove(_UNITS_OF_MEASUREMENT_KEY):
+                    raise
+                return super()._get_unit_of_measurement_id_by_name(
+                    unit_of_measurement, await self.list_units_of_measurement()
                 )
-            )
-
-            return super()._get_unit_of_measurement_id_by_name(
-                unit_of_measurement, list_response
-            )
 
         async def open(self) -> None:
             version_info = await self.config_service.GetVersion(
@@ -134,11 +227,17 @@ class Connection(_base_connection.Connection):
             )
 
             _validate_server_version(version_info)
+            await self._start()
 
-            reply = await self.session_service.StartSession(protobuf.empty_pb2.Empty())
+        async def _start(self, timeout: float | None = None) -> None:
+            """Start the session without checking the server version."""
+            reply = await self.session_service.StartSession(
+                protobuf.empty_pb2.Empty(), timeout=timeout
+            )
             self.session_id = _from_proto_guid(reply.session_id)
 
-            self.availability.session_id = self.session_id
+            if self._availability is not None:
+                self._availability.session_id = self.session_id
             self.stop_worker_thread.clear()
             self.worker_thread = super().WorkerThread(self, asyncio.get_running_loop())
             self.worker_thread.start()
@@ -150,12 +249,17 @@ class Connection(_base_connection.Connection):
 
             await self.session_service.EndSession(_to_proto_guid(self.session_id))
             self.session_id = None
+            self._end_model_definition_change(committed=False)
 
         async def rollback(self) -> None:
             await self.session_service.Rollback(_to_proto_guid(self.session_id))
+            self.path_cache.clear()
+            self._end_model_definition_change(committed=False)
 
         async def commit(self) -> None:
             await self.session_service.Commit(_to_proto_guid(self.session_id))
+            self.path_cache.clear()
+            self._end_model_definition_change(committed=True)
 
         async def read_timeseries_points(
             self,
@@ -171,6 +275,70 @@ class Connection(_base_connection.Connection):
             request = super()._prepare_write_timeseries_points_request(timeseries)
             await self.time_series_service.WriteTimeseries(request)
 
+        async def copy_timeseries_between_objects(
+            self,
+            source: uuid.UUID | str | Object,
+            target: uuid.UUID | str | Object,
+            start_time: datetime | None = None,
+            end_time: datetime | None = None,
+            scenario_name: str | None = None,
+            mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+        ) -> CopyTimeseriesResult:
+            request = super()._prepare_copy_timeseries_between_objects_request(
+                source, target, start_time, end_time, scenario_name, mappings
+            )
+            response = await self.time_series_service.CopyTimeseriesBetweenObjects(
+                request
+            )
+            return CopyTimeseriesResult._from_proto(response)
+
+        async def copy_timeseries_between_object_pairs(
+            self,
+            pairs: typing.Iterable[
+                typing.Tuple[uuid.UUID | str | Object, uuid.UUID | str | Object]
+            ],
+            start_time: datetime | None = None,
+            end_time: datetime | None = None,
+            scenario_name: str | None = None,
+            mappings: typing.Sequence[TypeAttributeMapping] | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> List[CopyTimeseriesResult]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            # validate all requests before copying anything
+            requests = [
+                self._prepare_copy_timeseries_between_objects_request(
+                    source, target, start_time, end_time, scenario_name, mappings
+                )
+                for source, target in pairs
+            ]
+
+            # send requests without waiting for responses, keep at most
+            # `max_concurrency` of them in flight
+            results = []
+            in_flight = collections.deque()
+
+            async def wait_for_oldest():
+                response = await in_flight.popleft()
+                results.append(CopyTimeseriesResult._from_proto(response))
+
+            try:
+                for request in requests:
+                    if len(in_flight) == max_concurrency:
+                        await wait_for_oldest()
+                    in_flight.append(
+                        asyncio.ensure_future(
+                            self.time_series_service.CopyTimeseriesBetweenObjects(
+                                request
+                            )
+                        )
+                    )
+                while in_flight:
+                    await wait_for_oldest()
+            finally:
+                for task in in_flight:
+                    task.cancel()
+            return results
+
         async def get_timeseries_resource_info(
             self, timeseries_key: int
         ) -> TimeseriesResource:
@@ -223,20 +391,86 @@ class Connection(_base_connection.Connection):
                 unit_of_measurement
             )
 
-            request = time_series_pb2.CreatePhysicalTimeseriesRequest(
-                session_id=_to_proto_guid(self.session_id),
-                path=path,
-                name=name,
-                curve_type=_to_proto_curve_type(curve_type),
-                resolution=_to_proto_resolution(resolution),
-                unit_of_measurement_id=unit_of_measurement_id,
-                time_zone=time_zone,
+            request = super()._prepare_create_physical_timeseries_request(
+                path,
+                name,
+                curve_type,
+                resolution,
+                unit_of_measurement_id,
+                time_zone,
             )
 
             response = await self.time_series_service.CreatePhysicalTimeseries(request)
 
             return TimeseriesResource._from_proto_timeseries_resource(response)
 
+        async def provision_physical_timeseries(
+            self,
+            timeseries: pa.Table,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> pa.Table:
+            _base_session._validate_max_concurrency(max_concurrency)
+            unit_of_measurement_ids = {}
+            for unit in _base_session._get_physical_timeseries_units(timeseries):
+                unit_of_measurement_ids[unit] = (
+                    await self._get_unit_of_measurement_id_by_name(unit)
+                )
+            requests, targets = super()._prepare_provision_physical_timeseries_requests(
+                timeseries, unit_of_measurement_ids
+            )
+
+            async def send(method, requests):
+                """Send requests with a fixed number of workers, return
+                responses or errors in order."""
+                responses = [None] * len(requests)
+                pending = iter(enumerate(requests))
+
+                async def worker():
+                    for i, request in pending:
+                        try:
+                            responses[i] = await method(request)
+                        except grpc.RpcError as e:
+                            responses[i] = e
+
+                workers = [
+                    asyncio.ensure_future(worker())
+                    for _ in range(min(max_concurrency, len(requests)))
+                ]
+                try:
+                    await asyncio.gather(*workers)
+                except BaseException:
+                    for task in workers:
+                        task.cancel()
+                    raise
+                return responses
+
+            responses = await send(
+                self.time_series_service.CreatePhysicalTimeseries, requests
+            )
+
+            rows = []
+            connect_requests = []
+            for row, (response, target) in enumerate(zip(responses, targets)):
+                if target is not None and not isinstance(response, grpc.RpcError):
+                    rows.append(row)
+                    connect_requests.append(
+                        super()._prepare_update_timeseries_attribute_request(
+                            target, None, response.timeseries_key
+                        )
+                    )
+            connect_responses = await send(
+                self.model_service.UpdateTimeseriesAttribute, connect_requests
+            )
+
+            connect_errors = {
+                row: response
+                for row, response in zip(rows, connect_responses)
+                if isinstance(response, grpc.RpcError)
+            }
+            return _base_session._to_provisioned_timeseries_table(
+                responses, connect_errors
+            )
+
         async def get_attribute(
             self,
             target: uuid.UUID | str | AttributeBase,
@@ -246,7 +480,56 @@ class Connection(_base_connection.Connection):
                 target, full_attribute_info
             )
             proto_attribute = await self.model_service.GetAttribute(request)
-            return _from_proto_attribute(proto_attribute)
+            return self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+        async def get_attributes(
+            self,
+            targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+            full_attribute_info: bool = False,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> List[AttributeBase]:
+            _base_session._validate_max_concurrency(max_concurrency)
+
+            async def all_targets():
+                for target in targets:
+                    yield target
+
+            return [
+                attribute
+                async for attribute in self._get_attributes(
+                    all_targets(), full_attribute_info, max_concurrency
+                )
+            ]
+
+        async def _get_attributes(
+            self,
+            targets: typing.AsyncIterable[uuid.UUID | str | AttributeBase],
+            full_attribute_info: bool,
+            max_concurrency: int,
+        ) -> typing.AsyncIterator[AttributeBase]:
+            """Request attributes without waiting for responses, keep at most
+            `max_concurrency` of them in flight, yield attributes in order."""
+            in_flight = collections.deque()
+
+            async def wait_for_oldest():
+                proto_attribute = await in_flight.popleft()
+                return self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+            try:
+                async for target in targets:
+                    if len(in_flight) == max_concurrency:
+                        yield await wait_for_oldest()
+                    request = super()._prepare_get_attribute_request(
+                        target, full_attribute_info
+                    )
+                    in_flight.append(
+                        asyncio.ensure_future(self.model_service.GetAttribute(request))
+                    )
+                while in_flight:
+                    yield await wait_for_oldest()
+            finally:
+                for task in in_flight:
+                    task.cancel()
 
         async def get_timeseries_attribute(
             self,
@@ -265,16 +548,40 @@ class Connection(_base_connection.Connection):
             target: uuid.UUID | str | Object,
             query: str,
             full_attribute_info: bool = False,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> List[AttributeBase]:
             request = super()._prepare_search_attributes_request(
-                target, query, full_attribute_info
+                target, query, full_attribute_info, attribute_fields
             )
 
             attributes = []
             async for proto_attribute in self.model_service.SearchAttributes(request):
-                attributes.append(_from_proto_attribute(proto_attribute))
+                attributes.append(
+                    self.path_cache._add(_from_proto_attribute(proto_attribute))
+                )
             return attributes
 
+        def iter_attributes(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            full_attribute_info: bool = False,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.AsyncIterator[AttributeBase | List[AttributeBase]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_attributes_request(
+                target, query, full_attribute_info, attribute_fields
+            )
+
+            async def attributes():
+                async for proto_attribute in self.model_service.SearchAttributes(
+                    request
+                ):
+                    yield self.path_cache._add(_from_proto_attribute(proto_attribute))
+
+            return _base_session._batched_async(attributes(), batch_size)
+
         async def search_for_timeseries_attributes(
             self,
             target: uuid.UUID | str | Object,
@@ -296,6 +603,53 @@ class Connection(_base_connection.Connection):
             request = super()._prepare_update_simple_attribute_request(target, value)
             await self.model_service.UpdateSimpleAttribute(request)
 
+        async def update_simple_attributes(
+            self,
+            values: (
+                typing.Mapping[
+                    uuid.UUID | str | AttributeBase,
+                    _attribute.SIMPLE_TYPE_OR_COLLECTION,
+                ]
+                | typing.Iterable[
+                    typing.Tuple[
+                        uuid.UUID | str | AttributeBase,
+                        _attribute.SIMPLE_TYPE_OR_COLLECTION,
+                    ]
+                ]
+                | pa.Table
+            ),
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> List[SimpleAttributeUpdateFailure]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            requests, failures = super()._prepare_update_simple_attributes_requests(
+                values
+            )
+
+            # a fixed number of workers take requests from a shared iterator,
+            # instead of a task per request
+            pending = iter(requests)
+
+            async def send():
+                for index, target, request in pending:
+                    try:
+                        await self.model_service.UpdateSimpleAttribute(request)
+                    except grpc.RpcError as e:
+                        failures.append(SimpleAttributeUpdateFailure(index, target, e))
+
+            workers = [
+                asyncio.ensure_future(send())
+                for _ in range(min(max_concurrency, len(requests)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                raise
+
+            failures.sort(key=lambda failure: failure.index)
+            return failures
+
         async def update_timeseries_attribute(
             self,
             target: uuid.UUID | str | AttributeBase,
@@ -319,6 +673,7 @@ class Connection(_base_connection.Connection):
             await self.model_definition_service.UpdateTimeseriesAttributeDefinition(
                 request
             )
+            self._begin_model_definition_change()
 
         async def update_link_relation_attribute(
             self,
@@ -355,6 +710,37 @@ class Connection(_base_connection.Connection):
             )
             await self.model_service.UpdateVersionedLinkRelationAttribute(request)
 
+        async def update_link_relation_attributes(
+            self,
+            updates: typing.Iterable[LinkRelationUpdate | VersionedLinkRelationUpdate],
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_UPDATES,
+        ) -> None:
+            _base_session._validate_max_concurrency(max_concurrency)
+            requests = super()._prepare_update_link_relation_attributes_requests(
+                updates
+            )
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def update(request):
+                async with semaphore:
+                    if isinstance(
+                        request, model_pb2.UpdateLinkRelationAttributeRequest
+                    ):
+                        await self.model_service.UpdateLinkRelationAttribute(request)
+                    else:
+                        await self.model_service.UpdateVersionedLinkRelationAttribute(
+                            request
+                        )
+
+            tasks = [asyncio.ensure_future(update(request)) for request in requests]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # updates waiting for the semaphore are not sent
+                for task in tasks:
+                    task.cancel()
+                raise
+
         async def list_models(
             self,
         ) -> List[Object]:
@@ -363,17 +749,122 @@ class Connection(_base_connection.Connection):
             response = await self.model_service.ListModels(request)
             return gen.send(response)
 
+        async def _get_metadata(
+            self,
+            key: tuple,
+            request_metadata: typing.Callable[
+                [], typing.Awaitable[typing.Tuple[typing.Any, ...]]
+            ],
+        ) -> List[typing.Any]:
+            metadata = self.metadata_cache._get(key)
+            if metadata is None:
+                # concurrent calls wait for the same request
+                task = self._metadata_requests.get(key)
+                if task is None:
+                    task = asyncio.ensure_future(request_metadata())
+                    self._metadata_requests[key] = task
+                    task.add_done_callback(
+                        lambda _: self._metadata_requests.pop(key, None)
+                    )
+                metadata = await task
+                # the session may have started a model definition change meanwhile
+                metadata = self.metadata_cache._set(key, metadata)
+            # attribute definitions are mutable, keep the cached ones intact
+            return copy.deepcopy(list(metadata))
+
+        async def list_units_of_measurement(self) -> List[UnitOfMeasurement]:
+            request = super()._prepare_list_units_of_measurement_request()
+
+            async def units():
+                response = await self.model_definition_service.ListUnitsOfMeasurement(
+                    request
+                )
+                return tuple(
+                    map(UnitOfMeasurement._from_proto, response.units_of_measurement)
+                )
+
+            return await self._get_metadata(_UNITS_OF_MEASUREMENT_KEY, units)
+
+        async def list_tags(self, target: uuid.UUID | str) -> List[Tag]:
+            request = super()._prepare_list_tags_request(target)
+
+            async def tags():
+                response = await self.model_definition_service.ListTags(request)
+                return tuple(map(Tag._from_proto, response.tags))
+
+            return await self._get_metadata(("tags", target), tags)
+
+        async def search_namespaces(
+            self, target: uuid.UUID | str, recursive: bool = False
+        ) -> List[Namespace]:
+            request = super()._prepare_search_namespaces_request(target, recursive)
+
+            async def namespaces():
+                return tuple(
+                    [
+                        Namespace._from_proto(proto_namespace)
+                        async for proto_namespace in self.model_definition_service.SearchNamespaces(
+                            request
+                        )
+                    ]
+                )
+
+            return await self._get_metadata(
+                ("namespaces", target, recursive), namespaces
+            )
+
+        async def search_object_definitions(
+            self, target: uuid.UUID | str, recursive: bool = False
+        ) -> List[ObjectDefinition]:
+            request = super()._prepare_search_object_definitions_request(
+                target, recursive
+            )
+
+            async def definitions():
+                return tuple(
+                    [
+                        ObjectDefinition._from_proto(proto_definition)
+                        async for proto_definition in self.model_definition_service.SearchObjectDefinitions(
+                            request
+                        )
+                    ]
+                )
+
+            return await self._get_metadata(
+                ("object_definitions", target, recursive), definitions
+            )
+
+        async def search_attribute_definitions(
+            self, target: uuid.UUID | str
+        ) -> List[AttributeBase.AttributeBaseDefinition]:
+            request = super()._prepare_search_attribute_definitions_request(target)
+
+            async def definitions():
+                return tuple(
+                    [
+                        _from_proto_attribute_definition(proto_definition)
+                        async for proto_definition in self.model_definition_service.SearchAttributeDefinitions(
+                            request
+                        )
+                    ]
+                )
+
+            return await self._get_metadata(
+                ("attribute_definitions", target), definitions
+            )
+
         async def get_object(
             self,
             target: uuid.UUID | str | Object,
             full_attribute_info: bool = False,
             attributes_filter: AttributesFilter | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> Object:
             request = super()._prepare_get_object_request(
-                target, full_attribute_info, attributes_filter
+                target, full_attribute_info, attributes_filter, attribute_fields
             )
             proto_object = await self.model_service.GetObject(request)
-            return Object._from_proto_object(proto_object)
+            return self.path_cache._add(Object._from_proto_object(proto_object))
 
         async def search_for_objects(
             self,
@@ -381,22 +872,194 @@ class Connection(_base_connection.Connection):
             query: str,
             full_attribute_info: bool = False,
             attributes_filter: AttributesFilter | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
         ) -> List[Object]:
             request = super()._prepare_search_for_objects_request(
-                target, query, full_attribute_info, attributes_filter
+                target, query, full_attribute_info, attributes_filter, attribute_fields
             )
 
             objects = []
             async for proto_object in self.model_service.SearchObjects(request):
-                objects.append(Object._from_proto_object(proto_object))
+                objects.append(
+                    self.path_cache._add(Object._from_proto_object(proto_object))
+                )
             return objects
 
+        def iter_objects(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.AsyncIterator[Object | List[Object]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_for_objects_request(
+                target, query, full_attribute_info, attributes_filter, attribute_fields
+            )
+
+            async def objects():
+                async for proto_object in self.model_service.SearchObjects(request):
+                    yield self.path_cache._add(
+                        Object._from_proto_object(proto_object, lazy=True)
+                    )
+
+            return _base_session._batched_async(objects(), batch_size)
+
+        def iter_objects_by_definition(
+            self,
+            target: uuid.UUID | str,
+            ids_only: bool = False,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            batch_size: int | None = None,
+            attribute_fields: typing.Sequence[str] | None = None,
+        ) -> typing.AsyncIterator[Object | uuid.UUID | List[Object | uuid.UUID]]:
+            _base_session._validate_batch_size(batch_size)
+            request = super()._prepare_search_objects_by_definition_request(
+                target,
+                ids_only,
+                full_attribute_info,
+                attributes_filter,
+                attribute_fields,
+            )
+
+            async def objects():
+                async for proto_object in self.model_service.SearchObjectsByDefinition(
+                    request
+                ):
+                    if ids_only:
+                        yield _from_proto_guid(proto_object.id)
+                    else:
+                        yield self.path_cache._add(
+                            Object._from_proto_object(proto_object, lazy=True)
+                        )
+
+            return _base_session._batched_async(objects(), batch_size)
+
+        async def search_simple_attributes_table(
+            self,
+            target: uuid.UUID | str | Object,
+            query: str,
+            attribute_names: typing.Sequence[str],
+        ) -> pa.Table:
+            builder = _SimpleAttributeTableBuilder(attribute_names)
+            request = super()._prepare_search_for_objects_request(
+                target,
+                query,
+                full_attribute_info=False,
+                attributes_filter=AttributesFilter(name_mask=builder.attribute_names),
+                attribute_fields=SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+            )
+
+            async for proto_object in self.model_service.SearchObjects(request):
+                builder.add(proto_object)
+            return builder.to_table()
+
+        async def search_simple_attributes_table_by_definition(
+            self,
+            target: uuid.UUID | str,
+            attribute_names: typing.Sequence[str],
+        ) -> pa.Table:
+            builder = _SimpleAttributeTableBuilder(attribute_names)
+            request = super()._prepare_search_objects_by_definition_request(
+                target,
+                ids_only=False,
+                full_attribute_info=False,
+                attributes_filter=AttributesFilter(name_mask=builder.attribute_names),
+                attribute_fields=SIMPLE_ATTRIBUTE_TABLE_FIELDS,
+            )
+
+            async for proto_object in self.model_service.SearchObjectsByDefinition(
+                request
+            ):
+                builder.add(proto_object)
+            return builder.to_table()
+
+        def iter_linked_from(
+            self,
+            target: uuid.UUID | str | Object,
+            ids_only: bool = False,
+            full_attribute_info: bool = False,
+            batch_size: int | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> typing.AsyncIterator[
+            LinkRelationAttribute | uuid.UUID | List[LinkRelationAttribute | uuid.UUID]
+        ]:
+            _base_session._validate_batch_size(batch_size)
+            _base_session._validate_max_concurrency(max_concurrency)
+            request = super()._prepare_search_linked_from_request(target)
+
+            async def ids():
+                async for response in self.model_service.SearchLinkedFrom(request):
+                    yield _from_proto_guid(response.link_relation_id.id)
+
+            if ids_only:
+                attributes = ids()
+            else:
+                attributes = self._get_attributes(
+                    ids(), full_attribute_info, max_concurrency
+                )
+            return _base_session._batched_async(attributes, batch_size)
+
+        def traverse_objects(
+            self,
+            target: uuid.UUID | str | Object,
+            max_depth: int | None = None,
+            full_attribute_info: bool = False,
+            attributes_filter: AttributesFilter | None = None,
+            visitor: typing.Callable[[TraversalNode], bool | None] | None = None,
+            max_concurrency: int = _base_session.DEFAULT_MAX_CONCURRENT_READS,
+        ) -> typing.AsyncIterator[TraversalNode]:
+            _base_session._validate_max_concurrency(max_concurrency)
+            traversal = _base_session._Traversal(target, max_depth, visitor)
+
+            async def nodes():
+                in_flight = collections.deque()
+                try:
+                    while traversal.pending or in_flight:
+                        while traversal.pending and len(in_flight) < max_concurrency:
+                            target, depth, parent_id = traversal.pending.popleft()
+                            request = self._prepare_get_object_request(
+                                target, full_attribute_info, attributes_filter
+                            )
+                            task = asyncio.ensure_future(
+                                self.model_service.GetObject(request)
+                            )
+                            in_flight.append((depth, parent_id, task))
+
+                        depth, parent_id, task = in_flight.popleft()
+                        proto_object = await task
+                        object = self.path_cache._add(
+                            Object._from_proto_object(proto_object, lazy=True)
+                        )
+                        yield traversal.visit(object, proto_object, depth, parent_id)
+                finally:
+                    for _, _, task in in_flight:
+                        task.cancel()
+
+            return nodes()
+
         async def create_object(
             self, target: uuid.UUID | str | AttributeBase, name: str
         ) -> Object:
             request = super()._prepare_create_object_request(target=target, name=name)
             proto_object = await self.model_service.CreateObject(request)
-            return Object._from_proto_object(proto_object)
+            return self.path_cache._add(Object._from_proto_object(proto_object))
+
+        async def clone_object(
+            self,
+            target: uuid.UUID | str | Object,
+            new_name: str,
+            new_owner: uuid.UUID | str | Object | AttributeBase | None = None,
+            timeseries_copy_mode: TimeseriesCopyMode = TimeseriesCopyMode.ALL,
+        ) -> Object:
+            request = super()._prepare_clone_object_request(
+                target, new_name, new_owner, timeseries_copy_mode
+            )
+            response = await self.model_service.CloneObject(request)
+            return self.path_cache._add(Object._from_proto_object(response.new_object))
 
         async def update_object(
             self,
@@ -408,12 +1071,15 @@ class Connection(_base_connection.Connection):
                 target, new_name, new_owner_attribute
             )
             await self.model_service.UpdateObject(request)
+            # paths of the object and all objects and attributes owned by it changed
+            self.path_cache.clear()
 
         async def delete_object(
             self, target: uuid.UUID | str | Object, recursive_delete: bool = False
         ) -> None:
             request = super()._prepare_delete_object_request(target, recursive_delete)
             await self.model_service.DeleteObject(request)
+            self.path_cache.clear()
 
         def forecast_functions(
             self,
@@ -421,6 +1087,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> ForecastFunctionsAsync:
+            from volue.mesh.calc.forecast import ForecastFunctionsAsync
+
             return ForecastFunctionsAsync(self, target, start_time, end_time)
 
         def history_functions(
@@ -429,6 +1097,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> HistoryFunctionsAsync:
+            from volue.mesh.calc.history import HistoryFunctionsAsync
+
             return HistoryFunctionsAsync(self, target, start_time, end_time)
 
         def statistical_functions(
@@ -437,6 +1107,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> StatisticalFunctionsAsync:
+            from volue.mesh.calc.statistical import StatisticalFunctionsAsync
+
             return StatisticalFunctionsAsync(self, target, start_time, end_time)
 
         def transform_functions(
@@ -445,6 +1117,8 @@ class Connection(_base_connection.Connection):
             start_time: datetime,
             end_time: datetime,
         ) -> TransformFunctionsAsync:
+            from volue.mesh.calc.transform import TransformFunctionsAsync
+
             return TransformFunctionsAsync(self, target, start_time, end_time)
 
         async def get_xy_sets(
@@ -564,12 +1238,16 @@ class Connection(_base_connection.Connection):
                     yield None
 
     @staticmethod
-    def _secure_grpc_channel(*args, **kwargs):
-        return grpc.aio.secure_channel(*args, **kwargs)
+    def _secure_grpc_channel(*args, interceptors=None, **kwargs):
+        return grpc.aio.secure_channel(
+            *args, interceptors=_split_interceptors(interceptors), **kwargs
+        )
 
     @staticmethod
-    def _insecure_grpc_channel(*args, **kwargs):
-        return grpc.aio.insecure_channel(*args, **kwargs)
+    def _insecure_grpc_channel(*args, interceptors=None, **kwargs):
+        return grpc.aio.insecure_channel(
+            *args, interceptors=_split_interceptors(interceptors), **kwargs
+        )
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -579,6 +1257,61 @@ class Connection(_base_connection.Connection):
             await self.config_service.GetVersion(protobuf.empty_pb2.Empty())
         )
 
+    async def get_health_status(self) -> typing.Dict[str, typing.Any]:
+        return json_format.MessageToDict(
+            await self.config_service.GetHealthStatus(protobuf.empty_pb2.Empty())
+        )
+
+    async def warm_up(
+        self, timeout: float | None = None, number_of_sessions: int = 0
+    ) -> List[Session]:
+        deadline = self._get_warm_up_deadline(timeout)
+
+        try:
+            await asyncio.wait_for(
+                self._channel.channel_ready(),
+                timeout=self._get_remaining_time(deadline),
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"gRPC channel not ready within {timeout} seconds"
+            ) from None
+
+        # Kerberos token acquisition is a blocking call
+        await asyncio.get_running_loop().run_in_executor(None, self._prepare_warm_up)
+
+        version_info = await self.config_service.GetVersion(
+            protobuf.empty_pb2.Empty(),
+            metadata=get_compatibility_check_metadata(),
+            timeout=self._get_remaining_time(deadline),
+        )
+        _validate_server_version(version_info)
+
+        await self.config_service.GetHealthStatus(
+            protobuf.empty_pb2.Empty(), timeout=self._get_remaining_time(deadline)
+        )
+
+        # server version is validated already
+        sessions = [self.create_session() for _ in range(number_of_sessions)]
+        timeout = self._get_remaining_time(deadline)
+        results = await asyncio.gather(
+            *(session._start(timeout) for session in sessions), return_exceptions=True
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            await asyncio.gather(
+                *(
+                    session.close()
+                    for session, result in zip(sessions, results)
+                    if not isinstance(result, Exception)
+                ),
+                return_exceptions=True,
+            )
+            raise errors[0]
+
+        return sessions
+
     async def get_user_identity(self) -> UserIdentity:
         return UserIdentity._from_proto(
             await self.auth_service.GetUserIdentity(protobuf.empty_pb2.Empty())
@@ -619,5 +1352,6 @@ class Connection(_base_connection.Connection):
             time_series_service=self.time_series_service,
             availability_service=self.availability_service,
             session_id=session_id,
+            metadata_cache=self.metadata_cache,
         )
         return session
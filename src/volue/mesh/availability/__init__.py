@@ -2,21 +2,25 @@
 Functionality that supports Mesh availability events.
 """
 
-from ._base_availability import (
-    Availability,
-    AvailabilityRecordInfo,
-    EventType,
-    Recurrence,
-    RecurrenceType,
-    Restriction,
-    RestrictionBasicRecurrence,
-    RestrictionComplexRecurrence,
-    RestrictionInstance,
-    Revision,
-    RevisionInstance,
-    RevisionRecurrence,
-    TimePoint,
-)
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    from ._base_availability import (
+        Availability,
+        AvailabilityRecordInfo,
+        EventType,
+        Recurrence,
+        RecurrenceType,
+        Restriction,
+        RestrictionBasicRecurrence,
+        RestrictionComplexRecurrence,
+        RestrictionInstance,
+        Revision,
+        RevisionInstance,
+        RevisionRecurrence,
+        TimePoint,
+    )
 
 __all__ = [
     "AvailabilityRecordInfo",
@@ -32,3 +36,19 @@ __all__ = [
     "RevisionRecurrence",
     "TimePoint",
 ]
+
+# See `volue.mesh.__getattr__`.
+_LAZY_ATTRIBUTES = {name: "._base_availability" for name in [*__all__, "Availability"]}
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
 
-import uuid
-
 import helpers
 
-from volue.mesh import Connection, TimeseriesAttribute
+from volue.mesh import Connection
+from volue.mesh.timeseries_duplicates import TimeseriesKeyAudit
 
 
 def get_pem_certificate_contents(certificate_path: str):
@@ -27,28 +26,6 @@ def get_pem_certificate_contents(certificate_path: str):
     return tls_root_pem_cert
 
 
-def find_time_series_duplicates(
-    session: Connection.Session, model: str | uuid.UUID
-) -> dict[int, list[str]]:
-    """
-    Iterates over all Mesh model objects and stores time series key of physical
-    or virtual time series connected to time series attributes.
-    """
-    time_series_info = {}
-
-    for obj in session.search_for_objects(model, "{*}"):
-        for attr in obj.attributes.values():
-            if isinstance(attr, TimeseriesAttribute):
-                if attr.time_series_resource is not None:
-                    timeseries_key = attr.time_series_resource.timeseries_key
-                    if timeseries_key not in time_series_info:
-                        time_series_info[timeseries_key] = [attr.path]
-                    else:
-                        time_series_info[timeseries_key].append(attr.path)
-
-    return time_series_info
-
-
 def main(address, tls_root_pem_cert):
     """Checks for duplicated physical or virtual time series in a Mesh model."""
 
@@ -58,17 +35,20 @@ def main(address, tls_root_pem_cert):
 
     model_name = "SimpleThermalTestModel"
 
+    audit = TimeseriesKeyAudit()
     with connection.create_session() as session:
         print(f"Model: '{model_name}'")
-        time_series_info = find_time_series_duplicates(session, f"Model/{model_name}")
-
-        for timeseries_key, paths in time_series_info.items():
-            if len(paths) > 1:
-                print(
-                    f"Time series key {timeseries_key} is connected in {len(paths)} time series attributes:"
-                )
-                for path in paths:
-                    print(f"  {path}")
+        # only time series keys of attributes are requested from Mesh
+        audit.add_model(session, f"Model/{model_name}")
+
+    # time series keys are grouped in Arrow, other models can be added to
+    # find time series shared across models
+    for duplicate in audit.find_duplicates():
+        print(
+            f"Time series key {duplicate.timeseries_key} is connected in {len(duplicate.attribute_paths)} time series attributes:"
+        )
+        for path in duplicate.attribute_paths:
+            print(f"  {path}")
 
     print("Check for duplicated time series done.")
 
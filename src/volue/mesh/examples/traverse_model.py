@@ -1,3 +1,5 @@
+import collections
+
 import helpers
 
 from volue.mesh import Connection, OwnershipRelationAttribute
@@ -5,19 +7,22 @@ from volue.mesh import Connection, OwnershipRelationAttribute
 leaves = []
 
 
-def traverse_model_top_down(session: Connection.Session, target, depth=0):
-    """Traverses the Mesh model recursively."""
-    object = session.get_object(target)
-    print(f"{'..' * depth}{object.name}")
-    leaf = True
+def traverse_model_top_down(session: Connection.Session, target):
+    """Traverses the Mesh model breadth-first, requesting objects concurrently,
+    and prints it depth-first as a tree."""
+    children = collections.defaultdict(list)
+    for node in session.traverse_objects(target, max_concurrency=16):
+        children[node.parent_id].append(node)
 
-    for attr in object.attributes.values():
-        if isinstance(attr, OwnershipRelationAttribute):
-            for child_id in attr.target_object_ids:
-                leaf = False
-                traverse_model_top_down(session, child_id, depth + 1)
-    if leaf:
-        leaves.append(object)
+    def print_tree(node):
+        object = node.object
+        print(f"{'..' * node.depth}{object.name}")
+        if not children[object.id]:
+            leaves.append(node)
+        for child in children[object.id]:
+            print_tree(child)
+
+    print_tree(children[None][0])
 
 
 def traverse_model_bottom_up(session: Connection.Session, target, model):
@@ -52,9 +57,11 @@ def main(address, tls_root_pem_cert):
             # ....SubChildObject2
             # ..ChildObject2
             print("\nBottom-top traversal:")
-            traverse_model_bottom_up(session, leaves[0].id, model)
+            # start at the last of the deepest leaves
+            deepest = max(reversed(leaves), key=lambda node: node.depth)
+            traverse_model_bottom_up(session, deepest.object.id, model)
             # Excepted output:
-            # ....SubChildObject1
+            # ....SubChildObject2
             # ..ChildObject1
             # Model
 
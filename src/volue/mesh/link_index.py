@@ -0,0 +1,769 @@
+"""
+Client-side index of link relations by the objects they point to.
+
+Link relation attributes store only their target objects, finding all links
+pointing to an object requires either a crawl of the model or a call to Mesh
+per object. A :py:class:`ReverseLinkIndex` is built once, from a streamed
+crawl of a model or from link relations found by the Mesh server for given
+objects, and then answers "what links here" without calls to Mesh. Together
+with `update_link_relation_attributes` it rewires many link relations at
+once. Example::
+
+    from volue.mesh import LinkRelationUpdate
+    from volue.mesh.link_index import ReverseLinkIndex
+
+    with connection.create_session() as session:
+        index = ReverseLinkIndex.load(session, "Model/SimpleThermalTestModel")
+
+        session.update_link_relation_attributes(
+            LinkRelationUpdate(source.attribute_id, [new_plant_id])
+            for source in index.get_sources(old_plant_id)
+            if not source.versioned
+        )
+        session.commit()
+
+Versioned link relations are indexed by all target objects of all their
+versions. The index is not updated by Mesh, attributes updated later can be
+added again with :py:meth:`ReverseLinkIndex.add_attribute`.
+
+A :py:class:`LinkTimelineIndex` answers "what did a link point to at a time"
+for versioned link relations. Valid from times of all versions are kept in
+one sorted array per entry and looked up with binary search, many
+(attribute, time) queries at once, or for the whole model at a point in
+time. Example::
+
+    from volue.mesh.link_index import LinkTimelineIndex
+
+    with connection.create_session() as session:
+        index = LinkTimelineIndex.load(session, "Model/SimpleThermalTestModel")
+
+    for time in index.get_change_times():
+        topology = index.get_topology(time)
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import typing
+import uuid
+from array import array
+from dataclasses import dataclass
+
+import pyarrow as pa
+from dateutil import tz
+
+from volue.mesh._attribute import (
+    AttributeBase,
+    LinkRelationAttribute,
+    VersionedLinkRelationAttribute,
+)
+from volue.mesh._common import LinkRelationVersion
+from volue.mesh._object import Object, _LazyAttributes
+
+if typing.TYPE_CHECKING:
+    from volue.mesh import Connection
+    from volue.mesh.aio import Connection as AsyncConnection
+
+_DEFAULT_BATCH_SIZE = 1000
+
+# valid from time of link relations that are not versioned
+_BEGINNING_OF_TIME = -(2**63)
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=tz.UTC)
+
+LINK_TOPOLOGY_SCHEMA = pa.schema(
+    [
+        pa.field("attribute_id", pa.string(), nullable=False),
+        pa.field("attribute_path", pa.string(), nullable=False),
+        pa.field("object_id", pa.string()),
+        pa.field("object_path", pa.string(), nullable=False),
+        pa.field("versioned", pa.bool_(), nullable=False),
+        pa.field("entry", pa.int32(), nullable=False),
+        pa.field("target_object_id", pa.string(), nullable=False),
+    ]
+)
+"""Schema of the table returned by :py:meth:`LinkTimelineIndex.get_topology`.
+
+`entry` is the index of the versioned link relation entry, or of the target
+of a link relation that is not versioned.
+"""
+
+
+@dataclass(frozen=True)
+class LinkSource:
+    """Link relation attribute pointing to an indexed object."""
+
+    attribute_id: uuid.UUID
+    attribute_path: str
+    object_id: uuid.UUID | None
+    object_path: str
+    versioned: bool
+
+
+class ReverseLinkIndex:
+    """Index of link relation attributes by their target objects."""
+
+    def __init__(self):
+        self._sources: typing.Dict[uuid.UUID, typing.Dict[uuid.UUID, LinkSource]] = {}
+        # source and targets of each indexed attribute, to replace or remove it
+        self._attributes: typing.Dict[
+            uuid.UUID, typing.Tuple[LinkSource, typing.Tuple[uuid.UUID, ...]]
+        ] = {}
+        self._attribute_ids_by_path: typing.Dict[str, uuid.UUID] = {}
+
+    @classmethod
+    def load(
+        cls,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ReverseLinkIndex:
+        """Build an index of link relation attributes of the `target` object
+        and objects found by `query`.
+
+        Objects are streamed from Mesh and only their link relation
+        attributes are kept.
+
+        Args:
+            session: Session used to read the model.
+            target: Mesh object to start the search from, e.g. a model. It
+                could be a Universal Unique Identifier or a path in the
+                `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: Search query, by default all objects owned directly or
+                indirectly by `target`.
+            batch_size: Number of objects received from Mesh before they are
+                indexed.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        index = cls()
+        index.add_object(session.get_object(target))
+        for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                index.add_object(object)
+        return index
+
+    @classmethod
+    async def load_async(
+        cls,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ReverseLinkIndex:
+        """Asynchronous version of :py:meth:`load`."""
+        index = cls()
+        index.add_object(await session.get_object(target))
+        async for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                index.add_object(object)
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed link relation attributes."""
+        return len(self._attributes)
+
+    def __contains__(self, target: uuid.UUID | Object) -> bool:
+        """Check if any indexed link relation attribute points to the object."""
+        return bool(self._sources.get(_to_object_id(target)))
+
+    def clear(self) -> None:
+        """Remove all indexed link relation attributes."""
+        self._sources.clear()
+        self._attributes.clear()
+        self._attribute_ids_by_path.clear()
+
+    def add_object(self, object: Object) -> None:
+        """Index all link relation attributes of an object."""
+        for attribute in object.attributes.values():
+            self.add_attribute(attribute)
+
+    def add_attribute(self, attribute: AttributeBase) -> bool:
+        """Index a link relation attribute.
+
+        An attribute indexed before is replaced, so updated attributes can be
+        added again.
+
+        Returns:
+            `False` if the attribute is not a link relation attribute or has
+            no ID, e.g. excluded by an attribute field mask, and was not
+            indexed.
+        """
+        if attribute.id is None:
+            return False
+
+        if isinstance(attribute, LinkRelationAttribute):
+            target_ids = attribute.target_object_ids
+        elif isinstance(attribute, VersionedLinkRelationAttribute):
+            target_ids = (
+                version.target_object_id
+                for entry in attribute.entries
+                for version in entry.versions
+                if version.target_object_id is not None
+            )
+        else:
+            return False
+        # unique targets in the original order
+        targets = tuple(dict.fromkeys(target_ids))
+
+        self.remove_attribute(attribute.id)
+        source = LinkSource(
+            attribute_id=attribute.id,
+            attribute_path=attribute.path,
+            object_id=attribute.owner_id,
+            object_path=attribute.owner_path,
+            versioned=isinstance(attribute, VersionedLinkRelationAttribute),
+        )
+        for target_id in targets:
+            self._sources.setdefault(target_id, {})[attribute.id] = source
+        self._attributes[attribute.id] = (source, targets)
+        if attribute.path:
+            self._attribute_ids_by_path[attribute.path] = attribute.id
+        return True
+
+    def remove_attribute(self, target: uuid.UUID | str | AttributeBase) -> None:
+        """Remove an indexed link relation attribute, if indexed.
+
+        Args:
+            target: Attribute ID, path or instance.
+        """
+        indexed = self._attributes.pop(self._to_attribute_id(target), None)
+        if indexed is None:
+            return
+
+        source, targets = indexed
+        for target_id in targets:
+            sources = self._sources[target_id]
+            del sources[source.attribute_id]
+            if not sources:
+                del self._sources[target_id]
+        if (
+            self._attribute_ids_by_path.get(source.attribute_path)
+            == source.attribute_id
+        ):
+            del self._attribute_ids_by_path[source.attribute_path]
+
+    def add_linked_from(
+        self, session: Connection.Session, target: uuid.UUID | str | Object
+    ) -> typing.List[LinkSource]:
+        """Index all link relation attributes pointing to the `target` object,
+        found by the Mesh server.
+
+        Attributes indexed before that no longer point to the `target` object
+        are not removed.
+
+        Args:
+            session: Session used to search for the attributes.
+            target: Mesh object the link relation attributes point to. It
+                could be a Universal Unique Identifier or a path in the
+                `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+
+        Returns:
+            The found link relation attributes.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        attributes = list(session.iter_linked_from(target))
+        return self._add_linked_from(attributes)
+
+    async def add_linked_from_async(
+        self, session: AsyncConnection.Session, target: uuid.UUID | str | Object
+    ) -> typing.List[LinkSource]:
+        """Asynchronous version of :py:meth:`add_linked_from`."""
+        attributes = [attribute async for attribute in session.iter_linked_from(target)]
+        return self._add_linked_from(attributes)
+
+    def _add_linked_from(
+        self, attributes: typing.List[AttributeBase]
+    ) -> typing.List[LinkSource]:
+        return [
+            self._attributes[attribute.id][0]
+            for attribute in attributes
+            if self.add_attribute(attribute)
+        ]
+
+    def get_sources(self, target: uuid.UUID | Object) -> typing.List[LinkSource]:
+        """Get indexed link relation attributes pointing to an object.
+
+        Args:
+            target: ID or instance of the object the attributes point to.
+        """
+        return list(self._sources.get(_to_object_id(target), {}).values())
+
+    def get_targets(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> typing.List[uuid.UUID]:
+        """Get IDs of objects an indexed link relation attribute points to.
+
+        Args:
+            target: Attribute ID, path or instance.
+
+        Raises:
+            KeyError: The attribute is not indexed.
+        """
+        indexed = self._attributes.get(self._to_attribute_id(target))
+        if indexed is None:
+            raise KeyError(target)
+        return list(indexed[1])
+
+    def _to_attribute_id(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> uuid.UUID | None:
+        if isinstance(target, AttributeBase):
+            target = target.id if target.id is not None else target.path
+        if isinstance(target, str):
+            return self._attribute_ids_by_path.get(target)
+        return target
+
+
+class LinkTimelineIndex:
+    """Index of target objects of link relation attributes over time.
+
+    Versions of each versioned link relation entry are stored sorted by
+    valid from time, in microseconds since the epoch, in one array shared by
+    all entries. A version is active from its valid from time until the valid
+    from time of the next version of the entry. Before the first version an
+    entry points to no object.
+
+    Link relations that are not versioned are indexed as entries with one
+    version, always active, so :py:meth:`get_topology` returns all links of
+    the model at a point in time.
+
+    Naive datetimes are interpreted as UTC.
+    """
+
+    def __init__(self):
+        # version columns, versions of each entry are a sorted slice
+        self._valid_from = array("q")
+        self._targets: typing.List[uuid.UUID | None] = []
+        # source and version slices of entries of each indexed attribute
+        self._attributes: typing.Dict[
+            uuid.UUID,
+            typing.Tuple[LinkSource, typing.Tuple[typing.Tuple[int, int], ...]],
+        ] = {}
+        self._attribute_ids_by_path: typing.Dict[str, uuid.UUID] = {}
+        # versions of replaced and removed attributes, dropped in `_compact`
+        self._unused_versions = 0
+
+    @classmethod
+    def load(
+        cls,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> LinkTimelineIndex:
+        """Build an index of link relation attributes of the `target` object
+        and objects found by `query`.
+
+        Objects are streamed from Mesh and versions are read from the received
+        messages, without parsing the attributes.
+
+        Args:
+            session: Session used to read the model.
+            target: Mesh object to start the search from, e.g. a model. It
+                could be a Universal Unique Identifier or a path in the
+                `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: Search query, by default all objects owned directly or
+                indirectly by `target`.
+            batch_size: Number of objects received from Mesh before they are
+                indexed.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        index = cls()
+        index.add_object(session.get_object(target))
+        for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                index.add_object(object)
+        return index
+
+    @classmethod
+    async def load_async(
+        cls,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> LinkTimelineIndex:
+        """Asynchronous version of :py:meth:`load`."""
+        index = cls()
+        index.add_object(await session.get_object(target))
+        async for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                index.add_object(object)
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed link relation attributes."""
+        return len(self._attributes)
+
+    def __contains__(self, target: uuid.UUID | str | AttributeBase) -> bool:
+        """Check if a link relation attribute is indexed."""
+        return self._to_attribute_id(target) in self._attributes
+
+    def clear(self) -> None:
+        """Remove all indexed link relation attributes."""
+        self._valid_from = array("q")
+        self._targets = []
+        self._attributes.clear()
+        self._attribute_ids_by_path.clear()
+        self._unused_versions = 0
+
+    def add_object(self, object: Object) -> None:
+        """Index all link relation attributes of an object."""
+        attributes = object.attributes
+        if (
+            not isinstance(attributes, _LazyAttributes)
+            or attributes._proto_attributes is None
+        ):
+            for attribute in attributes.values():
+                self.add_attribute(attribute)
+            return
+
+        # read the versions without parsing the attributes
+        for proto_attribute in attributes._proto_attributes:
+            if not proto_attribute.HasField("id"):
+                continue
+            proto_values = proto_attribute.values
+            if len(proto_values) == 0:
+                continue
+            if proto_values[0].HasField("versioned_link_relation_value"):
+                entries = [
+                    [
+                        (
+                            version.valid_from_time.seconds * 1_000_000
+                            + version.valid_from_time.nanos // 1_000,
+                            (
+                                uuid.UUID(bytes_le=version.target_object_id.bytes_le)
+                                if version.HasField("target_object_id")
+                                else None
+                            ),
+                        )
+                        for version in proto_value.versioned_link_relation_value.versions
+                    ]
+                    for proto_value in proto_values
+                ]
+                versioned = True
+            elif proto_values[0].HasField("link_relation_value"):
+                entries = [
+                    [
+                        (
+                            _BEGINNING_OF_TIME,
+                            uuid.UUID(
+                                bytes_le=proto_value.link_relation_value.target_object_id.bytes_le
+                            ),
+                        )
+                    ]
+                    for proto_value in proto_values
+                ]
+                versioned = False
+            else:
+                continue
+
+            source = LinkSource(
+                attribute_id=uuid.UUID(bytes_le=proto_attribute.id.bytes_le),
+                attribute_path=proto_attribute.path,
+                object_id=object.id,
+                object_path=object.path,
+                versioned=versioned,
+            )
+            self._add(source, entries)
+
+    def add_attribute(self, attribute: AttributeBase) -> bool:
+        """Index a link relation attribute.
+
+        An attribute indexed before is replaced, so updated attributes can be
+        added again.
+
+        Returns:
+            `False` if the attribute is not a link relation attribute or has
+            no ID, e.g. excluded by an attribute field mask, and was not
+            indexed.
+        """
+        if attribute.id is None:
+            return False
+
+        if isinstance(attribute, VersionedLinkRelationAttribute):
+            entries = [
+                [
+                    (
+                        _to_microseconds(version.valid_from_time),
+                        version.target_object_id,
+                    )
+                    for version in entry.versions
+                ]
+                for entry in attribute.entries
+            ]
+        elif isinstance(attribute, LinkRelationAttribute):
+            entries = [
+                [(_BEGINNING_OF_TIME, target_id)]
+                for target_id in attribute.target_object_ids
+            ]
+        else:
+            return False
+
+        source = LinkSource(
+            attribute_id=attribute.id,
+            attribute_path=attribute.path,
+            object_id=attribute.owner_id,
+            object_path=attribute.owner_path,
+            versioned=isinstance(attribute, VersionedLinkRelationAttribute),
+        )
+        self._add(source, entries)
+        return True
+
+    def _add(
+        self,
+        source: LinkSource,
+        entries: typing.List[typing.List[typing.Tuple[int, uuid.UUID | None]]],
+    ) -> None:
+        self.remove_attribute(source.attribute_id)
+
+        slices = []
+        for versions in entries:
+            # versions are sorted by Mesh, sorting keeps the lookups correct
+            # for attributes built by hand
+            versions.sort(key=lambda version: version[0])
+            start = len(self._targets)
+            for valid_from, target_id in versions:
+                self._valid_from.append(valid_from)
+                self._targets.append(target_id)
+            slices.append((start, len(self._targets)))
+
+        self._attributes[source.attribute_id] = (source, tuple(slices))
+        if source.attribute_path:
+            self._attribute_ids_by_path[source.attribute_path] = source.attribute_id
+
+    def remove_attribute(self, target: uuid.UUID | str | AttributeBase) -> None:
+        """Remove an indexed link relation attribute, if indexed.
+
+        Args:
+            target: Attribute ID, path or instance.
+        """
+        indexed = self._attributes.pop(self._to_attribute_id(target), None)
+        if indexed is None:
+            return
+
+        source, slices = indexed
+        if (
+            self._attribute_ids_by_path.get(source.attribute_path)
+            == source.attribute_id
+        ):
+            del self._attribute_ids_by_path[source.attribute_path]
+
+        self._unused_versions += sum(end - start for start, end in slices)
+        if self._unused_versions > len(self._targets) // 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Drop versions of replaced and removed attributes."""
+        valid_from = array("q")
+        targets: typing.List[uuid.UUID | None] = []
+        for attribute_id, (source, slices) in self._attributes.items():
+            new_slices = []
+            for start, end in slices:
+                new_start = len(targets)
+                valid_from.extend(self._valid_from[start:end])
+                targets.extend(self._targets[start:end])
+                new_slices.append((new_start, len(targets)))
+            self._attributes[attribute_id] = (source, tuple(new_slices))
+
+        self._valid_from = valid_from
+        self._targets = targets
+        self._unused_versions = 0
+
+    def _get_indexed(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> typing.Tuple[LinkSource, typing.Tuple[typing.Tuple[int, int], ...]]:
+        indexed = self._attributes.get(self._to_attribute_id(target))
+        if indexed is None:
+            raise KeyError(target)
+        return indexed
+
+    def _get_target(self, start: int, end: int, time: int) -> uuid.UUID | None:
+        row = bisect.bisect_right(self._valid_from, time, start, end) - 1
+        return self._targets[row] if row >= start else None
+
+    def get_source(self, target: uuid.UUID | str | AttributeBase) -> LinkSource:
+        """Get an indexed link relation attribute.
+
+        Args:
+            target: Attribute ID, path or instance.
+
+        Raises:
+            KeyError: The attribute is not indexed.
+        """
+        return self._get_indexed(target)[0]
+
+    def get_versions(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> typing.List[typing.List[LinkRelationVersion]]:
+        """Get versions of each entry of an indexed link relation attribute,
+        sorted by valid from time.
+
+        Versions of link relations that are not versioned have the minimum
+        valid from time, `datetime.datetime.min`.
+
+        Raises:
+            KeyError: The attribute is not indexed.
+        """
+        return [
+            [
+                LinkRelationVersion(
+                    self._targets[row], _from_microseconds(self._valid_from[row])
+                )
+                for row in range(start, end)
+            ]
+            for start, end in self._get_indexed(target)[1]
+        ]
+
+    def get_targets(
+        self, target: uuid.UUID | str | AttributeBase, time: datetime.datetime
+    ) -> typing.List[uuid.UUID | None]:
+        """Get IDs of objects an indexed link relation attribute points to at
+        the given time, one per entry. `None` if no object is active.
+
+        Args:
+            target: Attribute ID, path or instance.
+            time: Point in time.
+
+        Raises:
+            KeyError: The attribute is not indexed.
+        """
+        microseconds = _to_microseconds(time)
+        return [
+            self._get_target(start, end, microseconds)
+            for start, end in self._get_indexed(target)[1]
+        ]
+
+    def get_targets_at(
+        self,
+        queries: typing.Iterable[
+            typing.Tuple[uuid.UUID | str | AttributeBase, datetime.datetime]
+        ],
+    ) -> typing.List[typing.List[uuid.UUID | None]]:
+        """Get IDs of objects link relation attributes point to, for many
+        (attribute, time) pairs, see :py:meth:`get_targets`.
+
+        Args:
+            queries: Pairs of attribute ID, path or instance and point in time.
+
+        Returns:
+            Targets of each entry, in the order of `queries`.
+
+        Raises:
+            KeyError: An attribute is not indexed.
+        """
+        results = []
+        get_target = self._get_target
+        for target, time in queries:
+            microseconds = _to_microseconds(time)
+            results.append(
+                [
+                    get_target(start, end, microseconds)
+                    for start, end in self._get_indexed(target)[1]
+                ]
+            )
+        return results
+
+    def get_change_times(
+        self,
+        start_time: datetime.datetime | None = None,
+        end_time: datetime.datetime | None = None,
+    ) -> typing.List[datetime.datetime]:
+        """Get sorted, unique valid from times of all versions, i.e. the
+        points in time at which the topology changes.
+
+        Args:
+            start_time: Include only times at or after `start_time`.
+            end_time: Include only times before `end_time`.
+        """
+        start = _to_microseconds(start_time) if start_time is not None else None
+        end = _to_microseconds(end_time) if end_time is not None else None
+        times = set()
+        for _, slices in self._attributes.values():
+            for first, last in slices:
+                times.update(self._valid_from[first:last])
+        times.discard(_BEGINNING_OF_TIME)
+        return [
+            _from_microseconds(time)
+            for time in sorted(times)
+            if (start is None or time >= start) and (end is None or time < end)
+        ]
+
+    def get_topology(self, time: datetime.datetime) -> pa.Table:
+        """Get all links active at the given time, one row per entry pointing
+        to an object, see :py:data:`LINK_TOPOLOGY_SCHEMA`.
+
+        Entries pointing to no object at that time are left out. IDs are
+        exported as strings.
+
+        Args:
+            time: Point in time.
+        """
+        microseconds = _to_microseconds(time)
+        get_target = self._get_target
+        columns: typing.List[typing.List[typing.Any]] = [[] for _ in range(7)]
+        (
+            attribute_ids,
+            attribute_paths,
+            object_ids,
+            object_paths,
+            versioned,
+            entries,
+            target_ids,
+        ) = columns
+        for source, slices in self._attributes.values():
+            attribute_id = str(source.attribute_id)
+            object_id = str(source.object_id) if source.object_id is not None else None
+            for entry, (start, end) in enumerate(slices):
+                target_id = get_target(start, end, microseconds)
+                if target_id is None:
+                    continue
+                attribute_ids.append(attribute_id)
+                attribute_paths.append(source.attribute_path)
+                object_ids.append(object_id)
+                object_paths.append(source.object_path)
+                versioned.append(source.versioned)
+                entries.append(entry)
+                target_ids.append(str(target_id))
+
+        return pa.Table.from_arrays(
+            [
+                pa.array(column, type=field.type)
+                for column, field in zip(columns, LINK_TOPOLOGY_SCHEMA)
+            ],
+            schema=LINK_TOPOLOGY_SCHEMA,
+        )
+
+    def _to_attribute_id(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> uuid.UUID | None:
+        if isinstance(target, AttributeBase):
+            target = target.id if target.id is not None else target.path
+        if isinstance(target, str):
+            return self._attribute_ids_by_path.get(target)
+        return target
+
+
+def _to_microseconds(time: datetime.datetime) -> int:
+    """Microseconds since the epoch, naive datetimes are UTC."""
+    if time.tzinfo is None:
+        time = time.replace(tzinfo=tz.UTC)
+    return (time - _EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _from_microseconds(microseconds: int) -> datetime.datetime:
+    if microseconds == _BEGINNING_OF_TIME:
+        return datetime.datetime.min.replace(tzinfo=tz.UTC)
+    return _EPOCH + datetime.timedelta(microseconds=microseconds)
+
+
+def _to_object_id(target: uuid.UUID | Object) -> uuid.UUID:
+    return target.id if isinstance(target, Object) else target
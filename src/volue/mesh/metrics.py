@@ -0,0 +1,450 @@
+"""
+Client-side instrumentation of Mesh gRPC calls.
+
+Per-method latency histograms, request/response sizes, response stream
+message counts and status codes are recorded by gRPC client interceptors and
+handed to a pluggable exporter::
+
+    from volue import mesh
+    from volue.mesh import metrics
+
+    exporter = metrics.PrometheusExporter()
+    connection = mesh.Connection.insecure(
+        "localhost:50051", interceptors=[metrics.MetricsInterceptor(exporter)]
+    )
+    ...
+    print(exporter.to_text())
+
+For :py:mod:`volue.mesh.aio` connections use
+:py:class:`AsyncMetricsInterceptor` instead.
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+
+import grpc
+
+# Upper bounds of the latency histogram buckets in seconds, the same as the
+# default buckets of the Prometheus client libraries.
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+@dataclass(frozen=True)
+class RpcRecord:
+    """Measurements of a single finished gRPC call.
+
+    Attributes:
+        method: Full gRPC method name, e.g.
+            `/volue.mesh.grpc.model.v1alpha.ModelService/SearchObjects`.
+        code: Final status code of the call.
+        latency: Time from issuing the call until the last response message
+            was received or the call failed, in seconds.
+        request_bytes: Serialized size of the request message.
+        response_bytes: Total serialized size of all response messages.
+        response_messages: Number of received response messages.
+    """
+
+    method: str
+    code: grpc.StatusCode
+    latency: float
+    request_bytes: int
+    response_bytes: int
+    response_messages: int
+
+
+@dataclass
+class MethodMetrics:
+    """Aggregated measurements of all calls to a single gRPC method.
+
+    Attributes:
+        latency_buckets: Upper bounds of the latency histogram buckets.
+        latency_bucket_counts: Number of calls per latency bucket (not
+            cumulative). The last element counts calls slower than the
+            largest upper bound.
+        latency_sum: Sum of the latencies of all calls, in seconds.
+        calls: Number of calls per status code name, e.g. `{"OK": 10}`.
+        request_bytes: Total serialized size of all requests.
+        response_bytes: Total serialized size of all responses.
+        response_messages: Total number of received response messages.
+    """
+
+    latency_buckets: typing.Tuple[float, ...]
+    latency_bucket_counts: typing.List[int] = field(default_factory=list)
+    latency_sum: float = 0.0
+    calls: typing.Dict[str, int] = field(default_factory=dict)
+    request_bytes: int = 0
+    response_bytes: int = 0
+    response_messages: int = 0
+
+    def __post_init__(self):
+        if not self.latency_bucket_counts:
+            self.latency_bucket_counts = [0] * (len(self.latency_buckets) + 1)
+
+    @property
+    def count(self) -> int:
+        """Number of recorded calls."""
+        return sum(self.calls.values())
+
+    def _add(self, record: RpcRecord) -> None:
+        index = bisect.bisect_left(self.latency_buckets, record.latency)
+        self.latency_bucket_counts[index] += 1
+        self.latency_sum += record.latency
+        self.calls[record.code.name] = self.calls.get(record.code.name, 0) + 1
+        self.request_bytes += record.request_bytes
+        self.response_bytes += record.response_bytes
+        self.response_messages += record.response_messages
+
+    def _copy(self) -> MethodMetrics:
+        return MethodMetrics(
+            latency_buckets=self.latency_buckets,
+            latency_bucket_counts=list(self.latency_bucket_counts),
+            latency_sum=self.latency_sum,
+            calls=dict(self.calls),
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            response_messages=self.response_messages,
+        )
+
+
+class MetricsExporter(abc.ABC):
+    """Receiver of the measurements recorded by the metrics interceptors.
+
+    Implement :py:meth:`export` to forward the measurements to a custom
+    monitoring system. It is called once per finished gRPC call, possibly
+    from different threads, and should return quickly.
+    """
+
+    @abc.abstractmethod
+    def export(self, record: RpcRecord) -> None:
+        """Handle measurements of a finished gRPC call."""
+
+
+class InMemoryExporter(MetricsExporter):
+    """Aggregates measurements in memory, per gRPC method.
+
+    Args:
+        latency_buckets: Upper bounds of the latency histogram buckets in
+            seconds, in increasing order.
+    """
+
+    def __init__(
+        self, latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS
+    ):
+        self.latency_buckets = tuple(latency_buckets)
+        if list(self.latency_buckets) != sorted(self.latency_buckets):
+            raise ValueError("latency buckets must be in increasing order")
+
+        self._lock = threading.Lock()
+        self._metrics: typing.Dict[str, MethodMetrics] = {}
+
+    def export(self, record: RpcRecord) -> None:
+        with self._lock:
+            method_metrics = self._metrics.get(record.method)
+            if method_metrics is None:
+                method_metrics = MethodMetrics(self.latency_buckets)
+                self._metrics[record.method] = method_metrics
+            method_metrics._add(record)
+
+    def get_metrics(self) -> typing.Dict[str, MethodMetrics]:
+        """Get a copy of the aggregated measurements.
+
+        Returns:
+            Full gRPC method names mapped to their aggregated measurements.
+        """
+        with self._lock:
+            return {
+                method: method_metrics._copy()
+                for method, method_metrics in self._metrics.items()
+            }
+
+    def reset(self) -> None:
+        """Discard all aggregated measurements."""
+        with self._lock:
+            self._metrics.clear()
+
+
+class PrometheusExporter(InMemoryExporter):
+    """Aggregates measurements in memory and renders them in the Prometheus
+    text exposition format.
+
+    Args:
+        latency_buckets: Upper bounds of the latency histogram buckets in
+            seconds, in increasing order.
+        prefix: Prefix of the metric names.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        prefix: str = "mesh_client",
+    ):
+        super().__init__(latency_buckets)
+        self.prefix = prefix
+
+    def to_text(self) -> str:
+        """Render the aggregated measurements, e.g. to be served by an HTTP
+        endpoint scraped by Prometheus.
+        """
+        metrics = self.get_metrics()
+        lines = []
+
+        def add_header(name: str, metric_type: str, help_text: str) -> str:
+            name = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            return name
+
+        name = add_header(
+            "rpc_duration_seconds", "histogram", "Latency of gRPC calls to Mesh."
+        )
+        for method, method_metrics in sorted(metrics.items()):
+            labels = _get_method_labels(method)
+            cumulative_count = 0
+            for upper_bound, count in zip(
+                [*method_metrics.latency_buckets, "+Inf"],
+                method_metrics.latency_bucket_counts,
+            ):
+                cumulative_count += count
+                lines.append(
+                    f'{name}_bucket{{{labels},le="{upper_bound}"}} {cumulative_count}'
+                )
+            lines.append(f"{name}_sum{{{labels}}} {method_metrics.latency_sum}")
+            lines.append(f"{name}_count{{{labels}}} {method_metrics.count}")
+
+        name = add_header(
+            "rpc_calls_total", "counter", "Finished gRPC calls to Mesh by status code."
+        )
+        for method, method_metrics in sorted(metrics.items()):
+            labels = _get_method_labels(method)
+            for code, count in sorted(method_metrics.calls.items()):
+                lines.append(f'{name}{{{labels},grpc_code="{code}"}} {count}')
+
+        for metric, help_text in (
+            ("request_bytes", "Serialized size of gRPC requests sent to Mesh."),
+            ("response_bytes", "Serialized size of gRPC responses from Mesh."),
+            ("response_messages", "Number of gRPC response messages from Mesh."),
+        ):
+            name = add_header(f"rpc_{metric}_total", "counter", help_text)
+            for method, method_metrics in sorted(metrics.items()):
+                labels = _get_method_labels(method)
+                lines.append(f"{name}{{{labels}}} {getattr(method_metrics, metric)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _get_method_labels(method: str) -> str:
+    service, _, method_name = method.lstrip("/").rpartition("/")
+    return f'grpc_service="{service}",grpc_method="{method_name}"'
+
+
+def _get_byte_size(message) -> int:
+    # messages are protobuf messages, except when a custom serializer is used
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else 0
+
+
+class _StreamingResponseIterator:
+    """Wraps a response stream of a synchronous gRPC call, records the
+    measurements once the stream is exhausted or fails. Streams cancelled or
+    abandoned before that are recorded as `CANCELLED`.
+
+    Everything except iteration is delegated to the wrapped call object.
+    """
+
+    def __init__(self, call, record: typing.Callable[..., None]):
+        self._call = call
+        self._record = record
+        self._response_bytes = 0
+        self._response_messages = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._finish(grpc.StatusCode.OK)
+            raise
+        except grpc.RpcError as e:
+            self._finish(e.code() if isinstance(e, grpc.Call) else None)
+            raise
+        self._response_bytes += _get_byte_size(response)
+        self._response_messages += 1
+        return response
+
+    def _finish(self, code: grpc.StatusCode | None) -> None:
+        if self._record is not None:
+            self._record(code, self._response_bytes, self._response_messages)
+            self._record = None
+
+    def cancel(self) -> bool:
+        cancelled = self._call.cancel()
+        self._finish(grpc.StatusCode.CANCELLED)
+        return cancelled
+
+    def __del__(self):
+        # the stream was abandoned before it was finished
+        self._finish(grpc.StatusCode.CANCELLED)
+
+    def __getattr__(self, name: str):
+        return getattr(self._call, name)
+
+
+class MetricsInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Records measurements of gRPC calls made through a synchronous
+    :py:class:`volue.mesh.Connection`.
+
+    Args:
+        exporter: Receiver of the measurements.
+    """
+
+    def __init__(self, exporter: MetricsExporter):
+        self.exporter = exporter
+
+    def _export(
+        self,
+        method: str,
+        start: float,
+        request,
+        code: grpc.StatusCode | None,
+        response_bytes: int,
+        response_messages: int,
+    ) -> None:
+        self.exporter.export(
+            RpcRecord(
+                method=_get_method_name(method),
+                code=code if code is not None else grpc.StatusCode.UNKNOWN,
+                latency=time.perf_counter() - start,
+                request_bytes=_get_byte_size(request),
+                response_bytes=response_bytes,
+                response_messages=response_messages,
+            )
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def on_done(future):
+            code = future.code()
+            response_bytes = 0
+            if code == grpc.StatusCode.OK:
+                response_bytes = _get_byte_size(future.result())
+            self._export(
+                client_call_details.method,
+                start,
+                request,
+                code,
+                response_bytes,
+                int(code == grpc.StatusCode.OK),
+            )
+
+        outcome.add_done_callback(on_done)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        call = continuation(client_call_details, request)
+        return _StreamingResponseIterator(
+            call,
+            lambda code, response_bytes, response_messages: self._export(
+                client_call_details.method,
+                start,
+                request,
+                code,
+                response_bytes,
+                response_messages,
+            ),
+        )
+
+
+class AsyncMetricsInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """Records measurements of gRPC calls made through an asynchronous
+    :py:class:`volue.mesh.aio.Connection`.
+
+    Args:
+        exporter: Receiver of the measurements.
+    """
+
+    def __init__(self, exporter: MetricsExporter):
+        self.exporter = exporter
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        call = await continuation(client_call_details, request)
+
+        # waits for the call to finish, but does not raise on errors
+        code = await call.code()
+        response_bytes = 0
+        if code == grpc.StatusCode.OK:
+            response_bytes = _get_byte_size(await call)
+        self.exporter.export(
+            RpcRecord(
+                method=_get_method_name(client_call_details.method),
+                code=code,
+                latency=time.perf_counter() - start,
+                request_bytes=_get_byte_size(request),
+                response_bytes=response_bytes,
+                response_messages=int(code == grpc.StatusCode.OK),
+            )
+        )
+        return call
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        call = await continuation(client_call_details, request)
+
+        async def response_iterator():
+            code = grpc.StatusCode.CANCELLED
+            response_bytes = 0
+            response_messages = 0
+            try:
+                async for response in call:
+                    response_bytes += _get_byte_size(response)
+                    response_messages += 1
+                    yield response
+                code = grpc.StatusCode.OK
+            except grpc.RpcError as e:
+                code = e.code() if isinstance(e, grpc.aio.AioRpcError) else None
+                raise
+            finally:
+                self.exporter.export(
+                    RpcRecord(
+                        method=_get_method_name(client_call_details.method),
+                        code=code if code is not None else grpc.StatusCode.UNKNOWN,
+                        latency=time.perf_counter() - start,
+                        request_bytes=_get_byte_size(request),
+                        response_bytes=response_bytes,
+                        response_messages=response_messages,
+                    )
+                )
+
+        return response_iterator()
+
+
+def _get_method_name(method: str | bytes) -> str:
+    # grpc.aio passes method names as bytes
+    return method.decode() if isinstance(method, bytes) else method
@@ -0,0 +1,449 @@
+"""
+Differences between two states of a Mesh model.
+
+A :py:class:`ModelDigest` keeps, for each object of a streamed crawl of a
+model, only its path, type, owner and a 64-bit hash of each attribute value.
+Two digests, e.g. of the committed model and of a session with uncommitted
+changes, are compared by object ID in linear time with :py:func:`diff`.
+Attributes are compared only for objects whose hashes differ. Example::
+
+    from volue.mesh.model_diff import ModelDigest, diff
+
+    with connection.create_session() as committed:
+        before = ModelDigest.load(committed, "Model/SimpleThermalTestModel")
+
+    with connection.create_session() as session:
+        ...  # edit the model
+        changes = diff(
+            before, ModelDigest.load(session, "Model/SimpleThermalTestModel")
+        )
+        for change in changes.modified_objects:
+            print(change.path, change.modified_attributes)
+
+Attribute values are hashed from the messages received from Mesh, without
+parsing the attributes. Optionally time series points of time series
+attributes connected to physical or virtual time series are read in a given
+interval and hashed as well.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sys
+import typing
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+
+from volue.mesh._object import Object, _LazyAttributes
+
+if typing.TYPE_CHECKING:
+    import pyarrow as pa
+
+    from volue.mesh import Connection
+    from volue.mesh.aio import Connection as AsyncConnection
+    from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+    from volue.mesh.snapshot import ModelSnapshot
+
+_DEFAULT_BATCH_SIZE = 1000
+
+_DEFAULT_MAX_CONCURRENT_READS = 16
+
+
+def _hash(*parts: bytes) -> int:
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(part)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def _hash_attribute_values(proto_attribute: model_resources_pb2.Attribute) -> int:
+    proto_values = proto_attribute.values
+    if len(proto_values) == 1:
+        # most attributes have a single value, hash it directly
+        digest = hashlib.blake2b(
+            proto_values[0].SerializeToString(deterministic=True), digest_size=8
+        )
+    else:
+        digest = hashlib.blake2b(len(proto_values).to_bytes(4, "little"), digest_size=8)
+        for proto_value in proto_values:
+            serialized = proto_value.SerializeToString(deterministic=True)
+            digest.update(len(serialized).to_bytes(4, "little"))
+            digest.update(serialized)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def _hash_timeseries_points(table: pa.Table) -> int:
+    """Hash timestamps, flags and values of time series points."""
+    return _hash(
+        *(column.to_numpy(zero_copy_only=False).tobytes() for column in table.columns)
+    )
+
+
+@dataclass(frozen=True)
+class ObjectChange:
+    """Object found in both compared digests, with different path, type,
+    owner or attributes.
+
+    Attributes:
+        id: ID of the object.
+        path: Path of the object in the new digest.
+        old_path: Path of the object in the old digest.
+        changed_fields: Changed fields of the object: `path`, `type_name` or
+            `owner_id`.
+        added_attributes: Names of attributes only in the new digest.
+        removed_attributes: Names of attributes only in the old digest.
+        modified_attributes: Names of attributes with different values or,
+            if time series were hashed, time series points.
+    """
+
+    id: uuid.UUID
+    path: str
+    old_path: str
+    changed_fields: typing.Tuple[str, ...] = ()
+    added_attributes: typing.Tuple[str, ...] = ()
+    removed_attributes: typing.Tuple[str, ...] = ()
+    modified_attributes: typing.Tuple[str, ...] = ()
+
+
+@dataclass
+class ModelDiff:
+    """Change set between two model digests, see :py:func:`diff`.
+
+    Attributes:
+        added_objects: Paths of objects only in the new digest, by object ID.
+        removed_objects: Paths of objects only in the old digest, by object ID.
+        modified_objects: Objects in both digests that differ.
+    """
+
+    added_objects: typing.Dict[uuid.UUID, str]
+    removed_objects: typing.Dict[uuid.UUID, str]
+    modified_objects: typing.List[ObjectChange]
+
+    def __bool__(self) -> bool:
+        """`True` if there are any changes."""
+        return bool(self.added_objects or self.removed_objects or self.modified_objects)
+
+
+class ModelDigest:
+    """Compact hashes of objects and attribute values of a Mesh model.
+
+    Use :py:meth:`load` or :py:meth:`load_async` to hash a model read from
+    Mesh, :py:meth:`from_objects` to hash objects already read from Mesh or
+    :py:meth:`from_snapshot` to hash the structure of a
+    :py:class:`~volue.mesh.snapshot.ModelSnapshot`.
+
+    Only digests created the same way, i.e. both from Mesh objects or both
+    from snapshots, and with or without time series points, can be compared.
+    """
+
+    def __init__(self, kind: str = "objects"):
+        self._kind = kind
+
+        # object columns
+        self._object_ids: typing.List[uuid.UUID] = []
+        self._object_paths: typing.List[str] = []
+        self._object_type_names: typing.List[str] = []
+        self._object_owner_ids: typing.List[uuid.UUID | None] = []
+        self._object_hashes = array("Q")
+        # attributes of object `row` are at `[starts[row], starts[row + 1])`
+        self._attribute_starts = array("q", [0])
+
+        # attribute columns, sorted by name within an object
+        self._attribute_names: typing.List[str] = []
+        self._attribute_hashes = array("Q")
+
+        self._object_rows_by_id: typing.Dict[uuid.UUID, int] = {}
+        # attribute rows by time series key, hashed with time series points in `_build`
+        self._timeseries_rows: typing.Dict[int, typing.List[int]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        timeseries_interval: typing.Tuple[datetime, datetime] | None = None,
+    ) -> ModelDigest:
+        """Hash the `target` object and objects found by `query`.
+
+        Objects are streamed from Mesh and only their hashes are kept.
+
+        Args:
+            session: Session used to read the model. Uncommitted changes of
+                the session are a part of the digest.
+            target: Mesh object to start the search from, e.g. a model. It
+                could be a Universal Unique Identifier or a path in the
+                `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: Search query, by default all objects owned directly or
+                indirectly by `target`.
+            batch_size: Number of objects received from Mesh before they are
+                hashed.
+            timeseries_interval: If set, time series points of each physical
+                or virtual time series connected to the found time series
+                attributes are read in this interval, once per time series,
+                and hashed with the attribute values.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        digest = cls("timeseries" if timeseries_interval is not None else "objects")
+        # objects are hashed as streamed, with unparsed attributes
+        for node in session.traverse_objects(target, max_depth=0):
+            digest._add_object(node.object)
+        for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                digest._add_object(object)
+
+        if timeseries_interval is not None:
+            for key in digest._timeseries_rows:
+                timeseries = session.read_timeseries_points(key, *timeseries_interval)
+                digest._add_timeseries_points(key, timeseries.arrow_table)
+        digest._build()
+        return digest
+
+    @classmethod
+    async def load_async(
+        cls,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        timeseries_interval: typing.Tuple[datetime, datetime] | None = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENT_READS,
+    ) -> ModelDigest:
+        """Asynchronous version of :py:meth:`load`.
+
+        Args:
+            max_concurrency: Maximum number of time series read concurrently.
+        """
+        digest = cls("timeseries" if timeseries_interval is not None else "objects")
+        async for node in session.traverse_objects(target, max_depth=0):
+            digest._add_object(node.object)
+        async for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                digest._add_object(object)
+
+        if timeseries_interval is not None:
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def read(key):
+                async with semaphore:
+                    timeseries = await session.read_timeseries_points(
+                        key, *timeseries_interval
+                    )
+                digest._add_timeseries_points(key, timeseries.arrow_table)
+
+            await asyncio.gather(*(read(key) for key in digest._timeseries_rows))
+        digest._build()
+        return digest
+
+    @classmethod
+    def from_objects(cls, objects: typing.Iterable[Object]) -> ModelDigest:
+        """Hash objects streamed from Mesh, e.g. by `iter_objects`.
+
+        Objects that occur more than once are hashed only once.
+
+        Raises:
+            ValueError: Attributes of an object were parsed upfront, e.g. by
+                `get_object`, or modified locally, they can be hashed only
+                as received from Mesh.
+        """
+        digest = cls()
+        for object in objects:
+            digest._add_object(object)
+        digest._build()
+        return digest
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ModelSnapshot) -> ModelDigest:
+        """Hash the structure of a model snapshot: objects, attribute types,
+        time series keys and relations.
+
+        Snapshots do not store simple attribute values, so such digests can
+        be compared only with other digests of snapshots.
+        """
+        digest = cls("snapshot")
+        for object in snapshot:
+            attributes = {
+                attribute.name: _hash(
+                    attribute.attribute_type.encode(),
+                    str(attribute.timeseries_key).encode(),
+                    *(id.bytes for id in attribute.target_object_ids),
+                )
+                for attribute in snapshot.get_attributes(object)
+            }
+            digest._add_row(
+                object.id, object.path, object.type_name, object.owner_id, attributes
+            )
+        digest._build()
+        return digest
+
+    def _add_object(self, object: Object) -> None:
+        if object.id in self._object_rows_by_id:
+            return
+
+        if (
+            not isinstance(object.attributes, _LazyAttributes)
+            or object.attributes._proto_attributes is None
+        ):
+            raise ValueError(
+                f"attributes of object '{object.path}' must be hashed as received from Mesh"
+            )
+
+        proto_attributes = object.attributes._proto_attributes
+        attributes = dict(
+            zip(
+                [proto_attribute.name for proto_attribute in proto_attributes],
+                map(_hash_attribute_values, proto_attributes),
+            )
+        )
+        start = self._add_row(
+            object.id, object.path, object.type_name, object.owner_id, attributes
+        )
+
+        if self._kind == "timeseries":
+            names = self._attribute_names
+            for proto_attribute in proto_attributes:
+                if len(proto_attribute.values) != 1:
+                    continue
+                proto_value = proto_attribute.values[0]
+                if not proto_value.HasField("timeseries_value"):
+                    continue
+                timeseries_value = proto_value.timeseries_value
+                if timeseries_value.HasField("time_series_resource"):
+                    key = timeseries_value.time_series_resource.timeseries_key
+                    row = names.index(proto_attribute.name, start)
+                    self._timeseries_rows.setdefault(key, []).append(row)
+
+    def _add_row(
+        self,
+        object_id: uuid.UUID,
+        path: str,
+        type_name: str,
+        owner_id: uuid.UUID | None,
+        attributes: typing.Dict[str, int],
+    ) -> int:
+        """Add an object with hashes of its attributes by name, return row of
+        its first attribute."""
+        self._object_rows_by_id[object_id] = len(self._object_ids)
+        self._object_ids.append(object_id)
+        self._object_paths.append(path)
+        self._object_type_names.append(sys.intern(type_name))
+        self._object_owner_ids.append(owner_id)
+
+        start = len(self._attribute_names)
+        for name in sorted(attributes):
+            self._attribute_names.append(sys.intern(name))
+            self._attribute_hashes.append(attributes[name])
+        self._attribute_starts.append(len(self._attribute_names))
+        return start
+
+    def _add_timeseries_points(self, key: int, table: pa.Table) -> None:
+        points_hash = _hash_timeseries_points(table).to_bytes(8, "little")
+        for row in self._timeseries_rows[key]:
+            self._attribute_hashes[row] = _hash(
+                self._attribute_hashes[row].to_bytes(8, "little"), points_hash
+            )
+
+    def _build(self) -> None:
+        """Hash objects once all attribute hashes are known."""
+        self._object_hashes = array("Q")
+        for row in range(len(self._object_ids)):
+            owner_id = self._object_owner_ids[row]
+            start, end = self._attribute_starts[row], self._attribute_starts[row + 1]
+            self._object_hashes.append(
+                _hash(
+                    self._object_paths[row].encode(),
+                    b"\0",
+                    self._object_type_names[row].encode(),
+                    owner_id.bytes if owner_id is not None else b"",
+                    *(
+                        name.encode() + b"\0"
+                        for name in self._attribute_names[start:end]
+                    ),
+                    self._attribute_hashes[start:end].tobytes(),
+                )
+            )
+        self._timeseries_rows = {}
+
+    def __len__(self) -> int:
+        """Number of hashed objects."""
+        return len(self._object_ids)
+
+    def __contains__(self, target: uuid.UUID) -> bool:
+        """Check if an object with given ID is hashed."""
+        return target in self._object_rows_by_id
+
+    def _get_attributes(self, row: int) -> typing.Dict[str, int]:
+        start, end = self._attribute_starts[row], self._attribute_starts[row + 1]
+        return dict(
+            zip(self._attribute_names[start:end], self._attribute_hashes[start:end])
+        )
+
+
+def diff(old: ModelDigest, new: ModelDigest) -> ModelDiff:
+    """Compare two model digests by object ID.
+
+    Raises:
+        ValueError: The digests were created in different ways, e.g. one
+            from a snapshot and the other one from Mesh objects.
+    """
+    if old._kind != new._kind:
+        raise ValueError(
+            f"cannot compare digests of {old._kind} and {new._kind}, "
+            "create both digests the same way"
+        )
+
+    added_objects = {}
+    modified_objects = []
+    for new_row, object_id in enumerate(new._object_ids):
+        old_row = old._object_rows_by_id.get(object_id)
+        if old_row is None:
+            added_objects[object_id] = new._object_paths[new_row]
+        elif old._object_hashes[old_row] != new._object_hashes[new_row]:
+            modified_objects.append(_compare_objects(old, old_row, new, new_row))
+
+    removed_objects = {
+        object_id: old._object_paths[old_row]
+        for old_row, object_id in enumerate(old._object_ids)
+        if object_id not in new._object_rows_by_id
+    }
+    return ModelDiff(added_objects, removed_objects, modified_objects)
+
+
+def _compare_objects(
+    old: ModelDigest, old_row: int, new: ModelDigest, new_row: int
+) -> ObjectChange:
+    changed_fields = tuple(
+        field
+        for field, old_values, new_values in (
+            ("path", old._object_paths, new._object_paths),
+            ("type_name", old._object_type_names, new._object_type_names),
+            ("owner_id", old._object_owner_ids, new._object_owner_ids),
+        )
+        if old_values[old_row] != new_values[new_row]
+    )
+
+    old_attributes = old._get_attributes(old_row)
+    new_attributes = new._get_attributes(new_row)
+    return ObjectChange(
+        id=new._object_ids[new_row],
+        path=new._object_paths[new_row],
+        old_path=old._object_paths[old_row],
+        changed_fields=changed_fields,
+        added_attributes=tuple(
+            name for name in new_attributes if name not in old_attributes
+        ),
+        removed_attributes=tuple(
+            name for name in old_attributes if name not in new_attributes
+        ),
+        modified_attributes=tuple(
+            name
+            for name, attribute_hash in new_attributes.items()
+            if name in old_attributes and old_attributes[name] != attribute_hash
+        ),
+    )
@@ -0,0 +1,271 @@
+"""
+Opt-in client-side profiling of Mesh session operations.
+
+While a :py:class:`Profiler` is active, timing spans are recorded for every
+public session method and for the client-side phases inside them:
+
+- ``decode_timeseries``: decoding of Arrow IPC time series data read from Mesh,
+- ``encode_timeseries``: encoding of time series data to Arrow IPC,
+- ``parse_attribute``: parsing of a protobuf attribute,
+- ``sort_attributes``: sorting attributes of a parsed object by name.
+
+Spans of session methods have phase ``session.<method name>``, e.g.
+``session.read_timeseries_points``. Example::
+
+    from volue.mesh import profiling
+
+    with profiling.Profiler(slow_call_threshold=1.0) as profiler:
+        session.read_timeseries_points(...)
+
+    for span in profiler.spans:
+        print(span.phase, span.target, span.duration)
+
+Profilers are scoped to the calling context: spans are recorded only for
+operations run in the thread or asyncio task that started the profiler (and
+asyncio tasks created from it), so concurrent callers do not see each other's
+spans.
+
+When no profiler is active the cost is a single check per phase.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import logging
+import time
+import typing
+import uuid
+from dataclasses import dataclass
+
+_logger = logging.getLogger(__name__)
+
+_active_profiler: contextvars.ContextVar[Profiler | None] = contextvars.ContextVar(
+    "_active_profiler", default=None
+)
+
+
+@dataclass(frozen=True)
+class TimingSpan:
+    """Timing of a single phase of a session operation.
+
+    Attributes:
+        phase: Name of the phase, e.g. `decode_timeseries`.
+        duration: Duration of the phase in seconds.
+        target: Path, ID or time series key of the processed Mesh object,
+            attribute or time series, if known.
+        points: Number of processed time series points or attributes, if
+            applicable.
+        bytes: Size of the processed data in bytes, if applicable.
+    """
+
+    phase: str
+    duration: float
+    target: str | None = None
+    points: int | None = None
+    bytes: int | None = None
+
+
+class Profiler:
+    """Records timing spans of session operations while active.
+
+    Only one profiler can be active at a time in a context (thread or asyncio
+    task). Use it as a context manager or call :py:meth:`start` and
+    :py:meth:`stop` from the same context.
+
+    Args:
+        handler: Called with each recorded span, e.g. to forward it to a
+            tracing system. If not set, spans are collected in
+            :py:attr:`spans`.
+        slow_call_threshold: Spans longer than this (in seconds) are logged as
+            warnings by the `volue.mesh.profiling` logger.
+    """
+
+    def __init__(
+        self,
+        handler: typing.Callable[[TimingSpan], None] | None = None,
+        slow_call_threshold: float | None = None,
+    ):
+        self.handler = handler
+        self.slow_call_threshold = slow_call_threshold
+        self.spans: typing.List[TimingSpan] = []
+        self._token: contextvars.Token | None = None
+
+    def start(self) -> None:
+        """Activate the profiler in the current context.
+
+        Raises:
+            RuntimeError: Another profiler is already active in the current
+                context.
+        """
+        active_profiler = _active_profiler.get()
+        if active_profiler is self:
+            return
+        if active_profiler is not None:
+            raise RuntimeError("another profiler is already active")
+        self._token = _active_profiler.set(self)
+
+    def stop(self) -> None:
+        """Deactivate the profiler in the current context."""
+        if _active_profiler.get() is self:
+            try:
+                _active_profiler.reset(self._token)
+            except ValueError:
+                # started in a different context
+                _active_profiler.set(None)
+        self._token = None
+
+    def __enter__(self) -> Profiler:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _add(self, span: TimingSpan) -> None:
+        if (
+            self.slow_call_threshold is not None
+            and span.duration >= self.slow_call_threshold
+        ):
+            _logger.warning(
+                "slow %s: %.3f s (target: %s, points: %s, bytes: %s)",
+                span.phase,
+                span.duration,
+                span.target,
+                span.points,
+                span.bytes,
+            )
+
+        if self.handler is not None:
+            self.handler(span)
+        else:
+            self.spans.append(span)
+
+
+def _start() -> float | None:
+    """Get the start time of a phase, or None if profiling is not active."""
+    return time.perf_counter() if _active_profiler.get() is not None else None
+
+
+def _record(
+    phase: str,
+    start: float,
+    target: typing.Any = None,
+    points: int | None = None,
+    bytes: int | None = None,
+) -> None:
+    """Record a phase started at `start`, see :py:func:`_start`."""
+    profiler = _active_profiler.get()
+    if profiler is not None:
+        profiler._add(
+            TimingSpan(
+                phase=phase,
+                duration=time.perf_counter() - start,
+                target=str(target) if target is not None else None,
+                points=points,
+                bytes=bytes,
+            )
+        )
+
+
+def _get_target(args: tuple, kwargs: dict) -> typing.Any:
+    # most session methods take the path, ID or time series key as first argument
+    target = kwargs["target"] if "target" in kwargs else args[0] if args else None
+    return target if isinstance(target, (str, uuid.UUID, int)) else None
+
+
+def _profile_method(method: typing.Callable) -> typing.Callable:
+    """Wrap a session method to record a span covering the whole call,
+    including iteration of returned generators.
+    """
+    phase = f"session.{method.__name__}"
+
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def async_generator_wrapper(self, *args, **kwargs):
+            start = _start()
+            try:
+                async for item in method(self, *args, **kwargs):
+                    yield item
+            finally:
+                if start is not None:
+                    _record(phase, start, _get_target(args, kwargs))
+
+        return async_generator_wrapper
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def coroutine_wrapper(self, *args, **kwargs):
+            start = _start()
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                if start is not None:
+                    _record(phase, start, _get_target(args, kwargs))
+
+        return coroutine_wrapper
+
+    if inspect.isgeneratorfunction(method):
+
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            start = _start()
+            try:
+                yield from method(self, *args, **kwargs)
+            finally:
+                if start is not None:
+                    _record(phase, start, _get_target(args, kwargs))
+
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = _start()
+        if start is None:
+            return method(self, *args, **kwargs)
+
+        target = _get_target(args, kwargs)
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException:
+            _record(phase, start, target)
+            raise
+
+        # methods validating their arguments before iteration return generators
+        if inspect.isgenerator(result):
+            return _profile_generator(result, phase, start, target)
+        if inspect.isasyncgen(result):
+            return _profile_async_generator(result, phase, start, target)
+        _record(phase, start, target)
+        return result
+
+    return wrapper
+
+
+def _profile_generator(
+    generator: typing.Iterator, phase: str, start: float, target: typing.Any
+) -> typing.Iterator:
+    try:
+        yield from generator
+    finally:
+        _record(phase, start, target)
+
+
+async def _profile_async_generator(
+    generator: typing.AsyncIterator, phase: str, start: float, target: typing.Any
+) -> typing.AsyncIterator:
+    try:
+        async for item in generator:
+            yield item
+    finally:
+        _record(phase, start, target)
+
+
+def _profile_public_methods(cls: type) -> None:
+    """Wrap all public methods defined directly in `cls`."""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.isfunction(value):
+            setattr(cls, name, _profile_method(value))
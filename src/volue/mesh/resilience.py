@@ -0,0 +1,799 @@
+"""
+Retries, hedging and adaptive concurrency limiting of Mesh gRPC calls.
+
+Read-only calls (`Get*`, `List*`, `Read*` and `Search*` gRPC methods) failing
+with a transient error are retried with exponential backoff and full jitter.
+All other calls, e.g. writes, are never retried. Optionally, slow unary
+read-only calls are hedged: a second attempt is sent if the first does not
+finish within a delay and the first successful result is used.
+
+An :py:class:`AdaptiveConcurrencyLimit` bounds the number of calls in flight.
+The limit is increased additively on every successful call and decreased
+multiplicatively when Mesh responds with `RESOURCE_EXHAUSTED` or calls get
+slower than a latency threshold (AIMD)::
+
+    from volue import mesh
+    from volue.mesh import resilience
+
+    interceptor = resilience.ResilienceInterceptor(
+        resilience.RetryPolicy(hedging_delay=0.5),
+        resilience.AdaptiveConcurrencyLimit(latency_threshold=2.0),
+    )
+    connection = mesh.Connection.insecure(
+        "localhost:50051", interceptors=[interceptor]
+    )
+
+Unary calls of synchronous connections do not block the caller while waiting
+for the concurrency limit, a retry backoff or a hedging delay, so calls made
+with `.future()` stay pipelined.
+
+For :py:mod:`volue.mesh.aio` connections use
+:py:class:`AsyncResilienceInterceptor` instead. When combined with
+:py:mod:`volue.mesh.metrics` interceptors, interceptors listed before the
+resilience interceptor see the whole call including retries, and interceptors
+listed after it see each attempt.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import concurrent.futures
+import random
+import threading
+import time
+import typing
+from dataclasses import dataclass
+
+import grpc
+
+
+@dataclass
+class RetryPolicy:
+    """Defines which calls are retried and how.
+
+    Attributes:
+        max_attempts: Maximum number of attempts of a call, including the
+            first one. Hedged attempts are not counted.
+        initial_backoff: Upper bound of the random delay before the first
+            retry, in seconds.
+        max_backoff: Maximum upper bound of the random delay before a retry,
+            in seconds.
+        backoff_multiplier: The upper bound of the delay is multiplied by
+            this after each retry.
+        retryable_status_codes: Status codes of failed attempts that are
+            retried.
+        idempotent_method_prefixes: gRPC method name prefixes of calls that
+            are safe to retry and hedge.
+        hedging_delay: If set, a second attempt of a unary read-only call is
+            sent when the first one did not finish within this delay, in
+            seconds.
+    """
+
+    max_attempts: int = 4
+    initial_backoff: float = 0.1
+    max_backoff: float = 5.0
+    backoff_multiplier: float = 2.0
+    retryable_status_codes: typing.Tuple[grpc.StatusCode, ...] = (
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+    )
+    idempotent_method_prefixes: typing.Tuple[str, ...] = (
+        "Get",
+        "List",
+        "Read",
+        "Search",
+    )
+    hedging_delay: float | None = None
+
+    def is_idempotent(self, method: str | bytes) -> bool:
+        """Check if calls of the given full gRPC method name may be retried."""
+        return _get_method_name(method).startswith(self.idempotent_method_prefixes)
+
+    def _should_retry(
+        self, retryable: bool, attempt: int, code: grpc.StatusCode | None
+    ) -> bool:
+        return (
+            retryable
+            and attempt < self.max_attempts
+            and code in self.retryable_status_codes
+        )
+
+    def _get_backoff(self, attempt: int) -> float:
+        """Get the delay before the retry following the `attempt`-th attempt."""
+        upper_bound = min(
+            self.max_backoff,
+            self.initial_backoff * self.backoff_multiplier ** (attempt - 1),
+        )
+        return random.uniform(0, upper_bound)
+
+
+class AdaptiveConcurrencyLimit:
+    """Limits the number of concurrent calls, adapting the limit using
+    additive increase and multiplicative decrease (AIMD).
+
+    Each successful call increases the limit by `1 / limit`, i.e. roughly by
+    one per `limit` calls. A call failing with `RESOURCE_EXHAUSTED` or a unary
+    call slower than `latency_threshold` multiplies the limit by
+    `backoff_ratio`. Only one decrease is applied for calls started before
+    the previous decrease.
+
+    Can be shared by multiple connections, both synchronous and asynchronous.
+
+    Args:
+        initial_limit: Initial number of allowed concurrent calls.
+        min_limit: Minimum number of allowed concurrent calls.
+        max_limit: Maximum number of allowed concurrent calls.
+        latency_threshold: Unary calls slower than this (in seconds) decrease
+            the limit. If not set only `RESOURCE_EXHAUSTED` errors decrease it.
+        backoff_ratio: Multiplier applied to the limit on decrease.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        latency_threshold: float | None = None,
+        backoff_ratio: float = 0.5,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            )
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff ratio must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff_ratio = backoff_ratio
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+        self._async_waiters: typing.List[asyncio.Future] = []
+        self._deferred: typing.Deque[typing.Callable[[float], None]] = (
+            collections.deque()
+        )
+
+    @property
+    def limit(self) -> int:
+        """Current number of allowed concurrent calls."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Current number of calls in flight."""
+        return self._in_flight
+
+    def _try_acquire(self) -> float | None:
+        # must be called with `_condition` held
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return time.monotonic()
+        return None
+
+    def acquire(self) -> float:
+        """Wait until a call is allowed.
+
+        Returns:
+            Start time of the call, to be passed to :py:meth:`release`.
+        """
+        with self._condition:
+            while (start := self._try_acquire()) is None:
+                self._condition.wait()
+            return start
+
+    def _acquire_or_defer(
+        self, callback: typing.Callable[[float], None]
+    ) -> float | None:
+        """Acquire without waiting. If no call is allowed, `callback` is called
+        with the start time once one is, from the thread releasing a call.
+        """
+        with self._condition:
+            start = self._try_acquire()
+            if start is None:
+                self._deferred.append(callback)
+            return start
+
+    async def acquire_async(self) -> float:
+        """Asynchronously wait until a call is allowed.
+
+        Returns:
+            Start time of the call, to be passed to :py:meth:`release`.
+        """
+        while True:
+            with self._condition:
+                start = self._try_acquire()
+                if start is not None:
+                    return start
+                waiter = asyncio.get_running_loop().create_future()
+                self._async_waiters.append(waiter)
+            await waiter
+
+    def release(
+        self,
+        start: float,
+        code: grpc.StatusCode | None = None,
+        latency: float | None = None,
+    ) -> None:
+        """Finish a call and adapt the limit.
+
+        Args:
+            start: Start time returned by :py:meth:`acquire`.
+            code: Final status code of the call. If not known the limit is
+                not adapted.
+            latency: Latency of the call in seconds, if it should be compared
+                with the latency threshold.
+        """
+        with self._condition:
+            self._in_flight -= 1
+
+            congested = code == grpc.StatusCode.RESOURCE_EXHAUSTED or (
+                code == grpc.StatusCode.OK
+                and latency is not None
+                and self.latency_threshold is not None
+                and latency > self.latency_threshold
+            )
+            if congested:
+                if start > self._last_decrease:
+                    self._limit = max(
+                        float(self.min_limit), self._limit * self.backoff_ratio
+                    )
+                    self._last_decrease = time.monotonic()
+            elif code == grpc.StatusCode.OK:
+                self._limit = min(float(self.max_limit), self._limit + 1 / self._limit)
+
+            deferred = []
+            while self._deferred and (acquired := self._try_acquire()) is not None:
+                deferred.append((self._deferred.popleft(), acquired))
+
+            self._condition.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for callback, acquired in deferred:
+            callback(acquired)
+        # waiters re-check the limit once woken up
+        for waiter in waiters:
+            waiter.get_loop().call_soon_threadsafe(_set_waiter_result, waiter)
+
+
+def _set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _get_method_name(method: str | bytes) -> str:
+    # grpc.aio passes method names as bytes
+    if isinstance(method, bytes):
+        method = method.decode()
+    return method.rpartition("/")[2]
+
+
+class _RetryingResponseIterator:
+    """Response stream of a synchronous gRPC call. The call is retried if it
+    fails before the first response message is received.
+
+    Everything except iteration is delegated to the current call object.
+    """
+
+    def __init__(self, interceptor: ResilienceInterceptor, start_call, retryable: bool):
+        self._interceptor = interceptor
+        self._start_call = start_call
+        self._retryable = retryable
+        self._attempt = 0
+        self._received = False
+        self._call = None
+        self._start = None
+        self._next_call()
+
+    def _next_call(self) -> None:
+        self._attempt += 1
+        if self._interceptor.limit is not None:
+            self._start = self._interceptor.limit.acquire()
+        try:
+            self._call = self._start_call()
+        except BaseException:
+            self._release(None)
+            raise
+
+    def _release(self, code: grpc.StatusCode | None) -> None:
+        if self._start is not None:
+            self._interceptor.limit.release(self._start, code)
+            self._start = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            try:
+                response = next(self._call)
+            except StopIteration:
+                self._release(grpc.StatusCode.OK)
+                raise
+            except grpc.RpcError as e:
+                code = e.code() if isinstance(e, grpc.Call) else None
+                self._release(code)
+                if self._received or not self._interceptor.policy._should_retry(
+                    self._retryable, self._attempt, code
+                ):
+                    raise
+                time.sleep(self._interceptor.policy._get_backoff(self._attempt))
+                self._next_call()
+                continue
+
+            self._received = True
+            return response
+
+    def __del__(self):
+        # the stream was abandoned before it was finished
+        self._release(None)
+
+    def __getattr__(self, name: str):
+        return getattr(self._call, name)
+
+
+class _FailedAttempt(grpc.Call, grpc.Future):
+    """Finished attempt that failed without a response from Mesh, e.g. because
+    the call was cancelled or the channel raised an exception.
+    """
+
+    def __init__(self, exception: BaseException, code: grpc.StatusCode):
+        self._exception = exception
+        self._code = code
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return str(self._exception)
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return self._code == grpc.StatusCode.CANCELLED
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def result(self, timeout=None):
+        raise self._exception
+
+    def exception(self, timeout=None):
+        return self._exception
+
+    def traceback(self, timeout=None):
+        return self._exception.__traceback__
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+class _RetryingCall(grpc.Call, grpc.Future):
+    """Outcome of a synchronous unary gRPC call. Completes with the first
+    successful attempt, or the last failed one.
+
+    Attempts are started without blocking the caller: retries are sent from a
+    timer thread after the backoff and attempts waiting for the concurrency
+    limit are sent once a call is released. Losing hedged attempts are
+    cancelled. Everything except waiting is delegated to the final attempt.
+    """
+
+    def __init__(
+        self, interceptor: ResilienceInterceptor, send_attempt, retryable: bool
+    ):
+        self._interceptor = interceptor
+        self._send_attempt = send_attempt
+        self._retryable = retryable
+        self._hedged = retryable and interceptor.policy.hedging_delay is not None
+        self._condition = threading.Condition()
+        self._attempt = 0
+        self._running = 0
+        self._in_flight: typing.List[grpc.Future] = []
+        self._timer: threading.Timer | None = None
+        self._outcome: grpc.Future | None = None
+        self._cancelled = False
+        self._callbacks: typing.List[typing.Callable] = []
+
+    def _start_attempt(self, hedge: bool = False, raise_errors: bool = False) -> None:
+        if not hedge:
+            with self._condition:
+                self._attempt += 1
+
+        limit = self._interceptor.limit
+        start = None
+        if limit is not None:
+            start = limit._acquire_or_defer(
+                lambda start: self._interceptor._get_executor().submit(
+                    self._send, start, hedge
+                )
+            )
+            if start is None:
+                return
+
+        if self._hedged:
+            # blocking calls return from the continuation only when finished,
+            # send from the executor to be able to hedge them
+            self._interceptor._get_executor().submit(self._send, start, hedge)
+        else:
+            self._send(start, hedge, raise_errors)
+
+    def _start_timer(self, delay: float, function, *args) -> None:
+        # must be called with `_condition` held
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, function, args)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _send(self, start: float | None, hedge: bool, raise_errors: bool = False):
+        with self._condition:
+            finished = self._outcome is not None
+            if not finished:
+                self._running += 1
+                if self._hedged and not hedge:
+                    self._start_timer(
+                        self._interceptor.policy.hedging_delay,
+                        self._hedge,
+                        self._attempt,
+                    )
+        if finished:
+            self._release(start, None)
+            return
+
+        try:
+            outcome = self._send_attempt()
+        except BaseException as e:
+            self._release(start, None)
+            with self._condition:
+                self._running -= 1
+            if raise_errors:
+                raise
+            self._finish(_FailedAttempt(e, grpc.StatusCode.UNKNOWN))
+            return
+
+        with self._condition:
+            self._in_flight.append(outcome)
+            finished = self._outcome is not None
+        if finished:
+            outcome.cancel()
+        outcome.add_done_callback(lambda outcome: self._on_attempt_done(outcome, start))
+
+    def _hedge(self, attempt: int) -> None:
+        with self._condition:
+            if self._outcome is not None or self._attempt != attempt:
+                return
+            if self._running != 1:
+                return
+        self._start_attempt(hedge=True)
+
+    def _release(self, start: float | None, code: grpc.StatusCode | None) -> None:
+        if start is not None:
+            self._interceptor.limit.release(start, code, time.monotonic() - start)
+
+    def _on_attempt_done(self, outcome: grpc.Future, start: float | None) -> None:
+        code = outcome.code()
+        self._release(start, code)
+
+        with self._condition:
+            self._running -= 1
+            self._in_flight = [
+                attempt for attempt in self._in_flight if attempt is not outcome
+            ]
+            if self._outcome is not None:
+                return
+            if code != grpc.StatusCode.OK:
+                if self._running > 0:
+                    # the other hedged attempt may still succeed
+                    return
+                policy = self._interceptor.policy
+                if policy._should_retry(self._retryable, self._attempt, code):
+                    self._start_timer(
+                        policy._get_backoff(self._attempt), self._start_attempt
+                    )
+                    return
+        self._finish(outcome)
+
+    def _finish(self, outcome: grpc.Future, cancelled: bool = False) -> bool:
+        with self._condition:
+            if self._outcome is not None:
+                return False
+            self._outcome = outcome
+            self._cancelled = cancelled
+            if self._timer is not None:
+                self._timer.cancel()
+            losers, self._in_flight = self._in_flight, []
+            callbacks, self._callbacks = self._callbacks, []
+            self._condition.notify_all()
+
+        # cancelled attempts release their concurrency limit slots
+        for loser in losers:
+            loser.cancel()
+        for callback in callbacks:
+            callback(self)
+        return True
+
+    def _wait(self, timeout: float | None) -> grpc.Future:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._outcome is not None, timeout):
+                raise grpc.FutureTimeoutError()
+            return self._outcome
+
+    def initial_metadata(self):
+        return self._wait(None).initial_metadata()
+
+    def trailing_metadata(self):
+        return self._wait(None).trailing_metadata()
+
+    def code(self):
+        return self._wait(None).code()
+
+    def details(self):
+        return self._wait(None).details()
+
+    def is_active(self):
+        return self._outcome is None
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback):
+        self.add_done_callback(lambda call: callback())
+        return True
+
+    def cancel(self):
+        return self._finish(
+            _FailedAttempt(grpc.FutureCancelledError(), grpc.StatusCode.CANCELLED),
+            cancelled=True,
+        )
+
+    def cancelled(self):
+        return self._cancelled
+
+    def running(self):
+        return self._outcome is None
+
+    def done(self):
+        return self._outcome is not None
+
+    def result(self, timeout=None):
+        return self._wait(timeout).result()
+
+    def exception(self, timeout=None):
+        return self._wait(timeout).exception()
+
+    def traceback(self, timeout=None):
+        return self._wait(timeout).traceback()
+
+    def add_done_callback(self, fn):
+        with self._condition:
+            if self._outcome is None:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+
+class ResilienceInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Retries, hedges and limits concurrency of gRPC calls made through a
+    synchronous :py:class:`volue.mesh.Connection`.
+
+    Unary calls return without waiting for the concurrency limit, retries or
+    hedging, these run in background threads. Streaming calls are retried
+    only if they fail before the first response message is received and are
+    never hedged.
+
+    Args:
+        policy: Retry and hedging policy. Defaults to :py:class:`RetryPolicy`
+            with default values.
+        limit: If set, limits the number of concurrent calls.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        limit: AdaptiveConcurrencyLimit | None = None,
+    ):
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.limit = limit
+        self._executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="mesh-resilience"
+                )
+            return self._executor
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        retryable = self.policy.is_idempotent(client_call_details.method)
+        if not retryable and self.limit is None:
+            return continuation(client_call_details, request)
+
+        call = _RetryingCall(
+            self, lambda: continuation(client_call_details, request), retryable
+        )
+        call._start_attempt(raise_errors=True)
+        return call
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        retryable = self.policy.is_idempotent(client_call_details.method)
+        if not retryable and self.limit is None:
+            return continuation(client_call_details, request)
+
+        return _RetryingResponseIterator(
+            self,
+            lambda: continuation(client_call_details, request),
+            retryable,
+        )
+
+
+class AsyncResilienceInterceptor(
+    grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    """Retries, hedges and limits concurrency of gRPC calls made through an
+    asynchronous :py:class:`volue.mesh.aio.Connection`.
+
+    Streaming calls are retried only if they fail before the first response
+    message is received and are never hedged.
+
+    Args:
+        policy: Retry and hedging policy. Defaults to :py:class:`RetryPolicy`
+            with default values.
+        limit: If set, limits the number of concurrent calls.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        limit: AdaptiveConcurrencyLimit | None = None,
+    ):
+        self.policy = policy if policy is not None else RetryPolicy()
+        self.limit = limit
+
+    async def _invoke(self, continuation, client_call_details, request):
+        """Run an attempt and wait for it to finish."""
+        start = await self.limit.acquire_async() if self.limit is not None else None
+        code = None
+        call = None
+        try:
+            call = await continuation(client_call_details, request)
+            code = await call.code()
+            return call
+        except asyncio.CancelledError:
+            # a hedged attempt lost, stop it on the server as well
+            if call is not None:
+                call.cancel()
+            raise
+        finally:
+            if start is not None:
+                self.limit.release(start, code, time.monotonic() - start)
+
+    async def _invoke_hedged(self, continuation, client_call_details, request):
+        first = asyncio.ensure_future(
+            self._invoke(continuation, client_call_details, request)
+        )
+        done, _ = await asyncio.wait({first}, timeout=self.policy.hedging_delay)
+        if done:
+            return first.result()
+
+        second = asyncio.ensure_future(
+            self._invoke(continuation, client_call_details, request)
+        )
+        # use the first successful attempt, or the last failed one
+        pending = {first, second}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    call = task.result()
+                    if await call.code() == grpc.StatusCode.OK:
+                        return call
+            return call
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        retryable = self.policy.is_idempotent(client_call_details.method)
+        if not retryable and self.limit is None:
+            return await continuation(client_call_details, request)
+
+        hedged = retryable and self.policy.hedging_delay is not None
+        attempt = 0
+        while True:
+            attempt += 1
+            if hedged:
+                call = await self._invoke_hedged(
+                    continuation, client_call_details, request
+                )
+            else:
+                call = await self._invoke(continuation, client_call_details, request)
+
+            if not self.policy._should_retry(retryable, attempt, await call.code()):
+                return call
+            await asyncio.sleep(self.policy._get_backoff(attempt))
+
+    async def _start_stream(self, continuation, client_call_details, request):
+        """Start an attempt of a streaming call, the concurrency limit slot is
+        released once the call is done, also if the stream is abandoned.
+        """
+        if self.limit is None:
+            return await continuation(client_call_details, request)
+
+        start = await self.limit.acquire_async()
+        try:
+            call = await continuation(client_call_details, request)
+        except BaseException:
+            self.limit.release(start)
+            raise
+
+        def release(code_task: asyncio.Task) -> None:
+            code = None
+            if not code_task.cancelled() and code_task.exception() is None:
+                code = code_task.result()
+            self.limit.release(start, code)
+
+        call.add_done_callback(
+            lambda call: asyncio.ensure_future(call.code()).add_done_callback(release)
+        )
+        return call
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        retryable = self.policy.is_idempotent(client_call_details.method)
+        if not retryable and self.limit is None:
+            return await continuation(client_call_details, request)
+
+        # the first attempt must be started before returning, grpc.aio uses
+        # the returned call for e.g. cancellation
+        call = await self._start_stream(continuation, client_call_details, request)
+
+        async def response_iterator(call):
+            attempt = 1
+            while True:
+                received = False
+                try:
+                    async for response in call:
+                        received = True
+                        yield response
+                    return
+                except grpc.RpcError as e:
+                    code = e.code() if isinstance(e, grpc.aio.AioRpcError) else None
+                    if received or not self.policy._should_retry(
+                        retryable, attempt, code
+                    ):
+                        raise
+                await asyncio.sleep(self.policy._get_backoff(attempt))
+                attempt += 1
+                call = await self._start_stream(
+                    continuation, client_call_details, request
+                )
+
+        return response_iterator(call)
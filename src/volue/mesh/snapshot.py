@@ -0,0 +1,1000 @@
+"""
+In-memory indexed snapshot of a Mesh model.
+
+A :py:class:`ModelSnapshot` loads a whole model (or a part of it) once, streamed
+from the Mesh server, into compact columnar storage. Lookups by ID, path, type
+name, owner and time series key are dictionary lookups, and traversals of the
+ownership and link relations run offline, without further calls to Mesh.
+Example::
+
+    from volue.mesh.snapshot import ModelSnapshot
+
+    with connection.create_session() as session:
+        snapshot = ModelSnapshot.load(session, "Model/SimpleThermalTestModel")
+
+    for object in snapshot.walk("Model/SimpleThermalTestModel/ThermalComponent"):
+        print(object.path)
+
+    objects_table, attributes_table = snapshot.to_arrow()
+
+Only the structure of the model is captured: objects, attribute names and
+types, relations and time series keys. Simple attribute values and attribute
+definitions are not stored.
+
+A loaded snapshot can be kept up to date without loading the whole model
+again, see :py:meth:`ModelSnapshot.refresh`. A :py:class:`ModelChangeTracker`
+records link relation and time series attributes updated in committed
+sessions of the same connection, so they are read again too::
+
+    from volue.mesh.snapshot import ModelChangeInterceptor, ModelChangeTracker
+
+    tracker = ModelChangeTracker()
+    connection = mesh.Connection.insecure(
+        "localhost:50051", interceptors=[ModelChangeInterceptor(tracker)]
+    )
+    ...
+    with connection.create_session() as session:
+        snapshot = snapshot.refresh(
+            session,
+            "Model/SimpleThermalTestModel",
+            modified_attributes=tracker.pop_modified_attributes(),
+        )
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import typing
+import uuid
+from array import array
+from collections import deque
+from dataclasses import dataclass
+
+import grpc
+import pyarrow as pa
+
+from volue.mesh._attribute import (
+    AttributeBase,
+    LinkRelationAttribute,
+    OwnershipRelationAttribute,
+    TimeseriesAttribute,
+    VersionedLinkRelationAttribute,
+)
+from volue.mesh._common import AttributesFilter
+from volue.mesh._object import Object
+from volue.mesh.proto.model.v1alpha import model_pb2
+
+if typing.TYPE_CHECKING:
+    from volue.mesh import Connection
+    from volue.mesh.aio import Connection as AsyncConnection
+
+# marks missing owner, owner object and time series key in integer columns
+_NONE = -1
+
+_DEFAULT_BATCH_SIZE = 1000
+
+# several times the interval of extending lifetime of sessions opened by the SDK
+_DEFAULT_MAX_SESSION_IDLE_TIME = 600.0
+
+# objects without attributes, used to compare the structure of a model
+_STRUCTURE_FILTER = AttributesFilter(return_no_attributes=True)
+
+_LINK_ATTRIBUTE_TYPES = frozenset(
+    (LinkRelationAttribute.__name__, VersionedLinkRelationAttribute.__name__)
+)
+
+OBJECTS_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("path", pa.string(), nullable=False),
+        pa.field("name", pa.string(), nullable=False),
+        pa.field("type_name", pa.string(), nullable=False),
+        pa.field("owner_id", pa.string()),
+        pa.field("owner_object_id", pa.string()),
+    ]
+)
+"""Schema of the objects table returned by :py:meth:`ModelSnapshot.to_arrow`.
+
+`owner_id` is the ID of the owning ownership relation attribute and
+`owner_object_id` the ID of the object owning that attribute, if it is a part
+of the snapshot.
+"""
+
+ATTRIBUTES_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("path", pa.string(), nullable=False),
+        pa.field("name", pa.string(), nullable=False),
+        pa.field("owner_id", pa.string(), nullable=False),
+        pa.field("attribute_type", pa.string(), nullable=False),
+        pa.field("timeseries_key", pa.int64()),
+        pa.field("target_object_ids", pa.list_(pa.string())),
+    ]
+)
+"""Schema of the attributes table returned by :py:meth:`ModelSnapshot.to_arrow`.
+
+`attribute_type` is the name of the attribute class, e.g.
+`TimeseriesAttribute`. `timeseries_key` is set for time series attributes
+connected to a physical or virtual time series. `target_object_ids` is set for
+ownership, link relation and versioned link relation attributes. For versioned
+link relations it holds objects linked to in any version.
+"""
+
+
+@dataclass(frozen=True)
+class SnapshotObject:
+    """Mesh object stored in a :py:class:`ModelSnapshot`.
+
+    Attributes:
+        id: ID of the object.
+        path: Path of the object.
+        name: Name of the object.
+        type_name: Name of the object definition.
+        owner_id: ID of the ownership relation attribute owning the object.
+    """
+
+    id: uuid.UUID
+    path: str
+    name: str
+    type_name: str
+    owner_id: uuid.UUID | None
+
+
+@dataclass(frozen=True)
+class SnapshotAttribute:
+    """Mesh attribute stored in a :py:class:`ModelSnapshot`.
+
+    Attributes:
+        id: ID of the attribute.
+        path: Path of the attribute.
+        name: Name of the attribute.
+        owner_id: ID of the object the attribute belongs to.
+        attribute_type: Name of the attribute class, e.g. `TimeseriesAttribute`.
+        timeseries_key: Time series key of the physical or virtual time series
+            connected to a time series attribute.
+        target_object_ids: Target objects of an ownership or link relation
+            attribute. For versioned link relation attributes, objects linked
+            to in any version, in order of first occurrence.
+    """
+
+    id: uuid.UUID
+    path: str
+    name: str
+    owner_id: uuid.UUID
+    attribute_type: str
+    timeseries_key: int | None = None
+    target_object_ids: typing.Tuple[uuid.UUID, ...] = ()
+
+
+class ModelSnapshot:
+    """Indexed, read-only snapshot of Mesh model objects and attributes.
+
+    Use :py:meth:`load` or :py:meth:`load_async` to load a snapshot from Mesh
+    or :py:meth:`from_objects` to build it from already read objects.
+
+    Objects and attributes can be identified by ID or path. All methods
+    raise `KeyError` if a given object or attribute is not a part of the
+    snapshot.
+    """
+
+    def __init__(self):
+        # object columns
+        self._object_ids: typing.List[uuid.UUID] = []
+        self._object_paths: typing.List[str] = []
+        self._object_names: typing.List[str] = []
+        self._object_type_names: typing.List[str] = []
+        self._object_owner_ids: typing.List[uuid.UUID | None] = []
+        # row of the object owning the owner attribute, resolved in `_build`
+        self._object_owner_rows = array("q")
+
+        # attribute columns
+        self._attribute_ids: typing.List[uuid.UUID] = []
+        self._attribute_names: typing.List[str] = []
+        self._attribute_types: typing.List[str] = []
+        self._attribute_object_rows = array("q")
+        self._attribute_timeseries_keys = array("q")
+        self._attribute_targets: typing.List[typing.Tuple[uuid.UUID, ...] | None] = []
+
+        # indexes
+        self._object_rows_by_id: typing.Dict[uuid.UUID, int] = {}
+        self._object_rows_by_path: typing.Dict[str, int] = {}
+        self._object_rows_by_type_name: typing.Dict[str, typing.List[int]] = {}
+        self._attribute_rows_by_id: typing.Dict[uuid.UUID, int] = {}
+        self._attribute_rows_by_timeseries_key: typing.Dict[int, typing.List[int]] = {}
+        self._attribute_rows_by_object: typing.Dict[int, typing.Dict[str, int]] = {}
+
+        # adjacency lists, resolved in `_build`
+        self._children: typing.Dict[int, typing.List[int]] = {}
+        self._link_sources: typing.Dict[uuid.UUID, typing.List[int]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ModelSnapshot:
+        """Load a snapshot of the `target` object and objects found by `query`.
+
+        Objects are streamed from Mesh and added to the snapshot as they are
+        received, so the whole search result is never kept in memory as
+        :py:class:`~volue.mesh.Object` instances.
+
+        Args:
+            session: Session used to read the model.
+            target: Mesh object to start the search from, e.g. a model. It
+                could be a Universal Unique Identifier or a path in the
+                `Mesh model <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/modelling/general/#model>`__.
+            query: Search query, by default all objects owned directly or
+                indirectly by `target`.
+            batch_size: Number of objects received from Mesh before they are
+                added to the snapshot.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        snapshot = cls()
+        snapshot._add_object(session.get_object(target))
+        for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                snapshot._add_object(object)
+        snapshot._build()
+        return snapshot
+
+    @classmethod
+    async def load_async(
+        cls,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ModelSnapshot:
+        """Asynchronous version of :py:meth:`load`."""
+        snapshot = cls()
+        snapshot._add_object(await session.get_object(target))
+        async for objects in session.iter_objects(target, query, batch_size=batch_size):
+            for object in objects:
+                snapshot._add_object(object)
+        snapshot._build()
+        return snapshot
+
+    @classmethod
+    def from_objects(cls, objects: typing.Iterable[Object]) -> ModelSnapshot:
+        """Build a snapshot from objects, e.g. returned by `search_for_objects`.
+
+        Objects that occur more than once are added only once.
+        """
+        snapshot = cls()
+        for object in objects:
+            snapshot._add_object(object)
+        snapshot._build()
+        return snapshot
+
+    def _add_object(self, object: Object) -> None:
+        if object.id in self._object_rows_by_id:
+            return
+
+        row = self._append_object(
+            object.id, object.path, object.name, object.type_name, object.owner_id
+        )
+        for attribute in object.attributes.values():
+            self._add_attribute(row, attribute)
+
+    def _append_object(
+        self,
+        id: uuid.UUID,
+        path: str,
+        name: str,
+        type_name: str,
+        owner_id: uuid.UUID | None,
+    ) -> int:
+        row = len(self._object_ids)
+        type_name = sys.intern(type_name)
+        self._object_ids.append(id)
+        self._object_paths.append(path)
+        self._object_names.append(name)
+        self._object_type_names.append(type_name)
+        self._object_owner_ids.append(owner_id)
+        self._object_owner_rows.append(_NONE)
+
+        self._object_rows_by_id[id] = row
+        self._object_rows_by_path[path] = row
+        self._object_rows_by_type_name.setdefault(type_name, []).append(row)
+        self._attribute_rows_by_object[row] = {}
+        return row
+
+    def _add_attribute(self, object_row: int, attribute: AttributeBase) -> None:
+        timeseries_key = _NONE
+        targets = None
+
+        if isinstance(attribute, TimeseriesAttribute):
+            resource = getattr(attribute, "time_series_resource", None)
+            if resource is not None:
+                timeseries_key = resource.timeseries_key
+        elif isinstance(attribute, (OwnershipRelationAttribute, LinkRelationAttribute)):
+            targets = tuple(attribute.target_object_ids)
+        elif isinstance(attribute, VersionedLinkRelationAttribute):
+            # union over all versions, versions without a target end a period
+            targets = tuple(
+                dict.fromkeys(
+                    version.target_object_id
+                    for entry in attribute.entries
+                    for version in entry.versions
+                    if version.target_object_id is not None
+                )
+            )
+
+        self._append_attribute(
+            object_row,
+            attribute.id,
+            attribute.name,
+            type(attribute).__name__,
+            timeseries_key,
+            targets,
+        )
+
+    def _append_attribute(
+        self,
+        object_row: int,
+        id: uuid.UUID,
+        name: str,
+        attribute_type: str,
+        timeseries_key: int,
+        targets: typing.Tuple[uuid.UUID, ...] | None,
+    ) -> None:
+        row = len(self._attribute_ids)
+        name = sys.intern(name)
+        self._attribute_ids.append(id)
+        self._attribute_names.append(name)
+        self._attribute_types.append(sys.intern(attribute_type))
+        self._attribute_object_rows.append(object_row)
+        self._attribute_timeseries_keys.append(timeseries_key)
+        self._attribute_targets.append(targets)
+        self._attribute_rows_by_id[id] = row
+        self._attribute_rows_by_object[object_row][name] = row
+        if timeseries_key != _NONE:
+            self._attribute_rows_by_timeseries_key.setdefault(
+                timeseries_key, []
+            ).append(row)
+
+    def _copy_object(self, other: ModelSnapshot, other_row: int) -> None:
+        """Add an object and its attributes stored in another snapshot."""
+        row = self._append_object(
+            other._object_ids[other_row],
+            other._object_paths[other_row],
+            other._object_names[other_row],
+            other._object_type_names[other_row],
+            other._object_owner_ids[other_row],
+        )
+        for name, attribute_row in other._attribute_rows_by_object[other_row].items():
+            self._append_attribute(
+                row,
+                other._attribute_ids[attribute_row],
+                name,
+                other._attribute_types[attribute_row],
+                other._attribute_timeseries_keys[attribute_row],
+                other._attribute_targets[attribute_row],
+            )
+
+    def _build(self) -> None:
+        """Resolve owners and adjacency lists once all objects are added."""
+        self._children = {}
+        for row, owner_id in enumerate(self._object_owner_ids):
+            owner_attribute_row = self._attribute_rows_by_id.get(owner_id)
+            if owner_attribute_row is not None:
+                owner_row = self._attribute_object_rows[owner_attribute_row]
+                self._object_owner_rows[row] = owner_row
+                self._children.setdefault(owner_row, []).append(row)
+
+        self._link_sources = {}
+        for row, attribute_type in enumerate(self._attribute_types):
+            if attribute_type in _LINK_ATTRIBUTE_TYPES:
+                source_row = self._attribute_object_rows[row]
+                for target_id in self._attribute_targets[row]:
+                    sources = self._link_sources.setdefault(target_id, [])
+                    if not sources or sources[-1] != source_row:
+                        sources.append(source_row)
+
+    def refresh(
+        self,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        modified_attributes: typing.Iterable[uuid.UUID | str] = (),
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ModelSnapshot:
+        """Get an up to date snapshot, reading from Mesh only the objects
+        that changed since this snapshot was loaded.
+
+        The `target` object and objects found by `query` are first searched
+        for without attributes, and their IDs, paths and owners are compared
+        with the snapshot. Then only the following objects are read again:
+
+        - New, moved and renamed objects, with all objects they own.
+        - Owners of new, moved and removed objects, since their ownership
+          relation attributes changed.
+        - Objects of `modified_attributes`, e.g. returned by
+          :py:meth:`ModelChangeTracker.pop_modified_attributes`.
+
+        All other objects are copied from this snapshot. Changes of link
+        relation and time series attributes are not visible in the search
+        without attributes, so attributes changed by other clients are read
+        again only if their objects are read for any of the reasons above.
+
+        Args:
+            session: Session used to read the model.
+            target: Mesh object the snapshot was loaded from, see :py:meth:`load`.
+            query: Search query the snapshot was loaded with.
+            modified_attributes: IDs or paths of attributes known to be
+                changed. Attributes of objects that are not a part of the
+                snapshot are ignored.
+            batch_size: Number of objects received from Mesh in one batch.
+
+        Returns:
+            A new snapshot, or this snapshot if nothing changed.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        structure = _get_structure(
+            [session.get_object(target, attributes_filter=_STRUCTURE_FILTER)]
+        )
+        for objects in session.iter_objects(
+            target, query, attributes_filter=_STRUCTURE_FILTER, batch_size=batch_size
+        ):
+            structure.update(_get_structure(objects))
+
+        subtree_ids, object_ids = self._get_changed_objects(
+            structure, modified_attributes
+        )
+        if not subtree_ids and not object_ids and len(structure) == len(self):
+            return self
+
+        fetched: typing.Dict[uuid.UUID, Object] = {}
+        for id in subtree_ids:
+            # objects found before are owned by another changed object
+            if id in fetched:
+                continue
+            object = session.get_object(id)
+            fetched[object.id] = object
+            for objects in session.iter_objects(id, query, batch_size=batch_size):
+                fetched.update((object.id, object) for object in objects)
+        for id in object_ids:
+            if id not in fetched:
+                fetched[id] = session.get_object(id)
+
+        return self._refreshed(structure, fetched)
+
+    async def refresh_async(
+        self,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str = "{*}",
+        modified_attributes: typing.Iterable[uuid.UUID | str] = (),
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> ModelSnapshot:
+        """Asynchronous version of :py:meth:`refresh`."""
+        structure = _get_structure(
+            [await session.get_object(target, attributes_filter=_STRUCTURE_FILTER)]
+        )
+        async for objects in session.iter_objects(
+            target, query, attributes_filter=_STRUCTURE_FILTER, batch_size=batch_size
+        ):
+            structure.update(_get_structure(objects))
+
+        subtree_ids, object_ids = self._get_changed_objects(
+            structure, modified_attributes
+        )
+        if not subtree_ids and not object_ids and len(structure) == len(self):
+            return self
+
+        fetched: typing.Dict[uuid.UUID, Object] = {}
+        for id in subtree_ids:
+            if id in fetched:
+                continue
+            object = await session.get_object(id)
+            fetched[object.id] = object
+            async for objects in session.iter_objects(id, query, batch_size=batch_size):
+                fetched.update((object.id, object) for object in objects)
+        for id in object_ids:
+            if id not in fetched:
+                fetched[id] = await session.get_object(id)
+
+        return self._refreshed(structure, fetched)
+
+    def _get_owner_object_id(self, owner_id: uuid.UUID | None) -> uuid.UUID | None:
+        """ID of the object owning the ownership relation attribute, or the
+        owner itself for objects owned directly by a model."""
+        attribute_row = self._attribute_rows_by_id.get(owner_id)
+        if attribute_row is not None:
+            return self._object_ids[self._attribute_object_rows[attribute_row]]
+        return owner_id if owner_id in self._object_rows_by_id else None
+
+    def _get_changed_objects(
+        self,
+        structure: typing.Dict[uuid.UUID, typing.Tuple[str, uuid.UUID | None]],
+        modified_attributes: typing.Iterable[uuid.UUID | str],
+    ) -> typing.Tuple[typing.List[uuid.UUID], typing.List[uuid.UUID]]:
+        """Compare the structure of a model with the snapshot.
+
+        Returns:
+            IDs of objects to be read with all objects they own, sorted by
+            path so owners come first, and IDs of single objects to be read.
+        """
+        subtrees = []
+        object_ids = set()
+        for id, (path, owner_id) in structure.items():
+            row = self._object_rows_by_id.get(id)
+            if row is not None and (
+                self._object_paths[row] == path
+                and self._object_owner_ids[row] == owner_id
+            ):
+                continue
+            subtrees.append((path, id))
+            object_ids.add(self._get_owner_object_id(owner_id))
+            if row is not None:
+                object_ids.add(self._get_owner_object_id(self._object_owner_ids[row]))
+
+        if len(structure) - len(subtrees) < len(self):
+            for row, id in enumerate(self._object_ids):
+                if id not in structure:
+                    object_ids.add(
+                        self._get_owner_object_id(self._object_owner_ids[row])
+                    )
+
+        for attribute in modified_attributes:
+            if isinstance(attribute, uuid.UUID):
+                attribute_row = self._attribute_rows_by_id.get(attribute)
+                object_row = (
+                    self._attribute_object_rows[attribute_row]
+                    if attribute_row is not None
+                    else None
+                )
+            else:
+                object_row = self._object_rows_by_path.get(attribute.rpartition(".")[0])
+            if object_row is not None:
+                object_ids.add(self._object_ids[object_row])
+
+        subtrees.sort()
+        return [id for _, id in subtrees], [id for id in object_ids if id in structure]
+
+    def _refreshed(
+        self,
+        structure: typing.Dict[uuid.UUID, typing.Tuple[str, uuid.UUID | None]],
+        fetched: typing.Dict[uuid.UUID, Object],
+    ) -> ModelSnapshot:
+        """Create a snapshot of fetched objects and objects of this snapshot
+        that are still a part of the model, in the original order."""
+        snapshot = ModelSnapshot()
+        for row, id in enumerate(self._object_ids):
+            object = fetched.get(id)
+            if object is not None:
+                snapshot._add_object(object)
+            elif id in structure:
+                snapshot._copy_object(self, row)
+        for object in fetched.values():
+            snapshot._add_object(object)
+        snapshot._build()
+        return snapshot
+
+    def __len__(self) -> int:
+        """Number of objects in the snapshot."""
+        return len(self._object_ids)
+
+    def __contains__(self, target: typing.Any) -> bool:
+        """Check if an object with given ID or path is a part of the snapshot."""
+        return target in self._object_rows_by_id or target in self._object_rows_by_path
+
+    def __iter__(self) -> typing.Iterator[SnapshotObject]:
+        return map(self._get_object, range(len(self._object_ids)))
+
+    @property
+    def attribute_count(self) -> int:
+        """Number of attributes in the snapshot."""
+        return len(self._attribute_ids)
+
+    def _get_object_row(self, target: uuid.UUID | str | SnapshotObject) -> int:
+        if isinstance(target, (SnapshotObject, Object)):
+            target = target.id
+        row = (
+            self._object_rows_by_id.get(target)
+            if isinstance(target, uuid.UUID)
+            else self._object_rows_by_path.get(target)
+        )
+        if row is None:
+            raise KeyError(f"object '{target}' is not a part of the snapshot")
+        return row
+
+    def _get_object(self, row: int) -> SnapshotObject:
+        return SnapshotObject(
+            id=self._object_ids[row],
+            path=self._object_paths[row],
+            name=self._object_names[row],
+            type_name=self._object_type_names[row],
+            owner_id=self._object_owner_ids[row],
+        )
+
+    def _get_attribute(self, row: int) -> SnapshotAttribute:
+        object_row = self._attribute_object_rows[row]
+        timeseries_key = self._attribute_timeseries_keys[row]
+        return SnapshotAttribute(
+            id=self._attribute_ids[row],
+            path=f"{self._object_paths[object_row]}.{self._attribute_names[row]}",
+            name=self._attribute_names[row],
+            owner_id=self._object_ids[object_row],
+            attribute_type=self._attribute_types[row],
+            timeseries_key=timeseries_key if timeseries_key != _NONE else None,
+            target_object_ids=self._attribute_targets[row] or (),
+        )
+
+    def get_object(self, target: uuid.UUID | str | SnapshotObject) -> SnapshotObject:
+        """Get an object by ID or path."""
+        return self._get_object(self._get_object_row(target))
+
+    def get_attribute(self, target: uuid.UUID | str) -> SnapshotAttribute:
+        """Get an attribute by ID or path, e.g. `Model/Object.Attribute`."""
+        if isinstance(target, uuid.UUID):
+            row = self._attribute_rows_by_id.get(target)
+        else:
+            object_path, _, name = target.rpartition(".")
+            object_row = self._object_rows_by_path.get(object_path)
+            row = (
+                self._attribute_rows_by_object[object_row].get(name)
+                if object_row is not None
+                else None
+            )
+        if row is None:
+            raise KeyError(f"attribute '{target}' is not a part of the snapshot")
+        return self._get_attribute(row)
+
+    def get_attributes(
+        self, target: uuid.UUID | str | SnapshotObject
+    ) -> typing.List[SnapshotAttribute]:
+        """Get all attributes of an object."""
+        rows = self._attribute_rows_by_object[self._get_object_row(target)]
+        return [self._get_attribute(row) for row in rows.values()]
+
+    def find_objects_by_type(self, type_name: str) -> typing.List[SnapshotObject]:
+        """Get all objects of given object definition, e.g. `PlantElementType`."""
+        return [
+            self._get_object(row)
+            for row in self._object_rows_by_type_name.get(type_name, ())
+        ]
+
+    def find_attributes_by_timeseries_key(
+        self, timeseries_key: int
+    ) -> typing.List[SnapshotAttribute]:
+        """Get all time series attributes connected to the given physical or
+        virtual time series.
+        """
+        return [
+            self._get_attribute(row)
+            for row in self._attribute_rows_by_timeseries_key.get(timeseries_key, ())
+        ]
+
+    def get_timeseries_keys(self) -> typing.Dict[int, typing.List[str]]:
+        """Get paths of time series attributes by time series key of the
+        connected physical or virtual time series.
+        """
+        return {
+            key: [self._get_attribute(row).path for row in rows]
+            for key, rows in self._attribute_rows_by_timeseries_key.items()
+        }
+
+    def get_owner(
+        self, target: uuid.UUID | str | SnapshotObject
+    ) -> SnapshotObject | None:
+        """Get the object owning the given object, or None if the owner is not
+        a part of the snapshot.
+        """
+        owner_row = self._object_owner_rows[self._get_object_row(target)]
+        return self._get_object(owner_row) if owner_row != _NONE else None
+
+    def get_children(
+        self, target: uuid.UUID | str | SnapshotObject
+    ) -> typing.List[SnapshotObject]:
+        """Get objects owned directly by the given object."""
+        return [
+            self._get_object(row)
+            for row in self._children.get(self._get_object_row(target), ())
+        ]
+
+    def get_link_targets(
+        self, target: uuid.UUID | str | SnapshotObject
+    ) -> typing.List[uuid.UUID]:
+        """Get IDs of objects linked to by link relation attributes of the
+        given object, including objects linked to in any version of versioned
+        link relation attributes. The linked objects may be outside of the
+        snapshot.
+        """
+        targets = []
+        for row in self._attribute_rows_by_object[
+            self._get_object_row(target)
+        ].values():
+            if self._attribute_types[row] in _LINK_ATTRIBUTE_TYPES:
+                targets.extend(self._attribute_targets[row])
+        return targets
+
+    def get_link_sources(
+        self, target: uuid.UUID | str | SnapshotObject
+    ) -> typing.List[SnapshotObject]:
+        """Get objects with link relation attributes pointing to the given
+        object, in any version for versioned link relation attributes.
+        """
+        object_id = self._object_ids[self._get_object_row(target)]
+        return [self._get_object(row) for row in self._link_sources.get(object_id, ())]
+
+    def walk(
+        self,
+        target: uuid.UUID | str | SnapshotObject | None = None,
+        depth_first: bool = True,
+    ) -> typing.Iterator[SnapshotObject]:
+        """Iterate over the ownership tree starting from `target`, including
+        it.
+
+        Args:
+            target: Object to start from. If not set, the walk starts from
+                all objects whose owners are not a part of the snapshot.
+            depth_first: Walk the tree depth-first (pre-order) or
+                breadth-first.
+        """
+        if target is None:
+            rows = [
+                row
+                for row, owner_row in enumerate(self._object_owner_rows)
+                if owner_row == _NONE
+            ]
+        else:
+            rows = [self._get_object_row(target)]
+
+        if depth_first:
+            stack = rows[::-1]
+            while stack:
+                row = stack.pop()
+                yield self._get_object(row)
+                stack.extend(reversed(self._children.get(row, ())))
+        else:
+            queue = deque(rows)
+            while queue:
+                row = queue.popleft()
+                yield self._get_object(row)
+                queue.extend(self._children.get(row, ()))
+
+    def to_arrow(self) -> typing.Tuple[pa.Table, pa.Table]:
+        """Export the snapshot to PyArrow tables.
+
+        IDs are exported as strings. See :py:data:`OBJECTS_SCHEMA` and
+        :py:data:`ATTRIBUTES_SCHEMA`.
+
+        Returns:
+            Objects and attributes tables.
+        """
+
+        def to_strings(ids: typing.Iterable[uuid.UUID | None]):
+            return [str(id) if id is not None else None for id in ids]
+
+        objects_table = pa.Table.from_arrays(
+            [
+                pa.array(to_strings(self._object_ids), pa.string()),
+                pa.array(self._object_paths, pa.string()),
+                pa.array(self._object_names, pa.string()),
+                pa.array(self._object_type_names, pa.string()),
+                pa.array(to_strings(self._object_owner_ids), pa.string()),
+                pa.array(
+                    [
+                        str(self._object_ids[row]) if row != _NONE else None
+                        for row in self._object_owner_rows
+                    ],
+                    pa.string(),
+                ),
+            ],
+            schema=OBJECTS_SCHEMA,
+        )
+
+        attributes_table = pa.Table.from_arrays(
+            [
+                pa.array(to_strings(self._attribute_ids), pa.string()),
+                pa.array(
+                    [
+                        f"{self._object_paths[object_row]}.{name}"
+                        for object_row, name in zip(
+                            self._attribute_object_rows, self._attribute_names
+                        )
+                    ],
+                    pa.string(),
+                ),
+                pa.array(self._attribute_names, pa.string()),
+                pa.array(
+                    to_strings(
+                        self._object_ids[row] for row in self._attribute_object_rows
+                    ),
+                    pa.string(),
+                ),
+                pa.array(self._attribute_types, pa.string()),
+                pa.array(
+                    [
+                        key if key != _NONE else None
+                        for key in self._attribute_timeseries_keys
+                    ],
+                    pa.int64(),
+                ),
+                pa.array(
+                    [
+                        to_strings(targets) if targets is not None else None
+                        for targets in self._attribute_targets
+                    ],
+                    pa.list_(pa.string()),
+                ),
+            ],
+            schema=ATTRIBUTES_SCHEMA,
+        )
+
+        return objects_table, attributes_table
+
+    def to_parquet(self, objects_path: str, attributes_path: str) -> None:
+        """Export the snapshot to two Parquet files, see :py:meth:`to_arrow`."""
+        import pyarrow.parquet as pq
+
+        objects_table, attributes_table = self.to_arrow()
+        pq.write_table(objects_table, objects_path)
+        pq.write_table(attributes_table, attributes_path)
+
+
+def _get_structure(
+    objects: typing.Iterable[Object],
+) -> typing.Dict[uuid.UUID, typing.Tuple[str, uuid.UUID | None]]:
+    return {object.id: (object.path, object.owner_id) for object in objects}
+
+
+def _to_mesh_id(proto_mesh_id) -> uuid.UUID | str | None:
+    if proto_mesh_id.HasField("id"):
+        return uuid.UUID(bytes_le=proto_mesh_id.id.bytes_le)
+    if proto_mesh_id.HasField("path"):
+        return proto_mesh_id.path
+    return None
+
+
+class ModelChangeTracker:
+    """Link relation and time series attributes updated in committed
+    sessions, recorded by :py:class:`ModelChangeInterceptor` or
+    :py:class:`AsyncModelChangeInterceptor`.
+
+    Updates are kept per session until the session is committed, updates of
+    rolled back sessions or sessions closed without a commit are dropped.
+    Updates of expired sessions are dropped when extending the session
+    lifetime fails or when no call of the session succeeded for
+    `max_idle_time` seconds. Other changes of a model, e.g. created or
+    deleted objects, are found by :py:meth:`ModelSnapshot.refresh` without
+    tracking. The tracker is thread safe.
+
+    Args:
+        max_idle_time: Updates of sessions without successful calls for
+            longer than that are dropped. Sessions opened by the SDK extend
+            their lifetime every 150 seconds. If `None`, updates are not
+            dropped because of idle time.
+    """
+
+    def __init__(self, max_idle_time: float | None = _DEFAULT_MAX_SESSION_IDLE_TIME):
+        self.max_idle_time: float | None = max_idle_time
+        self._lock = threading.Lock()
+        self._pending: typing.Dict[bytes, typing.List[uuid.UUID | str]] = {}
+        # time of the last successful call of each session with pending updates
+        self._last_seen: typing.Dict[bytes, float] = {}
+        # unique attributes in the order of commits
+        self._committed: typing.Dict[uuid.UUID | str, None] = {}
+
+    def _on_done(self, method: str | bytes, request, code: grpc.StatusCode) -> None:
+        # grpc.aio passes method names as bytes
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        service, _, name = method.rpartition("/")
+        if service.endswith(".SessionService"):
+            # other calls, e.g. StartSession, do not take a session ID
+            if name in ("Commit", "Rollback", "EndSession", "ExtendSession"):
+                self._on_session_call(
+                    name, request.bytes_le, code == grpc.StatusCode.OK
+                )
+            return
+        if code != grpc.StatusCode.OK:
+            return
+
+        if isinstance(request, model_pb2.UpdateTimeseriesAttributeRequest):
+            attribute = _to_mesh_id(request.attribute_id)
+        elif isinstance(
+            request,
+            (
+                model_pb2.UpdateLinkRelationAttributeRequest,
+                model_pb2.UpdateVersionedLinkRelationAttributeRequest,
+            ),
+        ):
+            attribute = _to_mesh_id(request.attribute)
+        else:
+            return
+
+        if attribute is not None:
+            session_id = request.session_id.bytes_le
+            now = time.monotonic()
+            with self._lock:
+                self._drop_idle_sessions(now)
+                self._pending.setdefault(session_id, []).append(attribute)
+                self._last_seen[session_id] = now
+
+    def _on_session_call(self, name: str, session_id: bytes, succeeded: bool) -> None:
+        with self._lock:
+            if not succeeded:
+                # the session expired or can no longer be kept alive
+                if name == "ExtendSession":
+                    self._drop_session(session_id)
+            elif name == "Commit":
+                for attribute in self._pending.get(session_id, ()):
+                    self._committed[attribute] = None
+                self._drop_session(session_id)
+            elif name in ("Rollback", "EndSession"):
+                self._drop_session(session_id)
+            elif session_id in self._last_seen:
+                self._last_seen[session_id] = time.monotonic()
+
+    def _drop_session(self, session_id: bytes) -> None:
+        self._pending.pop(session_id, None)
+        self._last_seen.pop(session_id, None)
+
+    def _drop_idle_sessions(self, now: float) -> None:
+        if self.max_idle_time is None:
+            return
+        for session_id, last_seen in list(self._last_seen.items()):
+            if now - last_seen > self.max_idle_time:
+                self._drop_session(session_id)
+
+    def pop_modified_attributes(self) -> typing.List[uuid.UUID | str]:
+        """Get IDs or paths of attributes updated in sessions committed since
+        the last call, see :py:meth:`ModelSnapshot.refresh`."""
+        with self._lock:
+            self._drop_idle_sessions(time.monotonic())
+            attributes = list(self._committed)
+            self._committed.clear()
+        return attributes
+
+
+class ModelChangeInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Records model changes made through a synchronous
+    :py:class:`volue.mesh.Connection`.
+
+    Args:
+        tracker: Receiver of the changes.
+    """
+
+    def __init__(self, tracker: ModelChangeTracker):
+        self.tracker = tracker
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        outcome = continuation(client_call_details, request)
+
+        def on_done(future):
+            self.tracker._on_done(client_call_details.method, request, future.code())
+
+        outcome.add_done_callback(on_done)
+        return outcome
+
+
+class AsyncModelChangeInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Records model changes made through an asynchronous
+    :py:class:`volue.mesh.aio.Connection`.
+
+    Args:
+        tracker: Receiver of the changes.
+    """
+
+    def __init__(self, tracker: ModelChangeTracker):
+        self.tracker = tracker
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        call = await continuation(client_call_details, request)
+
+        # waits for the call to finish, but does not raise on errors
+        code = await call.code()
+        self.tracker._on_done(client_call_details.method, request, code)
+        return call
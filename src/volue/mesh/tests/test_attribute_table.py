@@ -0,0 +1,207 @@
+"""
+Tests for Arrow tables of simple attribute values, see
+volue.mesh.Connection.Session.search_simple_attributes_table.
+"""
+
+import sys
+import uuid
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+from dateutil import tz
+from google.protobuf import timestamp_pb2
+
+from volue.mesh import Connection, aio
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+
+from .test_utilities.utilities import (
+    create_session,
+    make_proto_attribute,
+    make_proto_object,
+    run,
+)
+
+OBJECT_IDS = [uuid.uuid4() for _ in range(3)]
+
+
+def make_object(i, **attributes):
+    # a list of values is a collection
+    return make_proto_object(
+        OBJECT_IDS[i],
+        f"Model/Test/Reservoir{i}",
+        attributes=[
+            make_proto_attribute(
+                name,
+                value_type,
+                values if isinstance(values, list) else [values],
+                collection=isinstance(values, list),
+            )
+            for name, (value_type, values) in attributes.items()
+        ],
+    )
+
+
+DOUBLE = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE
+INT = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_INT
+UTC_TIME = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UTC_TIME
+TIMESERIES = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES
+
+PROTO_OBJECTS = [
+    make_object(
+        0,
+        HRWL=(DOUBLE, model_resources_pb2.AttributeValue(double_value=101.5)),
+        Levels=(
+            INT,
+            [
+                model_resources_pb2.AttributeValue(int_value=1),
+                model_resources_pb2.AttributeValue(int_value=2),
+            ],
+        ),
+    ),
+    make_object(1, Levels=(INT, [])),
+    make_object(
+        2,
+        HRWL=(DOUBLE, model_resources_pb2.AttributeValue(double_value=90.0)),
+        Filled=(
+            UTC_TIME,
+            model_resources_pb2.AttributeValue(
+                utc_time_value=timestamp_pb2.Timestamp(seconds=1_600_000_000)
+            ),
+        ),
+    ),
+]
+
+
+class FakeModelService:
+    def __init__(self, proto_objects):
+        self.proto_objects = proto_objects
+        self.requests = []
+
+    def SearchObjects(self, request):
+        self.requests.append(request)
+        yield from self.proto_objects
+
+    SearchObjectsByDefinition = SearchObjects
+
+
+class FakeAsyncModelService(FakeModelService):
+    async def SearchObjects(self, request):
+        self.requests.append(request)
+        for proto_object in self.proto_objects:
+            yield proto_object
+
+    SearchObjectsByDefinition = SearchObjects
+
+
+def search_table(session_class, proto_objects, attribute_names, by_definition):
+    model_service = (
+        FakeAsyncModelService(proto_objects)
+        if session_class is aio.Connection.Session
+        else FakeModelService(proto_objects)
+    )
+    session = create_session(session_class, model_service)
+    if by_definition:
+        result = session.search_simple_attributes_table_by_definition(
+            "Repository/Test/ReservoirType", attribute_names
+        )
+    else:
+        result = session.search_simple_attributes_table(
+            "Model/Test", "*[.Type=Reservoir]", attribute_names
+        )
+    return run(session_class, result), model_service.requests
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("by_definition", [False, True])
+def test_search_simple_attributes_table(session_class, by_definition):
+    table, requests = search_table(
+        session_class,
+        PROTO_OBJECTS,
+        ["HRWL", "Levels", "Filled", "Missing", "HRWL"],
+        by_definition,
+    )
+
+    assert table.schema == pa.schema(
+        [
+            ("object_id", pa.string()),
+            ("object_path", pa.string()),
+            ("HRWL", pa.float64()),
+            ("Levels", pa.list_(pa.int64())),
+            ("Filled", pa.timestamp("us", tz="UTC")),
+            ("Missing", pa.null()),
+        ]
+    )
+    assert table.to_pydict() == {
+        "object_id": [str(id) for id in OBJECT_IDS],
+        "object_path": [f"Model/Test/Reservoir{i}" for i in range(3)],
+        "HRWL": [101.5, None, 90.0],
+        "Levels": [[1, 2], [], None],
+        "Filled": [None, None, datetime(2020, 9, 13, 12, 26, 40, tzinfo=tz.UTC)],
+        "Missing": [None, None, None],
+    }
+
+    # only the given attributes and their values are requested
+    request = requests[0]
+    assert list(request.attributes_masks.name_mask.paths) == [
+        "HRWL",
+        "Levels",
+        "Filled",
+        "Missing",
+    ]
+    assert list(request.attribute_field_mask.paths) == [
+        "name",
+        "value_type",
+        "value_type_collection",
+        "values",
+    ]
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+def test_search_simple_attributes_table_with_invalid_attributes(session_class):
+    with pytest.raises(ValueError, match="attribute_names must not be empty"):
+        search_table(session_class, PROTO_OBJECTS, [], False)
+
+    proto_objects = [
+        make_object(0, Att=(DOUBLE, model_resources_pb2.AttributeValue())),
+        make_object(1, Att=(INT, model_resources_pb2.AttributeValue())),
+    ]
+    with pytest.raises(ValueError, match="different value types"):
+        search_table(session_class, proto_objects, ["Att"], False)
+
+    proto_objects = [make_object(0, Att=(TIMESERIES, []))]
+    with pytest.raises(ValueError, match="not a simple attribute"):
+        search_table(session_class, proto_objects, ["Att"], False)
+
+
+@pytest.mark.database
+def test_search_simple_attributes_table_from_model(session):
+    attribute_names = ["DblAtt", "Int64Att", "BoolArrayAtt", "UtcDateTimeAtt"]
+    table = session.search_simple_attributes_table(
+        "Model/SimpleThermalTestModel", "{*}", attribute_names
+    )
+    objects = session.search_for_objects("Model/SimpleThermalTestModel", "{*}")
+    assert table.column("object_path").to_pylist() == [
+        object.path for object in objects
+    ]
+
+    for name in attribute_names:
+        assert table.column(name).to_pylist() == [
+            object.attributes[name].value if name in object.attributes else None
+            for object in objects
+        ]
+
+    by_definition = session.search_simple_attributes_table_by_definition(
+        "Repository/SimpleThermalTestRepository/PlantElementType", attribute_names
+    )
+    assert by_definition.num_rows > 0
+    assert by_definition.column("DblAtt").null_count == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -8,10 +8,16 @@ from datetime import datetime
 from typing import Tuple
 
 import grpc
+import pyarrow as pa
 import pytest
 from dateutil import tz
 
-from volue.mesh import AttributeBase, Timeseries, TimeseriesAttribute
+from volue.mesh import (
+    AttributeBase,
+    LinkRelationAttribute,
+    Timeseries,
+    TimeseriesAttribute,
+)
 
 from .test_utilities.utilities import CHIMNEY_1_ID, CHIMNEY_2_ID, UNIT_2
 
@@ -673,6 +679,23 @@ def test_get_one_to_one_link_relation_attribute(session, full_attribute_info):
         print(attribute)
 
 
+@pytest.mark.database
+@pytest.mark.parametrize("ids_only", [False, True])
+def test_iter_linked_from(session, ids_only):
+    """
+    Check that `iter_linked_from` finds link relation attributes pointing to an object.
+    """
+    attribute_id = get_targets(session, "SimpleReference")[0]
+
+    results = list(session.iter_linked_from(CHIMNEY_2_ID, ids_only=ids_only))
+    if ids_only:
+        assert attribute_id in results
+    else:
+        assert all(isinstance(result, LinkRelationAttribute) for result in results)
+        assert all(CHIMNEY_2_ID in result.target_object_ids for result in results)
+        assert attribute_id in [result.id for result in results]
+
+
 @pytest.mark.database
 @pytest.mark.parametrize("full_attribute_info", [False, True])
 def test_get_one_to_many_link_relation_attribute(session, full_attribute_info):
@@ -900,6 +923,61 @@ def test_search_with_absent_attribute(session, full_attribute_info):
     )
 
 
+@pytest.mark.database
+@pytest.mark.parametrize("batch_size", [None, 2])
+def test_iter_attributes(session, batch_size):
+    """
+    Check that 'iter_attributes' yields the same attributes as 'search_for_attributes'.
+    """
+    start_object_path = "Model/SimpleThermalTestModel/ThermalComponent"
+    query = "{*}.DblAtt"
+
+    expected_paths = [
+        attribute.path
+        for attribute in session.search_for_attributes(start_object_path, query)
+    ]
+
+    iterator = session.iter_attributes(start_object_path, query, batch_size=batch_size)
+    if batch_size is None:
+        attributes = list(iterator)
+    else:
+        attributes = [attribute for batch in iterator for attribute in batch]
+
+    assert all(isinstance(attribute, AttributeBase) for attribute in attributes)
+    assert [attribute.path for attribute in attributes] == expected_paths
+
+
+@pytest.mark.database
+def test_search_for_attributes_with_attribute_fields(session):
+    """
+    Check that 'search_for_attributes' with explicit attribute fields returns
+    only requested fields.
+    """
+    start_object_path = "Model/SimpleThermalTestModel/ThermalComponent"
+    query = "{*}.TsRawAtt"
+
+    expected = {
+        attribute.id: attribute.time_series_resource.timeseries_key
+        for attribute in session.search_for_attributes(start_object_path, query)
+    }
+
+    attributes = session.search_for_attributes(
+        start_object_path,
+        query,
+        attribute_fields=[
+            "id",
+            "values.timeseries_value.time_series_resource.timeseries_key",
+        ],
+    )
+
+    assert all(isinstance(attribute, TimeseriesAttribute) for attribute in attributes)
+    assert all(attribute.path == "" for attribute in attributes)
+    assert {
+        attribute.id: attribute.time_series_resource.timeseries_key
+        for attribute in attributes
+    } == expected
+
+
 @pytest.mark.database
 @pytest.mark.parametrize(
     "attribute_name, new_value",
@@ -951,6 +1029,73 @@ def test_update_simple_attribute_invalid_request(session):
         assert attribute.value == original_values
 
 
+@pytest.mark.database
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_update_simple_attributes(session, max_concurrency):
+    values = {
+        ATTRIBUTE_PATH_PREFIX + "DblAtt": 5.0,
+        ATTRIBUTE_PATH_PREFIX + "Int64Att": 70,
+        ATTRIBUTE_PATH_PREFIX + "StringAtt": "my test string attribute value",
+        # wrong dimension
+        ATTRIBUTE_PATH_PREFIX + "BoolArrayAtt": True,
+        ATTRIBUTE_PATH_PREFIX + "BoolAtt": False,
+    }
+    failures = session.update_simple_attributes(values, max_concurrency)
+
+    assert [(failure.index, failure.target) for failure in failures] == [
+        (3, ATTRIBUTE_PATH_PREFIX + "BoolArrayAtt")
+    ]
+    assert isinstance(failures[0].error, grpc.RpcError)
+    for target, value in values.items():
+        if target != failures[0].target:
+            assert session.get_attribute(target).value == value
+
+
+@pytest.mark.database
+def test_update_simple_attributes_from_arrow_table(session):
+    table = pa.table(
+        {
+            "target": [ATTRIBUTE_PATH_PREFIX + "Int64Att", "non_existing_path"],
+            "value": [70, 71],
+        }
+    )
+    failures = session.update_simple_attributes(table)
+
+    assert [(failure.index, failure.target) for failure in failures] == [
+        (1, "non_existing_path")
+    ]
+    assert session.get_attribute(ATTRIBUTE_PATH_PREFIX + "Int64Att").value == 70
+
+    table = pa.table(
+        {
+            "target": [ATTRIBUTE_PATH_PREFIX + "BoolArrayAtt"],
+            "value": [[False, False, True, False, False]],
+        }
+    )
+    assert session.update_simple_attributes(table) == []
+    assert session.get_attribute(ATTRIBUTE_PATH_PREFIX + "BoolArrayAtt").value == [
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.database
+async def test_update_simple_attributes_async(async_session):
+    values = {
+        ATTRIBUTE_PATH_PREFIX + "DblAtt": 5.0,
+        ATTRIBUTE_PATH_PREFIX + "Int64Att": 70,
+        ATTRIBUTE_PATH_PREFIX
+        + "UtcDateTimeAtt": datetime(2022, 5, 14, 13, 44, 45, 0, tzinfo=tz.UTC),
+    }
+    assert await async_session.update_simple_attributes(values) == []
+    for target, value in values.items():
+        assert (await async_session.get_attribute(target)).value == value
+
+
 @pytest.mark.database
 @pytest.mark.parametrize(
     "invalid_target",
@@ -1048,6 +1193,13 @@ async def test_attributes_async(async_session):
     assert len(attributes) == 3
     assert all(isinstance(attr, AttributeBase) for attr in attributes)
 
+    iterated_attributes = [
+        attr async for attr in async_session.iter_attributes(start_object_path, query)
+    ]
+    assert [attr.path for attr in iterated_attributes] == [
+        attr.path for attr in attributes
+    ]
+
     await async_session.update_simple_attribute(attributes[0].path, new_value)
     updated_attribute = await async_session.get_attribute(attributes[0].path)
 
@@ -0,0 +1,116 @@
+"""
+Performance tests of cloning Mesh objects with Python SDK.
+Compares server-side `clone_object` with client-side replication of an object
+and all its child objects. The tests are using SimpleThermalTestModel and
+require a running Mesh server. All changes are discarded.
+"""
+
+import statistics
+import time
+
+import grpc
+
+from volue.mesh import (
+    Connection,
+    Object,
+    SimpleAttribute,
+    TimeseriesAttribute,
+    TimeseriesCopyMode,
+)
+
+# Ip address for the Mesh server
+HOST = "localhost"
+# Mesh server port for gRPC communication
+PORT = 50051
+
+SOURCE_OBJECT_PATH = "Model/SimpleThermalTestModel/ThermalComponent.ThermalPowerToPlantRef/SomePowerPlant1"
+NEW_OBJECT_NAME_PREFIX = "ClonedPowerPlant"
+CLONES_PER_ITERATION = 10
+ITERATIONS = 5
+
+
+def _copy_attributes(
+    session: Connection.Session, source: Object, target_path: str
+) -> int:
+    """Copies simple attribute values and time series connections, returns number of calls."""
+    calls = 0
+    for name, attribute in source.attributes.items():
+        attribute_path = f"{target_path}.{name}"
+        if isinstance(attribute, SimpleAttribute) and attribute.value is not None:
+            session.update_simple_attribute(attribute_path, attribute.value)
+            calls += 1
+        elif isinstance(attribute, TimeseriesAttribute):
+            if attribute.time_series_resource is not None:
+                session.update_timeseries_attribute(
+                    attribute_path,
+                    new_timeseries_resource_key=attribute.time_series_resource.timeseries_key,
+                )
+                calls += 1
+            elif attribute.is_local_expression:
+                session.update_timeseries_attribute(
+                    attribute_path, new_local_expression=attribute.expression
+                )
+                calls += 1
+    return calls
+
+
+def _replicate_object(session: Connection.Session, new_name: str) -> int:
+    """
+    Replicates the source object and its descendants with separate calls per
+    object and attribute, the way it is done without `clone_object`.
+    Link relations are not replicated. Returns number of calls.
+    """
+    source = session.get_object(SOURCE_OBJECT_PATH)
+    descendants = session.search_for_objects(SOURCE_OBJECT_PATH, "{*}")
+    calls = 2
+
+    new_path = f"{source.owner_path}/{new_name}"
+    session.create_object(source.owner_path, new_name)
+    calls += 1 + _copy_attributes(session, source, new_path)
+
+    # owners are created before the objects they own
+    descendants = sorted(
+        (object for object in descendants if object.id != source.id),
+        key=lambda object: object.path.count("/"),
+    )
+    for object in descendants:
+        owner_path = new_path + object.owner_path[len(source.path) :]
+        session.create_object(owner_path, object.name)
+        calls += 1 + _copy_attributes(session, object, f"{owner_path}/{object.name}")
+    return calls
+
+
+def _clone_object(session: Connection.Session, new_name: str) -> int:
+    session.clone_object(
+        SOURCE_OBJECT_PATH, new_name, timeseries_copy_mode=TimeseriesCopyMode.ALL
+    )
+    return 1
+
+
+def run_tests(connection: Connection):
+    """Runs all test cases and prints results."""
+    for test_case_name, create_clone in [
+        ("client-side replication", _replicate_object),
+        ("clone_object", _clone_object),
+    ]:
+        durations = []
+        for _ in range(ITERATIONS):
+            # changes are not committed
+            with connection.create_session() as session:
+                start = time.perf_counter()
+                calls = sum(
+                    create_clone(session, f"{NEW_OBJECT_NAME_PREFIX}{i}")
+                    for i in range(CLONES_PER_ITERATION)
+                )
+                durations.append(time.perf_counter() - start)
+        print(
+            f"{test_case_name}: {CLONES_PER_ITERATION} clones, {calls} calls, "
+            f"median {statistics.median(durations):.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    try:
+        run_tests(Connection(host=HOST, port=PORT))
+    except grpc.RpcError as e:
+        print(f"Failed to run performance tests: {e}")
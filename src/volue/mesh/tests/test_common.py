@@ -7,9 +7,25 @@ import uuid
 
 import pytest
 
-from volue.mesh import Timeseries, _common
+from volue.mesh import (
+    AttributeMapping,
+    AttributesFilter,
+    SimpleAttribute,
+    Timeseries,
+    TimeseriesAttribute,
+    TypeAttributeMapping,
+    _common,
+)
+from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
 from volue.mesh.proto.type import resources_pb2
 
+TIMESKEY_FIELD = "values.timeseries_value.time_series_resource.timeseries_key"
+
 
 @pytest.mark.unittest
 @pytest.mark.parametrize(
@@ -63,5 +79,137 @@ def test_to_proto_resolution(resolution, expected_proto_type):
     assert proto_resolution.type == expected_proto_type
 
 
+@pytest.mark.unittest
+def test_to_proto_attribute_field_mask():
+    field_mask = _common._to_proto_attribute_field_mask(False)
+    assert "values" in field_mask.paths
+    assert _common._to_proto_attribute_field_mask(True) is None
+
+    field_mask = _common._to_proto_attribute_field_mask(
+        False, attribute_fields=["id", TIMESKEY_FIELD]
+    )
+    # value type is always returned so collections are parsed as collections
+    assert list(field_mask.paths) == [
+        "value_type",
+        "value_type_collection",
+        "id",
+        TIMESKEY_FIELD,
+    ]
+
+    field_mask = _common._to_proto_attribute_field_mask(
+        False, attribute_fields=["id", "name"], required_fields=("name",)
+    )
+    assert list(field_mask.paths) == [
+        "name",
+        "value_type",
+        "value_type_collection",
+        "id",
+    ]
+
+    field_mask = _common._to_proto_attribute_field_mask(
+        False,
+        AttributesFilter(return_no_attributes=True),
+        attribute_fields=["id"],
+    )
+    assert field_mask is None
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "attribute_fields", [["unknown"], ["values.unknown"], ["id.bytes_le.unknown"]]
+)
+def test_to_proto_attribute_field_mask_with_invalid_fields(attribute_fields):
+    with pytest.raises(ValueError, match="invalid attribute fields"):
+        _common._to_proto_attribute_field_mask(False, attribute_fields=attribute_fields)
+
+
+@pytest.mark.unittest
+def test_to_proto_attribute_field_mask_with_full_attribute_info():
+    with pytest.raises(ValueError, match="cannot be used together"):
+        _common._to_proto_attribute_field_mask(True, attribute_fields=["id"])
+
+
+@pytest.mark.unittest
+def test_to_proto_type_attribute_mappings():
+    proto_mappings = _common._to_proto_type_attribute_mappings(
+        [
+            TypeAttributeMapping(
+                "ChimneyElementType",
+                [
+                    AttributeMapping("TsRawAtt", target_attribute_name="TsAtt"),
+                    AttributeMapping(
+                        "TsRawAtt", target_attribute_search="../*[.Name=$ObjName].Ts"
+                    ),
+                ],
+            ),
+            TypeAttributeMapping(),
+        ]
+    )
+    assert proto_mappings[0].object_type_name == "ChimneyElementType"
+    first, second = proto_mappings[0].attribute_mappings
+    assert first.WhichOneof("target_attribute") == "target_attribute_name"
+    assert first.target_attribute_name == "TsAtt"
+    assert second.WhichOneof("target_attribute") == "target_attribute_search"
+    assert proto_mappings[1].object_type_name == ""
+    assert len(proto_mappings[1].attribute_mappings) == 0
+    assert _common._to_proto_type_attribute_mappings(None) == []
+
+    with pytest.raises(ValueError, match="exactly one of"):
+        _common._to_proto_type_attribute_mappings(
+            [TypeAttributeMapping(attribute_mappings=[AttributeMapping("TsRawAtt")])]
+        )
+
+
+@pytest.mark.unittest
+def test_parse_projected_attribute():
+    """Check that attributes with only some fields returned can be parsed."""
+    attribute_id = uuid.uuid4()
+    proto_attribute = model_resources_pb2.Attribute(
+        id=_common._to_proto_guid(attribute_id),
+        values=[
+            model_resources_pb2.AttributeValue(
+                timeseries_value=model_resources_pb2.TimeseriesAttributeValue(
+                    time_series_resource=time_series_pb2.TimeseriesResource(
+                        timeseries_key=1234
+                    )
+                )
+            )
+        ],
+    )
+
+    attribute = _from_proto_attribute(proto_attribute)
+    assert isinstance(attribute, TimeseriesAttribute)
+    assert attribute.id == attribute_id
+    assert attribute.owner_id is None
+    assert attribute.time_series_resource.timeseries_key == 1234
+    assert attribute.time_series_resource.resolution is None
+
+    attribute = _from_proto_attribute(model_resources_pb2.Attribute(name="Name"))
+    assert attribute.name == "Name"
+    assert attribute.id is None
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("with_value_type", [True, False])
+def test_parse_projected_collection_attribute(with_value_type):
+    values = [model_resources_pb2.AttributeValue(int_value=i) for i in (1, 2, 3)]
+    proto_attribute = model_resources_pb2.Attribute(name="Levels", values=values)
+    if with_value_type:
+        # value type fields are always a part of explicit attribute fields
+        proto_attribute.value_type = (
+            model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_INT
+        )
+        proto_attribute.value_type_collection = True
+
+    attribute = _from_proto_attribute(proto_attribute)
+    assert isinstance(attribute, SimpleAttribute)
+    assert attribute.value == [1, 2, 3]
+
+    # a collection with one value is a collection only if the value type is known
+    del proto_attribute.values[1:]
+    attribute = _from_proto_attribute(proto_attribute)
+    assert attribute.value == ([1] if with_value_type else 1)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
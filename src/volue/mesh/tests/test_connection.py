@@ -6,6 +6,9 @@ import sys
 
 import pytest
 
+import volue.mesh.aio
+from volue import mesh
+
 
 @pytest.mark.server
 def test_get_version(connection):
@@ -26,5 +29,57 @@ async def test_async_get_version(async_connection):
     assert version_info.name == "Volue Mesh Server"
 
 
+@pytest.mark.server
+def test_get_health_status(connection):
+    """Check if the server can respond with its health status."""
+    health_status = connection.get_health_status()
+    assert isinstance(health_status, dict)
+
+
+@pytest.mark.server
+@pytest.mark.asyncio
+async def test_async_get_health_status(async_connection):
+    """Check if the server can respond with its health status."""
+    health_status = await async_connection.get_health_status()
+    assert isinstance(health_status, dict)
+
+
+@pytest.mark.server
+def test_warm_up(connection):
+    """Check that warm-up opens requested number of sessions."""
+    assert connection.warm_up(timeout=10) == []
+
+    sessions = connection.warm_up(timeout=10, number_of_sessions=2)
+    assert len(sessions) == 2
+    assert sessions[0].session_id != sessions[1].session_id
+    for session in sessions:
+        assert session.list_models() is not None
+        session.close()
+
+
+@pytest.mark.server
+@pytest.mark.asyncio
+async def test_async_warm_up(async_connection):
+    """Check that warm-up opens requested number of sessions."""
+    assert await async_connection.warm_up(timeout=10) == []
+
+    sessions = await async_connection.warm_up(timeout=10, number_of_sessions=2)
+    assert len(sessions) == 2
+    assert sessions[0].session_id != sessions[1].session_id
+    for session in sessions:
+        assert await session.list_models() is not None
+        await session.close()
+
+
+@pytest.mark.unittest
+@pytest.mark.asyncio
+async def test_async_warm_up_timeout():
+    """Check that warm-up respects the deadline if there is no server."""
+    # port 1 is reserved (tcpmux) and should not have a Mesh server listening
+    connection = mesh.aio.Connection.insecure("localhost:1")
+    with pytest.raises(TimeoutError):
+        await connection.warm_up(timeout=0.5)
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
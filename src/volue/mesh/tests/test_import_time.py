@@ -0,0 +1,78 @@
+"""
+Tests for lazy loading of volue.mesh, volue.mesh.aio and volue.mesh.availability.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from volue import mesh
+
+# Budget for a cold `import volue.mesh` in a fresh interpreter, in seconds.
+# Eager imports of gRPC, protobuf and PyArrow take several hundred milliseconds.
+IMPORT_TIME_BUDGET_IN_SECS = 0.1
+
+# Modules that must not be loaded just by importing the package.
+HEAVY_MODULE_PREFIXES = (
+    "bidict",
+    "dateutil",
+    "google.protobuf",
+    "grpc",
+    "pyarrow",
+    "volue.mesh.calc",
+    "volue.mesh.proto",
+)
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{"duration": duration, "modules": list(sys.modules)}}))
+"""
+
+
+def _import_in_fresh_interpreter(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        check=True,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "module", ["volue.mesh", "volue.mesh.aio", "volue.mesh.availability"]
+)
+def test_import_does_not_load_heavy_modules(module):
+    loaded = _import_in_fresh_interpreter(module)["modules"]
+    heavy = [name for name in loaded if name.startswith(HEAVY_MODULE_PREFIXES)]
+    assert heavy == []
+
+
+@pytest.mark.unittest
+def test_import_time_budget():
+    # the first run may include writing bytecode caches, take the best of a few runs
+    duration = min(
+        _import_in_fresh_interpreter("volue.mesh")["duration"] for _ in range(3)
+    )
+    assert duration < IMPORT_TIME_BUDGET_IN_SECS
+
+
+@pytest.mark.unittest
+def test_public_names_are_resolved_on_access():
+    for name in mesh.__all__:
+        assert getattr(mesh, name) is not None
+        assert name in dir(mesh)
+
+    with pytest.raises(AttributeError):
+        mesh.NotExistingName
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,262 @@
+"""
+Tests for volue.mesh.link_index.
+"""
+
+import sys
+import uuid
+from datetime import datetime
+
+import pytest
+from dateutil import tz
+
+from volue.mesh import VersionedLinkRelationAttribute
+from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh._common import LinkRelationVersion, _to_proto_guid
+from volue.mesh.link_index import (
+    LINK_TOPOLOGY_SCHEMA,
+    LinkTimelineIndex,
+    ReverseLinkIndex,
+)
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+
+from .test_utilities.utilities import (
+    CHIMNEY_1_ID,
+    CHIMNEY_2_ID,
+    link_value,
+    make_object,
+    make_proto_attribute,
+    versioned_link_value,
+)
+
+OWNER_ID = uuid.uuid4()
+OWNER_PATH = "Model/SimpleThermalTestModel/ThermalComponent/SomePowerPlant1"
+
+
+def make_proto_link_attribute(name, target_object_ids):
+    return make_proto_attribute(
+        name,
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_LINK_RELATION,
+        [link_value(target_object_id) for target_object_id in target_object_ids],
+        owner_path=OWNER_PATH,
+        owner_id=OWNER_ID,
+    )
+
+
+def make_link_attribute(name, target_object_ids):
+    return _from_proto_attribute(make_proto_link_attribute(name, target_object_ids))
+
+
+def make_proto_versioned_link_attribute(name, target_object_ids):
+    return make_proto_attribute(
+        name,
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_VERSIONED_LINK_RELATION,
+        [
+            versioned_link_value(
+                *(
+                    (datetime(2020 + i, 1, 1), target_object_id)
+                    for i, target_object_id in enumerate(target_object_ids)
+                )
+            )
+        ],
+        owner_path=OWNER_PATH,
+        owner_id=OWNER_ID,
+    )
+
+
+def make_versioned_link_attribute(name, target_object_ids):
+    return _from_proto_attribute(
+        make_proto_versioned_link_attribute(name, target_object_ids)
+    )
+
+
+@pytest.mark.unittest
+def test_reverse_link_index():
+    one_to_many = make_link_attribute("RefCollection", [CHIMNEY_1_ID, CHIMNEY_2_ID])
+    versioned = make_versioned_link_attribute(
+        "ReferenceSeriesAtt", [CHIMNEY_1_ID, None, CHIMNEY_1_ID]
+    )
+    index = ReverseLinkIndex()
+    assert index.add_attribute(one_to_many)
+    assert index.add_attribute(versioned)
+    assert len(index) == 2
+
+    sources = index.get_sources(CHIMNEY_1_ID)
+    assert [source.attribute_path for source in sources] == [
+        one_to_many.path,
+        versioned.path,
+    ]
+    assert sources[0].object_id == OWNER_ID
+    assert sources[0].object_path == OWNER_PATH
+    assert [source.versioned for source in sources] == [False, True]
+    assert index.get_targets(versioned.path) == [CHIMNEY_1_ID]
+
+    # updated attribute replaces the indexed one
+    assert index.add_attribute(make_link_attribute("RefCollection", [CHIMNEY_1_ID]))
+    assert CHIMNEY_2_ID not in index
+    assert index.get_targets(one_to_many) == [CHIMNEY_1_ID]
+
+    index.remove_attribute(versioned.path)
+    assert [source.attribute_id for source in index.get_sources(CHIMNEY_1_ID)] == [
+        one_to_many.id
+    ]
+    with pytest.raises(KeyError):
+        index.get_targets(versioned.id)
+
+    index.clear()
+    assert len(index) == 0
+    assert CHIMNEY_1_ID not in index
+
+
+@pytest.mark.unittest
+def test_reverse_link_index_skips_other_attributes():
+    index = ReverseLinkIndex()
+    attribute = _from_proto_attribute(
+        model_resources_pb2.Attribute(
+            id=_to_proto_guid(uuid.uuid4()),
+            path=f"{OWNER_PATH}.DblAtt",
+            value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE,
+        )
+    )
+    assert not index.add_attribute(attribute)
+    # attribute ID excluded by an attribute field mask
+    assert not index.add_attribute(
+        _from_proto_attribute(
+            model_resources_pb2.Attribute(
+                path=f"{OWNER_PATH}.Ref",
+                value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_LINK_RELATION,
+            )
+        )
+    )
+    assert len(index) == 0
+
+
+@pytest.mark.database
+def test_load_reverse_link_index(session):
+    index = ReverseLinkIndex.load(session, "Model/SimpleThermalTestModel")
+    assert CHIMNEY_1_ID in index
+
+    linked_from = {attribute.id for attribute in session.iter_linked_from(CHIMNEY_1_ID)}
+    assert {
+        source.attribute_id for source in index.get_sources(CHIMNEY_1_ID)
+    } == linked_from
+
+    index = ReverseLinkIndex()
+    sources = index.add_linked_from(session, CHIMNEY_1_ID)
+    assert {source.attribute_id for source in sources} == linked_from
+    assert index.get_sources(CHIMNEY_1_ID) == sources
+
+
+@pytest.mark.asyncio
+@pytest.mark.database
+async def test_load_reverse_link_index_async(async_session):
+    index = await ReverseLinkIndex.load_async(
+        async_session, "Model/SimpleThermalTestModel"
+    )
+    sources = await ReverseLinkIndex().add_linked_from_async(
+        async_session, CHIMNEY_1_ID
+    )
+    assert {source.attribute_id for source in index.get_sources(CHIMNEY_1_ID)} == {
+        source.attribute_id for source in sources
+    }
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("from_object", [False, True])
+def test_link_timeline_index(from_object):
+    proto_attributes = [
+        make_proto_link_attribute("RefCollection", [CHIMNEY_1_ID, CHIMNEY_2_ID]),
+        make_proto_versioned_link_attribute(
+            "ReferenceSeriesAtt", [CHIMNEY_1_ID, None, CHIMNEY_2_ID]
+        ),
+    ]
+    one_to_many, versioned = map(_from_proto_attribute, proto_attributes)
+    index = LinkTimelineIndex()
+    if from_object:
+        # versions are read from the protobuf attributes
+        index.add_object(make_object(OWNER_ID, OWNER_PATH, attributes=proto_attributes))
+    else:
+        assert index.add_attribute(one_to_many)
+        assert index.add_attribute(versioned)
+    assert len(index) == 2
+    assert versioned.path in index
+
+    assert index.get_targets(versioned.id, datetime(2019, 1, 1)) == [None]
+    assert index.get_targets(versioned, datetime(2020, 6, 1)) == [CHIMNEY_1_ID]
+    assert index.get_targets_at(
+        [
+            (versioned.path, datetime(2021, 1, 1)),
+            (versioned.path, datetime(2022, 1, 1, tzinfo=tz.UTC)),
+            (one_to_many.path, datetime(1900, 1, 1)),
+        ]
+    ) == [[None], [CHIMNEY_2_ID], [CHIMNEY_1_ID, CHIMNEY_2_ID]]
+    assert index.get_versions(versioned)[0][1] == LinkRelationVersion(
+        None, datetime(2021, 1, 1, tzinfo=tz.UTC)
+    )
+    assert index.get_source(versioned.id).versioned
+
+    assert index.get_change_times() == [
+        datetime(2020 + i, 1, 1, tzinfo=tz.UTC) for i in range(3)
+    ]
+    assert index.get_change_times(datetime(2021, 1, 1), datetime(2022, 1, 1)) == [
+        datetime(2021, 1, 1, tzinfo=tz.UTC)
+    ]
+
+    topology = index.get_topology(datetime(2021, 6, 1))
+    assert topology.schema == LINK_TOPOLOGY_SCHEMA
+    assert topology.column("target_object_id").to_pylist() == [
+        str(CHIMNEY_1_ID),
+        str(CHIMNEY_2_ID),
+    ]
+    assert topology.column("entry").to_pylist() == [0, 1]
+    assert topology.column("object_id").to_pylist() == [str(OWNER_ID)] * 2
+
+    topology = index.get_topology(datetime(2022, 6, 1)).to_pylist()[-1]
+    assert topology["attribute_path"] == versioned.path
+    assert topology["versioned"]
+    assert topology["target_object_id"] == str(CHIMNEY_2_ID)
+
+    # replaced and removed attributes are compacted away
+    for _ in range(3):
+        index.add_attribute(make_link_attribute("RefCollection", [CHIMNEY_2_ID]))
+    index.remove_attribute(versioned.path)
+    assert len(index._targets) < 6
+    assert index.get_targets(one_to_many.id, datetime(2020, 1, 1)) == [CHIMNEY_2_ID]
+    with pytest.raises(KeyError):
+        index.get_targets(versioned.id, datetime(2020, 1, 1))
+
+    index.clear()
+    assert len(index) == 0
+    assert index.get_topology(datetime(2020, 1, 1)).num_rows == 0
+
+
+@pytest.mark.database
+def test_load_link_timeline_index(session):
+    model = "Model/SimpleThermalTestModel"
+    index = LinkTimelineIndex.load(session, model)
+
+    time = datetime(2016, 1, 1, tzinfo=tz.UTC)
+    expected = []
+    for object in session.search_for_objects(model, "{*}"):
+        for attribute in object.attributes.values():
+            if isinstance(attribute, VersionedLinkRelationAttribute):
+                targets = []
+                for entry in attribute.entries:
+                    active = [
+                        version.target_object_id
+                        for version in entry.versions
+                        if version.valid_from_time <= time
+                    ]
+                    targets.append(active[-1] if active else None)
+                expected.append((attribute.id, targets))
+
+    assert expected
+    assert index.get_targets_at(
+        (attribute_id, time) for attribute_id, _ in expected
+    ) == [targets for _, targets in expected]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
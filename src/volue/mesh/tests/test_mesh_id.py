@@ -2,17 +2,22 @@
 Tests for volue.mesh._mesh_id.
 """
 
+import asyncio
 import sys
+import threading
 import uuid
 
+import grpc
 import pytest
 
 from volue.mesh import Timeseries, _common, _mesh_id
+from volue.mesh.proto.model.v1alpha import model_pb2
 
 from .test_utilities.utilities import (
     AttributeForTesting,
     ObjectForTesting,
     AttributeDefinitionForTesting,
+    FakeRpcError,
 )
 
 
@@ -173,5 +178,232 @@ def test_to_proto_mesh_id_from_invalid_type(target):
         _mesh_id._to_proto_mesh_id(target)
 
 
+@pytest.mark.unittest
+def test_path_cache():
+    path_cache = _mesh_id.PathCache()
+    target = ObjectForTesting()
+
+    mesh_id = _mesh_id._to_proto_object_mesh_id(target.path, path_cache)
+    assert mesh_id.path == target.path
+    assert not mesh_id.HasField("id")
+    assert (path_cache.hits, path_cache.misses) == (0, 1)
+
+    assert path_cache._add(target) is target
+    mesh_id = _mesh_id._to_proto_object_mesh_id(target.path, path_cache)
+    assert mesh_id.id == _common._to_proto_guid(target.id)
+    assert mesh_id.path == ""
+    assert (path_cache.hits, path_cache.misses) == (1, 1)
+
+    path_cache.clear()
+    assert len(path_cache) == 0
+    mesh_id = _mesh_id._to_proto_object_mesh_id(target.path, path_cache)
+    assert mesh_id.path == target.path
+    assert (path_cache.hits, path_cache.misses) == (1, 2)
+
+
+def get_cached_object_request(path_cache, target):
+    path_cache._add(target)
+    return model_pb2.GetObjectRequest(
+        object_id=_mesh_id._to_proto_object_mesh_id(target.path, path_cache)
+    )
+
+
+@pytest.mark.unittest
+def test_path_cache_retry_request():
+    path_cache = _mesh_id.PathCache()
+    target = ObjectForTesting()
+    request = get_cached_object_request(path_cache, target)
+    assert request.object_id.HasField("id")
+
+    not_found = FakeRpcError(grpc.StatusCode.NOT_FOUND)
+    assert (
+        path_cache._get_retry_request(
+            FakeRpcError(grpc.StatusCode.UNAVAILABLE), request
+        )
+        is None
+    )
+    # IDs not known to the cache are not replaced
+    other_request = model_pb2.GetObjectRequest(
+        object_id=_mesh_id._to_proto_object_mesh_id(uuid.uuid4())
+    )
+    assert path_cache._get_retry_request(not_found, other_request) is None
+
+    retry_request = path_cache._get_retry_request(not_found, request)
+    assert retry_request.object_id.path == target.path
+    assert not retry_request.object_id.HasField("id")
+    # the original request is not modified, the stale entry is removed
+    assert request.object_id.HasField("id")
+    assert len(path_cache) == 0
+
+
+class FakeGetObject(grpc.UnaryUnaryMultiCallable):
+    """Fails with NOT_FOUND for requests with object ID."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request, *args, **kwargs):
+        self.requests.append(request)
+        if request.object_id.HasField("id"):
+            raise FakeRpcError(grpc.StatusCode.NOT_FOUND)
+        return request.object_id.path
+
+    def with_call(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def future(self, request, *args, **kwargs):
+        return FakeFuture(self, request)
+
+
+class FakeFuture:
+    def __init__(self, method, request):
+        self.cancelled = False
+        self.error = None
+        try:
+            self.response = method(request)
+        except grpc.RpcError as e:
+            self.error = e
+
+    def result(self, timeout=None):
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class FakeAsyncGetObject(grpc.aio.UnaryUnaryMultiCallable):
+    def __init__(self):
+        self.method = FakeGetObject()
+
+    def __call__(self, request, *args, **kwargs):
+        async def call():
+            return self.method(request)
+
+        return call()
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("use_async", [False, True])
+def test_path_cache_fallback_stub(use_async):
+    path_cache = _mesh_id.PathCache()
+    target = ObjectForTesting()
+    method = FakeAsyncGetObject() if use_async else FakeGetObject()
+    stub = _mesh_id._PathCacheFallbackStub(
+        type("FakeModelService", (), {"GetObject": method}), path_cache
+    )
+
+    def get_object(request):
+        if use_async:
+            return asyncio.run(stub.GetObject(request))
+        return stub.GetObject(request)
+
+    assert get_object(get_cached_object_request(path_cache, target)) == target.path
+    assert len(path_cache) == 0
+    requests = method.method.requests if use_async else method.requests
+    assert len(requests) == 2
+
+    # IDs passed by the caller are not retried
+    with pytest.raises(grpc.RpcError):
+        get_object(
+            model_pb2.GetObjectRequest(object_id={"id": {"bytes_le": b"1" * 16}})
+        )
+    assert len(requests) == 3
+
+
+@pytest.mark.unittest
+def test_path_cache_fallback_future():
+    path_cache = _mesh_id.PathCache()
+    target = ObjectForTesting()
+    method = FakeGetObject()
+    stub = _mesh_id._PathCacheFallbackStub(
+        type("FakeModelService", (), {"GetObject": method}), path_cache
+    )
+
+    future = stub.GetObject.future(get_cached_object_request(path_cache, target))
+    # the call is sent before the result is requested
+    assert len(method.requests) == 1
+    assert future.result() == target.path
+    assert len(path_cache) == 0
+    assert len(method.requests) == 2
+    # other methods are delegated to the current attempt
+    future.cancel()
+    assert future.cancelled
+
+    # IDs passed by the caller are not retried
+    future = stub.GetObject.future(
+        model_pb2.GetObjectRequest(object_id={"id": {"bytes_le": b"1" * 16}})
+    )
+    with pytest.raises(grpc.RpcError):
+        future.result()
+    assert len(method.requests) == 3
+
+
+@pytest.mark.unittest
+def test_path_cache_is_thread_safe():
+    path_cache = _mesh_id.PathCache(max_size=100)
+    targets = [ObjectForTesting() for _ in range(200)]
+    for i, target in enumerate(targets):
+        target.path = f"path{i}"
+    request = get_cached_object_request(path_cache, targets[0])
+    not_found = FakeRpcError(grpc.StatusCode.NOT_FOUND)
+
+    def add_and_get():
+        for _ in range(20):
+            for target in targets:
+                path_cache._add(target)
+                path_cache._get(target.path)
+
+    errors = []
+
+    def retry():
+        try:
+            for _ in range(200):
+                path_cache._get_retry_request(not_found, request)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=add_and_get) for _ in range(2)]
+    threads.append(threading.Thread(target=retry))
+    # switch threads often to interleave dictionary updates and iteration
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert errors == []
+    assert len(path_cache) == 100
+    assert path_cache.hits + path_cache.misses == 2 * 20 * len(targets) + 1
+
+
+@pytest.mark.unittest
+def test_path_cache_eviction():
+    path_cache = _mesh_id.PathCache(max_size=2)
+    first, second, third = [AttributeForTesting() for _ in range(3)]
+    for i, target in enumerate([first, second, third]):
+        target.path = f"path{i}"
+
+    path_cache._add(first)
+    path_cache._add(second)
+    # mark `first` as most recently used
+    assert path_cache._get(first.path) == first.id
+    path_cache._add(third)
+
+    assert len(path_cache) == 2
+    assert path_cache._get(second.path) is None
+    assert path_cache._get(first.path) == first.id
+    assert path_cache._get(third.path) == third.id
+
+    path_cache = _mesh_id.PathCache(max_size=0)
+    path_cache._add(first)
+    assert len(path_cache) == 0
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
@@ -2,6 +2,8 @@
 Tests for volue.mesh.Object.
 """
 
+import copy
+import pickle
 import sys
 import uuid
 
@@ -13,7 +15,15 @@ from volue.mesh import (
     AttributesFilter,
     Object,
     OwnershipRelationAttribute,
+    SimpleAttribute,
+    TimeseriesCopyMode,
 )
+from volue.mesh._common import _to_proto_guid
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.type.resources_pb2 import MeshId
 
 from .test_utilities.utilities import AttributeForTesting, ObjectForTesting
 
@@ -190,6 +200,99 @@ def test_search_objects(session):
             assert len(object.attributes) == 7
 
 
+@pytest.mark.database
+@pytest.mark.parametrize("batch_size", [None, 1, 5])
+def test_iter_objects(session, batch_size):
+    """
+    Check that `iter_objects` yields the same objects as `search_for_objects`.
+    """
+    start_object_path = "Model/SimpleThermalTestModel"
+    query = "{*}"
+
+    expected_ids = [
+        object.id for object in session.search_for_objects(start_object_path, query)
+    ]
+
+    iterator = session.iter_objects(start_object_path, query, batch_size=batch_size)
+    if batch_size is None:
+        objects = list(iterator)
+    else:
+        batches = list(iterator)
+        assert all(0 < len(batch) <= batch_size for batch in batches)
+        objects = [object for batch in batches for object in batch]
+
+    assert all(isinstance(object, Object) for object in objects)
+    assert [object.id for object in objects] == expected_ids
+
+
+@pytest.mark.database
+def test_iter_objects_with_invalid_batch_size(session):
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        session.iter_objects("Model/SimpleThermalTestModel", "{*}", batch_size=0)
+
+
+@pytest.mark.database
+@pytest.mark.parametrize("max_concurrency", [1, 8])
+def test_traverse_objects(session, max_concurrency):
+    """
+    Check that `traverse_objects` finds the same objects as searching all
+    descendants of the start object.
+    """
+    start_object_path = "Model/SimpleThermalTestModel"
+    expected_ids = {
+        object.id for object in session.search_for_objects(start_object_path, "{*}")
+    }
+
+    nodes = list(
+        session.traverse_objects(start_object_path, max_concurrency=max_concurrency)
+    )
+    assert {node.object.id for node in nodes} == expected_ids
+    assert len(nodes) == len(expected_ids)
+    assert nodes[0].depth == 0 and nodes[0].parent_id is None
+    assert [node.depth for node in nodes] == sorted(node.depth for node in nodes)
+
+    objects = {node.object.id: node.object for node in nodes}
+    for node in nodes[1:]:
+        parent = objects[node.parent_id]
+        assert node.object.owner_id in {
+            attribute.id for attribute in parent.attributes.values()
+        }
+
+    nodes = list(session.traverse_objects(start_object_path, max_depth=1))
+    assert {node.depth for node in nodes} == {0, 1}
+
+
+@pytest.mark.database
+def test_iter_objects_by_definition(session):
+    """
+    Check that `iter_objects_by_definition` yields all objects of the given type.
+    """
+    definition_path = "Repository/SimpleThermalTestRepository/ChimneyElementType"
+    expected_ids = {
+        object.id
+        for object in session.search_for_objects("Model/SimpleThermalTestModel", "{*}")
+        if object.type_name == "ChimneyElementType"
+    }
+    assert len(expected_ids) == 2
+
+    objects = list(session.iter_objects_by_definition(definition_path))
+    assert all(isinstance(object, Object) for object in objects)
+    assert all(object.type_name == "ChimneyElementType" for object in objects)
+    assert {object.id for object in objects} == expected_ids
+
+    batches = list(
+        session.iter_objects_by_definition(definition_path, ids_only=True, batch_size=1)
+    )
+    assert {batch[0] for batch in batches} == expected_ids
+
+    with pytest.raises(ValueError, match="ids_only cannot be used"):
+        next(
+            session.iter_objects_by_definition(
+                definition_path, ids_only=True, full_attribute_info=True
+            )
+        )
+
+
 @pytest.mark.database
 def test_create_object(session):
     """
@@ -221,6 +324,42 @@ def test_create_object(session):
         session.rollback()
 
 
+@pytest.mark.database
+@pytest.mark.parametrize(
+    "timeseries_copy_mode", [TimeseriesCopyMode.ALL, TimeseriesCopyMode.NONE]
+)
+def test_clone_object(session, timeseries_copy_mode):
+    """Check that `clone_object` clones an object with all its child objects."""
+    new_name = "SomePowerPlantClone"
+    source_descendants = session.search_for_objects(OBJECT_PATH, "{*}")
+
+    new_object = session.clone_object(
+        OBJECT_PATH, new_name, timeseries_copy_mode=timeseries_copy_mode
+    )
+    source_object = session.get_object(OBJECT_PATH)
+    assert isinstance(new_object, Object)
+    assert new_object.name == new_name
+    assert new_object.id != source_object.id
+    assert new_object.owner_path == source_object.owner_path
+    assert new_object.type_name == source_object.type_name
+
+    cloned_descendants = session.search_for_objects(new_object.id, "{*}")
+    assert len(cloned_descendants) == len(source_descendants)
+
+    cloned_resource = new_object.attributes["TsRawAtt"].time_series_resource
+    source_resource = source_object.attributes["TsRawAtt"].time_series_resource
+    if timeseries_copy_mode == TimeseriesCopyMode.NONE:
+        assert cloned_resource is None
+    elif source_resource is not None:
+        assert cloned_resource.timeseries_key == source_resource.timeseries_key
+
+    # clone into explicitly given owner
+    newer_object = session.clone_object(
+        OBJECT_PATH, "SomePowerPlantClone2", new_owner=source_object.owner_id
+    )
+    assert newer_object.owner_id == source_object.owner_id
+
+
 @pytest.mark.database
 def test_update_object(session):
     """
@@ -406,6 +545,28 @@ async def test_mesh_objects_async(async_session):
     assert len(objects) == 2
     assert all(isinstance(object, Object) for object in objects)
 
+    iterated_objects = [
+        object async for object in async_session.iter_objects(start_object_path, query)
+    ]
+    assert [object.id for object in iterated_objects] == [
+        object.id for object in objects
+    ]
+    batches = [
+        batch
+        async for batch in async_session.iter_objects(
+            start_object_path, query, batch_size=1
+        )
+    ]
+    assert [batch[0].id for batch in batches] == [object.id for object in objects]
+
+    ids = [
+        id
+        async for id in async_session.iter_objects_by_definition(
+            "Repository/SimpleThermalTestRepository/ChimneyElementType", ids_only=True
+        )
+    ]
+    assert set(ids) == {object.id for object in objects}
+
     new_object = await async_session.create_object(objects[0].owner_path, "new_object")
     assert isinstance(new_object, Object)
 
@@ -420,5 +581,119 @@ async def test_mesh_objects_async(async_session):
         await async_session.get_object(newer_object.path)
 
 
+@pytest.mark.database
+def test_path_cache(session):
+    """Check that resolved paths are sent as IDs until an object is updated."""
+    session.get_object(OBJECT_PATH)
+    assert session.path_cache.misses == 1
+
+    object = session.get_object(OBJECT_PATH)
+    assert object.id == OBJECT_ID
+    assert session.path_cache.hits == 1
+
+    session.update_object(OBJECT_PATH, new_name="SomeNewPowerPlant1")
+    assert len(session.path_cache) == 0
+    with pytest.raises(grpc.RpcError, match="not found"):
+        session.get_object(OBJECT_PATH)
+
+    session.rollback()
+    assert session.get_object(OBJECT_PATH).id == OBJECT_ID
+
+
+def get_proto_object(attribute_names):
+    object_id = _to_proto_guid(uuid.uuid4())
+    return model_resources_pb2.Object(
+        id=object_id,
+        path="Model/Object",
+        attributes=[
+            model_resources_pb2.Attribute(
+                id=_to_proto_guid(uuid.uuid4()),
+                path=f"Model/Object.{name}",
+                name=name,
+                owner_id=MeshId(id=object_id),
+                value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_INT,
+                values=[model_resources_pb2.AttributeValue(int_value=value)],
+            )
+            for value, name in enumerate(attribute_names)
+        ],
+    )
+
+
+@pytest.mark.unittest
+def test_lazy_attributes():
+    proto_object = get_proto_object(["b", "A", "c"])
+    object = Object._from_proto_object(proto_object, lazy=True)
+    eager_object = Object._from_proto_object(proto_object)
+    # lazy parsing is opt-in
+    assert type(eager_object.attributes) is dict
+
+    assert len(object.attributes) == 3
+    assert "A" in object.attributes
+    assert "a" not in object.attributes
+    assert object.attributes._parsed == {}
+
+    attribute = object.attributes["c"]
+    assert isinstance(attribute, SimpleAttribute)
+    assert attribute.value == 2
+    assert object.attributes["c"] is attribute
+    assert list(object.attributes._parsed) == ["c"]
+    with pytest.raises(KeyError):
+        object.attributes["d"]
+
+    # same order as eagerly parsed attributes
+    assert list(object.attributes) == list(eager_object.attributes) == ["A", "b", "c"]
+    assert [attribute.value for attribute in object.attributes.values()] == [1, 0, 2]
+
+
+@pytest.mark.unittest
+def test_modify_lazy_attributes():
+    object = Object._from_proto_object(get_proto_object(["b", "a"]), lazy=True)
+    attribute = object.attributes["a"]
+
+    del object.attributes["b"]
+    assert list(object.attributes) == ["a"]
+    assert object.attributes["a"] is attribute
+
+    object.attributes["c"] = attribute
+    assert list(object.attributes) == ["a", "c"]
+    assert dict(object.attributes) == {"a": attribute, "c": attribute}
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("lazy", [True, False])
+def test_pickle_object(lazy):
+    object = Object._from_proto_object(get_proto_object(["b", "A", "c"]), lazy=lazy)
+    # partially parsed lazy attributes
+    assert object.attributes["c"].value == 2
+
+    unpickled = pickle.loads(pickle.dumps(object))
+    assert unpickled.id == object.id
+    assert unpickled.path == object.path
+    assert list(unpickled.attributes) == ["A", "b", "c"]
+    assert [attribute.value for attribute in unpickled.attributes.values()] == [
+        1,
+        0,
+        2,
+    ]
+    assert unpickled.attributes["A"].path == "Model/Object.A"
+
+    copied = copy.deepcopy(object)
+    assert list(copied.attributes) == ["A", "b", "c"]
+
+
+@pytest.mark.unittest
+def test_compact_objects():
+    first, second = [
+        Object._from_proto_object(get_proto_object(["Attribute", "Other"]))
+        for _ in range(2)
+    ]
+
+    assert not hasattr(first, "__dict__")
+    assert not hasattr(first.attributes["Attribute"], "__dict__")
+    # repeated strings and owner IDs are shared
+    assert first.attributes["Attribute"].name is second.attributes["Attribute"].name
+    assert first.attributes["Attribute"].owner_id is first.attributes["Other"].owner_id
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,248 @@
+"""
+Tests for volue.mesh.metrics.
+"""
+
+import gc
+import sys
+
+import grpc
+import pytest
+
+import volue.mesh.aio
+from volue import mesh
+from volue.mesh import metrics
+from volue.mesh.proto.config.v1alpha import config_pb2
+from volue.mesh.proto.model.v1alpha import model_pb2
+
+from .test_utilities.utilities import FakeRpcError
+
+SEARCH_OBJECTS = "/volue.mesh.grpc.model.v1alpha.ModelService/SearchObjects"
+
+
+class FakeCallDetails:
+    method = SEARCH_OBJECTS
+
+
+class FakeUnaryOutcome:
+    def __init__(self, response, code=grpc.StatusCode.OK):
+        self.response = response
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def result(self):
+        return self.response
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+
+def fake_stream(responses, error=None):
+    yield from responses
+    if error is not None:
+        raise error
+
+
+class FakeStreamCall:
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.cancelled = False
+
+    def __next__(self):
+        return next(self._responses)
+
+    def cancel(self):
+        self.cancelled = True
+        return True
+
+
+def make_record(latency=0.003, code=grpc.StatusCode.OK, method=SEARCH_OBJECTS):
+    return metrics.RpcRecord(
+        method=method,
+        code=code,
+        latency=latency,
+        request_bytes=10,
+        response_bytes=100,
+        response_messages=2,
+    )
+
+
+@pytest.mark.unittest
+def test_in_memory_exporter_aggregates_per_method():
+    exporter = metrics.InMemoryExporter(latency_buckets=[0.01, 0.1])
+    exporter.export(make_record(latency=0.003))
+    exporter.export(make_record(latency=0.05))
+    exporter.export(make_record(latency=1.0, code=grpc.StatusCode.UNAVAILABLE))
+    exporter.export(make_record(method="/service/Other"))
+
+    result = exporter.get_metrics()
+    assert set(result) == {SEARCH_OBJECTS, "/service/Other"}
+
+    method_metrics = result[SEARCH_OBJECTS]
+    assert method_metrics.latency_bucket_counts == [1, 1, 1]
+    assert method_metrics.latency_sum == pytest.approx(1.053)
+    assert method_metrics.calls == {"OK": 2, "UNAVAILABLE": 1}
+    assert method_metrics.count == 3
+    assert method_metrics.request_bytes == 30
+    assert method_metrics.response_bytes == 300
+    assert method_metrics.response_messages == 6
+
+    exporter.reset()
+    assert exporter.get_metrics() == {}
+
+
+@pytest.mark.unittest
+def test_in_memory_exporter_with_unsorted_buckets():
+    with pytest.raises(ValueError, match="increasing order"):
+        metrics.InMemoryExporter(latency_buckets=[1.0, 0.1])
+
+
+@pytest.mark.unittest
+def test_prometheus_exporter_text_format():
+    exporter = metrics.PrometheusExporter(latency_buckets=[0.01, 0.1])
+    exporter.export(make_record(latency=0.003))
+    exporter.export(make_record(latency=0.05, code=grpc.StatusCode.CANCELLED))
+
+    labels = (
+        'grpc_service="volue.mesh.grpc.model.v1alpha.ModelService",'
+        'grpc_method="SearchObjects"'
+    )
+    lines = exporter.to_text().splitlines()
+    assert "# TYPE mesh_client_rpc_duration_seconds histogram" in lines
+    assert f'mesh_client_rpc_duration_seconds_bucket{{{labels},le="0.01"}} 1' in lines
+    assert f'mesh_client_rpc_duration_seconds_bucket{{{labels},le="0.1"}} 2' in lines
+    assert f'mesh_client_rpc_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"mesh_client_rpc_duration_seconds_count{{{labels}}} 2" in lines
+    assert f'mesh_client_rpc_calls_total{{{labels},grpc_code="OK"}} 1' in lines
+    assert f'mesh_client_rpc_calls_total{{{labels},grpc_code="CANCELLED"}} 1' in lines
+    assert f"mesh_client_rpc_request_bytes_total{{{labels}}} 20" in lines
+    assert f"mesh_client_rpc_response_bytes_total{{{labels}}} 200" in lines
+    assert f"mesh_client_rpc_response_messages_total{{{labels}}} 4" in lines
+
+
+@pytest.mark.unittest
+def test_interceptor_unary_call():
+    exporter = metrics.InMemoryExporter()
+    interceptor = metrics.MetricsInterceptor(exporter)
+    request = model_pb2.SearchObjectsRequest(query="*")
+    response = config_pb2.VersionInfo(version="1.0.0")
+
+    outcome = interceptor.intercept_unary_unary(
+        lambda details, request: FakeUnaryOutcome(response),
+        FakeCallDetails(),
+        request,
+    )
+    assert outcome.result() == response
+
+    method_metrics = exporter.get_metrics()[SEARCH_OBJECTS]
+    assert method_metrics.calls == {"OK": 1}
+    assert method_metrics.request_bytes == request.ByteSize()
+    assert method_metrics.response_bytes == response.ByteSize()
+    assert method_metrics.response_messages == 1
+
+
+@pytest.mark.unittest
+def test_interceptor_streaming_call():
+    exporter = metrics.InMemoryExporter()
+    interceptor = metrics.MetricsInterceptor(exporter)
+    responses = [config_pb2.VersionInfo(version=str(i)) for i in range(3)]
+
+    stream = interceptor.intercept_unary_stream(
+        lambda details, request: fake_stream(responses),
+        FakeCallDetails(),
+        model_pb2.SearchObjectsRequest(),
+    )
+    assert exporter.get_metrics() == {}
+    assert list(stream) == responses
+
+    method_metrics = exporter.get_metrics()[SEARCH_OBJECTS]
+    assert method_metrics.calls == {"OK": 1}
+    assert method_metrics.response_bytes == sum(r.ByteSize() for r in responses)
+    assert method_metrics.response_messages == 3
+
+
+@pytest.mark.unittest
+def test_interceptor_failed_streaming_call():
+    exporter = metrics.InMemoryExporter()
+    interceptor = metrics.MetricsInterceptor(exporter)
+    responses = [config_pb2.VersionInfo(version="1.0.0")]
+
+    stream = interceptor.intercept_unary_stream(
+        lambda details, request: fake_stream(responses, FakeRpcError()),
+        FakeCallDetails(),
+        model_pb2.SearchObjectsRequest(),
+    )
+    with pytest.raises(grpc.RpcError):
+        list(stream)
+
+    method_metrics = exporter.get_metrics()[SEARCH_OBJECTS]
+    assert method_metrics.calls == {"UNAVAILABLE": 1}
+    assert method_metrics.response_messages == 1
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("cancel", [True, False])
+def test_interceptor_abandoned_streaming_call(cancel):
+    exporter = metrics.InMemoryExporter()
+    interceptor = metrics.MetricsInterceptor(exporter)
+    responses = [config_pb2.VersionInfo(version=str(i)) for i in range(3)]
+    call = FakeStreamCall(responses)
+
+    stream = interceptor.intercept_unary_stream(
+        lambda details, request: call,
+        FakeCallDetails(),
+        model_pb2.SearchObjectsRequest(),
+    )
+    assert next(stream) == responses[0]
+    if cancel:
+        assert stream.cancel()
+        assert call.cancelled
+    del stream
+    gc.collect()
+
+    method_metrics = exporter.get_metrics()[SEARCH_OBJECTS]
+    assert method_metrics.calls == {"CANCELLED": 1}
+    assert method_metrics.response_messages == 1
+
+
+@pytest.mark.server
+def test_connection_with_metrics_interceptor(mesh_test_config):
+    if mesh_test_config.creds_type != "insecure":
+        pytest.skip("test uses an insecure connection")
+
+    exporter = metrics.InMemoryExporter()
+    connection = mesh.Connection.insecure(
+        mesh_test_config.address,
+        interceptors=[metrics.MetricsInterceptor(exporter)],
+    )
+    connection.get_version()
+
+    calls = exporter.get_metrics()[
+        "/volue.mesh.grpc.config.v1alpha.ConfigurationService/GetVersion"
+    ].calls
+    # one more call is made when creating the connection
+    assert calls == {"OK": 2}
+
+
+@pytest.mark.server
+@pytest.mark.asyncio
+async def test_async_connection_with_metrics_interceptor(mesh_test_config):
+    if mesh_test_config.creds_type != "insecure":
+        pytest.skip("test uses an insecure connection")
+
+    exporter = metrics.InMemoryExporter()
+    connection = mesh.aio.Connection.insecure(
+        mesh_test_config.address,
+        interceptors=[metrics.AsyncMetricsInterceptor(exporter)],
+    )
+    await connection.get_version()
+
+    calls = exporter.get_metrics()[
+        "/volue.mesh.grpc.config.v1alpha.ConfigurationService/GetVersion"
+    ].calls
+    assert calls == {"OK": 1}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,254 @@
+"""
+Tests for model definition metadata and volue.mesh.MetadataCache.
+"""
+
+import asyncio
+import sys
+import uuid
+
+import pytest
+
+from volue import mesh
+from volue.mesh import MetadataCache, ObjectDefinition, TimeseriesAttribute, aio
+from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh._common import _to_proto_guid
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    model_definition_pb2,
+    resources_pb2 as model_definition_resources_pb2,
+)
+
+from .test_utilities.utilities import UNIT_1, UNIT_2, create_session
+
+MODEL_DEFINITION_PATH = "Repository/SimpleThermalTestRepository"
+
+
+def make_attribute_definition(name):
+    return model_definition_resources_pb2.AttributeDefinition(
+        id=_to_proto_guid(uuid.uuid5(uuid.NAMESPACE_URL, name)),
+        path=f"{MODEL_DEFINITION_PATH}/PlantElementType/{name}",
+        name=name,
+        type_name="TimeseriesAttributeDefinition",
+        timeseries_definition=model_definition_resources_pb2.TimeseriesAttributeDefinition(
+            template_expression="##= 1"
+        ),
+    )
+
+
+class FakeModelDefinitionService:
+    """Counts requests for units of measurement and object definitions."""
+
+    def __init__(self, *unit_names):
+        self.units = [
+            model_definition_resources_pb2.UnitOfMeasurement(
+                id=_to_proto_guid(uuid.uuid4()), name=name
+            )
+            for name in unit_names
+        ]
+        self.calls = []
+
+    def ListUnitsOfMeasurement(self, request):
+        self.calls.append("ListUnitsOfMeasurement")
+        return model_definition_pb2.ListUnitsOfMeasurementResponse(
+            units_of_measurement=self.units
+        )
+
+    def SearchObjectDefinitions(self, request):
+        self.calls.append("SearchObjectDefinitions")
+        yield model_definition_resources_pb2.ObjectDefinition(
+            id=_to_proto_guid(uuid.uuid4()),
+            path=f"{MODEL_DEFINITION_PATH}/PlantElementType",
+            name="PlantElementType",
+            tags=[model_definition_resources_pb2.Tag(name="Plant")],
+            attribute_definitions=[make_attribute_definition("TsRawAtt")],
+        )
+
+    def UpdateTimeseriesAttributeDefinition(self, request):
+        self.calls.append("UpdateTimeseriesAttributeDefinition")
+
+
+class FakeSessionService:
+    def Commit(self, request):
+        pass
+
+    Rollback = EndSession = Commit
+
+
+class FakeAsyncModelDefinitionService(FakeModelDefinitionService):
+    async def ListUnitsOfMeasurement(self, request):
+        # let other tasks start their requests in the meantime
+        await asyncio.sleep(0)
+        return super().ListUnitsOfMeasurement(request)
+
+
+def create_definition_session(session_class, service, metadata_cache=None):
+    return create_session(
+        session_class,
+        model_definition_service=service,
+        session_service=FakeSessionService(),
+        metadata_cache=metadata_cache,
+    )
+
+
+@pytest.mark.unittest
+def test_metadata_cache_expires(monkeypatch):
+    cache = MetadataCache(ttl=10)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    assert cache._set(("units",), (1, 2)) == (1, 2)
+    assert cache._get(("units",)) == (1, 2)
+    now += 11
+    assert cache._get(("units",)) is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache._set(("units",), (1, 2))
+    cache.refresh()
+    assert cache._get(("units",)) is None
+
+    cache = MetadataCache(ttl=0)
+    cache._set(("units",), (1, 2))
+    assert len(cache) == 0
+
+
+@pytest.mark.unittest
+def test_units_of_measurement_are_cached_across_sessions():
+    service = FakeModelDefinitionService(UNIT_1, UNIT_2)
+    cache = MetadataCache()
+    first = create_definition_session(mesh.Connection.Session, service, cache)
+    second = create_definition_session(mesh.Connection.Session, service, cache)
+
+    for _ in range(3):
+        assert first._get_unit_of_measurement_id_by_name(UNIT_1) == service.units[0].id
+    assert second._get_unit_of_measurement_id_by_name(UNIT_2) == service.units[1].id
+    assert service.calls == ["ListUnitsOfMeasurement"]
+    assert [unit.name for unit in second.list_units_of_measurement()] == [
+        UNIT_1,
+        UNIT_2,
+    ]
+
+    # units are requested once more before an unknown unit is rejected
+    with pytest.raises(ValueError, match="invalid unit of measurement provided"):
+        first._get_unit_of_measurement_id_by_name("no_such_unit")
+    assert service.calls == ["ListUnitsOfMeasurement"] * 2
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("end", ["commit", "rollback", "close"])
+def test_uncommitted_definition_changes_are_not_shared(end):
+    service = FakeModelDefinitionService()
+    cache = MetadataCache()
+    changing = create_definition_session(mesh.Connection.Session, service, cache)
+    other = create_definition_session(mesh.Connection.Session, service, cache)
+    other.search_object_definitions(MODEL_DEFINITION_PATH)
+
+    changing.update_timeseries_attribute_definition(
+        f"{MODEL_DEFINITION_PATH}/PlantElementType/TsRawAtt", "##= 2"
+    )
+    # the changing session reads the definitions again, into its own cache
+    changing.search_object_definitions(MODEL_DEFINITION_PATH)
+    changing.search_object_definitions(MODEL_DEFINITION_PATH)
+    assert changing.metadata_cache is not cache
+    assert service.calls.count("SearchObjectDefinitions") == 2
+
+    # other sessions keep using the shared cache
+    other.search_object_definitions(MODEL_DEFINITION_PATH)
+    assert service.calls.count("SearchObjectDefinitions") == 2
+
+    getattr(changing, end)()
+    assert changing.metadata_cache is cache
+    other.search_object_definitions(MODEL_DEFINITION_PATH)
+    # committed changes are requested again
+    expected = 3 if end == "commit" else 2
+    assert service.calls.count("SearchObjectDefinitions") == expected
+
+
+@pytest.mark.unittest
+def test_units_of_measurement_are_requested_once_async():
+    service = FakeAsyncModelDefinitionService(UNIT_1)
+    session = create_definition_session(aio.Connection.Session, service)
+
+    async def get_ids():
+        return await asyncio.gather(
+            *(session._get_unit_of_measurement_id_by_name(UNIT_1) for _ in range(10))
+        )
+
+    assert asyncio.run(get_ids()) == [service.units[0].id] * 10
+    assert service.calls == ["ListUnitsOfMeasurement"]
+    assert session._metadata_requests == {}
+
+
+@pytest.mark.unittest
+def test_cached_object_definitions_are_copies():
+    service = FakeModelDefinitionService()
+    session = create_definition_session(mesh.Connection.Session, service)
+
+    definitions = session.search_object_definitions(MODEL_DEFINITION_PATH, True)
+    assert isinstance(definitions[0], ObjectDefinition)
+    assert definitions[0].tags == ("Plant",)
+    attribute_definition = definitions[0].attribute_definitions[0]
+    assert isinstance(
+        attribute_definition, TimeseriesAttribute.TimeseriesAttributeDefinition
+    )
+
+    # returned definitions can be modified without affecting the cache
+    attribute_definition.description = "changed"
+    attribute_definition.tags.append("changed")
+
+    cached = session.search_object_definitions(MODEL_DEFINITION_PATH, True)
+    assert service.calls == ["SearchObjectDefinitions"]
+    assert cached[0].attribute_definitions[0] is not attribute_definition
+    assert cached[0].attribute_definitions[0].path == attribute_definition.path
+    assert cached[0].attribute_definitions[0].description == ""
+    assert cached[0].attribute_definitions[0].tags == []
+
+    # definitions of full-info attributes are parsed for each attribute
+    attributes = [
+        _from_proto_attribute(
+            model_resources_pb2.Attribute(
+                path=f"Model/Test/Object{i}.TsRawAtt",
+                name="TsRawAtt",
+                value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES,
+                definition=make_attribute_definition("TsRawAtt"),
+            )
+        )
+        for i in range(2)
+    ]
+    attributes[0].definition.tags.append("changed")
+    assert attributes[1].definition.tags == []
+
+    session.metadata_cache.refresh()
+    session.search_object_definitions(MODEL_DEFINITION_PATH, True)
+    assert service.calls == ["SearchObjectDefinitions"] * 2
+
+
+@pytest.mark.database
+def test_search_model_definition_metadata(connection):
+    with connection.create_session() as session:
+        units = session.list_units_of_measurement()
+        assert {UNIT_1, UNIT_2} <= {unit.name for unit in units}
+
+        definitions = session.search_object_definitions(
+            MODEL_DEFINITION_PATH, recursive=True
+        )
+        chimney = next(
+            definition
+            for definition in definitions
+            if definition.name == "ChimneyElementType"
+        )
+        assert chimney.path == f"{MODEL_DEFINITION_PATH}/ChimneyElementType"
+        assert len(chimney.attribute_definitions) > 0
+
+        session.search_namespaces(MODEL_DEFINITION_PATH, recursive=True)
+        session.list_tags(MODEL_DEFINITION_PATH)
+
+    # metadata is shared by sessions of the same connection
+    hits = connection.metadata_cache.hits
+    with connection.create_session() as session:
+        assert session.list_units_of_measurement() == units
+    assert connection.metadata_cache.hits == hits + 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
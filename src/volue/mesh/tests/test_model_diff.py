@@ -0,0 +1,244 @@
+"""
+Tests for volue.mesh.model_diff.
+"""
+
+import sys
+import uuid
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+from dateutil import tz
+
+from volue.mesh import Object, Timeseries
+from volue.mesh.model_diff import ModelDigest, ObjectChange, diff
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.snapshot import ModelSnapshot
+
+from .test_utilities.utilities import (
+    FakeAsyncSession,
+    FakeSession,
+    call_with_session,
+    make_object,
+    make_proto_attribute,
+    make_proto_object,
+    timeseries_value,
+)
+
+MODEL_ID = uuid.uuid4()
+FIRST_ID = uuid.uuid4()
+SECOND_ID = uuid.uuid4()
+THIRD_ID = uuid.uuid4()
+TIMESKEY = 1234
+
+DOUBLE = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE
+TIMESERIES = model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES
+
+
+def double(value):
+    return DOUBLE, [model_resources_pb2.AttributeValue(double_value=value)]
+
+
+def timeseries(timeseries_key):
+    return TIMESERIES, [timeseries_value(timeseries_key)]
+
+
+def make_test_object(id, path, type_name="ElementType", **attributes):
+    return make_object(
+        id,
+        path,
+        type_name,
+        attributes=[
+            make_proto_attribute(name, value_type, values)
+            for name, (value_type, values) in attributes.items()
+        ],
+    )
+
+
+def get_test_objects(**changes):
+    attributes = {"Height": double(1.0), "Series": timeseries(TIMESKEY)}
+    attributes.update(changes)
+    return [
+        make_test_object(MODEL_ID, "Model/Test", "ModelType"),
+        make_test_object(
+            FIRST_ID,
+            "Model/Test/First",
+            **{name: value for name, value in attributes.items() if value is not None},
+        ),
+        make_test_object(SECOND_ID, "Model/Test/Second", Height=double(2.0)),
+    ]
+
+
+class FakeTimeseriesSession(FakeSession):
+    """Returns one point with the value `points` for each time series."""
+
+    def __init__(self, objects, points):
+        super().__init__(objects)
+        self.points = points
+        self.read_keys = []
+
+    def read_timeseries_points(self, target, start_time, end_time):
+        self.read_keys.append(target)
+        arrays = [
+            pa.array([1_600_000_000_000], type=pa.timestamp("ms")),
+            pa.array([0], type=pa.uint32()),
+            pa.array([self.points], type=pa.float64()),
+        ]
+        return Timeseries(pa.Table.from_arrays(arrays, schema=Timeseries.schema))
+
+
+class FakeAsyncTimeseriesSession(FakeAsyncSession, FakeTimeseriesSession):
+    async def read_timeseries_points(self, target, start_time, end_time):
+        return super().read_timeseries_points(target, start_time, end_time)
+
+
+@pytest.mark.unittest
+def test_diff_of_equal_models():
+    # attributes are compared as received from Mesh, regardless of order
+    old = ModelDigest.from_objects(get_test_objects())
+    new = ModelDigest.from_objects(reversed(get_test_objects()))
+
+    assert len(new) == 3
+    assert FIRST_ID in new
+    assert not diff(old, new)
+
+
+@pytest.mark.unittest
+def test_diff():
+    old_objects = get_test_objects()
+    new_objects = get_test_objects(Height=double(1.5), Series=None, Volume=double(3.0))
+    new_objects[2] = make_test_object(
+        SECOND_ID, "Model/Test/Renamed", "OtherType", Height=double(2.0)
+    )
+    added_id = uuid.uuid4()
+    new_objects[0] = make_test_object(added_id, "Model/Test/Added")
+
+    changes = diff(
+        ModelDigest.from_objects(old_objects), ModelDigest.from_objects(new_objects)
+    )
+
+    assert changes.added_objects == {added_id: "Model/Test/Added"}
+    assert changes.removed_objects == {MODEL_ID: "Model/Test"}
+    assert changes.modified_objects == [
+        ObjectChange(
+            id=FIRST_ID,
+            path="Model/Test/First",
+            old_path="Model/Test/First",
+            added_attributes=("Volume",),
+            removed_attributes=("Series",),
+            modified_attributes=("Height",),
+        ),
+        ObjectChange(
+            id=SECOND_ID,
+            path="Model/Test/Renamed",
+            old_path="Model/Test/Second",
+            changed_fields=("path", "type_name"),
+        ),
+    ]
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "session_class", [FakeTimeseriesSession, FakeAsyncTimeseriesSession]
+)
+def test_load_with_timeseries_points(session_class):
+    interval = (
+        datetime(2020, 9, 1, tzinfo=tz.UTC),
+        datetime(2020, 10, 1, tzinfo=tz.UTC),
+    )
+
+    def load(points):
+        # both objects use the same time series
+        objects = get_test_objects()
+        objects.append(
+            make_test_object(THIRD_ID, "Model/Test/Third", Series=timeseries(TIMESKEY))
+        )
+        session = session_class(objects, points)
+        digest = call_with_session(
+            ModelDigest.load,
+            ModelDigest.load_async,
+            session,
+            "Model/Test",
+            timeseries_interval=interval,
+        )
+        return digest, session
+
+    old, session = load(1.0)
+    assert session.read_keys == [TIMESKEY]
+    assert not diff(old, load(1.0)[0])
+
+    changes = diff(old, load(2.0)[0])
+    assert [change.modified_attributes for change in changes.modified_objects] == [
+        ("Series",),
+        ("Series",),
+    ]
+
+    with pytest.raises(ValueError, match="cannot compare"):
+        diff(old, ModelDigest.from_objects(get_test_objects()))
+
+
+@pytest.mark.unittest
+def test_diff_of_snapshots():
+    old = ModelDigest.from_snapshot(ModelSnapshot.from_objects(get_test_objects()))
+
+    # simple attribute values are not a part of snapshots
+    changes = diff(
+        old,
+        ModelDigest.from_snapshot(
+            ModelSnapshot.from_objects(get_test_objects(Height=double(1.5)))
+        ),
+    )
+    assert not changes
+
+    changes = diff(
+        old,
+        ModelDigest.from_snapshot(
+            ModelSnapshot.from_objects(get_test_objects(Series=timeseries(1)))
+        ),
+    )
+    assert changes.modified_objects[0].modified_attributes == ("Series",)
+
+    with pytest.raises(ValueError, match="cannot compare"):
+        diff(old, ModelDigest.from_objects(get_test_objects()))
+
+
+@pytest.mark.unittest
+def test_modified_objects_cannot_be_hashed():
+    objects = get_test_objects()
+    objects[1].attributes.pop("Height")
+
+    with pytest.raises(ValueError, match="as received from Mesh"):
+        ModelDigest.from_objects(objects)
+
+    # e.g. returned by `get_object`, attributes parsed upfront
+    eager = Object._from_proto_object(make_proto_object(THIRD_ID, "Model/Eager"))
+    with pytest.raises(ValueError, match="as received from Mesh"):
+        ModelDigest.from_objects([eager])
+
+
+@pytest.mark.database
+def test_diff_of_uncommitted_changes(connection):
+    model = "Model/SimpleThermalTestModel"
+    with connection.create_session() as committed:
+        old = ModelDigest.load(committed, model)
+
+    with connection.create_session() as session:
+        assert not diff(old, ModelDigest.load(session, model))
+
+        plant = f"{model}/ThermalComponent.ThermalPowerToPlantRef/SomePowerPlant1"
+        attribute = session.get_attribute(f"{plant}.DblAtt")
+        session.update_simple_attribute(attribute, attribute.value + 1)
+        changes = diff(old, ModelDigest.load(session, model))
+
+    assert changes.added_objects == {}
+    assert changes.removed_objects == {}
+    assert [
+        (change.path, change.modified_attributes) for change in changes.modified_objects
+    ] == [(plant, ("DblAtt",))]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,140 @@
+"""
+Performance tests of parsing Mesh objects received from Mesh server.
+The tests do not require a running Mesh server, run them with:
+
+    python -m volue.mesh.tests.test_object_parsing_performance
+"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from volue.mesh import Object
+from volue.mesh._common import _to_proto_guid
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.type.resources_pb2 import MeshId
+
+OBJECT_COUNT = 1000
+ATTRIBUTE_COUNT = 300
+ITERATIONS = 5
+# one million attributes
+MEMORY_OBJECT_COUNT = 2000
+MEMORY_ATTRIBUTE_COUNT = 500
+
+
+def _create_proto_objects(object_count: int, attribute_count: int):
+    """Creates objects with `attribute_count` simple attributes each."""
+    proto_objects = []
+    for object_index in range(object_count):
+        object_id = _to_proto_guid(uuid.uuid4())
+        object_path = f"Model/Object{object_index}"
+        proto_objects.append(
+            model_resources_pb2.Object(
+                id=object_id,
+                path=object_path,
+                name=f"Object{object_index}",
+                type_name="ObjectType",
+                attributes=[
+                    model_resources_pb2.Attribute(
+                        id=_to_proto_guid(uuid.uuid4()),
+                        path=f"{object_path}.Attribute{attribute_index}",
+                        name=f"Attribute{attribute_index}",
+                        owner_id=MeshId(id=object_id, path=object_path),
+                        value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_DOUBLE,
+                        values=[
+                            model_resources_pb2.AttributeValue(
+                                double_value=attribute_index
+                            )
+                        ],
+                    )
+                    # Mesh does not return attributes in any particular order
+                    for attribute_index in reversed(range(attribute_count))
+                ],
+            )
+        )
+    return proto_objects
+
+
+def _measure(proto_objects, lazy: bool, access):
+    """Parses all objects and accesses their attributes, returns seconds."""
+    start = time.perf_counter()
+    for proto_object in proto_objects:
+        access(Object._from_proto_object(proto_object, lazy=lazy))
+    return time.perf_counter() - start
+
+
+def _access_one(object: Object):
+    return object.attributes["Attribute1"]
+
+
+def _access_all(object: Object):
+    return list(object.attributes.values())
+
+
+def _measure_memory(proto_objects, lazy: bool, access=None):
+    """Parses all objects and optionally accesses their attributes, returns
+    allocated bytes.
+
+    Lazily parsed objects keep their protobuf messages. Protobuf allocations
+    are not traced by `tracemalloc`, their serialized size is reported
+    separately.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = []
+    for proto_object in proto_objects:
+        object = Object._from_proto_object(proto_object, lazy=lazy)
+        if access is not None:
+            access(object)
+        objects.append(object)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated
+
+
+def run_tests():
+    """Runs all test cases and prints results."""
+    proto_objects = _create_proto_objects(OBJECT_COUNT, ATTRIBUTE_COUNT)
+    print(f"Objects: {OBJECT_COUNT}, attributes per object: {ATTRIBUTE_COUNT}")
+
+    for test_case_name, access in [
+        ("access one attribute", _access_one),
+        ("access all attributes", _access_all),
+    ]:
+        for lazy in (False, True):
+            durations = [
+                _measure(proto_objects, lazy, access) for _ in range(ITERATIONS)
+            ]
+            print(
+                f"{test_case_name}, {'lazy' if lazy else 'eager'}: "
+                f"median {statistics.median(durations):.3f} s"
+            )
+
+    proto_objects = _create_proto_objects(MEMORY_OBJECT_COUNT, MEMORY_ATTRIBUTE_COUNT)
+    attribute_count = MEMORY_OBJECT_COUNT * MEMORY_ATTRIBUTE_COUNT
+    proto_bytes = sum(proto_object.ByteSize() for proto_object in proto_objects)
+    print(f"memory of {attribute_count} attributes:")
+    for test_case_name, lazy, access in [
+        ("eager", False, None),
+        ("lazy, not accessed", True, None),
+        ("lazy, access all attributes", True, _access_all),
+    ]:
+        allocated = _measure_memory(proto_objects, lazy, access)
+        kept_protobuf = (
+            f" + {proto_bytes / 2**20:.1f} MiB of kept protobuf messages (serialized size)"
+            if lazy
+            else ""
+        )
+        print(
+            f"{test_case_name}: {allocated / 2**20:.1f} MiB, "
+            f"{allocated / attribute_count:.0f} bytes per attribute{kept_protobuf}"
+        )
+
+
+if __name__ == "__main__":
+    run_tests()
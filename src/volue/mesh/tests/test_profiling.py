@@ -0,0 +1,226 @@
+"""
+Tests for volue.mesh.profiling.
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import uuid
+from datetime import datetime
+
+import pyarrow as pa
+import pytest
+
+from volue.mesh import Object, Timeseries, profiling
+from volue.mesh._common import (
+    _read_proto_reply,
+    _to_proto_guid,
+    _to_proto_timeseries,
+)
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
+from volue.mesh.proto.type.resources_pb2 import MeshId, Resolution
+
+TIMESKEY = 1234
+
+
+def get_test_timeseries() -> Timeseries:
+    arrays = [
+        pa.array([datetime(2016, 1, 1, hour) for hour in range(1, 4)]),
+        pa.array([Timeseries.PointFlags.OK.value] * 3),
+        pa.array([1.0, 2.0, 3.0]),
+    ]
+    table = pa.Table.from_arrays(arrays, schema=Timeseries.schema)
+    return Timeseries(
+        table,
+        start_time=datetime(2016, 1, 1, 1),
+        end_time=datetime(2016, 1, 1, 4),
+        uuid_id=uuid.uuid4(),
+        timskey=TIMESKEY,
+    )
+
+
+class FakeSession:
+    def read(self, target):
+        return target
+
+    async def read_async(self, target):
+        return target
+
+    def search(self, target):
+        yield from range(3)
+
+    async def search_async(self, target):
+        for i in range(3):
+            yield i
+
+    def iter(self, target):
+        # validates arguments before returning the generator
+        return self.search(target)
+
+    def iter_async(self, target):
+        return self.search_async(target)
+
+
+profiling._profile_public_methods(FakeSession)
+
+
+@pytest.mark.unittest
+def test_timeseries_encode_and_decode_spans():
+    timeseries = get_test_timeseries()
+
+    with profiling.Profiler() as profiler:
+        proto_timeseries = _to_proto_timeseries(timeseries)
+        proto_timeseries.resolution.type = Resolution.HOUR
+        _read_proto_reply(
+            time_series_pb2.ReadTimeseriesResponse(timeseries=[proto_timeseries])
+        )
+
+    encode, decode = profiler.spans
+    assert encode.phase == "encode_timeseries"
+    assert encode.target == str(TIMESKEY)
+    assert encode.points == 3
+    assert encode.bytes == len(proto_timeseries.data)
+    assert decode.phase == "decode_timeseries"
+    assert decode.target == str(TIMESKEY)
+    assert decode.points == 3
+    assert decode.bytes == len(proto_timeseries.data)
+
+
+@pytest.mark.unittest
+def test_object_parsing_spans():
+    object_id = _to_proto_guid(uuid.uuid4())
+    proto_object = model_resources_pb2.Object(
+        id=object_id,
+        path="Model/Object",
+        attributes=[
+            model_resources_pb2.Attribute(
+                id=_to_proto_guid(uuid.uuid4()),
+                path="Model/Object.B",
+                name="B",
+                owner_id=MeshId(id=object_id),
+            ),
+            model_resources_pb2.Attribute(
+                id=_to_proto_guid(uuid.uuid4()),
+                path="Model/Object.A",
+                name="A",
+                owner_id=MeshId(id=object_id),
+            ),
+        ],
+    )
+
+    with profiling.Profiler() as profiler:
+        object = Object._from_proto_object(proto_object, lazy=True)
+        # attributes are parsed on first access
+        assert profiler.spans == []
+        list(object.attributes.values())
+
+    assert [(span.phase, span.target) for span in profiler.spans] == [
+        ("sort_attributes", "Model/Object"),
+        ("parse_attribute", "Model/Object.A"),
+        ("parse_attribute", "Model/Object.B"),
+    ]
+    assert profiler.spans[0].points == 2
+
+
+@pytest.mark.unittest
+def test_no_spans_when_not_active():
+    profiler = profiling.Profiler()
+    _to_proto_timeseries(get_test_timeseries())
+    assert profiler.spans == []
+
+    with profiler:
+        pass
+    _to_proto_timeseries(get_test_timeseries())
+    assert profiler.spans == []
+
+
+@pytest.mark.unittest
+def test_session_method_spans():
+    session = FakeSession()
+
+    async def run_async_methods():
+        await session.read_async("async")
+        assert [i async for i in session.iter_async("async")] == [0, 1, 2]
+        return [i async for i in session.search_async(target="async")]
+
+    with profiling.Profiler() as profiler:
+        assert session.read("path") == "path"
+        assert list(session.search(1)) == [0, 1, 2]
+        iterator = session.iter("iter")
+        assert profiler.spans[-1].phase == "session.search"
+        assert list(iterator) == [0, 1, 2]
+        assert asyncio.run(run_async_methods()) == [0, 1, 2]
+
+    # spans of methods returning generators cover their iteration
+    assert [(span.phase, span.target) for span in profiler.spans] == [
+        ("session.read", "path"),
+        ("session.search", "1"),
+        ("session.search", "iter"),
+        ("session.iter", "iter"),
+        ("session.read_async", "async"),
+        ("session.search_async", "async"),
+        ("session.iter_async", "async"),
+        ("session.search_async", "async"),
+    ]
+
+
+@pytest.mark.unittest
+def test_custom_handler():
+    spans = []
+    with profiling.Profiler(handler=spans.append) as profiler:
+        FakeSession().read("path")
+
+    assert profiler.spans == []
+    assert [span.phase for span in spans] == ["session.read"]
+
+
+@pytest.mark.unittest
+def test_slow_call_logging(caplog):
+    with caplog.at_level(logging.WARNING, logger="volue.mesh.profiling"):
+        with profiling.Profiler(slow_call_threshold=0.0):
+            FakeSession().read("path")
+        with profiling.Profiler(slow_call_threshold=60.0):
+            FakeSession().read("other_path")
+
+    assert len(caplog.records) == 1
+    assert "slow session.read" in caplog.records[0].getMessage()
+    assert "target: path" in caplog.records[0].getMessage()
+
+
+@pytest.mark.unittest
+def test_only_one_profiler_can_be_active():
+    with profiling.Profiler():
+        with pytest.raises(RuntimeError, match="already active"):
+            profiling.Profiler().start()
+
+
+@pytest.mark.unittest
+def test_profiler_is_scoped_to_context():
+    started = threading.Event()
+    stopped = threading.Event()
+    other_spans = []
+
+    def profile_in_other_thread():
+        with profiling.Profiler() as profiler:
+            started.set()
+            stopped.wait(5)
+        other_spans.extend(profiler.spans)
+
+    thread = threading.Thread(target=profile_in_other_thread)
+    thread.start()
+    assert started.wait(5)
+
+    # the profiler of the other thread neither blocks nor records this one
+    with profiling.Profiler() as profiler:
+        profiling._record("phase", profiling._start())
+    stopped.set()
+    thread.join()
+
+    assert [span.phase for span in profiler.spans] == ["phase"]
+    assert other_spans == []
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
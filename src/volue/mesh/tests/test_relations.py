@@ -9,7 +9,11 @@ import grpc
 import pytest
 from dateutil import tz
 
-from volue.mesh import LinkRelationVersion
+from volue.mesh import (
+    LinkRelationUpdate,
+    LinkRelationVersion,
+    VersionedLinkRelationUpdate,
+)
 
 from .test_utilities.utilities import CHIMNEY_1_ID, CHIMNEY_2_ID
 
@@ -679,5 +683,92 @@ async def test_update_versioned_one_to_many_link_relations_async(async_session):
     assert len(attribute.entries) == 0
 
 
+@pytest.mark.database
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_update_link_relation_attributes(session, max_concurrency):
+    """
+    Check that link relation attributes of different kinds are updated in one
+    batch.
+    """
+    one_to_one_path = ATTRIBUTE_PATH_PREFIX + ONE_TO_ONE_LINK_RELATION_ATTRIBUTE_NAME
+    one_to_many_path = ATTRIBUTE_PATH_PREFIX + ONE_TO_MANY_LINK_RELATION_ATTRIBUTE_NAME
+    versioned_one_to_one_path = (
+        ATTRIBUTE_PATH_PREFIX + VERSIONED_ONE_TO_ONE_LINK_RELATION_ATTRIBUTE_NAME
+    )
+    versioned_one_to_many_path = (
+        ATTRIBUTE_PATH_PREFIX + VERSIONED_ONE_TO_MANY_LINK_RELATION_ATTRIBUTE_NAME
+    )
+    valid_from_time = datetime(2020, 1, 1, tzinfo=tz.UTC)
+
+    session.update_link_relation_attributes(
+        [
+            LinkRelationUpdate(one_to_one_path, [CHIMNEY_2_ID]),
+            LinkRelationUpdate(one_to_many_path, [CHIMNEY_1_ID]),
+            VersionedLinkRelationUpdate(
+                versioned_one_to_one_path,
+                [[LinkRelationVersion(CHIMNEY_2_ID, valid_from_time)]],
+                start_time=datetime.min,
+                end_time=datetime.max,
+            ),
+            VersionedLinkRelationUpdate(versioned_one_to_many_path, []),
+        ],
+        max_concurrency=max_concurrency,
+    )
+
+    assert session.get_attribute(one_to_one_path).target_object_ids == [CHIMNEY_2_ID]
+    assert session.get_attribute(one_to_many_path).target_object_ids == [CHIMNEY_1_ID]
+    entries = session.get_attribute(versioned_one_to_one_path).entries
+    assert entries[0].versions == [LinkRelationVersion(CHIMNEY_2_ID, valid_from_time)]
+    assert session.get_attribute(versioned_one_to_many_path).entries == []
+
+    session.rollback()
+
+
+@pytest.mark.database
+def test_update_link_relation_attributes_with_invalid_input(session):
+    one_to_one_path = ATTRIBUTE_PATH_PREFIX + ONE_TO_ONE_LINK_RELATION_ATTRIBUTE_NAME
+    original = session.get_attribute(one_to_one_path).target_object_ids
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        session.update_link_relation_attributes(
+            [LinkRelationUpdate(one_to_one_path, [CHIMNEY_2_ID])], max_concurrency=0
+        )
+
+    # no update is sent when any of them is invalid
+    with pytest.raises(TypeError):
+        session.update_link_relation_attributes(
+            [LinkRelationUpdate(one_to_one_path, [CHIMNEY_2_ID]), one_to_one_path]
+        )
+    assert session.get_attribute(one_to_one_path).target_object_ids == original
+
+    with pytest.raises(grpc.RpcError):
+        session.update_link_relation_attributes(
+            [LinkRelationUpdate(one_to_one_path, [CHIMNEY_1_ID, CHIMNEY_2_ID])]
+        )
+
+
+@pytest.mark.asyncio
+@pytest.mark.database
+async def test_update_link_relation_attributes_async(async_session):
+    """For async run the simplest test, implementation is the same."""
+
+    one_to_many_path = ATTRIBUTE_PATH_PREFIX + ONE_TO_MANY_LINK_RELATION_ATTRIBUTE_NAME
+    versioned_one_to_many_path = (
+        ATTRIBUTE_PATH_PREFIX + VERSIONED_ONE_TO_MANY_LINK_RELATION_ATTRIBUTE_NAME
+    )
+
+    await async_session.update_link_relation_attributes(
+        [
+            LinkRelationUpdate(one_to_many_path, []),
+            VersionedLinkRelationUpdate(versioned_one_to_many_path, []),
+        ]
+    )
+
+    attribute = await async_session.get_attribute(one_to_many_path)
+    assert attribute.target_object_ids == []
+    attribute = await async_session.get_attribute(versioned_one_to_many_path)
+    assert len(attribute.entries) == 0
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
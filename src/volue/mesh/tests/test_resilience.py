@@ -0,0 +1,354 @@
+"""
+Tests for volue.mesh.resilience.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+import grpc
+import pytest
+
+from volue.mesh import resilience
+
+from .test_utilities.utilities import FakeRpcError
+
+READ_METHOD = "/volue.mesh.grpc.time_series.v1alpha.TimeseriesService/ReadTimeseries"
+WRITE_METHOD = "/volue.mesh.grpc.time_series.v1alpha.TimeseriesService/WriteTimeseries"
+
+FAST_RETRY_POLICY = resilience.RetryPolicy(initial_backoff=0.001, max_backoff=0.001)
+
+
+class FakeCallDetails:
+    def __init__(self, method):
+        self.method = method
+
+
+class FakeOutcome:
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+    def cancel(self):
+        return False
+
+    def result(self):
+        return self._code
+
+
+class PendingOutcome(FakeOutcome):
+    """Outcome of a call that finishes when `complete` is called."""
+
+    def __init__(self):
+        super().__init__(None)
+        self.callbacks = []
+        self.cancelled = False
+
+    def add_done_callback(self, fn):
+        if self._code is None:
+            self.callbacks.append(fn)
+        else:
+            fn(self)
+
+    def complete(self, code):
+        self._code = code
+        for fn in self.callbacks:
+            fn(self)
+
+    def cancel(self):
+        self.cancelled = True
+        self.complete(grpc.StatusCode.CANCELLED)
+        return True
+
+
+class PendingContinuation:
+    """Returns pending outcomes, one per call."""
+
+    def __init__(self):
+        self.outcomes = []
+
+    def __call__(self, client_call_details, request):
+        outcome = PendingOutcome()
+        self.outcomes.append(outcome)
+        return outcome
+
+    def wait_for_calls(self, calls):
+        deadline = time.monotonic() + 5
+        while len(self.outcomes) < calls or self.outcomes[-1].callbacks == []:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        return self.outcomes[calls - 1]
+
+
+class FakeContinuation:
+    """Returns outcomes with the given status codes, one per call."""
+
+    def __init__(self, *codes, delays=()):
+        self.codes = list(codes)
+        self.delays = list(delays)
+        self.calls = 0
+
+    def __call__(self, client_call_details, request):
+        index = self.calls
+        self.calls += 1
+        if index < len(self.delays):
+            time.sleep(self.delays[index])
+        return FakeOutcome(self.codes[min(index, len(self.codes) - 1)])
+
+
+def fake_stream(responses, error=None):
+    yield from responses
+    if error is not None:
+        raise error
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "method, expected",
+    [
+        (READ_METHOD, True),
+        ("/volue.mesh.grpc.model.v1alpha.ModelService/SearchObjects", True),
+        ("/volue.mesh.grpc.model.v1alpha.ModelService/GetObject", True),
+        (b"/volue.mesh.grpc.model.v1alpha.ModelService/ListModels", True),
+        (WRITE_METHOD, False),
+        ("/volue.mesh.grpc.calc.v1alpha.CalculationService/RunCalculation", False),
+        ("/volue.mesh.grpc.model.v1alpha.ModelService/UpdateObject", False),
+    ],
+)
+def test_idempotent_methods(method, expected):
+    assert resilience.RetryPolicy().is_idempotent(method) == expected
+
+
+@pytest.mark.unittest
+def test_backoff_is_bounded():
+    policy = resilience.RetryPolicy(
+        initial_backoff=0.1, max_backoff=0.3, backoff_multiplier=2.0
+    )
+    for _ in range(100):
+        assert 0 <= policy._get_backoff(1) <= 0.1
+        assert 0 <= policy._get_backoff(2) <= 0.2
+        assert 0 <= policy._get_backoff(10) <= 0.3
+
+
+@pytest.mark.unittest
+def test_read_is_retried():
+    continuation = FakeContinuation(
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        grpc.StatusCode.OK,
+    )
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY)
+
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(READ_METHOD), None
+    )
+    assert outcome.code() == grpc.StatusCode.OK
+    assert continuation.calls == 3
+
+
+@pytest.mark.unittest
+def test_read_retries_are_limited():
+    continuation = FakeContinuation(grpc.StatusCode.UNAVAILABLE)
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY)
+
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(READ_METHOD), None
+    )
+    assert outcome.code() == grpc.StatusCode.UNAVAILABLE
+    assert continuation.calls == FAST_RETRY_POLICY.max_attempts
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "method, code",
+    [
+        (WRITE_METHOD, grpc.StatusCode.UNAVAILABLE),
+        (READ_METHOD, grpc.StatusCode.INVALID_ARGUMENT),
+    ],
+)
+def test_not_retried(method, code):
+    continuation = FakeContinuation(code, grpc.StatusCode.OK)
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY)
+
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(method), None
+    )
+    assert outcome.code() == code
+    assert continuation.calls == 1
+
+
+@pytest.mark.unittest
+def test_slow_read_is_hedged():
+    continuation = FakeContinuation(grpc.StatusCode.OK, delays=[1.0])
+    interceptor = resilience.ResilienceInterceptor(
+        resilience.RetryPolicy(hedging_delay=0.05)
+    )
+
+    start = time.monotonic()
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(READ_METHOD), None
+    )
+    assert outcome.code() == grpc.StatusCode.OK
+    assert continuation.calls == 2
+    assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.unittest
+def test_read_is_retried_without_blocking():
+    continuation = PendingContinuation()
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY)
+
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(READ_METHOD), None
+    )
+    assert not outcome.done()
+
+    continuation.wait_for_calls(1).complete(grpc.StatusCode.UNAVAILABLE)
+    continuation.wait_for_calls(2).complete(grpc.StatusCode.OK)
+    assert outcome.result(timeout=5) == grpc.StatusCode.OK
+    assert outcome.code() == grpc.StatusCode.OK
+
+
+@pytest.mark.unittest
+def test_hedged_loser_is_cancelled():
+    continuation = PendingContinuation()
+    limit = resilience.AdaptiveConcurrencyLimit()
+    interceptor = resilience.ResilienceInterceptor(
+        resilience.RetryPolicy(hedging_delay=0.01), limit
+    )
+
+    outcome = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(READ_METHOD), None
+    )
+    first = continuation.wait_for_calls(1)
+    continuation.wait_for_calls(2).complete(grpc.StatusCode.OK)
+
+    assert outcome.code() == grpc.StatusCode.OK
+    assert first.cancelled
+    assert limit.in_flight == 0
+
+
+@pytest.mark.unittest
+def test_limited_call_does_not_block():
+    continuation = PendingContinuation()
+    limit = resilience.AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY, limit)
+
+    first = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(WRITE_METHOD), None
+    )
+    second = interceptor.intercept_unary_unary(
+        continuation, FakeCallDetails(WRITE_METHOD), None
+    )
+    assert len(continuation.outcomes) == 1
+
+    continuation.wait_for_calls(1).complete(grpc.StatusCode.OK)
+    continuation.wait_for_calls(2).complete(grpc.StatusCode.OK)
+    assert first.code() == grpc.StatusCode.OK
+    assert second.code() == grpc.StatusCode.OK
+    assert limit.in_flight == 0
+
+
+@pytest.mark.unittest
+def test_stream_is_retried_before_first_response():
+    attempts = [
+        fake_stream([], FakeRpcError(grpc.StatusCode.UNAVAILABLE)),
+        fake_stream([1, 2], FakeRpcError(grpc.StatusCode.UNAVAILABLE)),
+    ]
+    interceptor = resilience.ResilienceInterceptor(FAST_RETRY_POLICY)
+
+    stream = interceptor.intercept_unary_stream(
+        lambda client_call_details, request: attempts.pop(0),
+        FakeCallDetails(READ_METHOD),
+        None,
+    )
+    assert next(stream) == 1
+    assert next(stream) == 2
+    # failed after the first response, must not be retried
+    with pytest.raises(grpc.RpcError):
+        next(stream)
+    assert attempts == []
+
+
+@pytest.mark.unittest
+def test_concurrency_limit_aimd():
+    limit = resilience.AdaptiveConcurrencyLimit(
+        initial_limit=4, min_limit=1, max_limit=5, latency_threshold=1.0
+    )
+
+    start = limit.acquire()
+    limit.release(start, grpc.StatusCode.OK, latency=0.1)
+    assert limit.limit == 4  # 4.25
+
+    for _ in range(4):
+        limit.release(limit.acquire(), grpc.StatusCode.OK, latency=0.1)
+    assert limit.limit == 5
+    for _ in range(10):
+        limit.release(limit.acquire(), grpc.StatusCode.OK, latency=0.1)
+    assert limit.limit == 5
+
+    # calls started before a decrease do not decrease again
+    first, second = limit.acquire(), limit.acquire()
+    limit.release(first, grpc.StatusCode.RESOURCE_EXHAUSTED)
+    limit.release(second, grpc.StatusCode.RESOURCE_EXHAUSTED)
+    assert limit.limit == 2
+
+    limit.release(limit.acquire(), grpc.StatusCode.OK, latency=2.0)
+    assert limit.limit == 1
+    limit.release(limit.acquire(), grpc.StatusCode.RESOURCE_EXHAUSTED)
+    assert limit.limit == 1
+    assert limit.in_flight == 0
+
+
+@pytest.mark.unittest
+def test_concurrency_limit_blocks():
+    limit = resilience.AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+    start = limit.acquire()
+    acquired = threading.Event()
+
+    def acquire_and_release():
+        limit.release(limit.acquire())
+        acquired.set()
+
+    thread = threading.Thread(target=acquire_and_release)
+    thread.start()
+    assert not acquired.wait(0.1)
+    limit.release(start)
+    assert acquired.wait(5)
+    thread.join()
+
+
+@pytest.mark.unittest
+def test_concurrency_limit_blocks_async():
+    limit = resilience.AdaptiveConcurrencyLimit(initial_limit=1, max_limit=1)
+
+    async def run():
+        start = await limit.acquire_async()
+        waiting = asyncio.ensure_future(limit.acquire_async())
+        await asyncio.sleep(0.05)
+        assert not waiting.done()
+        limit.release(start)
+        limit.release(await asyncio.wait_for(waiting, 5))
+
+    asyncio.run(run())
+    assert limit.in_flight == 0
+
+
+@pytest.mark.unittest
+def test_invalid_concurrency_limits():
+    with pytest.raises(ValueError):
+        resilience.AdaptiveConcurrencyLimit(initial_limit=0)
+    with pytest.raises(ValueError):
+        resilience.AdaptiveConcurrencyLimit(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        resilience.AdaptiveConcurrencyLimit(backoff_ratio=1.5)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -6,12 +6,35 @@ import asyncio
 import random
 import sys
 import threading
+import uuid
+from datetime import datetime, timezone
 from time import sleep
 
 import grpc
+import pyarrow as pa
 import pytest
 
-from .test_utilities.utilities import UNIT_1
+from volue.mesh import (
+    Connection,
+    LinkRelationUpdate,
+    SimpleAttributeUpdateFailure,
+    TraversalNode,
+    VersionedLinkRelationUpdate,
+    _base_session,
+    aio,
+)
+from volue.mesh._common import _from_proto_guid, _to_proto_guid
+from volue.mesh._object import _LazyAttributes
+from volue.mesh.proto.model.v1alpha import model_pb2
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    model_definition_pb2,
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.time_series.v1alpha import time_series_pb2
+from volue.mesh.proto.type import resources_pb2 as type_resources_pb2
+
+from .test_utilities.utilities import CHIMNEY_1_ID, UNIT_1, create_session, run
 
 # After this timeout an inactive session must be closed by the server.
 # gRPC session timeout + ping interval + minimal margin:
@@ -408,5 +431,771 @@ def test_model_changes_in_multiple_concurrent_sessions(connection):
     session_with_changes.close()
 
 
+@pytest.mark.unittest
+@pytest.mark.parametrize(
+    "batch_size, expected",
+    [
+        (None, [0, 1, 2, 3, 4]),
+        (1, [[0], [1], [2], [3], [4]]),
+        (2, [[0, 1], [2, 3], [4]]),
+        (5, [[0, 1, 2, 3, 4]]),
+        (10, [[0, 1, 2, 3, 4]]),
+    ],
+)
+def test_batched(batch_size, expected):
+    assert list(_base_session._batched(range(5), batch_size)) == expected
+
+    async def items():
+        for item in range(5):
+            yield item
+
+    async def collect():
+        return [
+            batch async for batch in _base_session._batched_async(items(), batch_size)
+        ]
+
+    assert asyncio.run(collect()) == expected
+
+
+class FakeService:
+    """Fake gRPC service stub with unary `METHODS` called through futures.
+    Records the maximum number of calls in flight, subclasses handle calls
+    in `_complete`."""
+
+    METHODS = ()
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        for name in self.METHODS:
+            setattr(self, name, self._Method(self))
+
+    def _send(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _complete(self, request):
+        self.in_flight -= 1
+
+    class _Method:
+        def __init__(self, service):
+            self.service = service
+
+        def future(self, request):
+            self.service._send(request)
+            return FakeService._Future(self.service, request)
+
+    class _Future:
+        def __init__(self, service, request):
+            self.service = service
+            self.request = request
+            self.cancelled = False
+
+        def result(self):
+            return self.service._complete(self.request)
+
+        def cancel(self):
+            self.cancelled = True
+
+
+class FakeAsyncService(FakeService):
+    """Like `FakeService`, but `METHODS` are coroutines like in `grpc.aio`
+    stubs. Mixed in before a `FakeService` subclass."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for name in self.METHODS:
+            setattr(self, name, self._call)
+
+    async def _call(self, request):
+        self._send(request)
+        await asyncio.sleep(0)
+        return self._complete(request)
+
+
+class FakeModelService(FakeService):
+    """Records attribute requests, fails requests for `failing_target`."""
+
+    METHODS = (
+        "UpdateLinkRelationAttribute",
+        "UpdateVersionedLinkRelationAttribute",
+        "UpdateSimpleAttribute",
+        "GetAttribute",
+    )
+
+    def __init__(self, failing_target=None):
+        super().__init__()
+        self.failing_target = failing_target
+        self.sent = []
+        self.requests = []
+
+    @staticmethod
+    def _path(request):
+        if isinstance(
+            request,
+            (model_pb2.UpdateSimpleAttributeRequest, model_pb2.GetAttributeRequest),
+        ):
+            return request.attribute_id.path
+        return request.attribute.path
+
+    def _send(self, request):
+        super()._send(request)
+        self.sent.append(self._path(request))
+        self.requests.append(request)
+
+    def _complete(self, request):
+        super()._complete(request)
+        if self._path(request) == self.failing_target:
+            raise grpc.RpcError()
+        if isinstance(request, model_pb2.GetAttributeRequest):
+            return model_resources_pb2.Attribute(
+                id=_to_proto_guid(uuid.uuid4()), path=request.attribute_id.path
+            )
+
+
+class FakeAsyncModelService(FakeAsyncService, FakeModelService):
+    pass
+
+
+def create_fake_service(session_class, service_class, async_service_class, **kwargs):
+    if session_class is aio.Connection.Session:
+        return async_service_class(**kwargs)
+    return service_class(**kwargs)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("iter_objects", ("Model/Object1", "{*}")),
+        ("iter_attributes", ("Model/Object1", "*")),
+        ("iter_objects_by_definition", ("Model/Definition",)),
+        ("iter_linked_from", ("Model/Object1",)),
+    ],
+)
+def test_iter_validates_batch_size_on_call(session_class, method, args):
+    session = create_session(session_class, None)
+    with pytest.raises(ValueError, match="batch_size must be at least 1"):
+        getattr(session, method)(*args, batch_size=0)
+
+
+class FakeSearchModelService:
+    """Returns the same object for each search."""
+
+    def __init__(self, proto_object):
+        self.proto_object = proto_object
+
+    def SearchObjects(self, request):
+        return [self.proto_object]
+
+
+@pytest.mark.unittest
+def test_only_streamed_objects_are_parsed_lazily():
+    proto_object = model_resources_pb2.Object(
+        id=_to_proto_guid(uuid.uuid4()), path="Model/Object1", name="Object1"
+    )
+    proto_object.attributes.add(name="b", path="Model/Object1.b")
+    proto_object.attributes.add(name="A", path="Model/Object1.A")
+    session = create_session(Connection.Session, FakeSearchModelService(proto_object))
+
+    [searched] = session.search_for_objects("Model", "{*}")
+    [streamed] = session.iter_objects("Model", "{*}")
+    assert type(searched.attributes) is dict
+    assert isinstance(streamed.attributes, _LazyAttributes)
+    assert streamed.attributes._parsed == {}
+    assert list(streamed.attributes) == list(searched.attributes) == ["A", "b"]
+
+
+def link_relation_updates(count):
+    return [
+        (
+            LinkRelationUpdate(f"Model/Object{i}.Link", [CHIMNEY_1_ID])
+            if i % 2
+            else VersionedLinkRelationUpdate(f"Model/Object{i}.Link", [])
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("max_concurrency", [1, 3, 20])
+def test_update_link_relation_attributes_is_pipelined(max_concurrency):
+    model_service = FakeModelService()
+    session = create_session(Connection.Session, model_service)
+    session.update_link_relation_attributes(link_relation_updates(10), max_concurrency)
+    assert model_service.sent == [f"Model/Object{i}.Link" for i in range(10)]
+    assert model_service.in_flight == 0
+    assert model_service.max_in_flight == min(max_concurrency, 10)
+
+    model_service = FakeAsyncModelService()
+    session = create_session(aio.Connection.Session, model_service)
+    asyncio.run(
+        session.update_link_relation_attributes(
+            link_relation_updates(10), max_concurrency
+        )
+    )
+    assert sorted(model_service.sent) == sorted(
+        f"Model/Object{i}.Link" for i in range(10)
+    )
+    assert model_service.max_in_flight == min(max_concurrency, 10)
+
+
+@pytest.mark.unittest
+def test_update_link_relation_attributes_stops_on_error():
+    model_service = FakeModelService(failing_target="Model/Object1.Link")
+    session = create_session(Connection.Session, model_service)
+    with pytest.raises(grpc.RpcError):
+        session.update_link_relation_attributes(link_relation_updates(10), 2)
+    # the failed update is detected when the third one is to be sent
+    assert len(model_service.sent) == 3
+
+    model_service = FakeAsyncModelService(failing_target="Model/Object1.Link")
+    session = create_session(aio.Connection.Session, model_service)
+    with pytest.raises(grpc.RpcError):
+        asyncio.run(
+            session.update_link_relation_attributes(link_relation_updates(10), 2)
+        )
+    assert len(model_service.sent) < 10
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        session = create_session(Connection.Session, FakeModelService())
+        session.update_link_relation_attributes(link_relation_updates(1), 0)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_get_attributes_is_pipelined(session_class, max_concurrency):
+    targets = [f"Model/Object{i}.Att" for i in range(10)]
+
+    model_service = create_fake_service(
+        session_class, FakeModelService, FakeAsyncModelService
+    )
+    session = create_session(session_class, model_service)
+    attributes = run(
+        session_class,
+        session.get_attributes(targets, max_concurrency=max_concurrency),
+    )
+    assert [attribute.path for attribute in attributes] == targets
+    assert model_service.max_in_flight == max_concurrency
+
+    model_service = create_fake_service(
+        session_class,
+        FakeModelService,
+        FakeAsyncModelService,
+        failing_target="Model/Object1.Att",
+    )
+    session = create_session(session_class, model_service)
+    with pytest.raises(grpc.RpcError):
+        run(session_class, session.get_attributes(targets, max_concurrency=2))
+    assert len(model_service.sent) < 10
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        run(session_class, session.get_attributes(targets, max_concurrency=0))
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+def test_iter_linked_from_is_pipelined(session_class):
+    ids = [uuid.uuid4() for _ in range(10)]
+    responses = [
+        model_pb2.SearchLinkedFromResponse(
+            link_relation_id=type_resources_pb2.MeshId(id=_to_proto_guid(id))
+        )
+        for id in ids
+    ]
+    model_service = create_fake_service(
+        session_class, FakeModelService, FakeAsyncModelService
+    )
+    if session_class is aio.Connection.Session:
+
+        async def search_linked_from(request):
+            for response in responses:
+                yield response
+
+        async def collect():
+            return [
+                batch
+                async for batch in session.iter_linked_from(
+                    "Model/Object1", batch_size=4, max_concurrency=3
+                )
+            ]
+
+    else:
+
+        def search_linked_from(request):
+            return iter(responses)
+
+        def collect():
+            return list(
+                session.iter_linked_from(
+                    "Model/Object1", batch_size=4, max_concurrency=3
+                )
+            )
+
+    model_service.SearchLinkedFrom = search_linked_from
+    session = create_session(session_class, model_service)
+    batches = run(session_class, collect())
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert model_service.requests == [
+        session._prepare_get_attribute_request(id, False) for id in ids
+    ]
+    assert model_service.max_in_flight == 3
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        session.iter_linked_from("Model/Object1", max_concurrency=0)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_update_simple_attributes_reports_failures(session_class, max_concurrency):
+    model_service = create_fake_service(
+        session_class,
+        FakeModelService,
+        FakeAsyncModelService,
+        failing_target="Model/Object3.Att",
+    )
+    session = create_session(session_class, model_service)
+    values = {f"Model/Object{i}.Att": float(i) for i in range(10)}
+    values["Model/Object5.Att"] = {"not": "supported"}
+    values[1234] = 1.0
+
+    failures = run(
+        session_class, session.update_simple_attributes(values, max_concurrency)
+    )
+    assert [(failure.index, failure.target) for failure in failures] == [
+        (3, "Model/Object3.Att"),
+        (5, "Model/Object5.Att"),
+        (10, 1234),
+    ]
+    assert all(
+        isinstance(failure, SimpleAttributeUpdateFailure) for failure in failures
+    )
+    assert isinstance(failures[0].error, grpc.RpcError)
+    assert isinstance(failures[1].error, RuntimeError)
+    assert isinstance(failures[2].error, TypeError)
+    # all valid updates are sent
+    assert sorted(model_service.sent) == sorted(
+        f"Model/Object{i}.Att" for i in range(10) if i != 5
+    )
+    assert model_service.max_in_flight == max_concurrency
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        run(session_class, session.update_simple_attributes(values, 0))
+
+
+@pytest.mark.unittest
+def test_update_simple_attributes_from_arrow_table():
+    values = [
+        [1, 2, 3],
+        [True],
+        [],
+        "text",
+        2.5,
+        datetime(2024, 5, 1, 12, 30, 15, 250000),
+        [datetime(1970, 1, 1), datetime(1969, 12, 31, 23, 59, 59, 500000)],
+    ]
+    targets = [f"Model/Object{i}.Att" for i in range(len(values))]
+    model_service = FakeModelService()
+    session = create_session(Connection.Session, model_service)
+    expected = [
+        session._prepare_update_simple_attribute_request(target, value)
+        for target, value in zip(targets, values)
+    ]
+
+    # each row in a separate table, so that each value column has one type
+    for target, value in zip(targets, values):
+        table = pa.table({"target": [target], "value": [value]})
+        assert session.update_simple_attributes(table) == []
+    assert model_service.requests == expected
+
+    # chunked and sliced list column
+    lists = [[1, 2, 3], [4], [], [5, 6], [7]]
+    table = pa.concat_tables(
+        [
+            pa.table(
+                {
+                    "target": targets[:3],
+                    "value": pa.array(lists[:3], pa.list_(pa.int64())),
+                }
+            ),
+            pa.table(
+                {
+                    "target": targets[3:5],
+                    "value": pa.array(lists[3:], pa.list_(pa.int64())),
+                }
+            ),
+        ]
+    ).slice(1)
+    model_service.requests.clear()
+    assert session.update_simple_attributes(table) == []
+    assert model_service.requests == [
+        session._prepare_update_simple_attribute_request(target, value)
+        for target, value in zip(targets[1:5], lists[1:])
+    ]
+
+    # IDs and time zone aware timestamps
+    ids = [uuid.uuid4(), uuid.uuid4()]
+    table = pa.table(
+        {
+            "target": pa.array([id.bytes for id in ids], pa.binary(16)),
+            "value": pa.array(
+                [datetime(2024, 5, 1, 12, tzinfo=timezone.utc)] * 2,
+                pa.timestamp("ms", tz="Europe/Oslo"),
+            ),
+        }
+    )
+    model_service = FakeModelService()
+    session = create_session(Connection.Session, model_service)
+    assert session.update_simple_attributes(table) == []
+    assert model_service.requests == [
+        session._prepare_update_simple_attribute_request(
+            id, datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        )
+        for id in ids
+    ]
+
+    with pytest.raises(ValueError, match="missing columns: value"):
+        session.update_simple_attributes(pa.table({"target": targets[:1]}))
+    with pytest.raises(ValueError, match="must not contain null"):
+        session.update_simple_attributes(
+            pa.table({"target": targets[:2], "value": [1, None]})
+        )
+    with pytest.raises(TypeError, match="not supported Arrow type"):
+        session.update_simple_attributes(
+            pa.table({"target": targets[:1], "value": [b"bytes"]})
+        )
+
+
+class FakeTreeModelService(FakeService):
+    """Returns objects of a tree of ownership relations."""
+
+    METHODS = ("GetObject",)
+
+    def __init__(self, children):
+        super().__init__()
+        self.children = children
+        self.requested = []
+
+    def _send(self, request):
+        super()._send(request)
+        self.requested.append(_from_proto_guid(request.object_id.id))
+
+    def _complete(self, request):
+        super()._complete(request)
+        id = _from_proto_guid(request.object_id.id)
+        proto_object = model_resources_pb2.Object(
+            id=_to_proto_guid(id), path=f"Model/{id}", name=str(id)
+        )
+        proto_object.attributes.add(name="Children").values.extend(
+            model_resources_pb2.AttributeValue(
+                ownership_relation_value=model_resources_pb2.OwnershipRelationAttributeValue(
+                    target_object_id=_to_proto_guid(child_id)
+                )
+            )
+            for child_id in self.children.get(id, [])
+        )
+        return proto_object
+
+
+class FakeAsyncTreeModelService(FakeAsyncService, FakeTreeModelService):
+    pass
+
+
+ROOT, A, B, C, D, E = (uuid.uuid4() for _ in range(6))
+
+# D is owned by both A and B to check that objects are visited once
+TREE = {ROOT: [A, B], A: [C, D], B: [D], C: [E]}
+
+
+def run_traverse_objects(session_class, **kwargs):
+    model_service = create_fake_service(
+        session_class, FakeTreeModelService, FakeAsyncTreeModelService, children=TREE
+    )
+    session = create_session(session_class, model_service)
+    nodes = session.traverse_objects(ROOT, **kwargs)
+    if session_class is aio.Connection.Session:
+
+        async def collect():
+            return [node async for node in nodes]
+
+        nodes = asyncio.run(collect())
+    return [
+        (node.object.id, node.depth, node.parent_id) for node in nodes
+    ], model_service
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("max_concurrency", [1, 2, 16])
+def test_traverse_objects(session_class, max_concurrency):
+    nodes, model_service = run_traverse_objects(
+        session_class, max_concurrency=max_concurrency
+    )
+    assert nodes == [
+        (ROOT, 0, None),
+        (A, 1, ROOT),
+        (B, 1, ROOT),
+        (C, 2, A),
+        (D, 2, A),
+        (E, 3, C),
+    ]
+    assert model_service.requested == [ROOT, A, B, C, D, E]
+    assert model_service.in_flight == 0
+    assert model_service.max_in_flight <= max_concurrency
+    # children of the start object are requested concurrently
+    assert model_service.max_in_flight >= min(max_concurrency, 2)
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+def test_traverse_objects_with_pruning(session_class):
+    nodes, model_service = run_traverse_objects(session_class, max_depth=1)
+    assert nodes == [(ROOT, 0, None), (A, 1, ROOT), (B, 1, ROOT)]
+    assert model_service.requested == [ROOT, A, B]
+
+    visited = []
+
+    def visitor(node):
+        assert isinstance(node, TraversalNode)
+        visited.append(node.object.id)
+        return node.object.id != A
+
+    nodes, model_service = run_traverse_objects(session_class, visitor=visitor)
+    assert nodes == [(ROOT, 0, None), (A, 1, ROOT), (B, 1, ROOT), (D, 2, B)]
+    assert model_service.requested == visited == [ROOT, A, B, D]
+
+    # arguments are validated on call, not when iterating
+    session = create_session(session_class, None)
+    with pytest.raises(ValueError, match="max_depth must not be negative"):
+        session.traverse_objects(ROOT, max_depth=-1)
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        session.traverse_objects(ROOT, max_concurrency=0)
+
+
+UNIT_IDS = {"MW": uuid.uuid4(), "m3/s": uuid.uuid4()}
+
+
+class FakeProvisioningService(FakeService):
+    """Model, model definition and time series services creating physical
+    time series and connecting them to attributes."""
+
+    METHODS = ("CreatePhysicalTimeseries", "UpdateTimeseriesAttribute")
+
+    def __init__(self, failing_name=None, failing_target=None):
+        super().__init__()
+        self.failing_name = failing_name
+        self.failing_target = failing_target
+        self.list_units_count = 0
+        self.created = []
+        self.connected = []
+
+    def ListUnitsOfMeasurement(self, request):
+        self.list_units_count += 1
+        return model_definition_pb2.ListUnitsOfMeasurementResponse(
+            units_of_measurement=[
+                model_definition_resources_pb2.UnitOfMeasurement(
+                    id=_to_proto_guid(id), name=name
+                )
+                for name, id in UNIT_IDS.items()
+            ]
+        )
+
+    def _complete(self, request):
+        super()._complete(request)
+        if isinstance(request, model_pb2.UpdateTimeseriesAttributeRequest):
+            if request.attribute_id.path == self.failing_target:
+                raise grpc.RpcError()
+            self.connected.append(
+                (request.attribute_id.path, request.new_timeseries_resource_key)
+            )
+            return None
+
+        if request.name == self.failing_name:
+            raise grpc.RpcError()
+        self.created.append(request)
+        return time_series_pb2.TimeseriesResource(
+            timeseries_key=1000 + len(self.created),
+            path=f"Resource{request.path}{request.name}",
+        )
+
+
+class FakeAsyncProvisioningService(FakeAsyncService, FakeProvisioningService):
+    async def ListUnitsOfMeasurement(self, request):
+        return super().ListUnitsOfMeasurement(request)
+
+
+def run_provision_physical_timeseries(session_class, service, table, **kwargs):
+    session = create_session(
+        session_class,
+        service,
+        model_definition_service=service,
+        time_series_service=service,
+    )
+    return run(session_class, session.provision_physical_timeseries(table, **kwargs))
+
+
+def physical_timeseries_table(count):
+    return pa.table(
+        {
+            "path": ["/Portfolio/"] * count,
+            "name": [f"Series{i}" for i in range(count)],
+            "curve_type": ["PIECEWISELINEAR"] * count,
+            "resolution": ["HOUR" if i % 2 else "DAY" for i in range(count)],
+            "unit_of_measurement": ["MW" if i % 2 else "m3/s" for i in range(count)],
+            "time_zone": [None if i % 2 else "Europe/Oslo" for i in range(count)],
+            "target": [
+                f"Model/Object{i}.Series" if i % 3 else None for i in range(count)
+            ],
+        }
+    )
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_provision_physical_timeseries(session_class, max_concurrency):
+    service = create_fake_service(
+        session_class,
+        FakeProvisioningService,
+        FakeAsyncProvisioningService,
+        failing_name="Series4",
+        failing_target="Model/Object5.Series",
+    )
+    result = run_provision_physical_timeseries(
+        session_class,
+        service,
+        physical_timeseries_table(10),
+        max_concurrency=max_concurrency,
+    )
+
+    # units are listed once
+    assert service.list_units_count == 1
+    assert service.max_in_flight == max_concurrency
+    assert [request.name for request in service.created] == [
+        f"Series{i}" for i in range(10) if i != 4
+    ]
+    request = service.created[0]
+    assert request.unit_of_measurement_id == _to_proto_guid(UNIT_IDS["m3/s"])
+    assert request.time_zone == "Europe/Oslo"
+    assert request.resolution.type == request.resolution.DAY
+
+    keys = result.column("timeseries_key").to_pylist()
+    assert keys[4] is None
+    assert result.column("path").to_pylist()[:2] == [
+        "Resource/Portfolio/Series0",
+        "Resource/Portfolio/Series1",
+    ]
+    errors = result.column("error").to_pylist()
+    assert [i for i, error in enumerate(errors) if error is not None] == [4, 5]
+
+    # series 4 was not created, series 5 was not connected
+    assert sorted(service.connected) == sorted(
+        (f"Model/Object{i}.Series", keys[i]) for i in (1, 2, 7, 8)
+    )
+
+
+@pytest.mark.unittest
+def test_provision_physical_timeseries_with_invalid_table():
+    table = physical_timeseries_table(2)
+    service = FakeProvisioningService()
+
+    with pytest.raises(ValueError, match="missing columns: resolution"):
+        run_provision_physical_timeseries(
+            Connection.Session, service, table.drop(["resolution"])
+        )
+    with pytest.raises(ValueError, match="invalid Timeseries.Curve 'LINEAR'"):
+        run_provision_physical_timeseries(
+            Connection.Session,
+            service,
+            table.set_column(2, "curve_type", pa.array(["LINEAR", "STAIRCASE"])),
+        )
+    with pytest.raises(ValueError, match="invalid unit of measurement"):
+        run_provision_physical_timeseries(
+            Connection.Session,
+            service,
+            table.set_column(4, "unit_of_measurement", pa.array(["kW", "kW"])),
+        )
+    assert service.created == []
+
+
+class FakeCopyService(FakeService):
+    """Time series service copying between objects, fails copying to
+    `failing_target`."""
+
+    METHODS = ("CopyTimeseriesBetweenObjects",)
+
+    def __init__(self, failing_target=None):
+        super().__init__()
+        self.failing_target = failing_target
+        self.sent = []
+
+    def _send(self, request):
+        super()._send(request)
+        self.sent.append(request.target.path)
+
+    def _complete(self, request):
+        super()._complete(request)
+        if request.target.path == self.failing_target:
+            raise grpc.RpcError()
+        return time_series_pb2.CopyTimeseriesBetweenObjectsResponse(
+            match_series_count=int(request.target.path.removeprefix("Model/Target"))
+        )
+
+
+class FakeAsyncCopyService(FakeAsyncService, FakeCopyService):
+    pass
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [Connection.Session, aio.Connection.Session])
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_copy_timeseries_between_object_pairs_is_pipelined(
+    session_class, max_concurrency
+):
+    pairs = [("Model/Base", f"Model/Target{i}") for i in range(10)]
+    start_time = datetime(2023, 1, 1)
+    end_time = datetime(2023, 1, 2)
+
+    service = create_fake_service(session_class, FakeCopyService, FakeAsyncCopyService)
+    session = create_session(session_class, time_series_service=service)
+    results = run(
+        session_class,
+        session.copy_timeseries_between_object_pairs(
+            pairs, start_time, end_time, max_concurrency=max_concurrency
+        ),
+    )
+    # results are in the order of pairs
+    assert [result.match_series_count for result in results] == list(range(10))
+    assert service.sent == [target for _, target in pairs]
+    assert service.max_in_flight == max_concurrency
+
+    # the first failure stops copying
+    service = create_fake_service(
+        session_class,
+        FakeCopyService,
+        FakeAsyncCopyService,
+        failing_target="Model/Target2",
+    )
+    session = create_session(session_class, time_series_service=service)
+    with pytest.raises(grpc.RpcError):
+        run(
+            session_class,
+            session.copy_timeseries_between_object_pairs(
+                pairs, start_time, end_time, max_concurrency=max_concurrency
+            ),
+        )
+    assert len(service.sent) < len(pairs)
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        run(
+            session_class,
+            session.copy_timeseries_between_object_pairs(pairs, max_concurrency=0),
+        )
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,505 @@
+"""
+Tests for volue.mesh.snapshot.
+"""
+
+import asyncio
+import sys
+import uuid
+from datetime import datetime
+from types import SimpleNamespace
+
+import grpc
+import pyarrow.parquet as pq
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+from volue.mesh._common import _to_proto_guid
+from volue.mesh.proto.model.v1alpha import model_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.type.resources_pb2 import Guid, MeshId, Resolution
+from volue.mesh.snapshot import (
+    AsyncModelChangeInterceptor,
+    ModelChangeInterceptor,
+    ModelChangeTracker,
+    ModelSnapshot,
+)
+
+from .test_utilities.utilities import (
+    FakeAsyncSession,
+    FakeSession,
+    attribute_id,
+    call_with_session,
+    link_value,
+    make_object,
+    make_proto_attribute,
+    ownership_value,
+    timeseries_value,
+    versioned_link_value,
+)
+
+MODEL_ID = uuid.uuid4()
+CHILDREN_ID = attribute_id("Model/Test.Children")
+FIRST_ID = uuid.uuid4()
+SECOND_ID = uuid.uuid4()
+THIRD_ID = uuid.uuid4()
+OUTSIDE_ID = uuid.uuid4()
+TIMESKEY = 1234
+
+
+def ownership(*target_ids):
+    return make_proto_attribute(
+        "Children",
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_OWNERSHIP_RELATION,
+        [ownership_value(target_id) for target_id in target_ids],
+    )
+
+
+def link(*target_ids):
+    return make_proto_attribute(
+        "Link",
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_LINK_RELATION,
+        [link_value(target_id) for target_id in target_ids],
+    )
+
+
+def versioned_link(*target_ids):
+    # None ends the period of the previous target
+    return make_proto_attribute(
+        "VersionedLink",
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_VERSIONED_LINK_RELATION,
+        [
+            versioned_link_value(
+                *(
+                    (datetime(2020, 1, 1, hours), target_id)
+                    for hours, target_id in enumerate(target_ids)
+                )
+            )
+        ],
+    )
+
+
+def timeseries(timeseries_key=None):
+    return make_proto_attribute(
+        "Series",
+        model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES,
+        (
+            [timeseries_value(timeseries_key, Resolution.HOUR)]
+            if timeseries_key is not None
+            else []
+        ),
+    )
+
+
+def get_test_objects():
+    return [
+        make_object(
+            MODEL_ID,
+            "Model/Test",
+            "ModelType",
+            attributes=[ownership(FIRST_ID, SECOND_ID)],
+        ),
+        make_object(
+            FIRST_ID,
+            "Model/Test/First",
+            "ElementType",
+            owner_id=CHILDREN_ID,
+            attributes=[link(SECOND_ID, OUTSIDE_ID), timeseries(TIMESKEY)],
+        ),
+        make_object(
+            SECOND_ID,
+            "Model/Test/Second",
+            "ElementType",
+            owner_id=CHILDREN_ID,
+            attributes=[timeseries(TIMESKEY)],
+        ),
+    ]
+
+
+@pytest.mark.unittest
+def test_lookups():
+    snapshot = ModelSnapshot.from_objects(get_test_objects())
+
+    assert len(snapshot) == 3
+    assert snapshot.attribute_count == 4
+    assert FIRST_ID in snapshot
+    assert "Model/Test/Second" in snapshot
+    assert OUTSIDE_ID not in snapshot
+
+    first = snapshot.get_object("Model/Test/First")
+    assert first.id == FIRST_ID
+    assert first.name == "First"
+    assert first.type_name == "ElementType"
+    assert first.owner_id == CHILDREN_ID
+    assert snapshot.get_object(FIRST_ID) == first
+
+    assert [object.id for object in snapshot.find_objects_by_type("ElementType")] == [
+        FIRST_ID,
+        SECOND_ID,
+    ]
+    assert snapshot.find_objects_by_type("Unknown") == []
+
+    attribute = snapshot.get_attribute("Model/Test/First.Series")
+    assert attribute.owner_id == FIRST_ID
+    assert attribute.attribute_type == "TimeseriesAttribute"
+    assert attribute.timeseries_key == TIMESKEY
+    assert snapshot.get_attribute(attribute.id) == attribute
+    assert {attribute.name for attribute in snapshot.get_attributes(first)} == {
+        "Link",
+        "Series",
+    }
+
+    with pytest.raises(KeyError):
+        snapshot.get_object(OUTSIDE_ID)
+    with pytest.raises(KeyError):
+        snapshot.get_attribute("Model/Test/First.Unknown")
+
+
+@pytest.mark.unittest
+def test_timeseries_key_index():
+    snapshot = ModelSnapshot.from_objects(get_test_objects())
+
+    assert [
+        attribute.path
+        for attribute in snapshot.find_attributes_by_timeseries_key(TIMESKEY)
+    ] == ["Model/Test/First.Series", "Model/Test/Second.Series"]
+    assert snapshot.find_attributes_by_timeseries_key(1) == []
+    assert snapshot.get_timeseries_keys() == {
+        TIMESKEY: ["Model/Test/First.Series", "Model/Test/Second.Series"]
+    }
+
+
+@pytest.mark.unittest
+def test_relations():
+    # children are added before their owner
+    snapshot = ModelSnapshot.from_objects(reversed(get_test_objects()))
+
+    assert snapshot.get_owner(FIRST_ID).id == MODEL_ID
+    assert snapshot.get_owner(MODEL_ID) is None
+    assert {object.id for object in snapshot.get_children(MODEL_ID)} == {
+        FIRST_ID,
+        SECOND_ID,
+    }
+    assert snapshot.get_children(FIRST_ID) == []
+
+    assert snapshot.get_link_targets(FIRST_ID) == [SECOND_ID, OUTSIDE_ID]
+    assert [object.id for object in snapshot.get_link_sources(SECOND_ID)] == [FIRST_ID]
+    assert snapshot.get_link_sources(FIRST_ID) == []
+
+
+@pytest.mark.unittest
+def test_versioned_link_relations():
+    objects = get_test_objects()
+    objects.append(
+        make_object(
+            THIRD_ID,
+            "Model/Test/Third",
+            "ElementType",
+            owner_id=CHILDREN_ID,
+            attributes=[versioned_link(FIRST_ID, None, OUTSIDE_ID, FIRST_ID)],
+        )
+    )
+    snapshot = ModelSnapshot.from_objects(objects)
+
+    attribute = snapshot.get_attribute("Model/Test/Third.VersionedLink")
+    assert attribute.attribute_type == "VersionedLinkRelationAttribute"
+    assert attribute.target_object_ids == (FIRST_ID, OUTSIDE_ID)
+    assert snapshot.get_link_targets(THIRD_ID) == [FIRST_ID, OUTSIDE_ID]
+    assert [object.id for object in snapshot.get_link_sources(FIRST_ID)] == [THIRD_ID]
+
+    _, attributes_table = snapshot.to_arrow()
+    row = attributes_table.column("path").to_pylist().index(attribute.path)
+    assert attributes_table.column("target_object_ids")[row].as_py() == [
+        str(FIRST_ID),
+        str(OUTSIDE_ID),
+    ]
+
+
+@pytest.mark.unittest
+def test_walk():
+    snapshot = ModelSnapshot.from_objects(get_test_objects())
+
+    assert [object.name for object in snapshot.walk()] == ["Test", "First", "Second"]
+    assert [object.name for object in snapshot.walk("Model/Test/Second")] == ["Second"]
+    assert [object.name for object in snapshot.walk(depth_first=False)] == [
+        "Test",
+        "First",
+        "Second",
+    ]
+
+
+@pytest.mark.unittest
+def test_load():
+    objects = get_test_objects()
+
+    # Mesh may return the start object as a part of the search result
+    session = FakeSession(objects, include_start=True)
+    snapshot = ModelSnapshot.load(session, "Model/Test", batch_size=2)
+    assert [object.id for object in snapshot] == [MODEL_ID, FIRST_ID, SECOND_ID]
+
+    snapshot = asyncio.run(
+        ModelSnapshot.load_async(
+            FakeAsyncSession(objects, include_start=True), "Model/Test", batch_size=2
+        )
+    )
+    assert [object.id for object in snapshot] == [MODEL_ID, FIRST_ID, SECOND_ID]
+
+
+@pytest.mark.unittest
+def test_arrow_and_parquet_export(tmp_path):
+    snapshot = ModelSnapshot.from_objects(get_test_objects())
+    objects_table, attributes_table = snapshot.to_arrow()
+
+    assert objects_table.num_rows == 3
+    assert objects_table.column("owner_object_id").to_pylist() == [
+        None,
+        str(MODEL_ID),
+        str(MODEL_ID),
+    ]
+    assert attributes_table.num_rows == 4
+    rows = {row["path"]: row for row in attributes_table.to_pylist()}
+    assert rows["Model/Test/First.Link"]["target_object_ids"] == [
+        str(SECOND_ID),
+        str(OUTSIDE_ID),
+    ]
+    assert rows["Model/Test/First.Link"]["timeseries_key"] is None
+    assert rows["Model/Test/Second.Series"]["timeseries_key"] == TIMESKEY
+    assert rows["Model/Test/Second.Series"]["owner_id"] == str(SECOND_ID)
+
+    snapshot.to_parquet(tmp_path / "objects.parquet", tmp_path / "attributes.parquet")
+    assert pq.read_table(tmp_path / "objects.parquet").equals(objects_table)
+    assert pq.read_table(tmp_path / "attributes.parquet").equals(attributes_table)
+
+
+def refresh(snapshot, session, **kwargs):
+    return call_with_session(
+        snapshot.refresh, snapshot.refresh_async, session, "Model/Test", **kwargs
+    )
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("session_class", [FakeSession, FakeAsyncSession])
+def test_refresh(session_class):
+    objects = get_test_objects()
+    snapshot = ModelSnapshot.from_objects(objects)
+
+    session = session_class(objects)
+    assert refresh(snapshot, session, batch_size=2) is snapshot
+    assert session.read == []
+
+    # Second is removed, Third is added and the time series of First changed
+    objects = [
+        make_object(
+            MODEL_ID,
+            "Model/Test",
+            "ModelType",
+            attributes=[ownership(FIRST_ID, THIRD_ID)],
+        ),
+        make_object(
+            FIRST_ID,
+            "Model/Test/First",
+            "ElementType",
+            owner_id=CHILDREN_ID,
+            attributes=[link(SECOND_ID, OUTSIDE_ID), timeseries(1)],
+        ),
+        make_object(THIRD_ID, "Model/Test/Third", "ElementType", owner_id=CHILDREN_ID),
+    ]
+    session = session_class(objects)
+    refreshed = refresh(
+        snapshot,
+        session,
+        modified_attributes=["Model/Test/First.Series", uuid.uuid4()],
+        batch_size=2,
+    )
+
+    # only the changed objects and the owner of added and removed ones are read
+    assert sorted(session.read) == sorted([MODEL_ID, FIRST_ID, THIRD_ID])
+    assert [object.id for object in refreshed] == [MODEL_ID, FIRST_ID, THIRD_ID]
+    assert SECOND_ID not in refreshed
+    assert [object.id for object in refreshed.get_children(MODEL_ID)] == [
+        FIRST_ID,
+        THIRD_ID,
+    ]
+    assert refreshed.get_attribute("Model/Test/First.Series").timeseries_key == 1
+    assert refreshed.find_attributes_by_timeseries_key(TIMESKEY) == []
+    # the old snapshot is not changed
+    assert SECOND_ID in snapshot
+
+    # renamed objects are read again, unchanged objects are copied
+    objects[2] = make_object(
+        THIRD_ID, "Model/Test/Renamed", "ElementType", owner_id=CHILDREN_ID
+    )
+    session = session_class(objects)
+    renamed = refresh(refreshed, session, batch_size=2)
+    assert THIRD_ID in session.read
+    assert FIRST_ID not in session.read
+    assert renamed.get_object(THIRD_ID).path == "Model/Test/Renamed"
+    assert "Model/Test/Third" not in renamed
+    assert renamed.get_attribute("Model/Test/First.Series").timeseries_key == 1
+
+
+def session_id(value):
+    return Guid(bytes_le=bytes([value]) * 16)
+
+
+UPDATE_METHOD = "/volue.mesh.grpc.model.v1alpha.ModelService/UpdateTimeseriesAttribute"
+SESSION_SERVICE = "/volue.mesh.grpc.session.v1alpha.SessionService"
+
+# method, request and whether the call succeeds
+CALLS = [
+    (f"{SESSION_SERVICE}/StartSession", Empty(), True),
+    (
+        UPDATE_METHOD,
+        model_pb2.UpdateTimeseriesAttributeRequest(
+            session_id=session_id(1),
+            attribute_id=MeshId(path="Model/Test/First.Series"),
+        ),
+        True,
+    ),
+    (
+        "/volue.mesh.grpc.model.v1alpha.ModelService/UpdateLinkRelationAttribute",
+        model_pb2.UpdateLinkRelationAttributeRequest(
+            session_id=session_id(2), attribute=MeshId(id=_to_proto_guid(CHILDREN_ID))
+        ),
+        True,
+    ),
+    (
+        UPDATE_METHOD,
+        model_pb2.UpdateTimeseriesAttributeRequest(
+            session_id=session_id(1), attribute_id=MeshId(path="Model/Test/Failed")
+        ),
+        False,
+    ),
+    (
+        "/volue.mesh.grpc.model.v1alpha.ModelService/UpdateSimpleAttribute",
+        model_pb2.UpdateSimpleAttributeRequest(
+            session_id=session_id(1), attribute_id=MeshId(path="Model/Test.Simple")
+        ),
+        True,
+    ),
+    (
+        "/volue.mesh.grpc.model.v1alpha.ModelService/UpdateVersionedLinkRelationAttribute",
+        model_pb2.UpdateVersionedLinkRelationAttributeRequest(
+            session_id=session_id(1), attribute=MeshId(path="Model/Test/First.Link")
+        ),
+        True,
+    ),
+    (
+        UPDATE_METHOD,
+        model_pb2.UpdateTimeseriesAttributeRequest(
+            session_id=session_id(3), attribute_id=MeshId(path="Model/Test/Expired")
+        ),
+        True,
+    ),
+    (f"{SESSION_SERVICE}/ExtendSession", session_id(3), False),
+    (f"{SESSION_SERVICE}/Rollback", session_id(2), True),
+    (f"{SESSION_SERVICE}/Commit", session_id(1), True),
+]
+
+
+class FakeCall:
+    def __init__(self, succeeded):
+        self.succeeded = succeeded
+
+    def code(self):
+        return grpc.StatusCode.OK if self.succeeded else grpc.StatusCode.INTERNAL
+
+    def add_done_callback(self, callback):
+        callback(self)
+
+
+class FakeAsyncCall(FakeCall):
+    async def code(self):
+        return super().code()
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("use_async", [False, True])
+def test_model_change_tracker(use_async):
+    tracker = ModelChangeTracker()
+
+    if use_async:
+        interceptor = AsyncModelChangeInterceptor(tracker)
+
+        async def call_all():
+            for method, request, succeeded in CALLS:
+
+                async def continuation(details, request):
+                    return FakeAsyncCall(succeeded)
+
+                await interceptor.intercept_unary_unary(
+                    continuation, SimpleNamespace(method=method.encode()), request
+                )
+
+        asyncio.run(call_all())
+    else:
+        interceptor = ModelChangeInterceptor(tracker)
+        for method, request, succeeded in CALLS:
+            interceptor.intercept_unary_unary(
+                lambda details, request: FakeCall(succeeded),
+                SimpleNamespace(method=method),
+                request,
+            )
+
+    # only successful updates of committed sessions are tracked
+    assert tracker.pop_modified_attributes() == [
+        "Model/Test/First.Series",
+        "Model/Test/First.Link",
+    ]
+    assert tracker.pop_modified_attributes() == []
+    # updates of the expired session are dropped
+    assert tracker._pending == {}
+
+
+@pytest.mark.unittest
+def test_model_change_tracker_drops_idle_sessions(monkeypatch):
+    tracker = ModelChangeTracker(max_idle_time=300)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    ok = grpc.StatusCode.OK
+
+    def update(session, path):
+        request = model_pb2.UpdateTimeseriesAttributeRequest(
+            session_id=session_id(session), attribute_id=MeshId(path=path)
+        )
+        tracker._on_done(UPDATE_METHOD, request, ok)
+
+    update(1, "Model/Test/Idle")
+    update(2, "Model/Test/Extended")
+    now += 200
+    tracker._on_done(f"{SESSION_SERVICE}/ExtendSession", session_id(2), ok)
+    now += 200
+    update(3, "Model/Test/New")
+    assert set(tracker._pending) == {session_id(2).bytes_le, session_id(3).bytes_le}
+
+    for session in (1, 2, 3):
+        tracker._on_done(f"{SESSION_SERVICE}/Commit", session_id(session), ok)
+    assert tracker.pop_modified_attributes() == [
+        "Model/Test/Extended",
+        "Model/Test/New",
+    ]
+
+
+@pytest.mark.database
+def test_refresh_model(session):
+    model = "Model/SimpleThermalTestModel"
+    snapshot = ModelSnapshot.load(session, model)
+    assert snapshot.refresh(session, model) is snapshot
+
+    owner_attribute = snapshot.get_attribute(
+        f"{model}/ThermalComponent.ThermalPowerToPlantRef"
+    )
+    new_object = session.create_object(owner_attribute.path, "RefreshedObject")
+    refreshed = snapshot.refresh(session, model)
+
+    assert len(refreshed) == len(snapshot) + 1
+    assert refreshed.get_object(new_object.id).path == new_object.path
+    assert (
+        new_object.id in refreshed.get_attribute(owner_attribute.id).target_object_ids
+    )
+    assert new_object.id not in snapshot
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
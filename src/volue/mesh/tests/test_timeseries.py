@@ -13,7 +13,12 @@ import pyarrow as pa
 import pytest
 from dateutil import tz
 
-from volue.mesh import Timeseries
+from volue.mesh import (
+    AttributeMapping,
+    CopyTimeseriesResult,
+    Timeseries,
+    TypeAttributeMapping,
+)
 from volue.mesh._common import _to_proto_guid, _to_proto_timeseries
 from volue.mesh.proto.time_series.v1alpha import time_series_pb2
 from volue.mesh.proto.type import resources_pb2
@@ -411,6 +416,50 @@ def test_write_timeseries_points(session):
         session.rollback()
 
 
+@pytest.mark.database
+def test_copy_timeseries_between_objects(session):
+    """
+    Check that time series points are copied on the server, both in a dry run
+    without interval and with interval.
+    """
+    object_path = TIME_SERIES_ATTRIBUTE_WITH_PHYSICAL_TIME_SERIES_PATH.rpartition(".")[
+        0
+    ]
+    mappings = [
+        TypeAttributeMapping(
+            attribute_mappings=[
+                AttributeMapping("TsRawAtt", target_attribute_name="TsRawAtt")
+            ]
+        )
+    ]
+
+    dry_run_result = session.copy_timeseries_between_objects(
+        object_path, object_path, mappings=mappings
+    )
+    assert isinstance(dry_run_result, CopyTimeseriesResult)
+    assert dry_run_result.source_series_count >= 1
+
+    results = session.copy_timeseries_between_object_pairs(
+        [(object_path, object_path)],
+        TIME_SERIES_START_TIME,
+        TIME_SERIES_END_TIME,
+        mappings=mappings,
+    )
+    assert results == [dry_run_result]
+
+    reply_timeseries = session.read_timeseries_points(
+        TIME_SERIES_ATTRIBUTE_WITH_PHYSICAL_TIME_SERIES_PATH,
+        TIME_SERIES_START_TIME,
+        TIME_SERIES_END_TIME,
+    )
+    verify_physical_timeseries(reply_timeseries)
+
+    with pytest.raises(ValueError, match="start_time and end_time"):
+        session.copy_timeseries_between_objects(
+            object_path, object_path, start_time=TIME_SERIES_START_TIME
+        )
+
+
 @pytest.mark.database
 def test_write_one_timeseries_point(session):
     """
@@ -0,0 +1,170 @@
+"""
+Tests for volue.mesh.timeseries_duplicates.
+"""
+
+import asyncio
+import sys
+import uuid
+
+import pyarrow.parquet as pq
+import pytest
+
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.snapshot import ModelSnapshot
+from volue.mesh.timeseries_duplicates import (
+    TIMESERIES_KEY_FIELDS,
+    DuplicatedTimeseries,
+    TimeseriesKeyAudit,
+)
+
+from .test_utilities.utilities import (
+    FakeAsyncSession,
+    FakeSession,
+    make_object,
+    make_proto_attribute,
+    timeseries_value,
+)
+
+
+def timeseries(timeseries_key=None):
+    return timeseries_value(timeseries_key, expression="## = 1")
+
+
+def make_test_object(path, **attributes):
+    # value types are not requested when searching for time series keys
+    return make_object(
+        uuid.uuid4(),
+        path,
+        attributes=[
+            make_proto_attribute(name, values=[value])
+            for name, value in attributes.items()
+        ],
+    )
+
+
+MODELS = {
+    "First": [
+        make_test_object("Model/First"),
+        make_test_object("Model/First/A", Inflow=timeseries(1), Calc=timeseries()),
+        make_test_object(
+            "Model/First/B",
+            Inflow=timeseries(1),
+            Outflow=timeseries(2),
+            Height=model_resources_pb2.AttributeValue(double_value=1.0),
+        ),
+    ],
+    "Second": [
+        make_test_object("Model/Second/C", Inflow=timeseries(2), Outflow=timeseries(3)),
+    ],
+}
+
+
+def create_session(session_class=FakeSession):
+    return session_class([object for model in MODELS.values() for object in model])
+
+
+EXPECTED_DUPLICATES = [
+    DuplicatedTimeseries(
+        1, ("Model/First/A.Inflow", "Model/First/B.Inflow"), ("First",)
+    ),
+    DuplicatedTimeseries(
+        2, ("Model/First/B.Outflow", "Model/Second/C.Inflow"), ("First", "Second")
+    ),
+]
+
+
+@pytest.mark.unittest
+@pytest.mark.parametrize("use_async", [False, True])
+def test_find_duplicates(use_async):
+    audit = TimeseriesKeyAudit()
+    assert audit.find_duplicates() == []
+
+    if use_async:
+        session = create_session(FakeAsyncSession)
+
+        async def add_models():
+            await asyncio.gather(
+                audit.add_model_async(session, "Model/First", batch_size=2),
+                audit.add_model_async(session, "Model/Second", batch_size=2),
+            )
+
+        asyncio.run(add_models())
+    else:
+        session = create_session()
+        audit.add_model(session, "Model/First", batch_size=2)
+        audit.add_model(session, "Model/Second", batch_size=2)
+
+    # only time series keys are requested
+    assert session.requests[0] == ("Model/First", "{*}", TIMESERIES_KEY_FIELDS)
+    assert sorted(audit.models) == ["First", "Second"]
+    assert len(audit) == 5
+
+    duplicates = audit.find_duplicates()
+    assert duplicates == EXPECTED_DUPLICATES
+    assert [duplicate.shared_across_models for duplicate in duplicates] == [
+        False,
+        True,
+    ]
+
+    # crawling a model again replaces its keys
+    MODELS["Second"].append(make_test_object("Model/Second/D", Inflow=timeseries(3)))
+    try:
+        audit.add_model(create_session(), "Model/Second", batch_size=2)
+    finally:
+        MODELS["Second"].pop()
+    assert len(audit) == 6
+    assert [duplicate.timeseries_key for duplicate in audit.find_duplicates()] == [
+        1,
+        2,
+        3,
+    ]
+
+    audit.remove_model("Second")
+    assert [duplicate.timeseries_key for duplicate in audit.find_duplicates()] == [1]
+
+
+@pytest.mark.unittest
+def test_snapshots_and_parquet(tmp_path):
+    audit = TimeseriesKeyAudit()
+    audit.add_snapshot("First", ModelSnapshot.from_objects(MODELS["First"]))
+
+    # attributes table of a saved snapshot
+    snapshot = ModelSnapshot.from_objects(MODELS["Second"])
+    snapshot.to_parquet(tmp_path / "objects.parquet", tmp_path / "attributes.parquet")
+    audit.add_snapshot("Second", pq.read_table(tmp_path / "attributes.parquet"))
+    assert audit.find_duplicates() == EXPECTED_DUPLICATES
+
+    audit.to_parquet(tmp_path / "audit.parquet")
+    loaded = TimeseriesKeyAudit.from_parquet(tmp_path / "audit.parquet")
+    assert sorted(loaded.models) == ["First", "Second"]
+    assert (
+        loaded.to_table()
+        .sort_by("attribute_path")
+        .equals(audit.to_table().sort_by("attribute_path"))
+    )
+    assert loaded.find_duplicates() == EXPECTED_DUPLICATES
+
+
+@pytest.mark.database
+def test_find_duplicates_in_model(session):
+    model = "Model/SimpleThermalTestModel"
+    expected = {}
+    for object in session.search_for_objects(model, "{*}"):
+        for attribute in object.attributes.values():
+            resource = getattr(attribute, "time_series_resource", None)
+            if resource is not None:
+                expected.setdefault(resource.timeseries_key, []).append(attribute.path)
+
+    audit = TimeseriesKeyAudit()
+    audit.add_model(session, model)
+
+    assert audit.models == ["SimpleThermalTestModel"]
+    assert len(audit) == sum(map(len, expected.values()))
+    assert {
+        duplicate.timeseries_key: sorted(duplicate.attribute_paths)
+        for duplicate in audit.find_duplicates()
+    } == {key: sorted(paths) for key, paths in expected.items() if len(paths) > 1}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
@@ -0,0 +1,223 @@
+"""
+Tests for volue.mesh.timeseries_keys.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+
+import grpc
+import pytest
+
+from volue.mesh import Timeseries
+from volue.mesh._attribute import _from_proto_attribute
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
+from volue.mesh.proto.type.resources_pb2 import Resolution
+from volue.mesh.timeseries_keys import DEFAULT_MAX_AGE, TimeseriesKeyResolver
+
+from .test_utilities.utilities import (
+    FakeRpcError,
+    make_proto_attribute,
+    timeseries_value,
+)
+
+OWNER_PATH = "Model/Test/Object"
+START_TIME = datetime(2023, 1, 1)
+END_TIME = datetime(2023, 1, 2)
+
+
+def make_attribute(name, timeseries_key=None, resolution=Resolution.HOUR):
+    values = []
+    if timeseries_key is not None:
+        values.append(timeseries_value(timeseries_key, resolution))
+    return _from_proto_attribute(
+        make_proto_attribute(
+            name,
+            model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_TIMESERIES,
+            values,
+            owner_path=OWNER_PATH,
+        )
+    )
+
+
+class FakeSession:
+    """Serves attributes by path and time series by key."""
+
+    def __init__(self, *attributes):
+        self.attributes = {attribute.path: attribute for attribute in attributes}
+        self.resolutions = {
+            attribute.time_series_resource.timeseries_key: attribute.time_series_resource.resolution
+            for attribute in attributes
+            if attribute.time_series_resource is not None
+        }
+        self.get_attribute_calls = []
+        self.read_calls = []
+
+    def get_attribute(self, target):
+        self.get_attribute_calls.append(target)
+        if not isinstance(target, str):
+            target = target.path
+        return self.attributes[target]
+
+    def get_attributes(self, targets, max_concurrency):
+        self.max_concurrency = max_concurrency
+        return [self.get_attribute(target) for target in targets]
+
+    def iter_attributes(self, target, query, attribute_fields=None):
+        yield from self.attributes.values()
+
+    def read_timeseries_points(self, target, start_time, end_time):
+        self.read_calls.append(target)
+        if target not in self.resolutions:
+            raise FakeRpcError(grpc.StatusCode.NOT_FOUND)
+        return Timeseries(
+            resolution=self.resolutions[target],
+            start_time=start_time,
+            end_time=end_time,
+            timskey=target,
+        )
+
+
+class FakeAsyncSession(FakeSession):
+    async def get_attribute(self, target):
+        return super().get_attribute(target)
+
+    async def get_attributes(self, targets, max_concurrency):
+        return super().get_attributes(targets, max_concurrency)
+
+    async def iter_attributes(self, target, query, attribute_fields=None):
+        for attribute in super().iter_attributes(target, query, attribute_fields):
+            yield attribute
+
+    async def read_timeseries_points(self, target, start_time, end_time):
+        return super().read_timeseries_points(target, start_time, end_time)
+
+
+@pytest.mark.unittest
+def test_resolve_search():
+    session = FakeSession(make_attribute("A", 1), make_attribute("Calc"))
+    resolver = TimeseriesKeyResolver()
+
+    resolved = resolver.resolve_search(session, "Model/Test", "{*}.A")
+    assert [mapping.timeseries_key for mapping in resolved] == [1]
+    assert resolved[0].resolution == Timeseries.Resolution.HOUR
+    assert resolver.resolved_count == 1
+    assert len(resolver) == 1
+    assert f"{OWNER_PATH}.A" in resolver
+    assert resolved[0].attribute_id in resolver
+    assert f"{OWNER_PATH}.Calc" not in resolver
+
+    timeseries = resolver.read_timeseries_points(
+        session, [f"{OWNER_PATH}.A"], START_TIME, END_TIME
+    )
+    assert [ts.timskey for ts in timeseries] == [1]
+    assert session.get_attribute_calls == []
+    assert session.read_calls == [1]
+
+
+@pytest.mark.unittest
+def test_resolve_targets():
+    first, second = make_attribute("A", 1), make_attribute("B", 2)
+    session = FakeSession(first, second, make_attribute("Calc"))
+    resolver = TimeseriesKeyResolver()
+
+    resolved = resolver.resolve(session, [f"{OWNER_PATH}.A", second], max_concurrency=4)
+    assert [mapping.timeseries_key for mapping in resolved] == [1, 2]
+    assert session.max_concurrency == 4
+    # attribute instances are resolved without calling Mesh
+    assert session.get_attribute_calls == [f"{OWNER_PATH}.A"]
+    assert resolver.resolved_count == 1
+
+    resolver.resolve(session, [first.id, f"{OWNER_PATH}.B"])
+    assert len(session.get_attribute_calls) == 1
+
+    with pytest.raises(ValueError):
+        resolver.resolve(session, [f"{OWNER_PATH}.Calc"])
+
+    resolver.invalidate(first)
+    assert f"{OWNER_PATH}.A" not in resolver
+    assert second.id in resolver
+    resolver.invalidate()
+    assert len(resolver) == 0
+
+
+@pytest.mark.unittest
+def test_mappings_expire(monkeypatch):
+    session = FakeSession(make_attribute("A", 1))
+    resolver = TimeseriesKeyResolver(max_age=10)
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+
+    resolver.resolve(session, [f"{OWNER_PATH}.A"])
+    assert f"{OWNER_PATH}.A" in resolver
+    now += 11
+    assert f"{OWNER_PATH}.A" not in resolver
+    resolver.resolve(session, [f"{OWNER_PATH}.A"])
+    assert resolver.resolved_count == 2
+
+
+@pytest.mark.unittest
+def test_stale_key_is_resolved_again():
+    resolver = TimeseriesKeyResolver()
+    resolver.resolve(FakeSession(make_attribute("A", 1)), [f"{OWNER_PATH}.A"])
+
+    # attribute connected to another time series, the old one is deleted
+    session = FakeSession(make_attribute("A", 2))
+    timeseries = resolver.read_timeseries_points(
+        session, [f"{OWNER_PATH}.A"], START_TIME, END_TIME
+    )
+    assert timeseries[0].timskey == 2
+    assert session.read_calls == [1, 2]
+    assert resolver.stale_count == 1
+    assert resolver.get(f"{OWNER_PATH}.A").timeseries_key == 2
+
+
+@pytest.mark.unittest
+def test_same_resolution_relink_is_resolved_after_max_age(monkeypatch):
+    resolver = TimeseriesKeyResolver()
+    assert resolver.max_age == DEFAULT_MAX_AGE
+    now = 1000.0
+    monkeypatch.setattr("time.monotonic", lambda: now)
+    resolver.resolve(FakeSession(make_attribute("A", 1)), [f"{OWNER_PATH}.A"])
+
+    # attribute connected to another existing time series with the same
+    # resolution, not detected until the mapping expires
+    session = FakeSession(make_attribute("A", 2), make_attribute("B", 1))
+    timeseries = resolver.read_timeseries_points(
+        session, [f"{OWNER_PATH}.A"], START_TIME, END_TIME
+    )
+    assert timeseries[0].timskey == 1
+
+    now += DEFAULT_MAX_AGE + 1
+    timeseries = resolver.read_timeseries_points(
+        session, [f"{OWNER_PATH}.A"], START_TIME, END_TIME
+    )
+    assert timeseries[0].timskey == 2
+    assert session.get_attribute_calls == [f"{OWNER_PATH}.A"]
+
+
+@pytest.mark.unittest
+def test_stale_resolution_is_resolved_again_async():
+    resolver = TimeseriesKeyResolver()
+    session = FakeAsyncSession(make_attribute("A", 1), make_attribute("B", 2))
+    asyncio.run(resolver.resolve_search_async(session, "Model/Test", "{*}.TsAtt"))
+    assert len(resolver) == 2
+
+    # A is connected to the time series of B, its old key has new resolution
+    session = FakeAsyncSession(make_attribute("A", 2), make_attribute("B", 2))
+    session.resolutions[1] = Timeseries.Resolution.DAY
+    timeseries = asyncio.run(
+        resolver.read_timeseries_points_async(
+            session, [f"{OWNER_PATH}.A", f"{OWNER_PATH}.B"], START_TIME, END_TIME
+        )
+    )
+    assert [ts.timskey for ts in timeseries] == [2, 2]
+    assert sorted(session.read_calls) == [1, 2, 2]
+    assert session.get_attribute_calls == [f"{OWNER_PATH}.A"]
+    assert resolver.stale_count == 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(sys.argv))
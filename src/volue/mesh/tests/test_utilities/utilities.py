@@ -2,9 +2,17 @@
 Utility functions used by tests
 """
 
+import asyncio
 import uuid
 
-from volue.mesh import AttributeBase, Object
+import grpc
+
+from volue.mesh import AttributeBase, Object, TraversalNode, aio
+from volue.mesh._common import _datetime_to_timestamp_pb2, _to_proto_guid
+from volue.mesh.proto.model.v1alpha import resources_pb2 as model_resources_pb2
+from volue.mesh.proto.model_definition.v1alpha import (
+    resources_pb2 as model_definition_resources_pb2,
+)
 
 CHIMNEY_1_ID = uuid.UUID("0000000A-0004-0000-0000-000000000000")
 CHIMNEY_2_ID = uuid.UUID("0000000A-0005-0000-0000-000000000000")
@@ -54,3 +62,234 @@ class AttributeDefinitionForTesting(AttributeBase.AttributeBaseDefinition):
     def __init__(self):
         self.id = uuid.uuid4()
         self.path = "test_attribute_definition_path"
+
+
+class FakeRpcError(grpc.RpcError, grpc.Call):
+    """gRPC error with a status code, like errors raised by gRPC calls."""
+
+    def __init__(self, code=grpc.StatusCode.UNAVAILABLE):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+SESSION_SERVICES = (
+    "calc_service",
+    "hydsim_service",
+    "model_service",
+    "model_definition_service",
+    "session_service",
+    "time_series_service",
+    "availability_service",
+)
+
+
+def create_session(session_class, model_service=None, **services):
+    """Create a session with the given fake services, other services are
+    not set."""
+    kwargs = dict.fromkeys(SESSION_SERVICES)
+    if session_class is aio.Connection.Session:
+        kwargs["config_service"] = None
+    kwargs.update(services, model_service=model_service)
+    return session_class(session_id=uuid.uuid4(), **kwargs)
+
+
+def run(session_class, result):
+    """Wait for the result of an asynchronous session method."""
+    if session_class is aio.Connection.Session:
+        return asyncio.run(result)
+    return result
+
+
+def attribute_id(path):
+    """ID of the attribute with the given path built by `make_proto_attribute`."""
+    return uuid.uuid5(uuid.NAMESPACE_URL, path)
+
+
+def make_proto_attribute(
+    name,
+    value_type=model_definition_resources_pb2.ATTRIBUTE_VALUE_TYPE_UNSPECIFIED,
+    values=(),
+    owner_path=None,
+    owner_id=None,
+    collection=False,
+):
+    """Protobuf attribute as returned by Mesh.
+
+    Path, ID and owner are set only with `owner_path`, attributes passed to
+    `make_proto_object` get them from the object.
+    """
+    proto_attribute = model_resources_pb2.Attribute(
+        name=name,
+        value_type=value_type,
+        value_type_collection=collection,
+        values=values,
+    )
+    if owner_path is not None:
+        _set_owner(proto_attribute, owner_path, owner_id)
+    return proto_attribute
+
+
+def _set_owner(proto_attribute, owner_path, owner_id):
+    proto_attribute.path = f"{owner_path}.{proto_attribute.name}"
+    proto_attribute.id.CopyFrom(_to_proto_guid(attribute_id(proto_attribute.path)))
+    proto_attribute.owner_id.path = owner_path
+    if owner_id is not None:
+        proto_attribute.owner_id.id.CopyFrom(_to_proto_guid(owner_id))
+
+
+def make_proto_object(id, path, type_name="", owner_id=None, attributes=()):
+    """Protobuf object as returned by Mesh, with attributes built by
+    `make_proto_attribute`. `owner_id` is the ID of the owning ownership
+    relation attribute."""
+    proto_object = model_resources_pb2.Object(
+        id=_to_proto_guid(id),
+        path=path,
+        name=path.rpartition("/")[2],
+        type_name=type_name,
+    )
+    if owner_id is not None:
+        proto_object.owner_id.id.CopyFrom(_to_proto_guid(owner_id))
+    for attribute in attributes:
+        proto_attribute = proto_object.attributes.add()
+        proto_attribute.CopyFrom(attribute)
+        _set_owner(proto_attribute, path, id)
+    return proto_object
+
+
+def make_object(*args, **kwargs):
+    """Object as streamed by `iter_objects`, see `make_proto_object`."""
+    return Object._from_proto_object(make_proto_object(*args, **kwargs), lazy=True)
+
+
+def timeseries_value(timeseries_key=None, resolution=None, expression=""):
+    """Value of a time series attribute, connected to a time series resource
+    if `timeseries_key` is set."""
+    value = model_resources_pb2.TimeseriesAttributeValue(expression=expression)
+    if timeseries_key is not None:
+        value.time_series_resource.timeseries_key = timeseries_key
+        if resolution is not None:
+            value.time_series_resource.resolution.type = resolution
+    return model_resources_pb2.AttributeValue(timeseries_value=value)
+
+
+def ownership_value(target_object_id):
+    return model_resources_pb2.AttributeValue(
+        ownership_relation_value=model_resources_pb2.OwnershipRelationAttributeValue(
+            target_object_id=_to_proto_guid(target_object_id)
+        )
+    )
+
+
+def link_value(target_object_id):
+    return model_resources_pb2.AttributeValue(
+        link_relation_value=model_resources_pb2.LinkRelationAttributeValue(
+            target_object_id=_to_proto_guid(target_object_id)
+        )
+    )
+
+
+def versioned_link_value(*versions):
+    """Value of a versioned link relation attribute from `(valid_from_time,
+    target_object_id)` pairs, `None` target ends the previous period."""
+    value = model_resources_pb2.VersionedLinkRelationAttributeValue()
+    for valid_from_time, target_object_id in versions:
+        version = value.versions.add()
+        version.valid_from_time.CopyFrom(_datetime_to_timestamp_pb2(valid_from_time))
+        if target_object_id is not None:
+            version.target_object_id.CopyFrom(_to_proto_guid(target_object_id))
+    return model_resources_pb2.AttributeValue(versioned_link_relation_value=value)
+
+
+class FakeSession:
+    """Session over objects of a model, found by ID or path. Records searches
+    and IDs of objects read with attributes.
+
+    Args:
+        objects: Objects of the model, e.g. built by `make_object`.
+        include_start: If set, searches also return the start object, Mesh
+            may return it as a part of the search result.
+    """
+
+    def __init__(self, objects, include_start=False):
+        self.objects = {object.id: object for object in objects}
+        self.include_start = include_start
+        self.requests = []
+        self.read = []
+
+    def _find(self, target):
+        if isinstance(target, uuid.UUID):
+            return self.objects[target]
+        return next(o for o in self.objects.values() if o.path == target)
+
+    def _get_object(self, target, attributes_filter=None):
+        object = self._find(target)
+        if attributes_filter is None:
+            self.read.append(object.id)
+        return object
+
+    def get_object(self, target, attributes_filter=None):
+        return self._get_object(target, attributes_filter)
+
+    def traverse_objects(self, target, max_depth=None):
+        # only the start object is supported
+        assert max_depth == 0
+        yield TraversalNode(self._get_object(target), 0, None)
+
+    def iter_objects(
+        self,
+        target,
+        query,
+        batch_size=None,
+        attributes_filter=None,
+        attribute_fields=None,
+    ):
+        self.requests.append((target, query, attribute_fields))
+        # the start object itself does not need to exist
+        path = self._find(target).path if isinstance(target, uuid.UUID) else target
+        objects = [
+            object
+            for object in self.objects.values()
+            if object.path.startswith(path + "/")
+            or (self.include_start and object.path == path)
+        ]
+        if attributes_filter is None:
+            self.read.extend(object.id for object in objects)
+        batch_size = batch_size or max(len(objects), 1)
+        for i in range(0, len(objects), batch_size):
+            yield objects[i : i + batch_size]
+
+
+class FakeAsyncSession(FakeSession):
+    """Like `FakeSession`, but with coroutines and asynchronous iterators
+    like :py:mod:`volue.mesh.aio` sessions. Mixed in before a `FakeSession`
+    subclass."""
+
+    async def get_object(self, target, attributes_filter=None):
+        return self._get_object(target, attributes_filter)
+
+    async def traverse_objects(self, target, max_depth=None):
+        for node in super().traverse_objects(target, max_depth):
+            yield node
+
+    async def iter_objects(
+        self,
+        target,
+        query,
+        batch_size=None,
+        attributes_filter=None,
+        attribute_fields=None,
+    ):
+        for batch in super().iter_objects(
+            target, query, batch_size, attributes_filter, attribute_fields
+        ):
+            yield batch
+
+
+def call_with_session(function, async_function, session, *args, **kwargs):
+    """Call `function` with `session`, or run `async_function` if `session`
+    is a `FakeAsyncSession`."""
+    if isinstance(session, FakeAsyncSession):
+        return asyncio.run(async_function(session, *args, **kwargs))
+    return function(session, *args, **kwargs)
@@ -0,0 +1,340 @@
+"""
+Detection of physical and virtual time series connected to more than one
+time series attribute.
+
+A :py:class:`TimeseriesKeyAudit` collects time series keys of time series
+attributes of one or more models into an Arrow table and finds keys shared
+by several attributes, also across models. Models are crawled with only the
+time series keys requested from Mesh, or taken from saved snapshots, see
+:py:meth:`volue.mesh.snapshot.ModelSnapshot.to_parquet`. Example::
+
+    from volue.mesh.timeseries_duplicates import TimeseriesKeyAudit
+
+    audit = TimeseriesKeyAudit()
+    with connection.create_session() as session:
+        for model in session.list_models():
+            audit.add_model(session, model)
+
+    for duplicate in audit.find_duplicates():
+        print(duplicate.timeseries_key, duplicate.attribute_paths)
+
+    audit.to_parquet("timeseries_keys.parquet")
+
+The saved audit can be loaded with :py:meth:`TimeseriesKeyAudit.from_parquet`
+and only the models changed since then crawled again.
+"""
+
+from __future__ import annotations
+
+import typing
+import uuid
+from dataclasses import dataclass
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from volue.mesh._attribute import TimeseriesAttribute
+from volue.mesh._object import Object, _LazyAttributes
+
+if typing.TYPE_CHECKING:
+    from volue.mesh import Connection
+    from volue.mesh.aio import Connection as AsyncConnection
+    from volue.mesh.snapshot import ModelSnapshot
+
+_DEFAULT_BATCH_SIZE = 1000
+
+TIMESERIES_KEYS_SCHEMA = pa.schema(
+    [
+        pa.field("model", pa.string(), nullable=False),
+        pa.field("attribute_path", pa.string(), nullable=False),
+        pa.field("timeseries_key", pa.int64(), nullable=False),
+    ]
+)
+"""Schema of the table returned by :py:meth:`TimeseriesKeyAudit.to_table`."""
+
+TIMESERIES_KEY_FIELDS = ("values.timeseries_value.time_series_resource.timeseries_key",)
+"""Attribute fields requested from Mesh when crawling models."""
+
+
+@dataclass(frozen=True)
+class DuplicatedTimeseries:
+    """Physical or virtual time series connected to more than one time
+    series attribute.
+
+    Attributes:
+        timeseries_key: Key of the time series.
+        attribute_paths: Paths of the connected attributes, sorted.
+        models: Models of the connected attributes, sorted.
+    """
+
+    timeseries_key: int
+    attribute_paths: typing.Tuple[str, ...]
+    models: typing.Tuple[str, ...]
+
+    @property
+    def shared_across_models(self) -> bool:
+        """`True` if the time series is connected in more than one model."""
+        return len(self.models) > 1
+
+
+def _iter_timeseries_keys(
+    object: Object,
+) -> typing.Iterator[typing.Tuple[str, int]]:
+    """Yield names and time series keys of time series attributes connected
+    to physical or virtual time series."""
+    attributes = object.attributes
+    if (
+        isinstance(attributes, _LazyAttributes)
+        and attributes._proto_attributes is not None
+    ):
+        # read the keys without parsing the attributes
+        for proto_attribute in attributes._proto_attributes:
+            if len(proto_attribute.values) != 1:
+                continue
+            proto_value = proto_attribute.values[0]
+            if proto_value.HasField("timeseries_value") and (
+                proto_value.timeseries_value.HasField("time_series_resource")
+            ):
+                yield proto_attribute.name, (
+                    proto_value.timeseries_value.time_series_resource.timeseries_key
+                )
+        return
+
+    for name, attribute in attributes.items():
+        if (
+            isinstance(attribute, TimeseriesAttribute)
+            and attribute.time_series_resource is not None
+        ):
+            yield name, attribute.time_series_resource.timeseries_key
+
+
+class _TimeseriesKeyTableBuilder:
+    def __init__(self, model: uuid.UUID | str | Object):
+        self.target = model
+        # models given by ID are named after paths of found objects
+        if isinstance(model, Object):
+            model = model.path
+        self.model: str | None = (
+            _to_model_name(model) if isinstance(model, str) else None
+        )
+        self.attribute_paths: typing.List[str] = []
+        self.timeseries_keys: typing.List[int] = []
+
+    def add(self, object: Object) -> None:
+        if self.model is None:
+            self.model = _to_model_name(object.path)
+        for name, timeseries_key in _iter_timeseries_keys(object):
+            self.attribute_paths.append(f"{object.path}.{name}")
+            self.timeseries_keys.append(timeseries_key)
+
+    def to_table(self) -> pa.Table:
+        if self.model is None:
+            self.model = str(self.target)
+        return _to_table(
+            self.model,
+            pa.array(self.attribute_paths, pa.string()),
+            pa.array(self.timeseries_keys, pa.int64()),
+        )
+
+
+def _to_table(
+    model: str, attribute_paths: pa.Array, timeseries_keys: pa.Array
+) -> pa.Table:
+    return pa.Table.from_arrays(
+        [
+            pa.array([model] * len(attribute_paths), pa.string()),
+            attribute_paths,
+            timeseries_keys,
+        ],
+        schema=TIMESERIES_KEYS_SCHEMA,
+    )
+
+
+class TimeseriesKeyAudit:
+    """Time series keys of time series attributes of many models.
+
+    Keys are stored per model. Adding a model that is already a part of the
+    audit replaces its keys, so an audit can be refreshed one model at a
+    time.
+    """
+
+    def __init__(self):
+        self._tables: typing.Dict[str, pa.Table] = {}
+
+    @property
+    def models(self) -> typing.List[str]:
+        """Models that are a part of the audit."""
+        return list(self._tables)
+
+    def __len__(self) -> int:
+        """Number of time series attributes connected to physical or virtual
+        time series."""
+        return sum(table.num_rows for table in self._tables.values())
+
+    def add_model(
+        self,
+        session: Connection.Session,
+        model: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Crawl a model and add time series keys of its time series
+        attributes.
+
+        Objects are streamed from Mesh with only the time series keys of
+        attributes, see :py:data:`TIMESERIES_KEY_FIELDS`.
+
+        Args:
+            session: Session used to crawl the model.
+            model: The model object, its ID or path, e.g. `Model/SimpleThermalTestModel`.
+            query: Search query, by default all objects of the model.
+            batch_size: Number of objects received from Mesh before they are
+                processed.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        builder = _TimeseriesKeyTableBuilder(model)
+        for objects in session.iter_objects(
+            model, query, batch_size=batch_size, attribute_fields=TIMESERIES_KEY_FIELDS
+        ):
+            for object in objects:
+                builder.add(object)
+        table = builder.to_table()
+        self._tables[builder.model] = table
+
+    async def add_model_async(
+        self,
+        session: AsyncConnection.Session,
+        model: uuid.UUID | str | Object,
+        query: str = "{*}",
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Like :py:meth:`add_model`, but for :py:mod:`volue.mesh.aio`
+        sessions. Many models can be crawled concurrently, e.g. with
+        `asyncio.gather`."""
+        builder = _TimeseriesKeyTableBuilder(model)
+        async for objects in session.iter_objects(
+            model, query, batch_size=batch_size, attribute_fields=TIMESERIES_KEY_FIELDS
+        ):
+            for object in objects:
+                builder.add(object)
+        table = builder.to_table()
+        self._tables[builder.model] = table
+
+    def add_snapshot(self, model: str, snapshot: ModelSnapshot | pa.Table) -> None:
+        """Add time series keys of a model snapshot without calling Mesh.
+
+        Args:
+            model: Name of the model.
+            snapshot: A snapshot or its attributes table, e.g. read from a
+                Parquet file saved with
+                :py:meth:`~volue.mesh.snapshot.ModelSnapshot.to_parquet`.
+                Only the `path` and `timeseries_key` columns are used.
+        """
+        if isinstance(snapshot, pa.Table):
+            table = snapshot
+        else:
+            _, table = snapshot.to_arrow()
+
+        table = table.filter(pc.is_valid(table.column("timeseries_key")))
+        self._tables[model] = _to_table(
+            model,
+            table.column("path").combine_chunks(),
+            table.column("timeseries_key").combine_chunks().cast(pa.int64()),
+        )
+
+    def remove_model(self, model: str) -> None:
+        """Remove time series keys of a model.
+
+        Raises:
+            KeyError: The model is not a part of the audit.
+        """
+        del self._tables[model]
+
+    def to_table(self) -> pa.Table:
+        """Time series keys of all models, see :py:data:`TIMESERIES_KEYS_SCHEMA`."""
+        if not self._tables:
+            return TIMESERIES_KEYS_SCHEMA.empty_table()
+        return pa.concat_tables(self._tables.values())
+
+    def to_parquet(self, path: str) -> None:
+        """Save the audit to a Parquet file, see :py:meth:`to_table`."""
+        import pyarrow.parquet as pq
+
+        pq.write_table(self.to_table(), path)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> TimeseriesKeyAudit:
+        """Load an audit saved with :py:meth:`to_parquet`."""
+        import pyarrow.parquet as pq
+
+        return cls.from_table(pq.read_table(path))
+
+    @classmethod
+    def from_table(cls, table: pa.Table) -> TimeseriesKeyAudit:
+        """Create an audit from a table returned by :py:meth:`to_table`."""
+        audit = cls()
+        table = table.select(TIMESERIES_KEYS_SCHEMA.names).cast(TIMESERIES_KEYS_SCHEMA)
+        models = table.column("model")
+        for model in pc.unique(models).to_pylist():
+            audit._tables[model] = table.filter(pc.equal(models, model))
+        return audit
+
+    def find_duplicates(self) -> typing.List[DuplicatedTimeseries]:
+        """Find time series keys connected to more than one time series
+        attribute, in any of the models.
+
+        Keys are grouped and counted in Arrow, only the attributes of
+        duplicated keys are converted to Python objects.
+
+        Returns:
+            Duplicated time series sorted by time series key.
+        """
+        table = self.to_table()
+        counts = table.group_by("timeseries_key").aggregate(
+            [("attribute_path", "count")]
+        )
+        duplicated_keys = counts.filter(
+            pc.greater(counts.column("attribute_path_count"), 1)
+        ).column("timeseries_key")
+        if len(duplicated_keys) == 0:
+            return []
+
+        rows = table.filter(
+            pc.is_in(table.column("timeseries_key"), value_set=duplicated_keys)
+        ).sort_by(
+            [
+                ("timeseries_key", "ascending"),
+                ("attribute_path", "ascending"),
+            ]
+        )
+
+        duplicates = []
+        paths: typing.List[str] = []
+        models: typing.Set[str] = set()
+        previous_key = None
+        for key, path, model in zip(
+            rows.column("timeseries_key").to_pylist(),
+            rows.column("attribute_path").to_pylist(),
+            rows.column("model").to_pylist(),
+        ):
+            if key != previous_key and paths:
+                duplicates.append(
+                    DuplicatedTimeseries(
+                        previous_key, tuple(paths), tuple(sorted(models))
+                    )
+                )
+                paths, models = [], set()
+            previous_key = key
+            paths.append(path)
+            models.add(model)
+        duplicates.append(
+            DuplicatedTimeseries(previous_key, tuple(paths), tuple(sorted(models)))
+        )
+        return duplicates
+
+
+def _to_model_name(path: str) -> str:
+    """Name of the model of an object path, e.g. `Model/Name/Object`."""
+    return path.split("/", 2)[1] if path.startswith("Model/") else path
@@ -0,0 +1,398 @@
+"""
+Resolution of time series attributes to time series keys.
+
+When time series points are read by attribute path or ID, the Mesh server
+resolves the attribute and its time series resource on every read. A
+:py:class:`TimeseriesKeyResolver` resolves many attributes once, e.g. with a
+single streamed search returning only the time series keys and resolutions,
+and then reads the time series points by key. Example::
+
+    from volue.mesh.timeseries_keys import TimeseriesKeyResolver
+
+    resolver = TimeseriesKeyResolver()
+
+    with connection.create_session() as session:
+        resolver.resolve_search(
+            session, "Model/SimpleThermalTestModel", "{*}.TsRawAtt"
+        )
+        timeseries = resolver.read_timeseries_points(
+            session,
+            ["Model/SimpleThermalTestModel/ThermalComponent.TsRawAtt"],
+            start_time,
+            end_time,
+        )
+
+A mapping becomes stale when the attribute is connected to a different time
+series. Stale mappings are detected when reading by key fails with
+``NOT_FOUND`` or ``INVALID_ARGUMENT``, or when the read time series has
+different resolution than the resolved one. Such mappings are resolved again
+and the time series is read once more. An attribute connected to another
+existing time series with the same resolution cannot be detected this way,
+so mappings also expire after `max_age` seconds and can be invalidated
+explicitly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import typing
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import grpc
+
+from volue.mesh._attribute import AttributeBase, TimeseriesAttribute
+from volue.mesh._base_session import DEFAULT_MAX_CONCURRENT_READS
+from volue.mesh._object import Object
+from volue.mesh._timeseries import Timeseries
+
+if typing.TYPE_CHECKING:
+    from volue.mesh import Connection
+    from volue.mesh.aio import Connection as AsyncConnection
+
+TIMESERIES_KEY_ATTRIBUTE_FIELDS = (
+    "id",
+    "path",
+    "value_type",
+    "values.timeseries_value.time_series_resource.timeseries_key",
+    "values.timeseries_value.time_series_resource.resolution",
+)
+"""Attribute fields requested from Mesh when resolving time series keys."""
+
+DEFAULT_MAX_AGE = 300.0
+"""Default number of seconds after which mappings are resolved again."""
+
+_STALE_STATUS_CODES = (grpc.StatusCode.NOT_FOUND, grpc.StatusCode.INVALID_ARGUMENT)
+
+
+@dataclass(frozen=True)
+class ResolvedTimeseries:
+    """Time series attribute resolved to the key of its time series resource."""
+
+    attribute_id: uuid.UUID | None
+    attribute_path: str
+    timeseries_key: int
+    resolution: Timeseries.Resolution | None
+    resolved_at: float = field(default=0.0, compare=False, repr=False)
+
+
+class TimeseriesKeyResolver:
+    """Cache of time series attributes resolved to time series keys.
+
+    Mappings are kept by attribute ID and path and are not bound to a
+    session, so one resolver can be reused by many sessions.
+
+    Reads detect stale mappings only if the old time series is deleted or has
+    different resolution. If an attribute is connected to another existing
+    time series with the same resolution, points of the old time series are
+    returned until the mapping expires or is invalidated.
+
+    Attributes:
+        max_age: If set, mappings older than `max_age` seconds are resolved
+            again before they are used. With `None` mappings never expire
+            and the limitation above applies for the lifetime of the
+            resolver.
+        resolved_count: Number of attributes resolved by calls to Mesh.
+        stale_count: Number of stale mappings detected when reading.
+    """
+
+    def __init__(self, max_age: float | None = DEFAULT_MAX_AGE):
+        self.max_age: float | None = max_age
+        self.resolved_count: int = 0
+        self.stale_count: int = 0
+        self._mappings: typing.Dict[uuid.UUID | str, ResolvedTimeseries] = {}
+
+    def __len__(self) -> int:
+        return len(set(self._mappings.values()))
+
+    def __contains__(self, target: uuid.UUID | str | AttributeBase) -> bool:
+        return self.get(target) is not None
+
+    def get(self, target: uuid.UUID | str | AttributeBase) -> ResolvedTimeseries | None:
+        """Get the resolved mapping of a time series attribute.
+
+        Args:
+            target: Attribute ID, path or instance.
+
+        Returns:
+            The mapping or `None` if the attribute is not resolved or its
+            mapping expired.
+        """
+        resolved = self._mappings.get(_to_key(target))
+        if resolved is None:
+            return None
+        if (
+            self.max_age is not None
+            and time.monotonic() - resolved.resolved_at > self.max_age
+        ):
+            self._remove(resolved)
+            return None
+        return resolved
+
+    def invalidate(self, target: uuid.UUID | str | AttributeBase | None = None) -> None:
+        """Remove the mapping of a time series attribute.
+
+        Args:
+            target: Attribute ID, path or instance. If not set, all mappings
+                are removed.
+        """
+        if target is None:
+            self._mappings.clear()
+            return
+
+        resolved = self._mappings.get(_to_key(target))
+        if resolved is not None:
+            self._remove(resolved)
+
+    def resolve(
+        self,
+        session: Connection.Session,
+        targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_READS,
+    ) -> typing.List[ResolvedTimeseries]:
+        """Resolve time series attributes to time series keys.
+
+        Only attributes without a valid mapping are requested from Mesh,
+        without waiting for the responses of the previous requests. Time
+        series attribute instances with a time series resource are resolved
+        without calling Mesh.
+
+        Args:
+            session: Session used to request unresolved attributes.
+            targets: Attribute IDs, paths or instances.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            Mappings in the order of `targets`.
+
+        Raises:
+            ValueError: An attribute is not connected to a physical or virtual
+                time series or `max_concurrency` is less than 1.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        targets = list(targets)
+        resolved = [self._resolve_locally(target) for target in targets]
+        missing = [i for i, mapping in enumerate(resolved) if mapping is None]
+        attributes = session.get_attributes(
+            [targets[i] for i in missing], max_concurrency=max_concurrency
+        )
+        for i, attribute in zip(missing, attributes):
+            resolved[i] = self._add_required(attribute)
+        return resolved
+
+    async def resolve_async(
+        self,
+        session: AsyncConnection.Session,
+        targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_READS,
+    ) -> typing.List[ResolvedTimeseries]:
+        """Like :py:meth:`resolve`, but for :py:mod:`volue.mesh.aio` sessions."""
+        targets = list(targets)
+        resolved = [self._resolve_locally(target) for target in targets]
+        missing = [i for i, mapping in enumerate(resolved) if mapping is None]
+        attributes = await session.get_attributes(
+            [targets[i] for i in missing], max_concurrency=max_concurrency
+        )
+        for i, attribute in zip(missing, attributes):
+            resolved[i] = self._add_required(attribute)
+        return resolved
+
+    def resolve_search(
+        self,
+        session: Connection.Session,
+        target: uuid.UUID | str | Object,
+        query: str,
+    ) -> typing.List[ResolvedTimeseries]:
+        """Resolve all time series attributes found by a search.
+
+        The attributes are streamed from Mesh with only the fields from
+        :py:data:`TIMESERIES_KEY_ATTRIBUTE_FIELDS`. Attributes not connected
+        to a physical or virtual time series, e.g. calculations, are skipped.
+
+        Args:
+            session: Session used to search for the attributes.
+            target: Start searching at the target object.
+            query: A search formulated using the `Mesh search language <https://volue-public.github.io/energy-smp-docs/latest/mesh/concepts/search-language/>`__.
+
+        Returns:
+            Mappings of found time series attributes.
+
+        Raises:
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        resolved = []
+        for attribute in session.iter_attributes(
+            target, query, attribute_fields=TIMESERIES_KEY_ATTRIBUTE_FIELDS
+        ):
+            mapping = self._add(attribute)
+            if mapping is not None:
+                resolved.append(mapping)
+        return resolved
+
+    async def resolve_search_async(
+        self,
+        session: AsyncConnection.Session,
+        target: uuid.UUID | str | Object,
+        query: str,
+    ) -> typing.List[ResolvedTimeseries]:
+        """Like :py:meth:`resolve_search`, but for :py:mod:`volue.mesh.aio` sessions."""
+        resolved = []
+        async for attribute in session.iter_attributes(
+            target, query, attribute_fields=TIMESERIES_KEY_ATTRIBUTE_FIELDS
+        ):
+            mapping = self._add(attribute)
+            if mapping is not None:
+                resolved.append(mapping)
+        return resolved
+
+    def read_timeseries_points(
+        self,
+        session: Connection.Session,
+        targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> typing.List[Timeseries]:
+        """Read time series points of time series attributes by their keys.
+
+        Unresolved attributes are resolved first, see :py:meth:`resolve`.
+        Stale mappings are resolved again and the time series is read once
+        more.
+
+        Args:
+            session: Session used to resolve attributes and read points.
+            targets: Attribute IDs, paths or instances.
+            start_time: the start date and time of the time series interval
+            end_time: the end date and time of the time series interval
+
+        Returns:
+            Time series in the order of `targets`.
+
+        Raises:
+            ValueError: An attribute is not connected to a physical or virtual
+                time series.
+            grpc.RpcError: Error message raised if the gRPC request could not be completed.
+        """
+        targets = list(targets)
+        timeseries = []
+        for target, resolved in zip(targets, self.resolve(session, targets)):
+            try:
+                result = session.read_timeseries_points(
+                    resolved.timeseries_key, start_time, end_time
+                )
+            except grpc.RpcError as e:
+                if e.code() not in _STALE_STATUS_CODES:
+                    raise
+                result = None
+
+            if result is None or not _is_current(resolved, result):
+                self._mark_stale(resolved)
+                # do not trust time series resources of attribute instances
+                current = self._add_required(session.get_attribute(target))
+                if result is None or current.timeseries_key != resolved.timeseries_key:
+                    result = session.read_timeseries_points(
+                        current.timeseries_key, start_time, end_time
+                    )
+            timeseries.append(result)
+        return timeseries
+
+    async def read_timeseries_points_async(
+        self,
+        session: AsyncConnection.Session,
+        targets: typing.Iterable[uuid.UUID | str | AttributeBase],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> typing.List[Timeseries]:
+        """Like :py:meth:`read_timeseries_points`, but for
+        :py:mod:`volue.mesh.aio` sessions.
+
+        Time series are read concurrently.
+        """
+        targets = list(targets)
+
+        async def read(target, resolved):
+            try:
+                result = await session.read_timeseries_points(
+                    resolved.timeseries_key, start_time, end_time
+                )
+            except grpc.RpcError as e:
+                if e.code() not in _STALE_STATUS_CODES:
+                    raise
+                result = None
+
+            if result is None or not _is_current(resolved, result):
+                self._mark_stale(resolved)
+                current = self._add_required(await session.get_attribute(target))
+                if result is None or current.timeseries_key != resolved.timeseries_key:
+                    result = await session.read_timeseries_points(
+                        current.timeseries_key, start_time, end_time
+                    )
+            return result
+
+        resolved = await self.resolve_async(session, targets)
+        return list(await asyncio.gather(*map(read, targets, resolved)))
+
+    def _resolve_locally(
+        self, target: uuid.UUID | str | AttributeBase
+    ) -> ResolvedTimeseries | None:
+        mapping = self.get(target)
+        if mapping is None and isinstance(target, TimeseriesAttribute):
+            mapping = self._add(target, count=False)
+        return mapping
+
+    def _mark_stale(self, resolved: ResolvedTimeseries) -> None:
+        self.stale_count += 1
+        self._remove(resolved)
+
+    def _add(
+        self, attribute: AttributeBase, count: bool = True
+    ) -> ResolvedTimeseries | None:
+        if (
+            not isinstance(attribute, TimeseriesAttribute)
+            or attribute.time_series_resource is None
+        ):
+            return None
+
+        resource = attribute.time_series_resource
+        resolved = ResolvedTimeseries(
+            attribute_id=attribute.id,
+            attribute_path=attribute.path,
+            timeseries_key=resource.timeseries_key,
+            resolution=resource.resolution,
+            resolved_at=time.monotonic(),
+        )
+        if attribute.id is not None:
+            self._mappings[attribute.id] = resolved
+        if attribute.path:
+            self._mappings[attribute.path] = resolved
+        if count:
+            self.resolved_count += 1
+        return resolved
+
+    def _add_required(self, attribute: AttributeBase) -> ResolvedTimeseries:
+        resolved = self._add(attribute)
+        if resolved is None:
+            raise ValueError(
+                f"attribute '{attribute.path}' is not connected to a physical "
+                "or virtual time series"
+            )
+        return resolved
+
+    def _remove(self, resolved: ResolvedTimeseries) -> None:
+        for key in (resolved.attribute_id, resolved.attribute_path):
+            if self._mappings.get(key) is resolved:
+                del self._mappings[key]
+
+
+def _to_key(target: uuid.UUID | str | AttributeBase) -> uuid.UUID | str:
+    if isinstance(target, AttributeBase):
+        return target.id if target.id is not None else target.path
+    return target
+
+
+def _is_current(resolved: ResolvedTimeseries, timeseries: Timeseries) -> bool:
+    return resolved.resolution is None or timeseries.resolution in (
+        None,
+        resolved.resolution,
+    )